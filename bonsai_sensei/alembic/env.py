@@ -6,7 +6,7 @@ from sqlmodel import SQLModel
 
 from alembic import context
 
-from bonsai_sensei.domain import species, bonsai, fertilizer, phytosanitary, bonsai_event, user_settings, bonsai_photo, fertilization_plan, phytosanitary_plan, development_plan, planned_work, pest
+from bonsai_sensei.domain import species, bonsai, fertilizer, phytosanitary, bonsai_event, user_settings, bonsai_photo, fertilization_plan, phytosanitary_plan, development_plan, planned_work, pest, telegram_file
 
 config = context.config
 
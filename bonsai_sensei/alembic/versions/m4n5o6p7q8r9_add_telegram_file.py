@@ -0,0 +1,32 @@
+"""add_telegram_file
+
+Revision ID: m4n5o6p7q8r9
+Revises: l3m4n5o6p7q8
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = 'm4n5o6p7q8r9'
+down_revision: Union[str, Sequence[str], None] = 'l3m4n5o6p7q8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing_tables = inspector.get_table_names()
+    if 'telegram_file' not in existing_tables:
+        op.create_table(
+            'telegram_file',
+            sa.Column('content_hash', sa.String(), nullable=False),
+            sa.Column('file_id', sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint('content_hash'),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('telegram_file')
@@ -57,6 +57,10 @@ def get_delete_bonsai_photos_svc(request: Request) -> Callable:
     return request.app.state.bonsai_photo_service["delete_bonsai_photos"]
 
 
+def get_warm_thumbnail_svc(request: Request) -> Callable:
+    return request.app.state.warm_thumbnail
+
+
 @router.get("/bonsai", response_model=List[Bonsai])
 def get_bonsai_list(
     user_id: Optional[str] = Query(default=None),
@@ -132,6 +136,7 @@ async def create_bonsai_photo(
     bonsai_id: int,
     file: UploadFile,
     create_photo_func: Callable = Depends(get_create_bonsai_photo_svc),
+    warm_thumbnail_func: Callable = Depends(get_warm_thumbnail_svc),
     taken_on: Optional[date] = Query(default=None),
 ):
     photos_dir = Path(PHOTOS_PATH) / str(bonsai_id)
@@ -140,6 +145,7 @@ async def create_bonsai_photo(
     raw_bytes = await file.read()
     image = Image.open(io.BytesIO(raw_bytes))
     image.save(photos_dir / file_name, format="WEBP", quality=85)
+    warm_thumbnail_func(str(photos_dir / file_name))
     photo = BonsaiPhoto(bonsai_id=bonsai_id, file_path=f"{bonsai_id}/{file_name}")
     if taken_on is not None:
         photo.taken_on = taken_on
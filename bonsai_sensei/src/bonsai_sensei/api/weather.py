@@ -15,9 +15,9 @@ class WeatherRequest(BaseModel):
     location: str
 
 
-def get_weather_service() -> Callable[[str], object]:
+def get_weather_service(request: Request) -> Callable[[str], object]:
     base_url = os.getenv("WEATHER_API_BASE", "https://wttr.in")
-    return create_weather_tool(base_url)
+    return create_weather_tool(base_url, request.app.state.forecast_cache.get)
 
 
 @router.post("/weather")
@@ -1,2 +1 @@
-from bonsai_sensei.database.session import get_engine, get_session
-
+from bonsai_sensei.database.session import get_async_engine, get_async_session, get_engine, get_session
@@ -26,3 +26,33 @@ def with_session(func):
                 session.rollback()
                 raise
     return wrapper
+
+
+def with_async_session(func):
+    """
+    Async counterpart of with_session for the same store functions.
+    It expects 'create_session' to be an AsyncSession factory. The store body is executed through
+    AsyncSession.run_sync, so queries travel over the async driver (asyncpg) without blocking the
+    event loop, and every store keeps a single implementation shared by the sync and async paths.
+    """
+    store_func = getattr(func, "__wrapped__", func)
+
+    @wraps(store_func)
+    async def wrapper(*args, **kwargs):
+        create_session = kwargs.pop('create_session', None)
+        if not create_session:
+            raise ValueError("create_session factory must be provided to the decorated function")
+
+        async with create_session() as session:
+            try:
+                result = await session.run_sync(lambda sync_session: store_func(sync_session, *args, **kwargs))
+                await session.commit()
+
+                if result and hasattr(result, "id"):
+                    await session.refresh(result)
+
+                return result
+            except Exception:
+                await session.rollback()
+                raise
+    return wrapper
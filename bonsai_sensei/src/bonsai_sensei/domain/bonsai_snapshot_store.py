@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from sqlalchemy import func
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
+
+from bonsai_sensei.database.session_wrapper import with_session
+from bonsai_sensei.domain.bonsai_event import BonsaiEvent
+from bonsai_sensei.domain.development_plan import DevelopmentPlan
+from bonsai_sensei.domain.fertilization_plan import FertilizationPlan
+
+
+@with_session
+def load_bonsai_snapshot_data(
+    session: Session,
+    bonsai_ids: List[int],
+    pest_hours: int = 720,
+    abandoned_days: int = 90,
+    reason_contains: str = "disease_pause",
+) -> Dict[int, dict]:
+    """Load everything a mimamori snapshot needs for many bonsai in a fixed number of queries.
+
+    Mirrors the per-bonsai lookups (last event, active plans, unlinked pest events and
+    recently abandoned plans) but resolves them set-wise, so the cost no longer grows as
+    N round-trips per bonsai.
+    """
+    if not bonsai_ids:
+        return {}
+
+    now = datetime.now(timezone.utc)
+    pest_cutoff = now - timedelta(hours=pest_hours)
+    abandoned_cutoff = now - timedelta(days=abandoned_days)
+
+    last_events = _latest_per_bonsai(
+        session, BonsaiEvent, bonsai_ids, order_by=(BonsaiEvent.occurred_at.desc(), BonsaiEvent.id.desc())
+    )
+    active_development_plans = _latest_per_bonsai(
+        session,
+        DevelopmentPlan,
+        bonsai_ids,
+        order_by=(DevelopmentPlan.created_at.desc(), DevelopmentPlan.id.desc()),
+        status="active",
+    )
+    active_fertilization_plans = _latest_per_bonsai(
+        session,
+        FertilizationPlan,
+        bonsai_ids,
+        order_by=(FertilizationPlan.created_at.desc(), FertilizationPlan.id.desc()),
+        status="active",
+    )
+    unlinked_pest_events = _unlinked_pest_events(session, bonsai_ids, pest_cutoff)
+    abandoned_fertilization_ids = _recently_abandoned_bonsai_ids(
+        session, FertilizationPlan, bonsai_ids, abandoned_cutoff, reason_contains
+    )
+    abandoned_development_ids = _recently_abandoned_bonsai_ids(
+        session, DevelopmentPlan, bonsai_ids, abandoned_cutoff, reason_contains
+    )
+
+    return {
+        bonsai_id: {
+            "last_event": last_events.get(bonsai_id),
+            "active_development_plan": active_development_plans.get(bonsai_id),
+            "active_fertilization_plan": active_fertilization_plans.get(bonsai_id),
+            "unlinked_pest_events": unlinked_pest_events.get(bonsai_id, []),
+            "has_abandoned_fertilization_plan": bonsai_id in abandoned_fertilization_ids,
+            "has_abandoned_development_plan": bonsai_id in abandoned_development_ids,
+        }
+        for bonsai_id in bonsai_ids
+    }
+
+
+def _latest_per_bonsai(session: Session, model, bonsai_ids: List[int], order_by: tuple, status: str | None = None) -> dict:
+    ranked = select(
+        model,
+        func.row_number().over(partition_by=model.bonsai_id, order_by=order_by).label("row_rank"),
+    ).where(model.bonsai_id.in_(bonsai_ids))
+    if status is not None:
+        ranked = ranked.where(model.status == status)
+    ranked_subquery = ranked.subquery()
+    ranked_model = aliased(model, ranked_subquery)
+    rows = session.exec(select(ranked_model).where(ranked_subquery.c.row_rank == 1)).all()
+    return {row.bonsai_id: row for row in rows}
+
+
+def _unlinked_pest_events(session: Session, bonsai_ids: List[int], cutoff: datetime) -> Dict[int, List[BonsaiEvent]]:
+    events = session.exec(
+        select(BonsaiEvent)
+        .where(BonsaiEvent.bonsai_id.in_(bonsai_ids))
+        .where(
+            ((BonsaiEvent.event_type == "pest_detection") & (BonsaiEvent.occurred_at >= cutoff))
+            | (BonsaiEvent.event_type == "phytosanitary_application")
+        )
+        .order_by(BonsaiEvent.occurred_at.desc())
+    ).all()
+
+    linked_ids_by_bonsai: Dict[int, set] = {}
+    for event in events:
+        if event.event_type == "phytosanitary_application" and event.payload.get("pest_event_id") is not None:
+            linked_ids_by_bonsai.setdefault(event.bonsai_id, set()).add(event.payload["pest_event_id"])
+
+    unlinked: Dict[int, List[BonsaiEvent]] = {}
+    for event in events:
+        if event.event_type != "pest_detection":
+            continue
+        if event.id in linked_ids_by_bonsai.get(event.bonsai_id, set()):
+            continue
+        unlinked.setdefault(event.bonsai_id, []).append(event)
+    return unlinked
+
+
+def _recently_abandoned_bonsai_ids(
+    session: Session, model, bonsai_ids: List[int], cutoff: datetime, reason_contains: str
+) -> set:
+    statement = (
+        select(model.bonsai_id)
+        .distinct()
+        .where(model.bonsai_id.in_(bonsai_ids))
+        .where(model.status == "abandoned")
+        .where(model.abandoned_at >= cutoff)
+        .where(model.abandonment_reason.like(f"%{reason_contains}%"))
+    )
+    return set(session.exec(statement).all())
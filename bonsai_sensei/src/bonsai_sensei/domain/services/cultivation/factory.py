@@ -1,5 +1,7 @@
 from typing import Callable
 
+import httpx
+
 from bonsai_sensei.domain.services.cultivation.species.factory import create_botanist_group
 from bonsai_sensei.domain.services.cultivation.plan.factory import create_kikaru_group
 
@@ -7,6 +9,7 @@ from bonsai_sensei.domain.services.cultivation.plan.factory import create_kikaru
 def create_cultivation_group(
     model: object,
     session_factory,
+    wiki_client: httpx.AsyncClient,
     ask_confirmation: Callable,
     ask_human: Callable,
     ask_selection: Callable,
@@ -43,6 +46,7 @@ def create_cultivation_group(
     botanist = create_botanist_group(
         model=model,
         session_factory=session_factory,
+        wiki_client=wiki_client,
         ask_confirmation=ask_confirmation,
         ask_selection=ask_selection,
         build_create_species_selection_question=build_create_species_selection_question,
@@ -58,6 +62,7 @@ def create_cultivation_group(
     kikaru = create_kikaru_group(
         model=model,
         session_factory=session_factory,
+        wiki_client=wiki_client,
         ask_confirmation=ask_confirmation,
         ask_human=ask_human,
         ask_selection=ask_selection,
@@ -4,7 +4,6 @@ from typing import Callable
 from google.genai import types
 
 from bonsai_sensei.domain.services.llm_runner import create_single_turn_llm_runner
-from bonsai_sensei.infrastructure.wiki_client import create_http_read_wiki_page_tool, create_http_write_wiki_page_tool
 
 _APP_NAME = "pest_wiki_compiler"
 _MAX_LLM_CALLS = 20
@@ -26,7 +25,8 @@ La ficha debe contener al menos las secciones: nombre de la plaga como título H
 
 def create_pest_wiki_compiler(
     model: object,
-    kb_base_url: str,
+    read_wiki_page_func: Callable,
+    write_wiki_page_func: Callable,
     searcher: Callable[[str], dict],
 ) -> Callable[[str, str], str]:
     """Create an async compiler that generates a markdown wiki page for a pest.
@@ -36,25 +36,24 @@ def create_pest_wiki_compiler(
 
     Args:
         model: LLM model to use for the compiler agent.
-        kb_base_url: Base URL of the knowledge_base HTTP service.
+        read_wiki_page_func: Async callable that reads a wiki page by path.
+        write_wiki_page_func: Async wiki write tool handed to the compiler agent.
         searcher: Callable that accepts a search query and returns a dict with
             'answer' (str) and optional 'results' list of dicts with 'url' keys.
     """
-    read_wiki_page = create_http_read_wiki_page_tool(kb_base_url)
-    write_wiki_page = create_http_write_wiki_page_tool(kb_base_url)
     search_tool = _create_search_tool(searcher)
     run_llm = create_single_turn_llm_runner(
         model=model,
         app_name=_APP_NAME,
         instruction=_COMPILER_INSTRUCTION,
-        tools=[search_tool, write_wiki_page],
+        tools=[search_tool, write_wiki_page_func],
         max_llm_calls=_MAX_LLM_CALLS,
     )
 
     async def compile_pest_page(name: str, user_instructions: str = "") -> str:
         slug = _slugify(name)
         relative_path = f"pests/{slug}.md"
-        existing_content_result = read_wiki_page(path=relative_path)
+        existing_content_result = await read_wiki_page_func(path=relative_path)
         existing_content = existing_content_result.get("content") if existing_content_result.get("status") == "success" else None
         prompt = _build_compile_prompt(name, relative_path, existing_content, user_instructions)
         message = types.Content(role="user", parts=[types.Part(text=prompt)])
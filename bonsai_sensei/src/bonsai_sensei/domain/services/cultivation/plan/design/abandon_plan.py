@@ -85,7 +85,7 @@ def create_abandon_development_plan_tool(
         plan.abandoned_at = datetime.now(timezone.utc)
         update_development_plan_func(plan)
 
-        update_wiki_on_abandon(plan.wiki_path, reason, read_wiki_page_func, write_wiki_page_func)
+        await update_wiki_on_abandon(plan.wiki_path, reason, read_wiki_page_func, write_wiki_page_func)
 
         return {"status": "success", "plan_id": plan.id}
 
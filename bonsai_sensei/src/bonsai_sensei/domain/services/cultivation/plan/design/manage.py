@@ -97,14 +97,14 @@ def create_manage_development_plan_tool(
 
             bonsai_user_id = bonsai.user_id or "default"
             existing_plan = get_active_development_plan_func(bonsai_id=bonsai.id)
-            bonsai_context = load_bonsai_plan_context(
+            bonsai_context = await load_bonsai_plan_context(
                 bonsai=bonsai,
                 bonsai_name=bonsai_name,
                 list_bonsai_events_func=list_bonsai_events_func,
                 list_wiki_files_func=list_wiki_files_func,
                 read_wiki_page_func=read_wiki_page_func,
             )
-            recent_reports = _filter_current_year_reports(
+            recent_reports = await _filter_current_year_reports(
                 bonsai_name=bonsai_name,
                 bonsai_user_id=bonsai_user_id,
                 all_reports=bonsai_context["reports"],
@@ -115,10 +115,10 @@ def create_manage_development_plan_tool(
             ctx.state["bonsai_context"] = bonsai_context
             ctx.state["recent_reports"] = recent_reports
             ctx.state["existing_plan"] = existing_plan
-            ctx.state["existing_plan_wiki"] = read_wiki_content(existing_plan.wiki_path, read_wiki_page_func) if existing_plan else ""
-            ctx.state["species_wiki_content"] = _load_species_wiki(bonsai, get_species_by_id_func, read_wiki_page_func)
-            ctx.state["style_wiki_content"] = _load_style_wiki(target_style, read_wiki_page_func)
-            ctx.state["available_techniques"] = _list_technique_names(list_wiki_files_func)
+            ctx.state["existing_plan_wiki"] = await read_wiki_content(existing_plan.wiki_path, read_wiki_page_func) if existing_plan else ""
+            ctx.state["species_wiki_content"] = await _load_species_wiki(bonsai, get_species_by_id_func, read_wiki_page_func)
+            ctx.state["style_wiki_content"] = await _load_style_wiki(target_style, read_wiki_page_func)
+            ctx.state["available_techniques"] = await _list_technique_names(list_wiki_files_func)
             ctx.state["user_location"] = _get_user_location(tool_context, get_user_settings_func)
             ctx.route = "ok"
 
@@ -211,7 +211,7 @@ def create_manage_development_plan_tool(
             slug = bonsai_slug(bonsai_name)
 
             if existing_plan:
-                _abandon_existing_plan(existing_plan, delete_future_planned_works_func, update_development_plan_func, read_wiki_page_func, write_wiki_page_func)
+                await _abandon_existing_plan(existing_plan, delete_future_planned_works_func, update_development_plan_func, read_wiki_page_func, write_wiki_page_func)
 
             wiki_path = f"users/{bonsai_user_id}/bonsai/{slug}/design-plans/{start_date[:7]}_to_{end_date[:7]}.md"
             plan = create_development_plan_func(
@@ -228,7 +228,7 @@ def create_manage_development_plan_tool(
                 )
             )
             _create_planned_works(bonsai_id=bonsai.id, plan_id=plan.id, entries=entries, create_planned_work_func=create_planned_work_func)
-            write_wiki_page_func(
+            await write_wiki_page_func(
                 path=wiki_path,
                 content=plan_wiki_page_template.render(
                     bonsai_name=bonsai_name,
@@ -244,7 +244,7 @@ def create_manage_development_plan_tool(
                     entries=entries,
                 ),
             )
-            _update_plans_index(bonsai_name, slug, bonsai_user_id, plan, start_date, end_date, plans_index_wiki_template, write_wiki_page_func)
+            await _update_plans_index(bonsai_name, slug, bonsai_user_id, plan, start_date, end_date, plans_index_wiki_template, write_wiki_page_func)
 
             ctx.state["plan_result"] = {
                 "status": "success",
@@ -293,22 +293,22 @@ def create_manage_development_plan_tool(
     return manage_development_plan
 
 
-def _load_species_wiki(bonsai, get_species_by_id_func: Callable, read_wiki_page_func: Callable) -> str:
+async def _load_species_wiki(bonsai, get_species_by_id_func: Callable, read_wiki_page_func: Callable) -> str:
     species = get_species_by_id_func(species_id=bonsai.species_id)
     if species and species.wiki_path:
-        page = read_wiki_page_func(path=species.wiki_path)
+        page = await read_wiki_page_func(path=species.wiki_path)
         if page.get("status") == "success":
             return page["content"]
     return ""
 
 
-def _load_style_wiki(target_style: str, read_wiki_page_func: Callable) -> str:
-    page = read_wiki_page_func(path=f"design/{target_style}.md")
+async def _load_style_wiki(target_style: str, read_wiki_page_func: Callable) -> str:
+    page = await read_wiki_page_func(path=f"design/{target_style}.md")
     return page["content"] if page.get("status") == "success" else ""
 
 
-def _list_technique_names(list_wiki_files_func: Callable) -> list[str]:
-    paths = list_wiki_files_func("techniques/")
+async def _list_technique_names(list_wiki_files_func: Callable) -> list[str]:
+    paths = await list_wiki_files_func("techniques/")
     return [path.replace("techniques/", "").replace(".md", "") for path in paths]
 
 
@@ -320,7 +320,7 @@ def _get_user_location(tool_context, get_user_settings_func: Callable) -> str:
     return settings.location if settings and settings.location else "unknown"
 
 
-def _abandon_existing_plan(
+async def _abandon_existing_plan(
     plan,
     delete_future_planned_works_func: Callable,
     update_plan_func: Callable,
@@ -333,7 +333,7 @@ def _abandon_existing_plan(
     plan.abandonment_reason = "Replaced by new plan"
     plan.abandoned_at = datetime.now(timezone.utc)
     update_plan_func(plan)
-    update_wiki_on_abandon(plan.wiki_path, plan.abandonment_reason, read_wiki_page_func, write_wiki_page_func)
+    await update_wiki_on_abandon(plan.wiki_path, plan.abandonment_reason, read_wiki_page_func, write_wiki_page_func)
 
 
 def _create_planned_works(bonsai_id: int, plan_id: int, entries: list, create_planned_work_func: Callable) -> None:
@@ -357,11 +357,11 @@ def _create_planned_works(bonsai_id: int, plan_id: int, entries: list, create_pl
 _YEAR_PREFIX_RE = re.compile(r"^(\d{4})-")
 
 
-def _filter_current_year_reports(bonsai_name: str, bonsai_user_id: str, all_reports: list[str], list_wiki_files_func: Callable) -> list[str]:
+async def _filter_current_year_reports(bonsai_name: str, bonsai_user_id: str, all_reports: list[str], list_wiki_files_func: Callable) -> list[str]:
     """Returns only reports whose filename starts with the current year, or undated reports."""
     current_year = str(date.today().year)
     slug = bonsai_slug(bonsai_name)
-    paths = list_wiki_files_func(f"users/{bonsai_user_id}/bonsai/{slug}/reports")
+    paths = await list_wiki_files_func(f"users/{bonsai_user_id}/bonsai/{slug}/reports")
     recent_paths = {
         path for path in paths
         if not (match := _YEAR_PREFIX_RE.match(path.split("/")[-1])) or match.group(1) == current_year
@@ -372,7 +372,7 @@ def _filter_current_year_reports(bonsai_name: str, bonsai_user_id: str, all_repo
     return all_reports[-recent_count:] if recent_count else []
 
 
-def _update_plans_index(
+async def _update_plans_index(
     bonsai_name: str,
     slug: str,
     user_id: str,
@@ -382,7 +382,7 @@ def _update_plans_index(
     plans_index_wiki_template,
     write_wiki_page_func: Callable,
 ) -> None:
-    write_wiki_page_func(
+    await write_wiki_page_func(
         path=f"users/{user_id}/bonsai/{slug}/design-plans/index.md",
         content=plans_index_wiki_template.render(
             bonsai_name=bonsai_name,
@@ -51,8 +51,8 @@ def create_evaluate_plan_tool(
         if not active_plan:
             return {"status": "error", "message": "no_active_plan"}
 
-        plan_content = read_wiki_content(active_plan.wiki_path, read_wiki_page_func) if active_plan.wiki_path else ""
-        bonsai_context = load_bonsai_plan_context(
+        plan_content = await read_wiki_content(active_plan.wiki_path, read_wiki_page_func) if active_plan.wiki_path else ""
+        bonsai_context = await load_bonsai_plan_context(
             bonsai=bonsai,
             bonsai_name=bonsai_name,
             list_bonsai_events_func=list_bonsai_events_func,
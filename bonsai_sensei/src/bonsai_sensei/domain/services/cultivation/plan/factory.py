@@ -2,6 +2,8 @@ import os
 from functools import partial
 from typing import Callable
 
+import httpx
+
 from bonsai_sensei.domain import garden
 from bonsai_sensei.domain import herbarium
 from bonsai_sensei.domain import fertilizer_catalog
@@ -47,6 +49,7 @@ from bonsai_sensei.infrastructure.wiki_client import (
 def create_kikaru_group(
     model: object,
     session_factory,
+    wiki_client: httpx.AsyncClient,
     ask_confirmation: Callable,
     ask_human: Callable,
     ask_selection: Callable,
@@ -74,9 +77,9 @@ def create_kikaru_group(
 ):
     effective_orchestrator_model = orchestrator_model or model
     kb_base_url = os.getenv("KB_BASE_URL", "http://knowledge_base:8080")
-    read_wiki_page_func = create_http_read_wiki_page_tool(kb_base_url)
-    write_wiki_page_func = create_http_write_wiki_page_tool(kb_base_url)
-    list_wiki_files_func = create_http_list_wiki_files_tool(kb_base_url)
+    read_wiki_page_func = create_http_read_wiki_page_tool(kb_base_url, wiki_client)
+    write_wiki_page_func = create_http_write_wiki_page_tool(kb_base_url, wiki_client)
+    list_wiki_files_func = create_http_list_wiki_files_tool(kb_base_url, wiki_client)
 
     manage_fertilization_plan_tool = _create_manage_fertilization_plan_tool(
         model=effective_orchestrator_model,
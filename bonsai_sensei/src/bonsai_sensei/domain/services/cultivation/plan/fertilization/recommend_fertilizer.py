@@ -30,26 +30,26 @@ def create_fertilizer_recommender_func(
         events = list_bonsai_events_func(bonsai.id) or []
 
         plan_path = _build_plan_path(bonsai_name, bonsai_user_id)
-        existing_plan_result = read_wiki_page_func(path=plan_path)
+        existing_plan_result = await read_wiki_page_func(path=plan_path)
         existing_plan = existing_plan_result.get("content", "") if existing_plan_result.get("status") == "success" else ""
 
         bonsai_wiki = ""
         if bonsai.wiki_path:
-            bonsai_wiki_result = read_wiki_page_func(path=bonsai.wiki_path)
+            bonsai_wiki_result = await read_wiki_page_func(path=bonsai.wiki_path)
             if bonsai_wiki_result.get("status") == "success":
                 bonsai_wiki = bonsai_wiki_result["content"]
 
         fertilizer_pages = {}
         for fertilizer in fertilizers:
             if fertilizer.wiki_path:
-                page_result = read_wiki_page_func(path=fertilizer.wiki_path)
+                page_result = await read_wiki_page_func(path=fertilizer.wiki_path)
                 if page_result.get("status") == "success":
                     fertilizer_pages[fertilizer.name] = page_result["content"]
 
         context = _build_context(bonsai_name, date.today().isoformat(), events, existing_plan, bonsai_wiki, fertilizers, fertilizer_pages)
         recommendation = await run_recommendation(context)
 
-        write_wiki_page_func(path=plan_path, content=recommendation["wiki_content"])
+        await write_wiki_page_func(path=plan_path, content=recommendation["wiki_content"])
 
         return {
             "status": "success",
@@ -91,7 +91,7 @@ def create_manage_plan_tool(
                 return "error"
 
             existing_plan = get_active_plan_func(bonsai_id=bonsai.id)
-            bonsai_context = load_bonsai_plan_context(
+            bonsai_context = await load_bonsai_plan_context(
                 bonsai=bonsai,
                 bonsai_name=bonsai_name,
                 list_bonsai_events_func=list_bonsai_events_func,
@@ -103,7 +103,7 @@ def create_manage_plan_tool(
             ctx.state["products"] = products
             ctx.state["bonsai_context"] = bonsai_context
             ctx.state["existing_plan"] = existing_plan
-            ctx.state["existing_plan_wiki"] = read_wiki_content(existing_plan.wiki_path, read_wiki_page_func) if existing_plan else ""
+            ctx.state["existing_plan_wiki"] = await read_wiki_content(existing_plan.wiki_path, read_wiki_page_func) if existing_plan else ""
             ctx.route = "ok"
 
         @node
@@ -157,7 +157,7 @@ def create_manage_plan_tool(
                 context=clarification["context"],
                 events=bonsai_context["events"],
                 products=products,
-                product_pages=_load_product_wiki_pages(products, read_wiki_page_func),
+                product_pages=await _load_product_wiki_pages(products, read_wiki_page_func),
                 reports=bonsai_context["reports"],
                 bonsai_wiki_content=bonsai_context["bonsai_wiki_content"],
                 active_design_plan_content=bonsai_context.get("active_design_plan_content", ""),
@@ -189,7 +189,7 @@ def create_manage_plan_tool(
             slug = bonsai_slug(bonsai_name)
 
             if existing_plan:
-                _abandon_existing_plan(existing_plan, delete_future_planned_works_func, update_plan_func, read_wiki_page_func, write_wiki_page_func)
+                await _abandon_existing_plan(existing_plan, delete_future_planned_works_func, update_plan_func, read_wiki_page_func, write_wiki_page_func)
 
             wiki_path = f"users/{bonsai_user_id}/bonsai/{slug}/{wiki_path_prefix}/{start_date[:7]}_to_{end_date[:7]}.md"
             plan = create_plan_func(
@@ -213,7 +213,7 @@ def create_manage_plan_tool(
                 get_product_by_name_func=get_product_by_name_func,
                 create_planned_work_func=create_planned_work_func,
             )
-            write_wiki_page_func(
+            await write_wiki_page_func(
                 path=wiki_path,
                 content=plan_wiki_page_template.render(
                     bonsai_name=bonsai_name,
@@ -225,7 +225,7 @@ def create_manage_plan_tool(
                     entries=entries,
                 ),
             )
-            _update_plans_index(bonsai_name, slug, bonsai_user_id, plan, start_date, end_date, wiki_path_prefix, plans_index_wiki_template, write_wiki_page_func)
+            await _update_plans_index(bonsai_name, slug, bonsai_user_id, plan, start_date, end_date, wiki_path_prefix, plans_index_wiki_template, write_wiki_page_func)
 
             ctx.state["plan_result"] = {
                 "status": "success",
@@ -282,16 +282,16 @@ def create_manage_plan_tool(
     return manage_plan
 
 
-def _load_product_wiki_pages(products: list, read_wiki_page_func: Callable) -> dict:
+async def _load_product_wiki_pages(products: list, read_wiki_page_func: Callable) -> dict:
     return {
         product.name: page["content"]
         for product in products
         if product.wiki_path
-        and (page := read_wiki_page_func(path=product.wiki_path)).get("status") == "success"
+        and (page := await read_wiki_page_func(path=product.wiki_path)).get("status") == "success"
     }
 
 
-def _abandon_existing_plan(
+async def _abandon_existing_plan(
     plan,
     delete_future_planned_works_func: Callable,
     update_plan_func: Callable,
@@ -304,7 +304,7 @@ def _abandon_existing_plan(
     plan.abandonment_reason = "Replaced by new plan"
     plan.abandoned_at = datetime.now(timezone.utc)
     update_plan_func(plan)
-    update_wiki_on_abandon(plan.wiki_path, plan.abandonment_reason, read_wiki_page_func, write_wiki_page_func)
+    await update_wiki_on_abandon(plan.wiki_path, plan.abandonment_reason, read_wiki_page_func, write_wiki_page_func)
 
 
 def _create_planned_works(
@@ -336,7 +336,7 @@ def _create_planned_works(
         )
 
 
-def _update_plans_index(
+async def _update_plans_index(
     bonsai_name: str,
     slug: str,
     user_id: str,
@@ -347,7 +347,7 @@ def _update_plans_index(
     plans_index_wiki_template,
     write_wiki_page_func: Callable,
 ) -> None:
-    write_wiki_page_func(
+    await write_wiki_page_func(
         path=f"users/{user_id}/bonsai/{slug}/{wiki_path_prefix}/index.md",
         content=plans_index_wiki_template.render(
             bonsai_name=bonsai_name,
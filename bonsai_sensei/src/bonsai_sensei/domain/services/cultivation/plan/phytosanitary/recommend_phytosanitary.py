@@ -44,20 +44,20 @@ def create_recommend_phytosanitary_tool(
         events = list_bonsai_events_func(bonsai.id) or []
 
         plan_path = _build_plan_path(bonsai_name, bonsai_user_id)
-        existing_plan_result = read_wiki_page_func(path=plan_path)
+        existing_plan_result = await read_wiki_page_func(path=plan_path)
         existing_plan = existing_plan_result.get("content", "") if existing_plan_result.get("status") == "success" else ""
 
         product_pages = {}
         for product in products:
             if product.wiki_path:
-                page_result = read_wiki_page_func(path=product.wiki_path)
+                page_result = await read_wiki_page_func(path=product.wiki_path)
                 if page_result.get("status") == "success":
                     product_pages[product.name] = page_result["content"]
 
         context = _build_context(bonsai_name, date.today().isoformat(), events, existing_plan, products, product_pages)
         recommendation = await run_recommendation(context)
 
-        write_wiki_page_func(path=plan_path, content=recommendation["wiki_content"])
+        await write_wiki_page_func(path=plan_path, content=recommendation["wiki_content"])
 
         return {
             "status": "success",
@@ -3,6 +3,7 @@ from functools import partial
 from pathlib import Path
 from typing import Callable
 
+import httpx
 from google.adk.agents.llm_agent import LlmAgent
 from google.genai import types
 
@@ -31,6 +32,7 @@ from bonsai_sensei.infrastructure.wiki_client import (
 def create_kiroku_group(
     model: object,
     session_factory,
+    wiki_client: httpx.AsyncClient,
     ask_human: Callable,
     ask_selection: Callable,
     build_bonsai_name_question: Callable,
@@ -42,8 +44,8 @@ def create_kiroku_group(
 ) -> LlmAgent:
     effective_model = orchestrator_model or model
     kb_base_url = os.getenv("KB_BASE_URL", "http://knowledge_base:8080")
-    read_wiki_page_func = create_http_read_wiki_page_tool(kb_base_url)
-    write_wiki_page_func = create_http_write_wiki_page_tool(kb_base_url)
+    read_wiki_page_func = create_http_read_wiki_page_tool(kb_base_url, wiki_client)
+    write_wiki_page_func = create_http_write_wiki_page_tool(kb_base_url, wiki_client)
     photos_root = Path(os.getenv("PHOTOS_PATH", "./photos"))
 
     def get_pending_photo_bytes(user_id: str) -> bytes | None:
@@ -116,7 +118,7 @@ def create_kiroku_group(
         link_recent_photos_func=partial(cultivation_plan.link_recent_photos_to_work, create_session=session_factory),
     )
     close_session_tool = create_close_work_session_tool()
-    search_wiki_tool = create_http_search_wiki_knowledge_tool(kb_base_url)
+    search_wiki_tool = create_http_search_wiki_knowledge_tool(kb_base_url, wiki_client)
     load_memory_tool = _create_load_memory_tool(search_memory_func) if search_memory_func else None
 
     return create_kiroku(
@@ -86,8 +86,8 @@ def create_document_work_session_tool(
             work_slug=work_slug,
             today=today,
         )
-        plan_wiki_content = _load_plan_wiki([work], get_development_plan_func, read_wiki_page_func)
-        bonsai_wiki_content = read_wiki_content(bonsai.wiki_path, read_wiki_page_func) if bonsai and bonsai.wiki_path else ""
+        plan_wiki_content = await _load_plan_wiki([work], get_development_plan_func, read_wiki_page_func)
+        bonsai_wiki_content = await read_wiki_content(bonsai.wiki_path, read_wiki_page_func) if bonsai and bonsai.wiki_path else ""
 
         template = _TEMPLATE_ENV.get_template(template_name)
         rendered = template.render(
@@ -103,7 +103,7 @@ def create_document_work_session_tool(
 
         message = types.Content(role="user", parts=[types.Part(text=rendered)])
         wiki_content = await extract_text_from_events(run_wiki_generator(message))
-        write_wiki_page_func(path=wiki_path, content=wiki_content)
+        await write_wiki_page_func(path=wiki_path, content=wiki_content)
 
         if session_type == SESSION_TYPE_RESULT:
             if update_result_wiki_path_func:
@@ -183,7 +183,7 @@ def _build_wiki_path(
     return f"users/{user_id}/bonsai/{slug}/{wiki_subdir}/{work_slug}-{today}.md"
 
 
-def _load_plan_wiki(
+async def _load_plan_wiki(
     matching_works: list,
     get_development_plan_func: Callable | None,
     read_wiki_page_func: Callable,
@@ -199,4 +199,4 @@ def _load_plan_wiki(
     plan = get_development_plan_func(plan_id=plan_id)
     if not plan:
         return ""
-    return read_wiki_content(plan.wiki_path, read_wiki_page_func)
+    return await read_wiki_content(plan.wiki_path, read_wiki_page_func)
@@ -2,6 +2,8 @@ import os
 from functools import partial
 from typing import Callable
 
+import httpx
+
 from bonsai_sensei.domain import herbarium, pest_catalog
 from bonsai_sensei.domain import user_settings_store
 from bonsai_sensei.domain.services.cultivation.pests.pest_catalog_seeder import create_pest_catalog_seeder
@@ -14,12 +16,13 @@ from bonsai_sensei.domain.services.cultivation.species.scientific_name_searcher
 from bonsai_sensei.domain.services.cultivation.species.scientific_name_translator import translate_to_english
 from bonsai_sensei.domain.services.cultivation.species.species_wiki_compiler import create_species_wiki_compiler
 from bonsai_sensei.domain.services.cultivation.species.tavily_searcher import create_tavily_searcher
-from bonsai_sensei.infrastructure.wiki_client import create_http_read_wiki_page_tool
+from bonsai_sensei.infrastructure.wiki_client import create_http_read_wiki_page_tool, create_http_write_wiki_page_tool
 
 
 def create_botanist_group(
     model: object,
     session_factory,
+    wiki_client: httpx.AsyncClient,
     ask_confirmation: Callable,
     ask_selection: Callable,
     build_create_species_selection_question: Callable,
@@ -35,6 +38,7 @@ def create_botanist_group(
     botanist = _create_botanist(
         model=model,
         session_factory=session_factory,
+        wiki_client=wiki_client,
         ask_confirmation=ask_confirmation,
         ask_selection=ask_selection,
         build_create_species_selection_question=build_create_species_selection_question,
@@ -50,7 +54,7 @@ def create_botanist_group(
     return botanist
 
 
-def _create_botanist(model, session_factory, ask_confirmation, ask_selection, build_create_species_selection_question, build_create_species_confirmation, build_delete_species_confirmation, build_update_species_confirmation, build_refresh_species_wiki_confirmation, build_create_pest_confirmation, build_delete_pest_confirmation, orchestrator_model=None, register_background_task=None):
+def _create_botanist(model, session_factory, wiki_client, ask_confirmation, ask_selection, build_create_species_selection_question, build_create_species_confirmation, build_delete_species_confirmation, build_update_species_confirmation, build_refresh_species_wiki_confirmation, build_create_pest_confirmation, build_delete_pest_confirmation, orchestrator_model=None, register_background_task=None):
     effective_orchestrator_model = orchestrator_model or model
     get_species_by_name_func = partial(herbarium.get_species_by_name, create_session=session_factory)
     search_species_func = partial(herbarium.search_species_by_name, create_session=session_factory)
@@ -63,15 +67,19 @@ def _create_botanist(model, session_factory, ask_confirmation, ask_selection, bu
 
     tavily_base_url = os.getenv("TAVILY_API_BASE")
     kb_base_url = os.getenv("KB_BASE_URL", "http://knowledge_base:8080")
+    read_wiki_page_tool = create_http_read_wiki_page_tool(kb_base_url, wiki_client)
+    write_wiki_page_tool = create_http_write_wiki_page_tool(kb_base_url, wiki_client)
     tavily_searcher = create_tavily_searcher(os.getenv("TAVILY_API_KEY"), tavily_base_url)
     wiki_page_builder = create_species_wiki_compiler(
         model=effective_orchestrator_model,
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_tool,
+        write_wiki_page_func=write_wiki_page_tool,
         searcher=tavily_searcher,
     )
     compile_pest_page = create_pest_wiki_compiler(
         model=effective_orchestrator_model,
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_tool,
+        write_wiki_page_func=write_wiki_page_tool,
         searcher=tavily_searcher,
     )
     pest_catalog_seeder = create_pest_catalog_seeder(
@@ -81,7 +89,6 @@ def _create_botanist(model, session_factory, ask_confirmation, ask_selection, bu
         create_pest_func=partial(pest_catalog.create_pest, create_session=session_factory),
         get_pest_by_name_func=partial(pest_catalog.get_pest_by_name, create_session=session_factory),
     )
-    read_wiki_page_tool = create_http_read_wiki_page_tool(kb_base_url)
 
     return create_botanist(
         model=model,
@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+FROST_TEMPERATURE_C = 0.0
+FROST_CHANCE_PERCENT = 50
+HEAT_STRESS_TEMPERATURE_C = 32.0
+RAIN_CHANCE_PERCENT = 60
+RAIN_PRECIPITATION_MM = 1.0
+STRONG_WIND_KMH = 40.0
+SPRAY_DRY_HOURS = 6
+SPRAY_MAX_WIND_KMH = 15.0
+SPRAY_TEMPERATURE_RANGE_C = (5.0, 30.0)
+
+# wttr.in's j1 format reports every day in eight 3-hour slots.
+SLOT = np.timedelta64(3, "h")
+
+
+@dataclass(frozen=True)
+class HourlyForecast:
+    """Forecast variables over the whole horizon, one element per wttr.in time slot (3-hourly)."""
+
+    times: np.ndarray
+    temperature_c: np.ndarray
+    frost_chance: np.ndarray
+    precipitation_mm: np.ndarray
+    rain_chance: np.ndarray
+    wind_kmh: np.ndarray
+    humidity: np.ndarray
+
+
+@dataclass(frozen=True)
+class DailyForecast:
+    day: date
+    min_temp_c: float
+    max_temp_c: float
+
+
+@dataclass(frozen=True)
+class Forecast:
+    location: str
+    description: str
+    temperature_c: float
+    observed_at: datetime | None
+    days: list[DailyForecast]
+    hourly: HourlyForecast
+
+
+@dataclass(frozen=True)
+class RiskWindow:
+    start: datetime
+    end: datetime
+    extreme: float
+
+
+@dataclass(frozen=True)
+class WeatherRisks:
+    """Risk windows from the current observation to the end of the forecast horizon.
+
+    extreme is the lowest temperature of a frost window, the highest of a heat window,
+    the largest precipitation of a rain window and the strongest wind of a wind window.
+    spray_window is the first slot with calm, mild weather and no rain for SPRAY_DRY_HOURS.
+    """
+
+    frost: list[RiskWindow]
+    heat: list[RiskWindow]
+    rain: list[RiskWindow]
+    wind: list[RiskWindow]
+    spray_window: datetime | None
+
+
+def parse_forecast(location: str, data: dict) -> Forecast:
+    """Build a typed forecast from wttr.in's j1 JSON, covering every day it returns."""
+    current = data["current_condition"][0]
+    days = []
+    rows = []
+    for day_index, weather_day in enumerate(data["weather"]):
+        day = _parse_date(weather_day.get("date")) or date.today() + timedelta(days=day_index)
+        days.append(DailyForecast(day, float(weather_day["mintempC"]), float(weather_day["maxtempC"])))
+        for hour in weather_day["hourly"]:
+            minutes = int(hour["time"])
+            rows.append((
+                np.datetime64(day, "m") + np.timedelta64(minutes // 100 * 60 + minutes % 100, "m"),
+                float(hour["tempC"]),
+                int(hour.get("chanceoffrost", "0")),
+                float(hour.get("precipMM", "0")),
+                int(hour.get("chanceofrain", "0")),
+                float(hour.get("windspeedKmph", "0")),
+                int(hour.get("humidity", "0")),
+            ))
+    times, temperature, frost, precipitation, rain, wind, humidity = zip(*rows) if rows else ([],) * 7
+    return Forecast(
+        location=location,
+        description=current["weatherDesc"][0]["value"],
+        temperature_c=float(current["temp_C"]),
+        observed_at=_parse_observation_time(current.get("localObsDateTime")),
+        days=days,
+        hourly=HourlyForecast(
+            times=np.array(times, dtype="datetime64[m]"),
+            temperature_c=np.array(temperature, dtype=np.float32),
+            frost_chance=np.array(frost, dtype=np.int16),
+            precipitation_mm=np.array(precipitation, dtype=np.float32),
+            rain_chance=np.array(rain, dtype=np.int16),
+            wind_kmh=np.array(wind, dtype=np.float32),
+            humidity=np.array(humidity, dtype=np.int16),
+        ),
+    )
+
+
+def assess_risks(forecast: Forecast) -> WeatherRisks:
+    hourly = forecast.hourly
+    upcoming = np.ones(len(hourly.times), dtype=bool)
+    if forecast.observed_at is not None:
+        upcoming = hourly.times + SLOT > np.datetime64(forecast.observed_at, "m")
+
+    frost = upcoming & ((hourly.temperature_c <= FROST_TEMPERATURE_C) | (hourly.frost_chance >= FROST_CHANCE_PERCENT))
+    heat = upcoming & (hourly.temperature_c >= HEAT_STRESS_TEMPERATURE_C)
+    rain = upcoming & (
+        (hourly.rain_chance >= RAIN_CHANCE_PERCENT) | (hourly.precipitation_mm >= RAIN_PRECIPITATION_MM)
+    )
+    wind = upcoming & (hourly.wind_kmh >= STRONG_WIND_KMH)
+
+    dry = (hourly.precipitation_mm < 0.1) & (hourly.rain_chance < RAIN_CHANCE_PERCENT // 2)
+    slots_ahead = int(np.ceil(np.timedelta64(SPRAY_DRY_HOURS, "h") / SLOT))
+    dry_ahead = np.lib.stride_tricks.sliding_window_view(
+        np.concatenate([dry, np.zeros(slots_ahead, dtype=bool)]), slots_ahead + 1
+    )[:len(dry)].all(axis=1)
+    low, high = SPRAY_TEMPERATURE_RANGE_C
+    sprayable = upcoming & dry_ahead & (hourly.wind_kmh <= SPRAY_MAX_WIND_KMH) & (
+        (hourly.temperature_c >= low) & (hourly.temperature_c <= high)
+    )
+    spray_slots = np.flatnonzero(sprayable)
+
+    return WeatherRisks(
+        frost=_windows(frost, hourly.times, hourly.temperature_c, np.minimum),
+        heat=_windows(heat, hourly.times, hourly.temperature_c, np.maximum),
+        rain=_windows(rain, hourly.times, hourly.precipitation_mm, np.maximum),
+        wind=_windows(wind, hourly.times, hourly.wind_kmh, np.maximum),
+        spray_window=_to_datetime(hourly.times[spray_slots[0]]) if len(spray_slots) else None,
+    )
+
+
+def format_risk_summary(risks: WeatherRisks) -> str:
+    """One compact line per risk, meant for prompts."""
+    lines = [
+        _format_windows("Frost", risks.frost, "min {:.0f}°C"),
+        _format_windows("Heat stress", risks.heat, "max {:.0f}°C"),
+        _format_windows("Rain", risks.rain, "up to {:.1f} mm"),
+        _format_windows("Strong wind", risks.wind, "up to {:.0f} km/h"),
+    ]
+    spray = _format_time(risks.spray_window) if risks.spray_window else "none in the forecast"
+    lines.append(f"Next spray window ({SPRAY_DRY_HOURS}h dry, calm): {spray}")
+    return "\n".join(lines)
+
+
+def _windows(mask: np.ndarray, times: np.ndarray, values: np.ndarray, reduce) -> list[RiskWindow]:
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return []
+    neutral = np.inf if reduce is np.minimum else -np.inf
+    extremes = reduce.reduceat(np.where(mask, values, neutral), starts)
+    return [
+        RiskWindow(_to_datetime(times[start]), _to_datetime(times[end - 1] + SLOT), float(extreme))
+        for start, end, extreme in zip(starts, ends, extremes)
+    ]
+
+
+def _format_windows(label: str, windows: list[RiskWindow], extreme_format: str) -> str:
+    if not windows:
+        return f"{label}: none"
+    spans = ", ".join(
+        f"{_format_time(window.start)}-{window.end:%H:%M} ({extreme_format.format(window.extreme)})"
+        for window in windows
+    )
+    return f"{label}: {spans}"
+
+
+def _format_time(moment: datetime) -> str:
+    return f"{moment:%d/%m %H:%M}"
+
+
+def _to_datetime(moment: np.datetime64) -> datetime:
+    return moment.astype("datetime64[m]").astype(datetime)
+
+
+def _parse_date(value: str | None) -> date | None:
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _parse_observation_time(value: str | None) -> datetime | None:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %I:%M %p") if value else None
+    except ValueError:
+        return None
@@ -1,12 +1,132 @@
+import asyncio
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Awaitable, Callable, Iterable
+
 import httpx
 from bonsai_sensei.logging_config import get_logger
+from bonsai_sensei.domain.services.cultivation.weather.forecast import (
+    assess_risks,
+    format_risk_summary,
+    parse_forecast,
+)
 from bonsai_sensei.domain.services.tool_limiter import limit_tool_calls
 from bonsai_sensei.domain.services.tool_tracer import trace_tool_call
+from bonsai_sensei.metrics import WEATHER_CACHE_LOOKUPS_TOTAL
 
 logger = get_logger(__name__)
 
+WEATHER_CACHE_TTL_SECONDS = float(os.getenv("WEATHER_CACHE_TTL_SECONDS", str(3600)))
+WEATHER_CACHE_STALE_SECONDS = float(os.getenv("WEATHER_CACHE_STALE_SECONDS", str(6 * 3600)))
+WEATHER_CACHE_SIZE = int(os.getenv("WEATHER_CACHE_SIZE", "1024"))
+WEATHER_PREFETCH_CONCURRENCY = int(os.getenv("WEATHER_PREFETCH_CONCURRENCY", "4"))
+
+
+class ForecastCache:
+    """Forecasts keyed by (base_url, normalized location); build one per process and share its get.
+
+    An entry is served as is for ttl_seconds. For stale_seconds after that it is still
+    served, while one background request refreshes it (stale-while-revalidate). Concurrent
+    requests for a location that is not cached share a single fetch. Failed fetches are
+    not cached, so the next request tries again. A ttl_seconds of 0 disables caching.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str], Awaitable[dict | None]],
+        ttl_seconds: float = WEATHER_CACHE_TTL_SECONDS,
+        stale_seconds: float = WEATHER_CACHE_STALE_SECONDS,
+        max_entries: int = WEATHER_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fetch = fetch
+        self._ttl_seconds = ttl_seconds
+        self._stale_seconds = stale_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+        self._in_flight: dict[tuple[str, str], asyncio.Future] = {}
+
+    async def get(self, location: str, base_url: str) -> dict | None:
+        if self._ttl_seconds <= 0:
+            return await self._fetch(location, base_url)
+        key = (base_url.rstrip("/"), normalize_location(location))
+        cached = self._entries.get(key)
+        if cached is not None:
+            age = self._clock() - cached[0]
+            if age < self._ttl_seconds:
+                WEATHER_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc()
+                self._entries.move_to_end(key)
+                return cached[1]
+            if age < self._ttl_seconds + self._stale_seconds:
+                WEATHER_CACHE_LOOKUPS_TOTAL.labels(result="stale").inc()
+                if key not in self._in_flight:
+                    self._start_fetch(key, location, base_url).add_done_callback(_log_refresh_failure)
+                return cached[1]
+        if key in self._in_flight:
+            WEATHER_CACHE_LOOKUPS_TOTAL.labels(result="coalesced").inc()
+            return await asyncio.shield(self._in_flight[key])
+        WEATHER_CACHE_LOOKUPS_TOTAL.labels(result="miss").inc()
+        return await asyncio.shield(self._start_fetch(key, location, base_url))
+
+    async def refresh(self, location: str, base_url: str) -> dict | None:
+        """Fetch location now and cache the result, joining a fetch already in flight."""
+        key = (base_url.rstrip("/"), normalize_location(location))
+        in_flight = self._in_flight.get(key) or self._start_fetch(key, location, base_url)
+        return await asyncio.shield(in_flight)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _start_fetch(self, key: tuple[str, str], location: str, base_url: str) -> asyncio.Future:
+        task = asyncio.ensure_future(self._fetch_and_store(key, location, base_url))
+        self._in_flight[key] = task
+        return task
+
+    async def _fetch_and_store(self, key: tuple[str, str], location: str, base_url: str) -> dict | None:
+        try:
+            data = await self._fetch(location, base_url)
+            if data is not None and self._max_entries > 0:
+                self._entries[key] = (self._clock(), data)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+            return data
+        finally:
+            self._in_flight.pop(key, None)
+
+
+def normalize_location(location: str) -> str:
+    normalized = unicodedata.normalize("NFC", location).strip().casefold()
+    return re.sub(r"\s+", " ", re.sub(r"\s*,\s*", ",", normalized))
+
+
+def _log_refresh_failure(task: asyncio.Future) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background weather refresh failed: %s", task.exception())
+
 
-def create_weather_tool(base_url: str):
+async def _request_weather_data(location: str, base_url: str) -> dict | None:
+    url = f"{base_url.rstrip('/')}/{location}?format=j1"
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        response = await client.get(url)
+        if response.status_code == 200:
+            return response.json()
+
+    return None
+
+
+def create_forecast_cache() -> ForecastCache:
+    return ForecastCache(_request_weather_data)
+
+
+def create_weather_tool(
+    base_url: str,
+    fetch_forecast_func: Callable[[str, str], Awaitable[dict | None]] = _request_weather_data,
+):
     @trace_tool_call
     @limit_tool_calls(agent_name="weather_advisor")
     async def get_weather(location: str) -> dict:
@@ -25,7 +145,7 @@ def create_weather_tool(base_url: str):
             }
 
         try:
-            data = await _fetch_weather_data(location, base_url)
+            data = await fetch_forecast_func(location, base_url)
             if data:
                 result = _format_weather_report(location, data)
                 logger.info("Weather result: %s", result.get("summary"))
@@ -66,46 +186,55 @@ async def get_weather(location: str) -> dict:
     return await create_weather_tool("https://wttr.in")(location)
 
 
-async def fetch_weather(location: str, base_url: str = "https://wttr.in") -> dict:
+async def fetch_weather(
+    location: str,
+    base_url: str = "https://wttr.in",
+    fetch_forecast_func: Callable[[str, str], Awaitable[dict | None]] = _request_weather_data,
+) -> dict:
     """Fetch weather data for a location without ADK tool decorators."""
-    data = await _fetch_weather_data(location, base_url)
+    data = await fetch_forecast_func(location, base_url)
     if data:
         return {"status": "success", "result": _format_weather_report(location, data)}
     return {"status": "error", "message": f"Could not fetch weather for {location}."}
 
 
-async def _fetch_weather_data(location: str, base_url: str) -> dict | None:
-    url = f"{base_url.rstrip('/')}/{location}?format=j1"
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url)
-        if response.status_code == 200:
-            return response.json()
+async def prefetch_forecasts(
+    forecast_cache: ForecastCache,
+    locations: Iterable[str],
+    base_url: str = "https://wttr.in",
+    concurrency: int = WEATHER_PREFETCH_CONCURRENCY,
+) -> int:
+    """Refresh the cached forecast of every distinct location. Returns how many were fetched.
 
-    return None
-
-
-def _extract_hourly_data(weather_today: dict) -> tuple[str, int]:
-    """Parses hourly data to extract formatted string and max frost risk."""
-    hourly_info = []
-    max_frost_chance = 0
-
-    for hour in weather_today["hourly"]:
-        time_str = hour["time"].zfill(4)
-        formatted_time = f"{time_str[:2]}:{time_str[2:]}"
-        temp = hour["tempC"]
-        frost_chance = int(hour.get("chanceoffrost", "0"))
-
-        if frost_chance > max_frost_chance:
-            max_frost_chance = frost_chance
+    Run before batch jobs such as mimamori so their weather lookups are cache hits.
+    At most concurrency requests are sent at once to stay under wttr.in rate limits.
+    """
+    distinct_locations: dict[str, str] = {}
+    for location in locations:
+        if location:
+            distinct_locations.setdefault(normalize_location(location), location)
+    semaphore = asyncio.Semaphore(concurrency)
 
-        frost_str = f", Frost chance: {frost_chance}%" if frost_chance > 0 else ""
-        hourly_info.append(f"{formatted_time}h: {temp}°C{frost_str}")
+    async def refresh(location: str) -> bool:
+        async with semaphore:
+            try:
+                return await forecast_cache.refresh(location, base_url) is not None
+            except httpx.RequestError as exc:
+                logger.warning("Weather prefetch failed for location '%s': %s", location, exc)
+                return False
 
-    return "; ".join(hourly_info), max_frost_chance
+    results = await asyncio.gather(*(refresh(location) for location in distinct_locations.values()))
+    logger.info("Prefetched weather for %d of %d locations", sum(results), len(results))
+    return sum(results)
 
 
 def _format_weather_report(location: str, data: dict) -> dict:
-    """Formats the raw JSON data into a structured JSON payload."""
+    """Formats the raw JSON data into a structured JSON payload.
+
+    The summary carries today's conditions, the daily range over the forecast horizon
+    and precomputed risk windows instead of every hourly reading. max_frost_chance stays
+    today's, next to today's min/max; the frost windows cover the following days.
+    """
     current = data["current_condition"][0]
     weather_today = data["weather"][0]
 
@@ -114,19 +243,26 @@ def _format_weather_report(location: str, data: dict) -> dict:
     min_temp = weather_today["mintempC"]
     max_temp = weather_today["maxtempC"]
 
-    hourly_str, max_frost_chance = _extract_hourly_data(weather_today)
+    max_frost_chance = max((int(hour.get("chanceoffrost", "0")) for hour in weather_today["hourly"]), default=0)
+
+    forecast = parse_forecast(location, data)
+    risks = assess_risks(forecast)
 
     frost_warning = (
         f" WARNING: High risk of frost ({max_frost_chance}%)."
         if max_frost_chance > 50
         else ""
     )
+    daily_ranges = "; ".join(
+        f"{day.day:%d/%m} {day.min_temp_c:.0f}..{day.max_temp_c:.0f}°C" for day in forecast.days
+    )
 
     summary = (
         f"Weather in {location}: Current: {desc}, {current_temp}°C. "
         f"Min/Max: {min_temp}°C/{max_temp}°C. "
-        f"Max Frost Chance: {max_frost_chance}%.{frost_warning} "
-        f"Hourly: {hourly_str}"
+        f"Max Frost Chance: {max_frost_chance}%.{frost_warning}\n"
+        f"Days: {daily_ranges}\n"
+        f"{format_risk_summary(risks)}"
     )
     return {
         "location": location,
@@ -137,6 +273,5 @@ def _format_weather_report(location: str, data: dict) -> dict:
         "min_temp_c": min_temp,
         "max_temp_c": max_temp,
         "max_frost_chance": max_frost_chance,
-        "hourly": hourly_str,
         "summary": summary,
     }
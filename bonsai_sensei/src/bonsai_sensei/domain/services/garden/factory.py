@@ -1,5 +1,7 @@
 from typing import Callable
 
+import httpx
+
 from bonsai_sensei.domain.services.garden.nursery.factory import create_nursery_group
 from bonsai_sensei.domain.services.garden.caretaker.factory import create_caretaker_group
 from bonsai_sensei.domain.services.garden.gallery.factory import create_gallery_group
@@ -8,8 +10,10 @@ from bonsai_sensei.domain.services.garden.gallery.factory import create_gallery_
 def create_gardener_group(
     model: object,
     session_factory,
+    wiki_client: httpx.AsyncClient,
     ask_confirmation: Callable,
     ask_selection: Callable,
+    warm_thumbnail_func: Callable,
     build_create_bonsai_confirmation: Callable,
     build_delete_bonsai_confirmation: Callable,
     build_update_bonsai_confirmation: Callable,
@@ -31,6 +35,7 @@ def create_gardener_group(
     nursery = create_nursery_group(
         model=model,
         session_factory=session_factory,
+        wiki_client=wiki_client,
         ask_confirmation=ask_confirmation,
         ask_selection=ask_selection,
         build_create_bonsai_confirmation=build_create_bonsai_confirmation,
@@ -56,6 +61,7 @@ def create_gardener_group(
         session_factory=session_factory,
         ask_confirmation=ask_confirmation,
         ask_selection=ask_selection,
+        warm_thumbnail_func=warm_thumbnail_func,
         build_add_bonsai_photo_selection_question=build_add_bonsai_photo_selection_question,
         build_add_bonsai_photo_confirmation=build_add_bonsai_photo_confirmation,
         build_delete_bonsai_photo_selection_question=build_delete_bonsai_photo_selection_question,
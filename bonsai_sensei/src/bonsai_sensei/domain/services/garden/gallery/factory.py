@@ -16,6 +16,7 @@ def create_gallery_group(
     session_factory,
     ask_confirmation: Callable,
     ask_selection: Callable,
+    warm_thumbnail_func: Callable,
     build_add_bonsai_photo_selection_question: Callable = None,
     build_add_bonsai_photo_confirmation: Callable = None,
     build_delete_bonsai_photo_selection_question: Callable = None,
@@ -37,6 +38,7 @@ def create_gallery_group(
         bonsai_dir.mkdir(parents=True, exist_ok=True)
         file_name = f"{date.today().isoformat()}_{uuid.uuid4().hex[:8]}.webp"
         (bonsai_dir / file_name).write_bytes(photo_bytes)
+        warm_thumbnail_func(str(bonsai_dir / file_name))
         return f"{user_id}/{safe_name}/{file_name}"
 
     def get_pending_photo_bytes(user_id: str) -> bytes | None:
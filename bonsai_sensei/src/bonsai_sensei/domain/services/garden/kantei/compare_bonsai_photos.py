@@ -87,7 +87,7 @@ def create_compare_bonsai_photos_tool(
         bonsai_user_id = bonsai.user_id or "default"
         report_path = f"users/{bonsai_user_id}/bonsai/{slug}/reports/{newer_photo.taken_on}-comparison.md"
         report_content = f"[[{older_photo.file_path}|Foto anterior]] · [[{newer_photo.file_path}|Foto reciente]]\n\n{comparison}"
-        write_wiki_page_func(path=report_path, content=report_content)
+        await write_wiki_page_func(path=report_path, content=report_content)
         await update_reports_index_func(bonsai_name, user_id=bonsai_user_id)
 
         return {
@@ -3,6 +3,8 @@ from functools import partial
 from pathlib import Path
 from typing import Callable
 
+import httpx
+
 from bonsai_sensei.domain import bonsai_photo_store
 from bonsai_sensei.domain import garden
 from bonsai_sensei.domain.services.garden.kantei.analyze_bonsai_photo import create_analyze_bonsai_photo_tool
@@ -26,7 +28,7 @@ COMPARE_TOOL_DESCRIPTION = (
 )
 
 
-def create_kantei_group(model: object, session_factory, orchestrator_model: object = None, kb_base_url: str = "") -> tuple[Callable, Callable]:
+def create_kantei_group(model: object, session_factory, wiki_client: httpx.AsyncClient, orchestrator_model: object = None, kb_base_url: str = "") -> tuple[Callable, Callable]:
     effective_orchestrator_model = orchestrator_model or model
     get_bonsai_by_name_func = partial(garden.get_bonsai_by_name, create_session=session_factory)
     list_bonsai_photos_func = partial(bonsai_photo_store.list_bonsai_photos, create_session=session_factory)
@@ -39,14 +41,14 @@ def create_kantei_group(model: object, session_factory, orchestrator_model: obje
         return full_path.read_bytes()
 
     kb_base_url = os.getenv("KB_BASE_URL", "http://knowledge_base:8080")
-    write_wiki_page_tool = create_http_write_wiki_page_tool(kb_base_url)
-    list_wiki_files_func = create_http_list_wiki_files_tool(kb_base_url)
+    write_wiki_page_tool = create_http_write_wiki_page_tool(kb_base_url, wiki_client)
+    list_wiki_files_func = create_http_list_wiki_files_tool(kb_base_url, wiki_client)
     update_reports_index_tool = create_update_bonsai_reports_index_tool(
         list_wiki_files_func=list_wiki_files_func,
         write_wiki_page_func=write_wiki_page_tool,
     )
 
-    search_wiki_knowledge = create_http_search_wiki_knowledge_tool(kb_base_url) if kb_base_url else None
+    search_wiki_knowledge = create_http_search_wiki_knowledge_tool(kb_base_url, wiki_client) if kb_base_url else None
     run_photo_analysis = create_photo_analysis_runner(effective_orchestrator_model, search_wiki_knowledge=search_wiki_knowledge)
     run_photo_comparison = create_photo_comparison_runner(effective_orchestrator_model)
 
@@ -30,14 +30,14 @@ def create_update_bonsai_reports_index_tool(
             {"status": "success"} always.
         """
         slug = re.sub(r"[^a-z0-9]+", "-", bonsai_name.lower()).strip("-")
-        paths = list_wiki_files_func(f"users/{user_id}/bonsai/{slug}/reports")
+        paths = await list_wiki_files_func(f"users/{user_id}/bonsai/{slug}/reports")
         report_files = [path for path in paths if not path.endswith("index.md")]
         reports = sorted(
             filter(None, (_parse_report(path) for path in report_files)),
             key=lambda report: report["date"],
             reverse=True,
         )
-        write_wiki_page_func(
+        await write_wiki_page_func(
             path=f"users/{user_id}/bonsai/{slug}/reports/index.md",
             content=REPORTS_INDEX_WIKI.render(bonsai_name=bonsai_name, reports=reports),
         )
@@ -53,7 +53,7 @@ async def execute_create_bonsai(
         effective_user_id = user_id or "default"
         wiki_path = build_bonsai_wiki_path(name, effective_user_id)
         index_content = build_bonsai_index_page(name, species.name, species.wiki_path, effective_user_id)
-        write_wiki_page_func(path=wiki_path, content=index_content)
+        await write_wiki_page_func(path=wiki_path, content=index_content)
         create_bonsai_func(bonsai=Bonsai(name=name, species_id=species.id, wiki_path=wiki_path, user_id=user_id))
         return {"status": "success", "message": f"Bonsai '{name}' created.", "species_name": species.name}
 
@@ -2,6 +2,8 @@ import os
 from functools import partial
 from typing import Callable
 
+import httpx
+
 from bonsai_sensei.domain import garden
 from bonsai_sensei.domain import herbarium
 from bonsai_sensei.domain.services.garden.nursery.nursery import create_nursery
@@ -11,6 +13,7 @@ from bonsai_sensei.infrastructure.wiki_client import create_http_write_wiki_page
 def create_nursery_group(
     model: object,
     session_factory,
+    wiki_client: httpx.AsyncClient,
     ask_confirmation: Callable,
     ask_selection: Callable,
     build_create_bonsai_confirmation: Callable,
@@ -26,7 +29,7 @@ def create_nursery_group(
     list_species_func = partial(herbarium.list_species, create_session=session_factory)
     get_species_by_name_func = partial(herbarium.get_species_by_name, create_session=session_factory)
     kb_base_url = os.getenv("KB_BASE_URL", "http://knowledge_base:8080")
-    write_wiki_page_func = create_http_write_wiki_page_tool(kb_base_url)
+    write_wiki_page_func = create_http_write_wiki_page_tool(kb_base_url, wiki_client)
 
     return create_nursery(
         model=model,
@@ -2,7 +2,10 @@ import uuid
 from collections.abc import AsyncGenerator, Callable, Sequence
 
 from google.adk.agents.llm_agent import Agent
-from google.adk.runners import InMemoryRunner, RunConfig
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.memory import InMemoryMemoryService
+from google.adk.runners import RunConfig, Runner
+from google.adk.sessions import BaseSessionService, InMemorySessionService
 from google.genai import types
 
 
@@ -12,21 +15,34 @@ def create_single_turn_llm_runner(
     instruction: str,
     tools: Sequence[Callable] = (),
     max_llm_calls: int = 10,
+    session_service: BaseSessionService | None = None,
 ) -> Callable[[types.Content], AsyncGenerator]:
+    """Build the agent and runner once; each call runs in a throwaway session deleted afterwards."""
     agent = Agent(model=model, name=app_name, instruction=instruction, tools=list(tools))
-    runner = InMemoryRunner(agent=agent, app_name=app_name)
+    runner = Runner(
+        app_name=app_name,
+        agent=agent,
+        artifact_service=InMemoryArtifactService(),
+        session_service=session_service or InMemorySessionService(),
+        memory_service=InMemoryMemoryService(),
+    )
 
     async def run(message: types.Content) -> AsyncGenerator:
         session_id = str(uuid.uuid4())
         await runner.session_service.create_session(
             app_name=app_name, user_id=app_name, session_id=session_id
         )
-        async for event in runner.run_async(
-            user_id=app_name,
-            session_id=session_id,
-            new_message=message,
-            run_config=RunConfig(max_llm_calls=max_llm_calls),
-        ):
-            yield event
+        try:
+            async for event in runner.run_async(
+                user_id=app_name,
+                session_id=session_id,
+                new_message=message,
+                run_config=RunConfig(max_llm_calls=max_llm_calls),
+            ):
+                yield event
+        finally:
+            await runner.session_service.delete_session(
+                app_name=app_name, user_id=app_name, session_id=session_id
+            )
 
     return run
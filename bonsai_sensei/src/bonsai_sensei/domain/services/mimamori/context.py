@@ -32,38 +32,81 @@ def build_bonsai_snapshots(
     for bonsai in bonsais:
         events = list_bonsai_events_func(bonsai_id=bonsai.id)
         last_event = events[-1] if events else None
-        dev_plan = get_active_development_plan_func(bonsai_id=bonsai.id)
-        fert_plan = get_active_fertilization_plan_func(bonsai_id=bonsai.id)
-        fertilization_outdated = (
-            dev_plan is not None
-            and fert_plan is not None
-            and dev_plan.created_at > fert_plan.created_at
-        )
-        unlinked_pests = get_recent_unlinked_pest_events_func(bonsai_id=bonsai.id, hours=720)
-        abandoned_fert = get_recently_abandoned_fertilization_plans_func(bonsai_id=bonsai.id)
-        abandoned_dev = get_recently_abandoned_development_plans_func(bonsai_id=bonsai.id)
-        plans_pending_recreation = (
-            (["fertilization"] if abandoned_fert else [])
-            + (["design"] if abandoned_dev else [])
-        )
-        snapshots.append({
-            "name": bonsai.name,
-            "species_name": species_map.get(bonsai.species_id, "Especie desconocida"),
-            "development_phase": dev_plan.current_phase if dev_plan else None,
-            "design_goal": dev_plan.design_goal if dev_plan else None,
-            "last_event_type": last_event["event_type"] if last_event else None,
-            "last_event_date": last_event["occurred_at"][:10] if last_event else None,
-            "fertilization_outdated": fertilization_outdated,
-            "fertilization_plan_goal": fert_plan.goal if fert_plan and fertilization_outdated else None,
-            "current_design_goal": dev_plan.design_goal if dev_plan and fertilization_outdated else None,
-            "unlinked_pest_names": [event.payload.get("pest_name") for event in unlinked_pests],
-            "fertilization_at_risk": bool(unlinked_pests) and fert_plan is not None,
-            "design_at_risk": bool(unlinked_pests) and dev_plan is not None,
-            "plans_pending_recreation": plans_pending_recreation,
-        })
+        snapshots.append(_build_snapshot(
+            bonsai,
+            species_map,
+            last_event_type=last_event["event_type"] if last_event else None,
+            last_event_date=last_event["occurred_at"][:10] if last_event else None,
+            dev_plan=get_active_development_plan_func(bonsai_id=bonsai.id),
+            fert_plan=get_active_fertilization_plan_func(bonsai_id=bonsai.id),
+            unlinked_pests=get_recent_unlinked_pest_events_func(bonsai_id=bonsai.id, hours=720),
+            has_abandoned_fert=bool(get_recently_abandoned_fertilization_plans_func(bonsai_id=bonsai.id)),
+            has_abandoned_dev=bool(get_recently_abandoned_development_plans_func(bonsai_id=bonsai.id)),
+        ))
     return snapshots
 
 
+def build_bonsai_snapshots_batched(
+    bonsais,
+    species_map: dict,
+    load_bonsai_snapshot_data_func: Callable,
+) -> list[dict]:
+    snapshot_data = load_bonsai_snapshot_data_func(bonsai_ids=[bonsai.id for bonsai in bonsais])
+    snapshots = []
+    for bonsai in bonsais:
+        data = snapshot_data[bonsai.id]
+        last_event = data["last_event"]
+        snapshots.append(_build_snapshot(
+            bonsai,
+            species_map,
+            last_event_type=last_event.event_type if last_event else None,
+            last_event_date=last_event.occurred_at.isoformat()[:10] if last_event else None,
+            dev_plan=data["active_development_plan"],
+            fert_plan=data["active_fertilization_plan"],
+            unlinked_pests=data["unlinked_pest_events"],
+            has_abandoned_fert=data["has_abandoned_fertilization_plan"],
+            has_abandoned_dev=data["has_abandoned_development_plan"],
+        ))
+    return snapshots
+
+
+def _build_snapshot(
+    bonsai,
+    species_map: dict,
+    last_event_type: str | None,
+    last_event_date: str | None,
+    dev_plan,
+    fert_plan,
+    unlinked_pests: list,
+    has_abandoned_fert: bool,
+    has_abandoned_dev: bool,
+) -> dict:
+    fertilization_outdated = (
+        dev_plan is not None
+        and fert_plan is not None
+        and dev_plan.created_at > fert_plan.created_at
+    )
+    plans_pending_recreation = (
+        (["fertilization"] if has_abandoned_fert else [])
+        + (["design"] if has_abandoned_dev else [])
+    )
+    return {
+        "name": bonsai.name,
+        "species_name": species_map.get(bonsai.species_id, "Especie desconocida"),
+        "development_phase": dev_plan.current_phase if dev_plan else None,
+        "design_goal": dev_plan.design_goal if dev_plan else None,
+        "last_event_type": last_event_type,
+        "last_event_date": last_event_date,
+        "fertilization_outdated": fertilization_outdated,
+        "fertilization_plan_goal": fert_plan.goal if fert_plan and fertilization_outdated else None,
+        "current_design_goal": dev_plan.design_goal if dev_plan and fertilization_outdated else None,
+        "unlinked_pest_names": [event.payload.get("pest_name") for event in unlinked_pests],
+        "fertilization_at_risk": bool(unlinked_pests) and fert_plan is not None,
+        "design_at_risk": bool(unlinked_pests) and dev_plan is not None,
+        "plans_pending_recreation": plans_pending_recreation,
+    }
+
+
 def build_work_summaries(planned_works, bonsai_map: dict) -> list[dict]:
     return [
         {
@@ -1,12 +1,18 @@
+import asyncio
 import json
+import os
+import time
 from datetime import date, timedelta
 from typing import AsyncIterator, Callable
 
 from bonsai_sensei.domain.services.mimamori.context import build_work_summaries
 from bonsai_sensei.logging_config import get_logger
+from bonsai_sensei.metrics import MIMAMORI_QUEUE_DEPTH, MIMAMORI_USER_DURATION, MIMAMORI_USER_RUNS_TOTAL
 
 logger = get_logger(__name__)
 
+MIMAMORI_CONCURRENCY = int(os.getenv("MIMAMORI_CONCURRENCY", "4"))
+MIMAMORI_USER_TIMEOUT_SECONDS = float(os.getenv("MIMAMORI_USER_TIMEOUT_SECONDS", "300"))
 
 async def run_mimamori(
     run_mimamori_reflection: Callable,
@@ -18,13 +24,20 @@ async def run_mimamori(
     list_planned_works_in_date_range_func: Callable,
     send_telegram_message_func: Callable,
     search_memory_func: Callable | None = None,
+    concurrency: int = MIMAMORI_CONCURRENCY,
+    user_timeout_seconds: float = MIMAMORI_USER_TIMEOUT_SECONDS,
 ) -> AsyncIterator[str]:
+    """Run the daily reflection as one independent pipeline per user.
+
+    Each user only sees their own bonsai and works. Users are processed concurrently,
+    bounded by a semaphore so LLM, weather and memory calls are not fired for every
+    user at once, and each user gets its own timeout so one slow reflection cannot
+    stall the rest of the run. A user whose pipeline fails for any reason is reported with
+    status "error" while the others carry on; an escaping error would cancel every user
+    still running. Results are yielded as users finish.
+    """
     today = date.today()
     species_map = {species.id: species.name for species in list_species_func()}
-    bonsais = list_bonsai_func()
-    bonsai_map = {bonsai.id: bonsai.name for bonsai in bonsais}
-
-    bonsai_snapshots = build_bonsai_snapshots_func(bonsais, species_map)
     overdue_works = list_planned_works_in_date_range_func(
         start_date=date(2000, 1, 1),
         end_date=today - timedelta(days=1),
@@ -33,37 +46,105 @@ async def run_mimamori(
         start_date=today,
         end_date=today + timedelta(days=14),
     )
-    overdue_summaries = build_work_summaries(overdue_works, bonsai_map)
-    upcoming_summaries = build_work_summaries(upcoming_works, bonsai_map)
+    recipients = [user_settings for user_settings in list_all_user_settings_func() if user_settings.telegram_chat_id]
 
-    for user_settings in list_all_user_settings_func():
-        if not user_settings.telegram_chat_id:
-            continue
+    semaphore = asyncio.Semaphore(concurrency)
 
-        logger.info("Running mimamori for user_id=%s", user_settings.user_id)
-
-        recent_memory_facts = None
-        if search_memory_func:
-            recent_memory_facts = await search_memory_func(
-                user_settings.user_id,
-                "conversaciones recientes bonsáis últimos 7 días",
+    async def run_for_user(user_settings) -> dict:
+        MIMAMORI_QUEUE_DEPTH.inc()
+        try:
+            await semaphore.acquire()
+        finally:
+            MIMAMORI_QUEUE_DEPTH.dec()
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                _run_user_pipeline(
+                    user_settings=user_settings,
+                    today=today,
+                    species_map=species_map,
+                    overdue_works=overdue_works,
+                    upcoming_works=upcoming_works,
+                    run_mimamori_reflection=run_mimamori_reflection,
+                    build_bonsai_snapshots_func=build_bonsai_snapshots_func,
+                    build_reflection_context_func=build_reflection_context_func,
+                    list_bonsai_func=list_bonsai_func,
+                    send_telegram_message_func=send_telegram_message_func,
+                    search_memory_func=search_memory_func,
+                ),
+                timeout=user_timeout_seconds,
             )
+            MIMAMORI_USER_RUNS_TOTAL.labels(status="success").inc()
+            return result
+        except asyncio.TimeoutError:
+            logger.warning("Mimamori timed out after %.0fs for user_id=%s", user_timeout_seconds, user_settings.user_id)
+            MIMAMORI_USER_RUNS_TOTAL.labels(status="timeout").inc()
+            return {"user_id": user_settings.user_id, "date": today.isoformat(), "status": "timeout"}
+        except Exception:
+            logger.exception("Mimamori failed for user_id=%s", user_settings.user_id)
+            MIMAMORI_USER_RUNS_TOTAL.labels(status="error").inc()
+            return {"user_id": user_settings.user_id, "date": today.isoformat(), "status": "error"}
+        finally:
+            MIMAMORI_USER_DURATION.observe(time.perf_counter() - started)
+            semaphore.release()
+
+    tasks = [asyncio.create_task(run_for_user(user_settings)) for user_settings in recipients]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield json.dumps(await finished)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
-        context = await build_reflection_context_func(
-            today=today,
-            bonsai_snapshots=bonsai_snapshots,
-            overdue_summaries=overdue_summaries,
-            upcoming_summaries=upcoming_summaries,
-            user_settings=user_settings,
-            recent_memory_facts=recent_memory_facts,
+
+async def _run_user_pipeline(
+    user_settings,
+    today: date,
+    species_map: dict,
+    overdue_works: list,
+    upcoming_works: list,
+    run_mimamori_reflection: Callable,
+    build_bonsai_snapshots_func: Callable,
+    build_reflection_context_func: Callable,
+    list_bonsai_func: Callable,
+    send_telegram_message_func: Callable,
+    search_memory_func: Callable | None,
+) -> dict:
+    logger.info("Running mimamori for user_id=%s", user_settings.user_id)
+    bonsais = await asyncio.to_thread(list_bonsai_func, user_id=user_settings.user_id)
+    bonsai_map = {bonsai.id: bonsai.name for bonsai in bonsais}
+    bonsai_snapshots = await asyncio.to_thread(build_bonsai_snapshots_func, bonsais, species_map)
+    overdue_summaries = build_work_summaries(_works_for(overdue_works, bonsai_map), bonsai_map)
+    upcoming_summaries = build_work_summaries(_works_for(upcoming_works, bonsai_map), bonsai_map)
+
+    recent_memory_facts = None
+    if search_memory_func:
+        recent_memory_facts = await search_memory_func(
+            user_settings.user_id,
+            "conversaciones recientes bonsáis últimos 7 días",
         )
 
-        response_text = await run_mimamori_reflection(context, user_id=user_settings.user_id)
-        await send_telegram_message_func(user_settings.telegram_chat_id, response_text)
+    context = await build_reflection_context_func(
+        today=today,
+        bonsai_snapshots=bonsai_snapshots,
+        overdue_summaries=overdue_summaries,
+        upcoming_summaries=upcoming_summaries,
+        user_settings=user_settings,
+        recent_memory_facts=recent_memory_facts,
+    )
+
+    response_text = await run_mimamori_reflection(context, user_id=user_settings.user_id)
+    await send_telegram_message_func(user_settings.telegram_chat_id, response_text)
+
+    return {
+        "user_id": user_settings.user_id,
+        "date": today.isoformat(),
+        "bonsai_count": len(bonsais),
+        "response": response_text,
+    }
+
 
-        yield json.dumps({
-            "user_id": user_settings.user_id,
-            "date": today.isoformat(),
-            "bonsai_count": len(bonsais),
-            "response": response_text,
-        })
+def _works_for(planned_works: list, bonsai_map: dict) -> list:
+    return [work for work in planned_works if work.bonsai_id in bonsai_map]
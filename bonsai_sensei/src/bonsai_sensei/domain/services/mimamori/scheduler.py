@@ -7,6 +7,8 @@ from apscheduler.triggers.cron import CronTrigger
 
 from bonsai_sensei.domain.services.mimamori.runner import run_mimamori
 
+WEATHER_PREFETCH_LEAD_MINUTES = int(os.getenv("WEATHER_PREFETCH_LEAD_MINUTES", "15"))
+
 
 def create_mimamori_scheduler(
     run_mimamori_reflection: Callable,
@@ -18,11 +20,14 @@ def create_mimamori_scheduler(
     list_planned_works_in_date_range_func: Callable,
     send_telegram_message_func: Callable,
     search_memory_func: Callable | None = None,
+    prefetch_weather_func: Callable | None = None,
 ) -> AsyncIOScheduler:
     """Create and start an APScheduler that runs the daily mimamori reflection.
 
     The trigger hour is read from MIMAMORI_HOUR (default 8) and minute from
-    MIMAMORI_MINUTE (default 0). The scheduler must be shut down by the caller.
+    MIMAMORI_MINUTE (default 0). When prefetch_weather_func is given, it is called with
+    every registered location WEATHER_PREFETCH_LEAD_MINUTES (default 15) earlier, so the
+    reflections read cached forecasts. The scheduler must be shut down by the caller.
     """
     hour = int(os.getenv("MIMAMORI_HOUR", "8"))
     minute = int(os.getenv("MIMAMORI_MINUTE", "0"))
@@ -42,10 +47,27 @@ def create_mimamori_scheduler(
             "search_memory_func": search_memory_func,
         },
     )
+    if prefetch_weather_func is not None:
+        prefetch_at = (hour * 60 + minute - WEATHER_PREFETCH_LEAD_MINUTES) % (24 * 60)
+        scheduler.add_job(
+            _dispatch_weather_prefetch,
+            trigger=CronTrigger(hour=prefetch_at // 60, minute=prefetch_at % 60),
+            kwargs={
+                "list_all_user_settings_func": list_all_user_settings_func,
+                "prefetch_weather_func": prefetch_weather_func,
+            },
+        )
     scheduler.start()
     return scheduler
 
 
+async def _dispatch_weather_prefetch(list_all_user_settings_func: Callable, prefetch_weather_func: Callable):
+    logging.info("Prefetching weather before mimamori")
+    await prefetch_weather_func(
+        [user_settings.location for user_settings in list_all_user_settings_func() if user_settings.location]
+    )
+
+
 async def _dispatch_mimamori(
     run_mimamori_reflection: Callable,
     build_bonsai_snapshots_func: Callable,
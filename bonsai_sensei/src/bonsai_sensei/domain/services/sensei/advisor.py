@@ -6,7 +6,7 @@ from google.adk.apps.app import App, EventsCompactionConfig
 from google.adk.artifacts import InMemoryArtifactService
 from google.adk.memory import BaseMemoryService
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import BaseSessionService, InMemorySessionService
 from google.genai import types
 
 from bonsai_sensei.domain.services.sensei.session_manager import (
@@ -25,6 +25,7 @@ from bonsai_sensei.domain.services.sensei.runner import (
     build_user_message,
     build_response_texts,
     capture_session_to_memory_safe,
+    end_memory_session_safe,
 )
 
 COMPACTION_INTERVAL = 5
@@ -44,8 +45,9 @@ def create_advisor(
     progress_messages: dict[str, str] | None = None,
     context_state_builder: Callable[[str], dict] | None = None,
     memory_service: Optional[BaseMemoryService] = None,
+    session_service: Optional[BaseSessionService] = None,
 ) -> tuple[Callable[..., AdvisorResponse], Callable[..., None]]:
-    session_service = InMemorySessionService()
+    session_service = session_service or InMemorySessionService()
 
     default_app = App(
         name=APP_NAME,
@@ -69,6 +71,8 @@ def create_advisor(
     _ctx_builder = context_state_builder or (lambda _uid: {})
 
     async def reset_session(user_id: str) -> None:
+        if memory_service is not None:
+            await end_memory_session_safe(user_id, memory_service)
         await session_service.delete_session(
             app_name=APP_NAME, user_id=user_id, session_id=str(user_id)
         )
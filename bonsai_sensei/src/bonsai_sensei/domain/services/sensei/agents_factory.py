@@ -1,6 +1,8 @@
 from functools import partial
 from typing import Callable
 
+import httpx
+
 from bonsai_sensei.domain.services.cultivation.factory import create_cultivation_group
 from bonsai_sensei.domain.services.garden.factory import create_gardener_group
 from bonsai_sensei.domain.services.storekeeper.factory import create_storekeeper_group
@@ -10,6 +12,9 @@ from bonsai_sensei.domain.services.sensei.factory import create_agents, create_s
 def create_sensei_agent(
     model: object,
     session_factory,
+    wiki_client: httpx.AsyncClient,
+    fetch_forecast_func: Callable,
+    warm_thumbnail_func: Callable,
     orchestrator_model: object,
     pending_photos: dict,
     ask_confirmation: Callable,
@@ -29,6 +34,7 @@ def create_sensei_agent(
     cultivation_group_factory = partial(
         create_cultivation_group,
         session_factory=session_factory,
+        wiki_client=wiki_client,
         ask_confirmation=ask_confirmation,
         ask_human=ask_human,
         ask_selection=ask_selection,
@@ -43,20 +49,25 @@ def create_sensei_agent(
     gardener_group_factory = partial(
         create_gardener_group,
         session_factory=session_factory,
+        wiki_client=wiki_client,
         ask_confirmation=ask_confirmation,
         ask_selection=ask_selection,
+        warm_thumbnail_func=warm_thumbnail_func,
         pending_photos=pending_photos,
         **garden_messages,
     )
     storekeeper_group_factory = partial(
         create_storekeeper_group,
         session_factory=session_factory,
+        wiki_client=wiki_client,
         ask_confirmation=ask_confirmation,
         **storekeeper_messages,
     )
     sensei_group_factory = partial(
         create_sensei_group,
         session_factory=session_factory,
+        wiki_client=wiki_client,
+        fetch_forecast_func=fetch_forecast_func,
         orchestrator_model=orchestrator_model,
         kb_base_url=kb_base_url,
         searcher=searcher,
@@ -2,6 +2,7 @@ import os
 from functools import partial
 from typing import Callable
 
+import httpx
 from google.adk.agents.sequential_agent import SequentialAgent
 from google.adk.tools import AgentTool
 
@@ -69,7 +70,7 @@ def _build_agent_descriptions(agents) -> list[str]:
     return [f"- {agent.name}: {agent.description}" for agent in agents]
 
 
-def _create_query_tools(session_factory, kb_base_url: str) -> list:
+def _create_query_tools(session_factory, read_wiki_page_func: Callable) -> list:
     get_bonsai_by_name_func = partial(garden.get_bonsai_by_name, create_session=session_factory)
     list_species_func = partial(herbarium.list_species, create_session=session_factory)
 
@@ -93,14 +94,14 @@ def _create_query_tools(session_factory, kb_base_url: str) -> list:
     )
     get_fertilizer_by_name_tool = create_get_fertilizer_by_name_tool(
         get_fertilizer_by_name_func=partial(fertilizer_catalog.get_fertilizer_by_name, create_session=session_factory),
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_func,
     )
     list_phytosanitary_tool = create_list_phytosanitary_tool(
         list_phytosanitary_func=partial(phytosanitary_registry.list_phytosanitary, create_session=session_factory),
     )
     get_phytosanitary_by_name_tool = create_get_phytosanitary_by_name_tool(
         get_phytosanitary_by_name_func=partial(phytosanitary_registry.get_phytosanitary_by_name, create_session=session_factory),
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_func,
     )
     list_planned_works_tool = create_list_planned_works_tool(
         get_bonsai_by_name_func=get_bonsai_by_name_func,
@@ -155,30 +156,37 @@ def create_sensei_group(
     model: object,
     command_agents: list,
     session_factory,
+    wiki_client: httpx.AsyncClient,
+    fetch_forecast_func: Callable,
     kb_base_url: str = "",
     orchestrator_model: object = None,
     searcher=None,
 ):
     effective_orchestrator_model = orchestrator_model or model
+    read_wiki_page_func = create_http_read_wiki_page_tool(kb_base_url, wiki_client)
+    write_wiki_page_func = create_http_write_wiki_page_tool(kb_base_url, wiki_client)
     analyze_tool, compare_tool = create_kantei_group(
         model=model,
         session_factory=session_factory,
+        wiki_client=wiki_client,
         orchestrator_model=orchestrator_model,
         kb_base_url=kb_base_url,
     )
     weather_risk_tool = create_weather_risk_tool(
         get_user_settings_func=partial(user_settings_store.get_user_settings, create_session=session_factory),
-        get_weather_func=create_weather_tool(os.getenv("WEATHER_API_BASE", "https://wttr.in")),
+        get_weather_func=create_weather_tool(os.getenv("WEATHER_API_BASE", "https://wttr.in"), fetch_forecast_func),
     )
     recommend_fertilizer_callable = _create_recommend_fertilizer_callable(
         model=effective_orchestrator_model,
         session_factory=session_factory,
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_func,
+        write_wiki_page_func=write_wiki_page_func,
     )
     recommend_phytosanitary_callable = _create_recommend_phytosanitary_callable(
         model=effective_orchestrator_model,
         session_factory=session_factory,
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_func,
+        write_wiki_page_func=write_wiki_page_func,
     )
     search_phytosanitary_online_callable = create_search_phytosanitary_online_tool(searcher) if searcher else None
     tool_descriptions = [ANALYZE_TOOL_DESCRIPTION, COMPARE_TOOL_DESCRIPTION, WEATHER_RISK_TOOL_DESCRIPTION, RECOMMEND_FERTILIZER_TOOL_DESCRIPTION]
@@ -205,7 +213,7 @@ def create_sensei_group(
         sub_agents=[mitori, executor],
     )
 
-    query_tools = _create_query_tools(session_factory, kb_base_url)
+    query_tools = _create_query_tools(session_factory, read_wiki_page_func)
     phytosanitary_advice_tools = [recommend_phytosanitary_callable]
     if search_phytosanitary_online_callable:
         phytosanitary_advice_tools.append(search_phytosanitary_online_callable)
@@ -213,8 +221,8 @@ def create_sensei_group(
     wiki_query_tools = []
     if kb_base_url:
         wiki_query_tools = [
-            create_http_search_wiki_knowledge_tool(kb_base_url),
-            create_http_read_wiki_page_tool(kb_base_url),
+            create_http_search_wiki_knowledge_tool(kb_base_url, wiki_client),
+            read_wiki_page_func,
         ]
 
     return create_sensei(
@@ -223,30 +231,26 @@ def create_sensei_group(
     )
 
 
-def _create_recommend_phytosanitary_callable(model, session_factory, kb_base_url: str = ""):
+def _create_recommend_phytosanitary_callable(model, session_factory, read_wiki_page_func: Callable, write_wiki_page_func: Callable):
     from bonsai_sensei.domain.services.cultivation.plan.phytosanitary.phytosanitary_recommendation_runner import create_phytosanitary_recommendation_runner
-    read_wiki = create_http_read_wiki_page_tool(kb_base_url)
-    write_wiki = create_http_write_wiki_page_tool(kb_base_url)
     return create_recommend_phytosanitary_tool(
         get_bonsai_by_name_func=partial(garden.get_bonsai_by_name, create_session=session_factory),
         list_bonsai_events_func=partial(bonsai_history.list_bonsai_events, create_session=session_factory),
         list_phytosanitary_func=partial(phytosanitary_registry.list_phytosanitary, create_session=session_factory),
-        read_wiki_page_func=read_wiki,
-        write_wiki_page_func=write_wiki,
+        read_wiki_page_func=read_wiki_page_func,
+        write_wiki_page_func=write_wiki_page_func,
         run_recommendation=create_phytosanitary_recommendation_runner(model=model),
     )
 
 
-def _create_recommend_fertilizer_callable(model, session_factory, kb_base_url: str = ""):
+def _create_recommend_fertilizer_callable(model, session_factory, read_wiki_page_func: Callable, write_wiki_page_func: Callable):
     from bonsai_sensei.domain.services.cultivation.plan.fertilization.fertilizer_recommendation_runner import create_fertilizer_recommendation_runner
-    read_wiki = create_http_read_wiki_page_tool(kb_base_url)
-    write_wiki = create_http_write_wiki_page_tool(kb_base_url)
     return create_recommend_fertilizer_tool(
         get_bonsai_by_name_func=partial(garden.get_bonsai_by_name, create_session=session_factory),
         list_bonsai_events_func=partial(bonsai_history.list_bonsai_events, create_session=session_factory),
         list_fertilizers_func=partial(fertilizer_catalog.list_fertilizers, create_session=session_factory),
-        read_wiki_page_func=read_wiki,
-        write_wiki_page_func=write_wiki,
+        read_wiki_page_func=read_wiki_page_func,
+        write_wiki_page_func=write_wiki_page_func,
         run_recommendation=create_fertilizer_recommendation_runner(model=model),
     )
 
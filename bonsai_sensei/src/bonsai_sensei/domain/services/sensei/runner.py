@@ -103,3 +103,13 @@ async def capture_session_to_memory_safe(
             await memory_service.add_session_to_memory(session)
     except Exception:
         logging.exception("Memory capture failed for user_id=%s", user_id)
+
+
+async def end_memory_session_safe(user_id: str, memory_service: BaseMemoryService) -> None:
+    end_session = getattr(memory_service, "end_session", None)
+    if end_session is None:
+        return
+    try:
+        await end_session(user_id)
+    except Exception:
+        logging.exception("Memory session end failed for user_id=%s", user_id)
@@ -2,8 +2,11 @@ import os
 from functools import partial
 from typing import Callable
 
+import httpx
+
 from bonsai_sensei.domain import fertilizer_catalog
 from bonsai_sensei.domain import phytosanitary_registry
+from bonsai_sensei.infrastructure.wiki_client import create_http_read_wiki_page_tool, create_http_write_wiki_page_tool
 from bonsai_sensei.domain.services.storekeeper.storekeeper import create_storekeeper
 from bonsai_sensei.telegram.messages.storekeeper_messages import (
     build_refresh_fertilizer_wiki_confirmation,
@@ -23,6 +26,7 @@ from bonsai_sensei.domain.services.storekeeper.fertilizers.fertilizer_wiki_compi
 def create_storekeeper_group(
     model: object,
     session_factory,
+    wiki_client: httpx.AsyncClient,
     ask_confirmation: Callable,
     build_create_fertilizer_confirmation: Callable,
     build_delete_fertilizer_confirmation: Callable,
@@ -34,23 +38,27 @@ def create_storekeeper_group(
     tavily_api_key = os.getenv("TAVILY_API_KEY")
     tavily_base_url = os.getenv("TAVILY_API_BASE")
     kb_base_url = os.getenv("KB_BASE_URL", "http://knowledge_base:8080")
+    read_wiki_page_func = create_http_read_wiki_page_tool(kb_base_url, wiki_client)
+    write_wiki_page_func = create_http_write_wiki_page_tool(kb_base_url, wiki_client)
 
     tavily_searcher = create_tavily_searcher(tavily_api_key, tavily_base_url)
 
     phytosanitary_wiki_page_builder = create_phytosanitary_wiki_compiler(
         model=model,
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_func,
+        write_wiki_page_func=write_wiki_page_func,
         searcher=tavily_searcher,
     )
     fertilizer_wiki_page_builder = create_fertilizer_wiki_compiler(
         model=model,
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_func,
+        write_wiki_page_func=write_wiki_page_func,
         searcher=tavily_searcher,
     )
 
     return create_storekeeper(
         model=model,
-        kb_base_url=kb_base_url,
+        read_wiki_page_func=read_wiki_page_func,
         list_fertilizers_func=partial(
             fertilizer_catalog.list_fertilizers, create_session=session_factory
         ),
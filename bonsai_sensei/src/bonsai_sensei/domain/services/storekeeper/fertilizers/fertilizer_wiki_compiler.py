@@ -6,7 +6,6 @@ from google.adk.agents.llm_agent import Agent
 from google.adk.runners import InMemoryRunner, RunConfig
 from google.genai import types
 
-from bonsai_sensei.infrastructure.wiki_client import create_http_read_wiki_page_tool, create_http_write_wiki_page_tool
 
 _APP_NAME = "fertilizer_wiki_compiler"
 _MAX_LLM_CALLS = 20
@@ -29,7 +28,8 @@ La ficha debe contener al menos las secciones: nombre del producto como título
 
 def create_fertilizer_wiki_compiler(
     model: object,
-    kb_base_url: str,
+    read_wiki_page_func: Callable,
+    write_wiki_page_func: Callable,
     searcher: Callable[[str], dict],
 ) -> Callable[[str, str], tuple[str, str]]:
     """Create an async compiler that generates a markdown wiki page for a fertilizer.
@@ -39,18 +39,17 @@ def create_fertilizer_wiki_compiler(
 
     Args:
         model: LLM model to use for the compiler agent.
-        kb_base_url: Base URL of the knowledge_base HTTP service.
+        read_wiki_page_func: Async callable that reads a wiki page by path.
+        write_wiki_page_func: Async wiki write tool handed to the compiler agent.
         searcher: Callable that accepts a search query and returns a dict with
             'answer' (str) and optional 'results' list of dicts with 'url' keys.
     """
-    read_wiki_page = create_http_read_wiki_page_tool(kb_base_url)
-    write_wiki_page = create_http_write_wiki_page_tool(kb_base_url)
     search_tool = _create_search_tool(searcher)
 
     async def compile_fertilizer_page(name: str, user_instructions: str = "") -> tuple[str, str]:
         slug = _slugify(name)
         relative_path = f"fertilizers/{slug}.md"
-        existing_content_result = read_wiki_page(path=relative_path)
+        existing_content_result = await read_wiki_page_func(path=relative_path)
         existing_content = existing_content_result.get("content") if existing_content_result.get("status") == "success" else None
         captured = {"recommended_amount": "No disponible"}
 
@@ -59,7 +58,7 @@ def create_fertilizer_wiki_compiler(
             model=model,
             name=_APP_NAME,
             instruction=_COMPILER_INSTRUCTION,
-            tools=[search_tool, write_wiki_page, set_amount_tool],
+            tools=[search_tool, write_wiki_page_func, set_amount_tool],
         )
         runner = InMemoryRunner(agent=agent, app_name=_APP_NAME)
         session_id = str(uuid.uuid4())
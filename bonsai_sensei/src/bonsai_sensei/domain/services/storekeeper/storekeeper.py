@@ -28,7 +28,7 @@ Eres el responsable del catálogo de insumos para bonsáis: fertilizantes, micro
 
 def create_storekeeper(
     model: object,
-    kb_base_url: str,
+    read_wiki_page_func: Callable,
     list_fertilizers_func: Callable[[], list[Fertilizer]],
     get_fertilizer_by_name_func: Callable[[str], Fertilizer | None],
     fertilizer_wiki_page_builder: Callable[[str], tuple[str, str]],
@@ -59,7 +59,7 @@ def create_storekeeper(
         after_model_callback=limit_to_single_tool_call,
         tools=[
             create_list_fertilizers_tool(list_fertilizers_func),
-            create_get_fertilizer_by_name_tool(get_fertilizer_by_name_func, kb_base_url),
+            create_get_fertilizer_by_name_tool(get_fertilizer_by_name_func, read_wiki_page_func),
             create_create_fertilizer_tool(
                 create_fertilizer_func=create_fertilizer_func,
                 get_fertilizer_by_name_func=get_fertilizer_by_name_func,
@@ -87,7 +87,7 @@ def create_storekeeper(
                 build_confirmation_message=build_delete_fertilizer_confirmation,
             ),
             create_list_phytosanitary_tool(list_phytosanitary_func),
-            create_get_phytosanitary_by_name_tool(get_phytosanitary_by_name_func, kb_base_url),
+            create_get_phytosanitary_by_name_tool(get_phytosanitary_by_name_func, read_wiki_page_func),
             create_create_phytosanitary_tool(
                 create_phytosanitary_func=create_phytosanitary_func,
                 get_phytosanitary_by_name_func=get_phytosanitary_by_name_func,
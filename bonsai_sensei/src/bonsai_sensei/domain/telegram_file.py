@@ -0,0 +1,9 @@
+from sqlmodel import Field, SQLModel
+
+
+class TelegramFile(SQLModel, table=True):
+    """A file already uploaded to Telegram, keyed by the SHA-256 of its bytes."""
+
+    __tablename__ = "telegram_file"
+    content_hash: str = Field(primary_key=True)
+    file_id: str
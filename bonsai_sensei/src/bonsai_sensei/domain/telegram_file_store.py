@@ -0,0 +1,24 @@
+from sqlmodel import select, Session
+from bonsai_sensei.domain.telegram_file import TelegramFile
+from bonsai_sensei.database.session_wrapper import with_session
+
+
+@with_session
+def get_telegram_file_ids(session: Session, content_hashes: list[str]) -> dict[str, str]:
+    if not content_hashes:
+        return {}
+    statement = select(TelegramFile).where(TelegramFile.content_hash.in_(content_hashes))
+    return {telegram_file.content_hash: telegram_file.file_id for telegram_file in session.exec(statement).all()}
+
+
+@with_session
+def save_telegram_file_id(session: Session, content_hash: str, file_id: str) -> TelegramFile:
+    return session.merge(TelegramFile(content_hash=content_hash, file_id=file_id))
+
+
+@with_session
+def delete_telegram_file_ids(session: Session, content_hashes: list[str]) -> int:
+    telegram_files = session.exec(select(TelegramFile).where(TelegramFile.content_hash.in_(content_hashes))).all()
+    for telegram_file in telegram_files:
+        session.delete(telegram_file)
+    return len(telegram_files)
@@ -0,0 +1,320 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from google.adk.errors import StaleSessionError
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.errors.session_not_found_error import SessionNotFoundError
+from google.adk.events.event import Event
+from google.adk.sessions import BaseSessionService, DatabaseSessionService, InMemorySessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+from sqlalchemy.exc import SQLAlchemyError
+
+from bonsai_sensei.logging_config import get_logger
+from bonsai_sensei.metrics import (
+    SESSION_CACHE_EVICTIONS_TOTAL,
+    SESSION_CACHE_LOOKUPS_TOTAL,
+    SESSION_CACHE_RESIDENT,
+    SESSION_WRITE_BEHIND_DROPPED_TOTAL,
+    SESSION_WRITE_BEHIND_FAILURES_TOTAL,
+    SESSION_WRITE_BEHIND_PENDING,
+)
+
+logger = get_logger(__name__)
+
+SESSION_CACHE_MAX_RESIDENT = int(os.getenv("SESSION_CACHE_MAX_RESIDENT", "1000"))
+SESSION_CACHE_IDLE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_IDLE_TTL_SECONDS", "1800"))
+SESSION_WRITE_BEHIND_INTERVAL_SECONDS = float(os.getenv("SESSION_WRITE_BEHIND_INTERVAL_SECONDS", "1"))
+SESSION_WRITE_BEHIND_MAX_PENDING = int(os.getenv("SESSION_WRITE_BEHIND_MAX_PENDING", "20"))
+SESSION_WRITE_BEHIND_MAX_ATTEMPTS = int(os.getenv("SESSION_WRITE_BEHIND_MAX_ATTEMPTS", "5"))
+
+_DURABLE_WRITE_ERRORS = (SQLAlchemyError, StaleSessionError, SessionNotFoundError)
+
+_SessionKey = tuple[str, str, str]
+
+
+@dataclass
+class _ResidentSession:
+    durable_session: Session
+    last_access: float
+    pending: list[Event] = field(default_factory=list)
+    failed_attempts: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class WriteBehindSessionService(BaseSessionService):
+    """ADK session service with a bounded in-memory hot tier over a durable store.
+
+    Hot sessions live in an InMemorySessionService so agent turns read and append without
+    touching the database. Appended events are buffered per session and written to the
+    durable service in the background (every write_behind_interval_seconds, or as soon as
+    max_pending events pile up), and always before a session leaves memory.
+
+    At most max_resident sessions are kept; the least recently used one is flushed and
+    evicted when the bound is exceeded, and sessions idle for idle_ttl_seconds are evicted
+    by the background loop. An evicted session is transparently reloaded from the durable
+    store on its next access, so memory stays flat while conversations survive restarts.
+
+    A session whose events cannot be written stays resident, so the bound may be exceeded
+    while the durable store is failing. An event that fails max_flush_attempts writes in a
+    row is dropped and logged, so one poisoned event cannot pin its session forever. A session
+    written by someone else in the meantime is reloaded from the durable store, not dropped.
+    Call close() on shutdown to flush everything still buffered.
+    """
+
+    def __init__(
+        self,
+        durable: BaseSessionService,
+        max_resident: int = SESSION_CACHE_MAX_RESIDENT,
+        idle_ttl_seconds: float = SESSION_CACHE_IDLE_TTL_SECONDS,
+        write_behind_interval_seconds: float = SESSION_WRITE_BEHIND_INTERVAL_SECONDS,
+        max_pending: int = SESSION_WRITE_BEHIND_MAX_PENDING,
+        max_flush_attempts: int = SESSION_WRITE_BEHIND_MAX_ATTEMPTS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._durable = durable
+        self._hot = InMemorySessionService()
+        self._resident: OrderedDict[_SessionKey, _ResidentSession] = OrderedDict()
+        self._max_resident = max_resident
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._write_behind_interval_seconds = write_behind_interval_seconds
+        self._max_pending = max_pending
+        self._max_flush_attempts = max_flush_attempts
+        self._clock = clock
+        self._background_task: Optional[asyncio.Task] = None
+
+    @property
+    def resident_count(self) -> int:
+        return len(self._resident)
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        self._ensure_background_task()
+        durable_session = await self._durable.create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        durable_session.events.clear()
+        session = await self._hot.create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=durable_session.id
+        )
+        await self._admit((app_name, user_id, durable_session.id), durable_session)
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        self._ensure_background_task()
+        if not await self._ensure_resident((app_name, user_id, session_id)):
+            return None
+        return await self._hot.get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+
+    async def list_sessions(self, *, app_name: str, user_id: Optional[str] = None) -> ListSessionsResponse:
+        await self.flush()
+        return await self._durable.list_sessions(app_name=app_name, user_id=user_id)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        key = (app_name, user_id, session_id)
+        resident = self._resident.get(key)
+        if resident is None:
+            await self._durable.delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+            return
+        async with resident.lock:
+            if self._resident.get(key) is resident:
+                del self._resident[key]
+                SESSION_CACHE_RESIDENT.set(len(self._resident))
+                await self._hot.delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+            SESSION_WRITE_BEHIND_PENDING.dec(len(resident.pending))
+            resident.pending.clear()
+            await self._durable.delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+    async def get_user_state(self, *, app_name: str, user_id: str) -> dict[str, Any]:
+        await self.flush()
+        return await self._durable.get_user_state(app_name=app_name, user_id=user_id)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if event.partial:
+            return event
+        key = (session.app_name, session.user_id, session.id)
+        await self._ensure_resident(key)
+        event = await self._hot.append_event(session, event)
+        resident = self._resident.get(key)
+        if resident is not None:
+            resident.pending.append(event)
+            resident.last_access = self._clock()
+            SESSION_WRITE_BEHIND_PENDING.inc()
+            if len(resident.pending) >= self._max_pending:
+                await self._flush_key(key)
+        return event
+
+    async def flush(self) -> None:
+        """Write every buffered event to the durable store."""
+        for key in list(self._resident):
+            await self._flush_key(key)
+
+    async def close(self) -> None:
+        """Stop the background loop, flush all buffered events and close the durable store."""
+        if self._background_task is not None:
+            self._background_task.cancel()
+            try:
+                await self._background_task
+            except asyncio.CancelledError:
+                pass
+            self._background_task = None
+        await self.flush()
+        close_durable = getattr(self._durable, "close", None)
+        if close_durable is not None:
+            await close_durable()
+
+    async def evict_idle(self) -> None:
+        """Flush and drop sessions that have not been accessed within the idle TTL."""
+        cutoff = self._clock() - self._idle_ttl_seconds
+        for key, resident in list(self._resident.items()):
+            if resident.last_access <= cutoff:
+                await self._evict(key, reason="idle")
+
+    async def _ensure_resident(self, key: _SessionKey) -> bool:
+        resident = self._resident.get(key)
+        if resident is not None:
+            resident.last_access = self._clock()
+            self._resident.move_to_end(key)
+            SESSION_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc()
+            return True
+
+        app_name, user_id, session_id = key
+        stored = await self._durable.get_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        if stored is None:
+            SESSION_CACHE_LOOKUPS_TOTAL.labels(result="not_found").inc()
+            return False
+        SESSION_CACHE_LOOKUPS_TOTAL.labels(result="miss").inc()
+        if key in self._resident:
+            return True
+        try:
+            await self._hot.create_session(
+                app_name=app_name, user_id=user_id, state=dict(stored.state), session_id=session_id
+            )
+        except AlreadyExistsError:
+            pass
+        hot_session = self._hot.sessions[app_name][user_id][session_id]
+        hot_session.events = list(stored.events)
+        hot_session.last_update_time = stored.last_update_time
+        stored.events.clear()
+        await self._admit(key, stored)
+        return True
+
+    async def _admit(self, key: _SessionKey, durable_session: Session) -> None:
+        self._resident[key] = _ResidentSession(durable_session=durable_session, last_access=self._clock())
+        self._resident.move_to_end(key)
+        SESSION_CACHE_RESIDENT.set(len(self._resident))
+        while len(self._resident) > self._max_resident:
+            oldest_key = next(iter(self._resident))
+            if not await self._evict(oldest_key, reason="capacity"):
+                return
+
+    async def _evict(self, key: _SessionKey, reason: str) -> bool:
+        resident = self._resident.get(key)
+        if resident is None:
+            return True
+        while resident.pending:
+            if not await self._flush_key(key):
+                return False
+        if self._resident.get(key) is not resident:
+            return True
+        del self._resident[key]
+        app_name, user_id, session_id = key
+        await self._hot.delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        SESSION_CACHE_RESIDENT.set(len(self._resident))
+        SESSION_CACHE_EVICTIONS_TOTAL.labels(reason=reason).inc()
+        return True
+
+    async def _flush_key(self, key: _SessionKey) -> bool:
+        resident = self._resident.get(key)
+        if resident is None or not resident.pending:
+            return True
+        async with resident.lock:
+            events, resident.pending = resident.pending, []
+            for index, event in enumerate(events):
+                try:
+                    await self._append_durable(key, resident, event)
+                except _DURABLE_WRITE_ERRORS as error:
+                    SESSION_WRITE_BEHIND_FAILURES_TOTAL.inc()
+                    resident.failed_attempts += 1
+                    logger.warning(
+                        "Failed to flush session events for session_id=%s (attempt %d): %s",
+                        key[2],
+                        resident.failed_attempts,
+                        error,
+                    )
+                    if resident.failed_attempts >= self._max_flush_attempts:
+                        self._drop(key, resident, event)
+                        index += 1
+                    resident.pending[:0] = events[index:]
+                    return False
+                resident.failed_attempts = 0
+                SESSION_WRITE_BEHIND_PENDING.dec()
+        return True
+
+    async def _append_durable(self, key: _SessionKey, resident: _ResidentSession, event: Event) -> None:
+        """Append event to the durable store, reloading the session once if it went stale.
+
+        Another writer, such as a second replica during a rolling deploy, moves the stored
+        revision on; appending through the old durable session would fail on every retry.
+        """
+        try:
+            await self._durable.append_event(resident.durable_session, event)
+        except StaleSessionError:
+            logger.info("Reloading stale durable session session_id=%s", key[2])
+            await self._reload_durable(key, resident)
+            await self._durable.append_event(resident.durable_session, event)
+        finally:
+            resident.durable_session.events.clear()
+
+    async def _reload_durable(self, key: _SessionKey, resident: _ResidentSession) -> None:
+        app_name, user_id, session_id = key
+        stored = await self._durable.get_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        if stored is None:
+            raise SessionNotFoundError(f"Session {session_id} not found.")
+        stored.events.clear()
+        resident.durable_session = stored
+
+    def _drop(self, key: _SessionKey, resident: _ResidentSession, event: Event) -> None:
+        logger.error(
+            "Dropping event %s of session_id=%s after %d failed writes", event.id, key[2], resident.failed_attempts
+        )
+        resident.failed_attempts = 0
+        SESSION_WRITE_BEHIND_DROPPED_TOTAL.inc()
+        SESSION_WRITE_BEHIND_PENDING.dec()
+
+    def _ensure_background_task(self) -> None:
+        if self._background_task is None or self._background_task.done():
+            self._background_task = asyncio.create_task(self._write_behind_loop())
+
+    async def _write_behind_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._write_behind_interval_seconds)
+            await self.flush()
+            await self.evict_idle()
+
+
+def create_persistent_session_service(database_url: str, **kwargs) -> WriteBehindSessionService:
+    """Build the write-behind session service over ADK's DatabaseSessionService.
+
+    database_url must use an async driver (postgresql+asyncpg:// or sqlite+aiosqlite://).
+    On Postgres, session state and events are stored as JSONB.
+    """
+    return WriteBehindSessionService(DatabaseSessionService(db_url=database_url), **kwargs)
@@ -0,0 +1,231 @@
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from PIL import Image, ImageDraw, ImageFont
+
+from bonsai_sensei.logging_config import get_logger
+from bonsai_sensei.metrics import THUMBNAIL_CACHE_LOOKUPS_TOTAL
+
+THUMBNAIL_MAX_SIZE = (480, 480)
+BANNER_HEIGHT = 38
+BANNER_COLOR = (0, 0, 0, 170)
+TEXT_COLOR = (255, 255, 255)
+FONT_SIZE = 22
+JPEG_QUALITY = 85
+
+THUMBNAIL_CACHE_PATH = os.getenv(
+    "THUMBNAIL_CACHE_PATH", str(Path(os.getenv("PHOTOS_PATH", "./photos")) / ".thumbnails")
+)
+THUMBNAIL_CACHE_MAX_MB = int(os.getenv("THUMBNAIL_CACHE_MAX_MB", "256"))
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", "2"))
+
+logger = get_logger(__name__)
+
+
+def _load_font(size: int) -> ImageFont.ImageFont:
+    candidates = [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+    ]
+    for path in candidates:
+        if Path(path).exists():
+            try:
+                return ImageFont.truetype(path, size)
+            except OSError:
+                continue
+    return ImageFont.load_default(size=size)
+
+
+def _draw_banner(image: Image.Image, label: str) -> Image.Image:
+    """Overlay a semi-transparent banner with label at the bottom of image."""
+    image = image.convert("RGBA")
+    width, height = image.size
+
+    overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    draw.rectangle([(0, height - BANNER_HEIGHT), (width, height)], fill=BANNER_COLOR)
+
+    font = _load_font(FONT_SIZE)
+    bbox = draw.textbbox((0, 0), label, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    text_x = (width - text_width) // 2
+    text_y = height - BANNER_HEIGHT + (BANNER_HEIGHT - text_height) // 2
+    draw.text((text_x, text_y), label, fill=TEXT_COLOR, font=font)
+
+    return Image.alpha_composite(image, overlay)
+
+
+def _save_jpeg(image: Image.Image, target: Path) -> None:
+    """Write atomically, so readers never see a partial file."""
+    descriptor, temp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as temp_file:
+            image.convert("RGB").save(temp_file, format="JPEG", quality=JPEG_QUALITY)
+        os.replace(temp_path, target)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def _render_thumbnail(source_path: str, label: str, target: str, base_target: str, max_bytes: int) -> None:
+    """Worker entry point: write the thumbnail of source_path, with a banner when label is set.
+
+    Labeled thumbnails start from the cached unlabeled one at base_target, which is written
+    first when missing. Runs in a worker process, so it takes and returns only picklable values.
+    """
+    base = Path(base_target)
+    if base.exists():
+        image = Image.open(base)
+        image.load()
+    else:
+        image = Image.open(source_path)
+        image.thumbnail(THUMBNAIL_MAX_SIZE, Image.LANCZOS)
+        _save_jpeg(image, base)
+    if label:
+        _save_jpeg(_draw_banner(image, label), Path(target))
+    _evict(base.parent, max_bytes)
+
+
+def _evict(cache_dir: Path, max_bytes: int) -> None:
+    """Delete the least recently used thumbnails until the cache fits in max_bytes."""
+    entries = []
+    total = 0
+    with os.scandir(cache_dir) as scan:
+        for entry in scan:
+            if not entry.name.endswith(".jpg"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total += stat.st_size
+    if total <= max_bytes:
+        return
+    for _, size, path in sorted(entries):
+        Path(path).unlink(missing_ok=True)
+        total -= size
+        if total <= max_bytes:
+            return
+
+
+def _process_pool() -> Executor:
+    """Spawn workers, as the bot process runs threads that fork would copy mid-state."""
+    return ProcessPoolExecutor(max_workers=THUMBNAIL_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+
+class ThumbnailCache:
+    """JPEG thumbnails of stored photos, kept on disk and keyed by photo, size and label.
+
+    A key covers the photo's resolved path, byte size and modification time, so a photo
+    overwritten in place never serves an old thumbnail. Rendering runs in a process pool
+    created on first use; lookups refresh a file's mtime and each render evicts the least
+    recently used files beyond max_bytes. Concurrent requests for one thumbnail share a render.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = THUMBNAIL_CACHE_MAX_MB * 1024 * 1024,
+        executor_factory: Callable[[], Executor] = _process_pool,
+    ):
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._executor_factory = executor_factory
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._in_flight: dict[Path, Future] = {}
+
+    def path_for(self, source_path: str, label: str = "") -> Path:
+        source = Path(source_path).resolve()
+        stat = source.stat()
+        key = "\0".join(
+            [str(source), str(stat.st_size), str(stat.st_mtime_ns), "x".join(map(str, THUMBNAIL_MAX_SIZE)), label]
+        )
+        return self._cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.jpg"
+
+    async def get(self, source_path: str, label: str = "") -> str:
+        """Path of the cached thumbnail of source_path with label on its banner, rendering it if needed.
+
+        The file belongs to the cache: callers must not delete it.
+        """
+        target = self.path_for(source_path, label)
+        if _touch(target):
+            THUMBNAIL_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc()
+            return str(target)
+        future, started = self._render(source_path, label, target)
+        THUMBNAIL_CACHE_LOOKUPS_TOTAL.labels(result="miss" if started else "coalesced").inc()
+        await asyncio.wrap_future(future)
+        return str(target)
+
+    def warm(self, source_path: str) -> None:
+        """Start rendering the unlabeled thumbnail of a new photo without waiting for it.
+
+        Callable from any thread; failures are logged, as the next get renders again.
+        """
+        try:
+            target = self.path_for(source_path)
+        except OSError:
+            logger.warning("Cannot warm thumbnail of missing photo %s", source_path)
+            return
+        if target.exists():
+            return
+        future, started = self._render(source_path, "", target)
+        if started:
+            future.add_done_callback(_log_failure)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _render(self, source_path: str, label: str, target: Path) -> tuple[Future, bool]:
+        with self._lock:
+            future = self._in_flight.get(target)
+            if future is not None:
+                return future, False
+            if self._executor is None:
+                self._executor = self._executor_factory()
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            future = self._executor.submit(
+                _render_thumbnail,
+                str(source_path),
+                label,
+                str(target),
+                str(self.path_for(source_path)),
+                self._max_bytes,
+            )
+            self._in_flight[target] = future
+        future.add_done_callback(lambda _: self._forget(target))
+        return future, True
+
+    def _forget(self, target: Path) -> None:
+        with self._lock:
+            self._in_flight.pop(target, None)
+
+
+def _touch(path: Path) -> bool:
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _log_failure(future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Thumbnail warm-up failed", exc_info=future.exception())
+
+
+def create_thumbnail_cache() -> ThumbnailCache:
+    return ThumbnailCache(Path(THUMBNAIL_CACHE_PATH))
@@ -1,35 +1,100 @@
+import os
 import time
-import httpx
+from contextlib import contextmanager
 from typing import Callable
 
-from bonsai_sensei.metrics import WIKI_REQUEST_DURATION, WIKI_REQUESTS_TOTAL
+import httpx
 
+from bonsai_sensei.metrics import WIKI_REQUEST_DURATION, WIKI_REQUESTS_TOTAL
 
-def create_http_search_wiki_knowledge_tool(kb_base_url: str) -> Callable:
+WIKI_HTTP_TIMEOUT_SECONDS = float(os.getenv("WIKI_HTTP_TIMEOUT_SECONDS", "30"))
+WIKI_HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("WIKI_HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+WIKI_HTTP_MAX_CONNECTIONS = int(os.getenv("WIKI_HTTP_MAX_CONNECTIONS", "20"))
+WIKI_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("WIKI_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+WIKI_HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("WIKI_HTTP_KEEPALIVE_EXPIRY_SECONDS", "60"))
+WIKI_HTTP2 = os.getenv("WIKI_HTTP2", "false").lower() == "true"
+
+
+def create_wiki_http_client() -> httpx.AsyncClient:
+    """Build the pooled client shared by every knowledge_base tool.
+
+    The caller owns it: create it inside the running event loop and close it on shutdown.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(WIKI_HTTP_TIMEOUT_SECONDS, connect=WIKI_HTTP_CONNECT_TIMEOUT_SECONDS),
+        limits=httpx.Limits(
+            max_connections=WIKI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=WIKI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=WIKI_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        http2=WIKI_HTTP2,
+    )
+
+
+@contextmanager
+def _track_request(operation: str):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        WIKI_REQUESTS_TOTAL.labels(operation=operation, status="error").inc()
+        raise
+    finally:
+        WIKI_REQUEST_DURATION.labels(operation=operation).observe(time.perf_counter() - start)
+
+
+def _read_result(response: httpx.Response) -> dict:
+    if response.status_code == 404:
+        WIKI_REQUESTS_TOTAL.labels(operation="read", status="not_found").inc()
+        return {"status": "error", "message": "page_not_found"}
+    if response.status_code == 400:
+        WIKI_REQUESTS_TOTAL.labels(operation="read", status="error").inc()
+        return {"status": "error", "message": "invalid_path"}
+    response.raise_for_status()
+    WIKI_REQUESTS_TOTAL.labels(operation="read", status="success").inc()
+    return {"status": "success", "content": response.json()["content"]}
+
+
+def _write_result(response: httpx.Response, path: str) -> dict:
+    if response.status_code == 400:
+        WIKI_REQUESTS_TOTAL.labels(operation="write", status="error").inc()
+        return {"status": "error", "message": "invalid_path"}
+    response.raise_for_status()
+    WIKI_REQUESTS_TOTAL.labels(operation="write", status="success").inc()
+    return {"status": "success", "path": path}
+
+
+def _list_result(response: httpx.Response) -> list[str]:
+    if response.status_code != 200:
+        WIKI_REQUESTS_TOTAL.labels(operation="list", status="error").inc()
+        return []
+    WIKI_REQUESTS_TOTAL.labels(operation="list", status="success").inc()
+    return response.json()
+
+
+def _unsupported_protocol_result() -> dict:
+    WIKI_REQUESTS_TOTAL.labels(operation="read", status="not_found").inc()
+    return {"status": "error", "message": "page_not_found"}
+
+
+def create_http_search_wiki_knowledge_tool(kb_base_url: str, client: httpx.AsyncClient) -> Callable:
     """Create an async tool that searches the wiki via HTTP call to knowledge_base service."""
 
     async def search_wiki_knowledge(query: str) -> dict:
         """Search the wiki knowledge base semantically. Use this to find relevant pages about species, fertilizers, techniques, pests, or any bonsai topic before answering questions. Returns top 5 matching pages with their paths and abstracts."""
-        start = time.perf_counter()
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(f"{kb_base_url}/api/wiki/index/search", json={"query": query})
-                response.raise_for_status()
-                WIKI_REQUESTS_TOTAL.labels(operation="search", status="success").inc()
-                return response.json()
-        except Exception:
-            WIKI_REQUESTS_TOTAL.labels(operation="search", status="error").inc()
-            raise
-        finally:
-            WIKI_REQUEST_DURATION.labels(operation="search").observe(time.perf_counter() - start)
+        with _track_request("search"):
+            response = await client.post(f"{kb_base_url}/api/wiki/index/search", json={"query": query})
+            response.raise_for_status()
+            WIKI_REQUESTS_TOTAL.labels(operation="search", status="success").inc()
+            return response.json()
 
     return search_wiki_knowledge
 
 
-def create_http_read_wiki_page_tool(kb_base_url: str) -> Callable:
-    """Create a tool that reads a wiki page via HTTP call to knowledge_base service."""
+def create_http_read_wiki_page_tool(kb_base_url: str, client: httpx.AsyncClient) -> Callable:
+    """Create an async tool that reads a wiki page via HTTP call to knowledge_base service."""
 
-    def read_wiki_page(path: str) -> dict:
+    async def read_wiki_page(path: str) -> dict:
         """Read the content of a wiki page by its path relative to the wiki root.
 
         Use this to read care guides, disease profiles, fertilizer sheets, or any
@@ -44,35 +109,20 @@ def create_http_read_wiki_page_tool(kb_base_url: str) -> Callable:
             Output JSON (success): {"status": "success", "content": "<markdown content>"}.
             Output JSON (error): {"status": "error", "message": "page_not_found" | "invalid_path"}.
         """
-        start = time.perf_counter()
-        try:
-            with httpx.Client() as client:
-                response = client.get(f"{kb_base_url}/api/wiki", params={"path": path})
-                if response.status_code == 404:
-                    WIKI_REQUESTS_TOTAL.labels(operation="read", status="not_found").inc()
-                    return {"status": "error", "message": "page_not_found"}
-                if response.status_code == 400:
-                    WIKI_REQUESTS_TOTAL.labels(operation="read", status="error").inc()
-                    return {"status": "error", "message": "invalid_path"}
-                response.raise_for_status()
-                WIKI_REQUESTS_TOTAL.labels(operation="read", status="success").inc()
-                return {"status": "success", "content": response.json()["content"]}
-        except httpx.UnsupportedProtocol:
-            WIKI_REQUESTS_TOTAL.labels(operation="read", status="not_found").inc()
-            return {"status": "error", "message": "page_not_found"}
-        except Exception:
-            WIKI_REQUESTS_TOTAL.labels(operation="read", status="error").inc()
-            raise
-        finally:
-            WIKI_REQUEST_DURATION.labels(operation="read").observe(time.perf_counter() - start)
+        with _track_request("read"):
+            try:
+                response = await client.get(f"{kb_base_url}/api/wiki", params={"path": path})
+            except httpx.UnsupportedProtocol:
+                return _unsupported_protocol_result()
+            return _read_result(response)
 
     return read_wiki_page
 
 
-def create_http_write_wiki_page_tool(kb_base_url: str) -> Callable:
-    """Create a tool that writes a wiki page via HTTP call to knowledge_base service."""
+def create_http_write_wiki_page_tool(kb_base_url: str, client: httpx.AsyncClient) -> Callable:
+    """Create an async tool that writes a wiki page via HTTP call to knowledge_base service."""
 
-    def write_wiki_page(path: str, content: str) -> dict:
+    async def write_wiki_page(path: str, content: str) -> dict:
         """Write content to a wiki page at the given path relative to the wiki root.
 
         Creates parent directories if they do not exist.
@@ -86,29 +136,17 @@ def create_http_write_wiki_page_tool(kb_base_url: str) -> Callable:
             Output JSON (success): {"status": "success", "path": "<relative_path>"}.
             Output JSON (error): {"status": "error", "message": "invalid_path"}.
         """
-        start = time.perf_counter()
-        try:
-            with httpx.Client() as client:
-                response = client.put(f"{kb_base_url}/api/wiki", json={"path": path, "content": content})
-                if response.status_code == 400:
-                    WIKI_REQUESTS_TOTAL.labels(operation="write", status="error").inc()
-                    return {"status": "error", "message": "invalid_path"}
-                response.raise_for_status()
-                WIKI_REQUESTS_TOTAL.labels(operation="write", status="success").inc()
-                return {"status": "success", "path": path}
-        except Exception:
-            WIKI_REQUESTS_TOTAL.labels(operation="write", status="error").inc()
-            raise
-        finally:
-            WIKI_REQUEST_DURATION.labels(operation="write").observe(time.perf_counter() - start)
+        with _track_request("write"):
+            response = await client.put(f"{kb_base_url}/api/wiki", json={"path": path, "content": content})
+            return _write_result(response, path)
 
     return write_wiki_page
 
 
-def create_http_list_wiki_files_tool(kb_base_url: str) -> Callable:
-    """Create a function that lists wiki files via HTTP call to knowledge_base service."""
+def create_http_list_wiki_files_tool(kb_base_url: str, client: httpx.AsyncClient) -> Callable:
+    """Create an async function that lists wiki files via HTTP call to knowledge_base service."""
 
-    def list_wiki_files(directory: str, pattern: str = "*.md") -> list[str]:
+    async def list_wiki_files(directory: str, pattern: str = "*.md") -> list[str]:
         """List wiki files in a directory matching a glob pattern.
 
         Args:
@@ -118,19 +156,8 @@ def create_http_list_wiki_files_tool(kb_base_url: str) -> Callable:
         Returns:
             A sorted list of file paths relative to the wiki root.
         """
-        start = time.perf_counter()
-        try:
-            with httpx.Client() as client:
-                response = client.get(f"{kb_base_url}/api/wiki/files", params={"directory": directory, "pattern": pattern})
-                if response.status_code != 200:
-                    WIKI_REQUESTS_TOTAL.labels(operation="list", status="error").inc()
-                    return []
-                WIKI_REQUESTS_TOTAL.labels(operation="list", status="success").inc()
-                return response.json()
-        except Exception:
-            WIKI_REQUESTS_TOTAL.labels(operation="list", status="error").inc()
-            raise
-        finally:
-            WIKI_REQUEST_DURATION.labels(operation="list").observe(time.perf_counter() - start)
+        with _track_request("list"):
+            response = await client.get(f"{kb_base_url}/api/wiki/files", params={"directory": directory, "pattern": pattern})
+            return _list_result(response)
 
     return list_wiki_files
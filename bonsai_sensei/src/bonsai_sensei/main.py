@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import time
@@ -20,7 +21,7 @@ from bonsai_sensei.domain.services.cultivation.plan.refinement.factory import cr
 from bonsai_sensei.memory.episodic_memory_service import EpisodicMemoryService, create_search_memory_func
 from bonsai_sensei.domain.services.sensei.agents_factory import create_sensei_agent
 from bonsai_sensei.domain.services.cultivation.species.tavily_searcher import create_tavily_searcher
-from bonsai_sensei.domain.services.data_services import create_data_services
+from bonsai_sensei.domain.services.data_services import create_async_data_services, create_data_services
 from bonsai_sensei.domain.services.human_input import (
     create_ask_confirmation,
     create_ask_human,
@@ -30,9 +31,14 @@ from bonsai_sensei.domain.services.human_input import (
 )
 from bonsai_sensei.domain.services.mimamori.scheduler import create_mimamori_scheduler
 from bonsai_sensei.domain.services.mimamori.mimamori_agent_runner import create_mimamori_agent_runner
-from bonsai_sensei.domain.services.mimamori.context import build_bonsai_snapshots, build_reflection_context
+from bonsai_sensei.domain.services.mimamori.context import build_bonsai_snapshots_batched, build_reflection_context
 from bonsai_sensei.domain.services.garden.caretaker.bonsai_events_tool import create_list_bonsai_events_tool
-from bonsai_sensei.infrastructure.wiki_client import create_http_search_wiki_knowledge_tool, create_http_read_wiki_page_tool
+from bonsai_sensei.infrastructure.wiki_client import (
+    create_http_read_wiki_page_tool,
+    create_http_search_wiki_knowledge_tool,
+    create_wiki_http_client,
+)
+from bonsai_sensei.infrastructure.session_service import create_persistent_session_service
 from bonsai_sensei.domain.user_settings import UserSettings
 from bonsai_sensei.logging_config import configure_logging
 from bonsai_sensei.model_factory import (
@@ -40,7 +46,7 @@ from bonsai_sensei.model_factory import (
     get_cloud_orchestrator_model_factory,
     get_local_model_factory,
 )
-from bonsai_sensei.database.session import get_session, get_engine
+from bonsai_sensei.database.session import ASYNC_DATABASE_URL, get_async_engine, get_async_session, get_session, get_engine
 from bonsai_sensei.observability import init_telemetry
 
 from bonsai_sensei.telegram.messages.garden_messages import (
@@ -98,6 +104,7 @@ from bonsai_sensei.telegram.messages.botanist_messages import (
     build_delete_pest_confirmation,
 )
 from bonsai_sensei.telegram.bot import TelegramBot
+from bonsai_sensei.telegram.file_ids import TelegramFileIds
 from bonsai_sensei.telegram.error_handler import error_handler
 from bonsai_sensei.telegram.handle_confirmation_callback import handle_confirmation_callback
 from bonsai_sensei.telegram.handle_plan_review_callback import handle_plan_review_callback
@@ -118,7 +125,12 @@ from bonsai_sensei.telegram.commands import (
     handle_plagas,
     handle_tiempo,
 )
-from bonsai_sensei.domain.services.cultivation.weather.weather import fetch_weather
+from bonsai_sensei.domain.services.cultivation.weather.weather import (
+    create_forecast_cache,
+    fetch_weather,
+    prefetch_forecasts,
+)
+from bonsai_sensei.infrastructure.thumbnail_cache import create_thumbnail_cache
 
 from bonsai_sensei.api.species import router as species_router
 from bonsai_sensei.api.bonsai import router as bonsai_router
@@ -159,6 +171,7 @@ def _save_telegram_chat_id(user_id: str, chat_id: str, save_user_settings):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     get_session_partial = partial(get_session, engine=get_engine())
+    get_async_session_partial = partial(get_async_session, engine=get_async_engine())
     init_telemetry()
 
     services = create_data_services(get_session_partial)
@@ -174,6 +187,8 @@ async def lifespan(app: FastAPI):
     app.state.development_plan_service = services["development_plan"]
     app.state.bonsai_photo_service = services["bonsai_photo"]
     app.state.pest_service = services["pest"]
+    async_services = create_async_data_services(get_async_session_partial)
+    app.state.async_services = async_services
     app.state.pending_human_responses = {}
     app.state.pending_confirmation_cleanups = {}
     app.state.active_tasks = {}
@@ -185,8 +200,22 @@ async def lifespan(app: FastAPI):
     model_factory = get_local_model_factory() if provider == "local" else get_cloud_model_factory()
     model = model_factory()
     orchestrator_model = get_cloud_orchestrator_model_factory()() if provider == "cloud" else None
-
-    bot_instance = TelegramBot(error_handler=error_handler)
+    wiki_client = create_wiki_http_client()
+    forecast_cache = create_forecast_cache()
+    app.state.forecast_cache = forecast_cache
+    fetch_cached_weather = partial(fetch_weather, fetch_forecast_func=forecast_cache.get)
+    thumbnail_cache = create_thumbnail_cache()
+    app.state.warm_thumbnail = thumbnail_cache.warm
+
+    telegram_file_service = async_services["telegram_file"]
+    bot_instance = TelegramBot(
+        error_handler=error_handler,
+        file_ids=TelegramFileIds(
+            get_file_ids_func=telegram_file_service["get_telegram_file_ids"],
+            save_file_id_func=telegram_file_service["save_telegram_file_id"],
+            delete_file_ids_func=telegram_file_service["delete_telegram_file_ids"],
+        ),
+    )
 
     def _resolve_chat_id(user_id: str) -> str | None:
         if user_id is not None and user_id.lstrip("-").isdigit():
@@ -219,13 +248,11 @@ async def lifespan(app: FastAPI):
         chat_id = _resolve_chat_id(user_id)
         if not chat_id:
             return
-        from bonsai_sensei.telegram.photo_thumbnail import generate_labeled_thumbnail
-        thumbnail_paths = []
         try:
-            for option, photo_path in zip(options, photo_paths):
-                full_path = str(photos_root / photo_path)
-                label = option.replace("Foto del ", "📅 ")
-                thumbnail_paths.append(generate_labeled_thumbnail(full_path, label))
+            thumbnail_paths = await asyncio.gather(*(
+                thumbnail_cache.get(str(photos_root / photo_path), option.replace("Foto del ", "📅 "))
+                for option, photo_path in zip(options, photo_paths)
+            ))
             await bot_instance.send_selection_with_photos(
                 chat_id=chat_id,
                 question=question,
@@ -241,9 +268,6 @@ async def lifespan(app: FastAPI):
                 options=options,
                 selection_id=selection_id,
             )
-        finally:
-            for tmp_path in thumbnail_paths:
-                Path(tmp_path).unlink(missing_ok=True)
 
     ask_confirmation_func = create_ask_confirmation(send_confirmation_func, app.state.pending_human_responses)
     ask_human_func = create_ask_human(send_message_func, app.state.pending_human_responses)
@@ -269,6 +293,9 @@ async def lifespan(app: FastAPI):
     sensei_agent = create_sensei_agent(
         model=model,
         session_factory=get_session_partial,
+        wiki_client=wiki_client,
+        fetch_forecast_func=forecast_cache.get,
+        warm_thumbnail_func=thumbnail_cache.warm,
         orchestrator_model=orchestrator_model,
         pending_photos=app.state.pending_photos,
         ask_confirmation=ask_confirmation_func,
@@ -339,6 +366,7 @@ async def lifespan(app: FastAPI):
     kiroku_agent = create_kiroku_group(
         model=model,
         session_factory=get_session_partial,
+        wiki_client=wiki_client,
         ask_human=ask_human_func,
         ask_selection=ask_selection_func,
         build_bonsai_name_question=build_bonsai_name_question,
@@ -366,6 +394,11 @@ async def lifespan(app: FastAPI):
             LAST_ACTIVITY_STATE_KEY: datetime.now(timezone.utc).isoformat(),
         }
 
+    session_service = (
+        create_persistent_session_service(os.getenv("SESSION_DATABASE_URL", ASYNC_DATABASE_URL))
+        if os.getenv("SESSION_BACKEND", "database").lower() == "database"
+        else None
+    )
     app.state.advisor, app.state.reset_session = create_advisor(
         default_agent=sensei_agent,
         channels=[
@@ -390,6 +423,7 @@ async def lifespan(app: FastAPI):
         },
         context_state_builder=build_sensei_context_state,
         memory_service=memory_service,
+        session_service=session_service,
     )
 
     save_telegram_chat_id_func = partial(
@@ -407,6 +441,7 @@ async def lifespan(app: FastAPI):
         users_awaiting_location=users_awaiting_location,
         pending_human_responses=app.state.pending_human_responses,
         pending_confirmation_cleanups=app.state.pending_confirmation_cleanups,
+        send_photos_func=bot_instance.send_photos,
     )
     photo_handler = partial(
         handle_user_photo,
@@ -441,49 +476,49 @@ async def lifespan(app: FastAPI):
 
     mis_bonsais_handler = partial(
         handle_mis_bonsais,
-        list_bonsai_func=services["garden"]["list_bonsai"],
-        list_species_func=services["herbarium"]["list_species"],
+        list_bonsai_func=async_services["garden"]["list_bonsai"],
+        list_species_func=async_services["herbarium"]["list_species"],
     )
     plan_handler = partial(
         handle_plan,
-        get_bonsai_by_name_func=services["garden"]["get_bonsai_by_name"],
-        list_planned_works_func=services["cultivation_plan"]["list_planned_works"],
+        get_bonsai_by_name_func=async_services["garden"]["get_bonsai_by_name"],
+        list_planned_works_func=async_services["cultivation_plan"]["list_planned_works"],
     )
     proximos_handler = partial(
         handle_proximos,
-        list_planned_works_in_date_range_func=services["cultivation_plan"]["list_planned_works_in_date_range"],
-        list_bonsai_func=services["garden"]["list_bonsai"],
+        list_planned_works_in_date_range_func=async_services["cultivation_plan"]["list_planned_works_in_date_range"],
+        list_bonsai_func=async_services["garden"]["list_bonsai"],
     )
     fertilizantes_handler = partial(
         handle_fertilizantes,
-        list_fertilizers_func=services["fertilizer"]["list_fertilizers"],
+        list_fertilizers_func=async_services["fertilizer"]["list_fertilizers"],
     )
     fitosanitarios_handler = partial(
         handle_fitosanitarios,
-        list_phytosanitary_func=services["phytosanitary"]["list_phytosanitary"],
+        list_phytosanitary_func=async_services["phytosanitary"]["list_phytosanitary"],
     )
     especies_handler = partial(
         handle_especies,
-        list_species_func=services["herbarium"]["list_species"],
+        list_species_func=async_services["herbarium"]["list_species"],
     )
     historial_handler = partial(
         handle_historial,
-        get_bonsai_by_name_func=services["garden"]["get_bonsai_by_name"],
-        list_bonsai_events_func=services["bonsai_history"]["list_bonsai_events"],
+        get_bonsai_by_name_func=async_services["garden"]["get_bonsai_by_name"],
+        list_bonsai_events_func=async_services["bonsai_history"]["list_bonsai_events"],
     )
     fin_de_semana_handler = partial(
         handle_fin_de_semana,
-        list_planned_works_in_date_range_func=services["cultivation_plan"]["list_planned_works_in_date_range"],
-        list_bonsai_func=services["garden"]["list_bonsai"],
+        list_planned_works_in_date_range_func=async_services["cultivation_plan"]["list_planned_works_in_date_range"],
+        list_bonsai_func=async_services["garden"]["list_bonsai"],
     )
     plagas_handler = partial(
         handle_plagas,
-        list_pests_func=services["pest"]["list_pests"],
+        list_pests_func=async_services["pest"]["list_pests"],
     )
     tiempo_handler = partial(
         handle_tiempo,
-        get_user_settings_func=services["user_settings"]["get_user_settings"],
-        get_weather_func=fetch_weather,
+        get_user_settings_func=async_services["user_settings"]["get_user_settings"],
+        get_weather_func=fetch_cached_weather,
     )
     user_bot_handlers = [
         CommandHandler("start", start),
@@ -517,23 +552,18 @@ async def lifespan(app: FastAPI):
     )
     app.state.mimamori_runner = create_mimamori_agent_runner(
         model=orchestrator_model or model,
-        search_wiki_knowledge=create_http_search_wiki_knowledge_tool(KB_BASE_URL) if KB_BASE_URL else None,
-        read_wiki_page=create_http_read_wiki_page_tool(KB_BASE_URL) if KB_BASE_URL else None,
+        search_wiki_knowledge=create_http_search_wiki_knowledge_tool(KB_BASE_URL, wiki_client) if KB_BASE_URL else None,
+        read_wiki_page=create_http_read_wiki_page_tool(KB_BASE_URL, wiki_client) if KB_BASE_URL else None,
         list_bonsai_events=list_bonsai_events_tool,
         memory_service=memory_service,
     )
     app.state.mimamori_build_bonsai_snapshots = partial(
-        build_bonsai_snapshots,
-        list_bonsai_events_func=services["bonsai_history"]["list_bonsai_events"],
-        get_active_development_plan_func=services["development_plan"]["get_active_development_plan"],
-        get_active_fertilization_plan_func=services["fertilization_plan"]["get_active_fertilization_plan"],
-        get_recent_unlinked_pest_events_func=services["bonsai_history"]["get_recent_unlinked_pest_events"],
-        get_recently_abandoned_fertilization_plans_func=services["fertilization_plan"]["get_recently_abandoned_fertilization_plans"],
-        get_recently_abandoned_development_plans_func=services["development_plan"]["get_recently_abandoned_development_plans"],
+        build_bonsai_snapshots_batched,
+        load_bonsai_snapshot_data_func=services["bonsai_snapshot"]["load_bonsai_snapshot_data"],
     )
     app.state.mimamori_build_reflection_context = partial(
         build_reflection_context,
-        fetch_weather_func=fetch_weather,
+        fetch_weather_func=fetch_cached_weather,
     )
 
     mimamori_scheduler = create_mimamori_scheduler(
@@ -546,12 +576,18 @@ async def lifespan(app: FastAPI):
         list_planned_works_in_date_range_func=services["cultivation_plan"]["list_planned_works_in_date_range"],
         send_telegram_message_func=app.state.bot.send_message,
         search_memory_func=search_memory_func,
+        prefetch_weather_func=partial(prefetch_forecasts, forecast_cache),
     )
 
     yield
 
     mimamori_scheduler.shutdown()
     await bot_instance.shutdown()
+    if session_service is not None:
+        await session_service.close()
+    await get_async_engine().dispose()
+    await wiki_client.aclose()
+    thumbnail_cache.shutdown()
 
 
 configure_logging()
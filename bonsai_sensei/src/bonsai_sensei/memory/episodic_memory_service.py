@@ -1,3 +1,8 @@
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Callable
 
@@ -8,18 +13,48 @@ from google.adk.memory.base_memory_service import MemoryEntry, SearchMemoryRespo
 from google.adk.sessions.session import Session
 from google.genai import types
 
+from bonsai_sensei.metrics import MEMORY_SEARCH_CACHE_LOOKUPS_TOTAL
+
 _MEMORY_SYNCED_KEY = "memory_synced_event_count"
 
+MEMORY_SEARCH_CACHE_SIZE = int(os.getenv("MEMORY_SEARCH_CACHE_SIZE", "256"))
+MEMORY_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("MEMORY_SEARCH_CACHE_TTL_SECONDS", "30"))
+
 
-def create_search_memory_func(base_url: str) -> Callable:
+def create_search_memory_func(
+    base_url: str,
+    cache_size: int = MEMORY_SEARCH_CACHE_SIZE,
+    cache_ttl_seconds: float = MEMORY_SEARCH_CACHE_TTL_SECONDS,
+    clock: Callable[[], float] = time.monotonic,
+) -> Callable:
     """Create a callable that searches episodic memory via HTTP.
 
     Returns an async callable(user_id, query) -> str | None with the facts
     joined as newline-separated text, or None when no memories are found.
+    Results are kept for a short TTL keyed by (user_id, normalized query), so the
+    repeated lookups of one turn's tools skip the round-trip. The TTL is short because
+    this side is not told when the user's memory changes.
     """
     normalized_url = base_url.rstrip("/")
+    cache: OrderedDict[tuple[str, str], tuple[float, str | None]] = OrderedDict()
 
     async def search_memory(user_id: str, query: str) -> str | None:
+        key = (user_id, _normalize_query(query))
+        cached = cache.get(key)
+        if cached is not None and clock() - cached[0] < cache_ttl_seconds:
+            cache.move_to_end(key)
+            MEMORY_SEARCH_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc()
+            return cached[1]
+        MEMORY_SEARCH_CACHE_LOOKUPS_TOTAL.labels(result="miss").inc()
+        result = await fetch_memories(user_id, query)
+        if cache_size > 0:
+            cache[key] = (clock(), result)
+            cache.move_to_end(key)
+            while len(cache) > cache_size:
+                cache.popitem(last=False)
+        return result
+
+    async def fetch_memories(user_id: str, query: str) -> str | None:
         async with httpx.AsyncClient() as client:
             response = await client.get(
                 f"{normalized_url}/memory",
@@ -51,6 +86,15 @@ class EpisodicMemoryService(BaseMemoryService):
             )
         session.state[_MEMORY_SYNCED_KEY] = len(session.events)
 
+    async def end_session(self, user_id: str) -> None:
+        """Tell episodic memory the conversation ended so the buffered window becomes an episode now."""
+        async with httpx.AsyncClient() as client:
+            await client.post(
+                f"{self._base_url}/episodes",
+                json={"user_id": user_id, "messages": [], "end_of_session": True},
+                timeout=30,
+            )
+
     async def search_memory(self, *, app_name: str, user_id: str, query: str) -> SearchMemoryResponse:
         async with httpx.AsyncClient() as client:
             response = await client.get(
@@ -68,6 +112,10 @@ class EpisodicMemoryService(BaseMemoryService):
         )
 
 
+def _normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", query)).strip().casefold()
+
+
 def _extract_text_messages(events: Sequence[Event]) -> list[dict]:
     messages = []
     for event in events:
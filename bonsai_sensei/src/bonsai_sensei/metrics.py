@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 LLM_REQUEST_DURATION = Histogram(
     "llm_request_duration_seconds",
@@ -32,3 +32,78 @@ WIKI_REQUESTS_TOTAL = Counter(
     "Total number of wiki HTTP calls",
     ["operation", "status"],
 )
+
+
+MIMAMORI_QUEUE_DEPTH = Gauge(
+    "mimamori_queue_depth",
+    "Users waiting for a mimamori reflection slot",
+)
+
+MIMAMORI_USER_DURATION = Histogram(
+    "mimamori_user_duration_seconds",
+    "Per-user mimamori pipeline duration in seconds",
+    buckets=[1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0],
+)
+
+MIMAMORI_USER_RUNS_TOTAL = Counter(
+    "mimamori_user_runs_total",
+    "Total number of per-user mimamori runs",
+    ["status"],
+)
+
+
+SESSION_CACHE_RESIDENT = Gauge(
+    "session_cache_resident_sessions",
+    "ADK sessions currently held in the hot session cache",
+)
+
+SESSION_CACHE_LOOKUPS_TOTAL = Counter(
+    "session_cache_lookups_total",
+    "Session lookups served by the hot cache or loaded from the database",
+    ["result"],
+)
+
+SESSION_CACHE_EVICTIONS_TOTAL = Counter(
+    "session_cache_evictions_total",
+    "Sessions evicted from the hot cache",
+    ["reason"],
+)
+
+SESSION_WRITE_BEHIND_PENDING = Gauge(
+    "session_write_behind_pending_events",
+    "Session events buffered in memory and not yet written to the database",
+)
+
+SESSION_WRITE_BEHIND_FAILURES_TOTAL = Counter(
+    "session_write_behind_failures_total",
+    "Failed attempts to flush buffered session events to the database",
+)
+
+SESSION_WRITE_BEHIND_DROPPED_TOTAL = Counter(
+    "session_write_behind_dropped_events_total",
+    "Buffered session events dropped after repeatedly failing to reach the database",
+)
+
+MEMORY_SEARCH_CACHE_LOOKUPS_TOTAL = Counter(
+    "memory_search_cache_lookups_total",
+    "Episodic memory searches answered from the local short-TTL cache (hit) or over HTTP (miss)",
+    ["result"],
+)
+
+WEATHER_CACHE_LOOKUPS_TOTAL = Counter(
+    "weather_cache_lookups_total",
+    "Weather forecast lookups served fresh (hit) or stale from the cache, joined to a fetch in flight (coalesced) or fetched (miss)",
+    ["result"],
+)
+
+THUMBNAIL_CACHE_LOOKUPS_TOTAL = Counter(
+    "thumbnail_cache_lookups_total",
+    "Photo thumbnail lookups served from the disk cache (hit), joined to a render in flight (coalesced) or rendered (miss)",
+    ["result"],
+)
+
+TELEGRAM_PHOTOS_SENT_TOTAL = Counter(
+    "telegram_photos_sent_total",
+    "Photos sent to Telegram by reusing the file_id of an earlier upload (file_id) or by uploading their bytes (upload)",
+    ["source"],
+)
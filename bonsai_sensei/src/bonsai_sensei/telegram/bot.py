@@ -1,14 +1,28 @@
 import html
 import os
-from telegram import ForceReply, InlineKeyboardButton, InlineKeyboardMarkup
+from pathlib import Path
+from telegram import ForceReply, InlineKeyboardButton, InlineKeyboardMarkup, InputMediaPhoto, Message
+from telegram.error import BadRequest
 from telegram.ext import Application
 from bonsai_sensei.logging_config import get_logger
+from bonsai_sensei.metrics import TELEGRAM_PHOTOS_SENT_TOTAL
+from bonsai_sensei.telegram.file_ids import TelegramFileIds
 
 logger = get_logger(__name__)
 
+# Telegram's limit on photos per album (media group).
+MEDIA_GROUP_MAX_SIZE = 10
+
 class TelegramBot:
-    def __init__(self, token: str | None = None, handlers: list = None, error_handler=None):
+    def __init__(
+        self,
+        token: str | None = None,
+        handlers: list = None,
+        error_handler=None,
+        file_ids: TelegramFileIds | None = None,
+    ):
         self.application = None
+        self.file_ids = file_ids or TelegramFileIds()
         resolved_token = token or os.getenv("TELEGRAM_BOT_TOKEN")
         if resolved_token:
             self.application = Application.builder().token(resolved_token).concurrent_updates(True).build()
@@ -88,27 +102,72 @@ class TelegramBot:
         if not self.application:
             logger.error("Cannot send photo selection: Bot not configured")
             return
-        for index, (option, photo_file_path) in enumerate(zip(options, photo_file_paths)):
-            keyboard = InlineKeyboardMarkup([[
-                InlineKeyboardButton(f"✅ {option}", callback_data=f"selection:{selection_id}:{index}")
-            ]])
-            from pathlib import Path
-            path = Path(photo_file_path)
-            if path.exists():
-                with open(path, "rb") as photo_file:
-                    await self.application.bot.send_photo(chat_id=chat_id, photo=photo_file, reply_markup=keyboard)
-            else:
-                await self.application.bot.send_message(chat_id=chat_id, text=f"🌿 {option}", reply_markup=keyboard)
-        cancel_keyboard = InlineKeyboardMarkup([[
-            InlineKeyboardButton("🚫 Ninguna de las anteriores", callback_data=f"selection:{selection_id}:none")
-        ]])
+        await self.send_photos(chat_id=chat_id, photo_file_paths=photo_file_paths, captions=options)
+        keyboard = InlineKeyboardMarkup([
+            *[[InlineKeyboardButton(f"✅ {option}", callback_data=f"selection:{selection_id}:{index}")]
+              for index, option in enumerate(options)],
+            [InlineKeyboardButton("🚫 Ninguna de las anteriores", callback_data=f"selection:{selection_id}:none")],
+        ])
         await self.application.bot.send_message(
             chat_id=chat_id,
             text=f"<b>{html.escape(question)}</b>",
-            reply_markup=cancel_keyboard,
+            reply_markup=keyboard,
             parse_mode="HTML",
         )
 
+    async def send_photos(self, chat_id: str, photo_file_paths: list[str], captions: list[str] | None = None):
+        """Send photos as albums of up to MEDIA_GROUP_MAX_SIZE, skipping missing files.
+
+        Photos sent before are referenced by their Telegram file_id instead of being uploaded
+        again. If Telegram rejects a remembered file_id, the batch is uploaded once more.
+        """
+        if not self.application:
+            logger.error("Cannot send photos: Bot not configured")
+            return
+        captions = captions or [None] * len(photo_file_paths)
+        photos = [
+            (Path(photo_file_path), caption)
+            for photo_file_path, caption in zip(photo_file_paths, captions)
+            if Path(photo_file_path).exists()
+        ]
+        for start in range(0, len(photos), MEDIA_GROUP_MAX_SIZE):
+            await self._send_photo_batch(chat_id, photos[start:start + MEDIA_GROUP_MAX_SIZE])
+
+    async def _send_photo_batch(self, chat_id: str, photos: list[tuple[Path, str | None]]):
+        content_hashes = await self.file_ids.hash_files([path for path, _ in photos])
+        known = await self.file_ids.lookup(content_hashes)
+        try:
+            messages = await self._send_media(chat_id, photos, content_hashes, known)
+        except BadRequest:
+            if not known:
+                raise
+            logger.warning("Telegram rejected remembered file_ids, uploading the photos again", exc_info=True)
+            await self.file_ids.forget(list(known))
+            known = {}
+            messages = await self._send_media(chat_id, photos, content_hashes, known)
+        TELEGRAM_PHOTOS_SENT_TOTAL.labels(source="file_id").inc(len(known))
+        TELEGRAM_PHOTOS_SENT_TOTAL.labels(source="upload").inc(len(photos) - len(known))
+        await self.file_ids.remember({
+            content_hash: message.photo[-1].file_id
+            for content_hash, message in zip(content_hashes, messages)
+            if content_hash not in known and message.photo
+        })
+
+    async def _send_media(
+        self,
+        chat_id: str,
+        photos: list[tuple[Path, str | None]],
+        content_hashes: list[str],
+        known: dict[str, str],
+    ) -> tuple[Message, ...]:
+        media = [known.get(content_hash) or path.read_bytes() for (path, _), content_hash in zip(photos, content_hashes)]
+        if len(photos) == 1:
+            return (await self.application.bot.send_photo(chat_id=chat_id, photo=media[0], caption=photos[0][1]),)
+        return await self.application.bot.send_media_group(
+            chat_id=chat_id,
+            media=[InputMediaPhoto(photo, caption=caption) for photo, (_, caption) in zip(media, photos)],
+        )
+
     async def send_plan_review_message(self, chat_id: str, text: str, review_id: str):
         if not self.application:
             logger.error("Cannot send plan review message: Bot not configured")
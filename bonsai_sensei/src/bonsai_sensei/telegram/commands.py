@@ -31,8 +31,8 @@ async def handle_mis_bonsais(
     list_species_func=None,
 ):
     user_id = str(update.effective_user.id)
-    bonsais = list_bonsai_func(user_id=user_id)
-    species_list = list_species_func()
+    bonsais = await list_bonsai_func(user_id=user_id)
+    species_list = await list_species_func()
     species_id_to_name = {species.id: species.name for species in species_list}
     text = build_bonsai_list(bonsais, species_id_to_name)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
@@ -49,11 +49,11 @@ async def handle_plan(
         return
     user_id = str(update.effective_user.id)
     bonsai_name = " ".join(context.args)
-    bonsai = get_bonsai_by_name_func(bonsai_name, user_id=user_id)
+    bonsai = await get_bonsai_by_name_func(bonsai_name, user_id=user_id)
     if not bonsai:
         await update.message.reply_text(f"No encontré ningún bonsái llamado '{bonsai_name}'.")
         return
-    works = list_planned_works_func(bonsai.id)
+    works = await list_planned_works_func(bonsai.id)
     text = build_planned_works_list(bonsai.name, works)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
 
@@ -66,8 +66,8 @@ async def handle_proximos(
 ):
     user_id = str(update.effective_user.id)
     today = date.today()
-    works = list_planned_works_in_date_range_func(today, today + timedelta(days=_UPCOMING_DAYS))
-    bonsais = list_bonsai_func(user_id=user_id)
+    works = await list_planned_works_in_date_range_func(today, today + timedelta(days=_UPCOMING_DAYS))
+    bonsais = await list_bonsai_func(user_id=user_id)
     bonsai_id_to_name = {bonsai.id: bonsai.name for bonsai in bonsais}
     text = build_upcoming_works_list(works, bonsai_id_to_name)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
@@ -79,7 +79,7 @@ async def handle_fertilizantes(
     list_fertilizers_func=None,
 ):
     user_id = str(update.effective_user.id)
-    fertilizers = list_fertilizers_func(user_id=user_id)
+    fertilizers = await list_fertilizers_func(user_id=user_id)
     text = build_fertilizer_list(fertilizers)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
 
@@ -90,7 +90,7 @@ async def handle_fitosanitarios(
     list_phytosanitary_func=None,
 ):
     user_id = str(update.effective_user.id)
-    phytosanitaries = list_phytosanitary_func(user_id=user_id)
+    phytosanitaries = await list_phytosanitary_func(user_id=user_id)
     text = build_phytosanitary_list(phytosanitaries)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
 
@@ -100,7 +100,7 @@ async def handle_especies(
     context: ContextTypes.DEFAULT_TYPE,
     list_species_func=None,
 ):
-    species_list = list_species_func()
+    species_list = await list_species_func()
     text = build_species_list(species_list)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
 
@@ -116,11 +116,11 @@ async def handle_historial(
         return
     user_id = str(update.effective_user.id)
     bonsai_name = " ".join(context.args)
-    bonsai = get_bonsai_by_name_func(bonsai_name, user_id=user_id)
+    bonsai = await get_bonsai_by_name_func(bonsai_name, user_id=user_id)
     if not bonsai:
         await update.message.reply_text(f"No encontré ningún bonsái llamado '{bonsai_name}'.")
         return
-    events = list_bonsai_events_func(bonsai.id)
+    events = await list_bonsai_events_func(bonsai.id)
     text = build_bonsai_history(bonsai.name, events)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
 
@@ -136,8 +136,8 @@ async def handle_fin_de_semana(
     days_until_saturday = (5 - today.weekday()) % 7 or 7
     saturday = today + timedelta(days=days_until_saturday)
     sunday = saturday + timedelta(days=1)
-    works = list_planned_works_in_date_range_func(saturday, sunday)
-    bonsais = list_bonsai_func(user_id=user_id)
+    works = await list_planned_works_in_date_range_func(saturday, sunday)
+    bonsais = await list_bonsai_func(user_id=user_id)
     bonsai_id_to_name = {bonsai.id: bonsai.name for bonsai in bonsais}
     text = build_weekend_works_list(saturday, sunday, works, bonsai_id_to_name)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
@@ -148,7 +148,7 @@ async def handle_plagas(
     context: ContextTypes.DEFAULT_TYPE,
     list_pests_func=None,
 ):
-    pests = list_pests_func()
+    pests = await list_pests_func()
     text = build_pest_list(pests)
     await update.message.reply_text(text, parse_mode=ParseMode.HTML)
 
@@ -162,7 +162,7 @@ async def handle_tiempo(
     location = " ".join(context.args) if context.args else None
     if not location:
         user_id = str(update.effective_user.id)
-        user_settings = get_user_settings_func(user_id)
+        user_settings = await get_user_settings_func(user_id)
         location = user_settings.location if user_settings else None
     if not location:
         await update.message.reply_text(build_no_location_message())
@@ -0,0 +1,71 @@
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from bonsai_sensei.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TelegramFileIds:
+    """Telegram file_ids of photos uploaded before, keyed by the SHA-256 of the photo bytes.
+
+    Sending a file_id instead of the bytes makes Telegram reuse its stored copy, so nothing
+    is uploaded. Ids are kept in memory and, when store functions are given, persisted so
+    they survive restarts. Database failures of the store are logged and only cost a new upload.
+    """
+
+    def __init__(
+        self,
+        get_file_ids_func: Callable[..., Awaitable[dict[str, str]]] | None = None,
+        save_file_id_func: Callable[..., Awaitable[object]] | None = None,
+        delete_file_ids_func: Callable[..., Awaitable[object]] | None = None,
+    ):
+        self._get_file_ids = get_file_ids_func
+        self._save_file_id = save_file_id_func
+        self._delete_file_ids = delete_file_ids_func
+        self._file_ids: dict[str, str] = {}
+
+    async def hash_files(self, paths: list[Path]) -> list[str]:
+        return await asyncio.to_thread(lambda: [_hash_file(path) for path in paths])
+
+    async def lookup(self, content_hashes: list[str]) -> dict[str, str]:
+        missing = [content_hash for content_hash in content_hashes if content_hash not in self._file_ids]
+        if missing and self._get_file_ids is not None:
+            try:
+                self._file_ids.update(await self._get_file_ids(content_hashes=missing))
+            except SQLAlchemyError:
+                logger.warning("Could not load Telegram file_ids", exc_info=True)
+        return {
+            content_hash: self._file_ids[content_hash]
+            for content_hash in content_hashes
+            if content_hash in self._file_ids
+        }
+
+    async def remember(self, file_ids: dict[str, str]) -> None:
+        self._file_ids.update(file_ids)
+        if self._save_file_id is None:
+            return
+        for content_hash, file_id in file_ids.items():
+            try:
+                await self._save_file_id(content_hash=content_hash, file_id=file_id)
+            except SQLAlchemyError:
+                logger.warning("Could not store Telegram file_id", exc_info=True)
+
+    async def forget(self, content_hashes: list[str]) -> None:
+        for content_hash in content_hashes:
+            self._file_ids.pop(content_hash, None)
+        if self._delete_file_ids is None:
+            return
+        try:
+            await self._delete_file_ids(content_hashes=content_hashes)
+        except SQLAlchemyError:
+            logger.warning("Could not delete Telegram file_ids", exc_info=True)
+
+
+def _hash_file(path: Path) -> str:
+    with open(path, "rb") as photo_file:
+        return hashlib.file_digest(photo_file, "sha256").hexdigest()
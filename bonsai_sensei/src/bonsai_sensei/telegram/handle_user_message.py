@@ -45,6 +45,7 @@ async def handle_user_message(
     users_awaiting_location: set | None = None,
     pending_human_responses: dict | None = None,
     pending_confirmation_cleanups: dict | None = None,
+    send_photos_func: Callable | None = None,
 ):
     user_id = str(update.effective_user.id)
     chat_id = str(update.effective_chat.id)
@@ -130,7 +131,7 @@ async def handle_user_message(
                 pass
 
     await _reply_with_html(update, response.text)
-    await _send_photos(update, response.photos)
+    await _send_photos(update, response.photos, chat_id, send_photos_func)
 
     latency_ms = (time.monotonic() - start_time) * 1000
     _message_counter.add(1, {"user.id": user_id})
@@ -157,8 +158,13 @@ async def _confirm_and_save_location(
         await update.message.reply_text("Ubicación cancelada.")
 
 
-async def _send_photos(update: Update, photo_paths: list[str]) -> None:
+async def _send_photos(
+    update: Update, photo_paths: list[str], chat_id: str, send_photos_func: Callable | None = None
+) -> None:
     photos_dir = Path(os.getenv("PHOTOS_PATH", "./photos"))
+    if send_photos_func and photo_paths:
+        await send_photos_func(chat_id=chat_id, photo_file_paths=[str(photos_dir / file_path) for file_path in photo_paths])
+        return
     for file_path in photo_paths:
         full_path = photos_dir / file_path
         if full_path.exists():
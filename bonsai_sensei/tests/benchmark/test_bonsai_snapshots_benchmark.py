@@ -0,0 +1,101 @@
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+
+import pytest
+from hamcrest import assert_that, equal_to
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+from bonsai_sensei.domain.bonsai import Bonsai
+from bonsai_sensei.domain.bonsai_event import BonsaiEvent
+from bonsai_sensei.domain.development_plan import DevelopmentPlan
+from bonsai_sensei.domain.fertilization_plan import FertilizationPlan
+from bonsai_sensei.domain.services.data_services import create_data_services
+from bonsai_sensei.domain.services.mimamori.context import build_bonsai_snapshots, build_bonsai_snapshots_batched
+from bonsai_sensei.domain.species import Species
+from bonsai_sensei.domain.user_settings import UserSettings
+
+BONSAI_COUNT = int(os.getenv("BENCHMARK_BONSAI_COUNT", "300"))
+EVENTS_PER_BONSAI = int(os.getenv("BENCHMARK_EVENTS_PER_BONSAI", "20"))
+
+
+@pytest.mark.integration
+def should_build_snapshots_with_constant_query_count(populated_engine):
+    services = create_data_services(lambda: Session(populated_engine, expire_on_commit=False))
+    bonsais = services["garden"]["list_bonsai"]()
+    looped = partial(
+        build_bonsai_snapshots,
+        list_bonsai_events_func=services["bonsai_history"]["list_bonsai_events"],
+        get_active_development_plan_func=services["development_plan"]["get_active_development_plan"],
+        get_active_fertilization_plan_func=services["fertilization_plan"]["get_active_fertilization_plan"],
+        get_recent_unlinked_pest_events_func=services["bonsai_history"]["get_recent_unlinked_pest_events"],
+        get_recently_abandoned_fertilization_plans_func=services["fertilization_plan"]["get_recently_abandoned_fertilization_plans"],
+        get_recently_abandoned_development_plans_func=services["development_plan"]["get_recently_abandoned_development_plans"],
+    )
+    batched = partial(
+        build_bonsai_snapshots_batched,
+        load_bonsai_snapshot_data_func=services["bonsai_snapshot"]["load_bonsai_snapshot_data"],
+    )
+
+    looped_queries, looped_seconds = _measure(populated_engine, looped, bonsais)
+    batched_queries, batched_seconds = _measure(populated_engine, batched, bonsais)
+
+    logging.info(
+        f"{len(bonsais)} bonsai: loop={looped_queries} queries {looped_seconds * 1000:.0f}ms, "
+        f"batched={batched_queries} queries {batched_seconds * 1000:.0f}ms"
+    )
+    assert_that(batched_queries, equal_to(6), "Batched snapshot loading must not depend on the number of bonsai")
+
+
+def _measure(engine, build_snapshots, bonsais) -> tuple[int, float]:
+    statements = []
+
+    def count_statement(*_):
+        statements.append(1)
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    started = time.perf_counter()
+    build_snapshots(bonsais, {})
+    elapsed = time.perf_counter() - started
+    event.remove(engine, "before_cursor_execute", count_statement)
+    return len(statements), elapsed
+
+
+@pytest.fixture
+def populated_engine():
+    engine = create_engine(os.getenv("BENCHMARK_DATABASE_URL", "sqlite:///:memory:"))
+    tables = [
+        UserSettings.__table__,
+        Species.__table__,
+        Bonsai.__table__,
+        BonsaiEvent.__table__,
+        DevelopmentPlan.__table__,
+        FertilizationPlan.__table__,
+    ]
+    SQLModel.metadata.create_all(engine, tables=tables)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        species = Species(name="olmo", scientific_name="Ulmus")
+        session.add(species)
+        session.flush()
+        for index in range(BONSAI_COUNT):
+            bonsai = Bonsai(name=f"bonsai-{index}", species_id=species.id)
+            session.add(bonsai)
+            session.flush()
+            session.add_all(
+                BonsaiEvent(bonsai_id=bonsai.id, event_type="watering", payload={}, occurred_at=now - timedelta(days=day))
+                for day in range(EVENTS_PER_BONSAI)
+            )
+            session.add(FertilizationPlan(
+                bonsai_id=bonsai.id,
+                period_start=date(2025, 1, 1),
+                period_end=date(2025, 12, 31),
+                goal="engorde",
+                wiki_path=f"plans/{index}.md",
+            ))
+        session.commit()
+    yield engine
+    SQLModel.metadata.drop_all(engine, tables=list(reversed(tables)))
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+import os
+import statistics
+import time
+from functools import partial
+
+import pytest
+from hamcrest import assert_that, less_than_or_equal_to
+
+from bonsai_sensei.database.session import get_async_engine, get_async_session, get_engine, get_session
+from bonsai_sensei.domain.services.data_services import create_async_data_services, create_data_services
+
+CONCURRENT_USERS = int(os.getenv("BENCHMARK_CONCURRENT_USERS", "50"))
+QUERIES_PER_USER = int(os.getenv("BENCHMARK_QUERIES_PER_USER", "20"))
+
+
+@pytest.mark.integration
+async def should_serve_concurrent_users_with_lower_p95_on_async_path():
+    sync_services = create_data_services(partial(get_session, engine=get_engine()))
+    async_services = create_async_data_services(partial(get_async_session, engine=get_async_engine()))
+
+    sync_p95 = _p95(await _simulate_users(_blocking_call(sync_services["garden"]["list_bonsai"])))
+    async_p95 = _p95(await _simulate_users(async_services["garden"]["list_bonsai"]))
+    await get_async_engine().dispose()
+
+    logging.info(
+        f"{CONCURRENT_USERS} users x {QUERIES_PER_USER} queries: "
+        f"sync p95={sync_p95 * 1000:.1f}ms async p95={async_p95 * 1000:.1f}ms"
+    )
+    assert_that(async_p95, less_than_or_equal_to(sync_p95), "Async session path must not be slower than the blocking path under concurrency")
+
+
+def _blocking_call(list_bonsai):
+    async def call(user_id: str):
+        return list_bonsai(user_id=user_id)
+
+    return call
+
+
+async def _simulate_users(list_bonsai) -> list[float]:
+    async def timed_request(user_index: int, issued_at: float) -> float:
+        await list_bonsai(user_id=f"benchmark-user-{user_index}")
+        return time.perf_counter() - issued_at
+
+    latencies = []
+    for _ in range(QUERIES_PER_USER):
+        issued_at = time.perf_counter()
+        latencies.extend(
+            await asyncio.gather(*(timed_request(index, issued_at) for index in range(CONCURRENT_USERS)))
+        )
+    return latencies
+
+
+def _p95(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=20)[-1]
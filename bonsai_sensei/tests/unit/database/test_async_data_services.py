@@ -0,0 +1,79 @@
+import pytest
+from hamcrest import assert_that, equal_to, contains_exactly
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from bonsai_sensei.domain.bonsai import Bonsai
+from bonsai_sensei.domain.species import Species
+from bonsai_sensei.domain.telegram_file import TelegramFile
+from bonsai_sensei.domain.user_settings import UserSettings
+from bonsai_sensei.domain.services.data_services import create_async_data_services, create_data_services
+
+
+async def should_create_and_list_bonsai_through_async_services(async_services, existing_species):
+    await async_services["garden"]["create_bonsai"](bonsai=Bonsai(name="Hinoki", species_id=existing_species.id))
+
+    bonsai_list = await async_services["garden"]["list_bonsai"]()
+
+    assert_that([bonsai.name for bonsai in bonsai_list], contains_exactly("hinoki"), "Async list_bonsai must return bonsai created through the async path")
+
+
+async def should_return_entity_with_generated_id_from_async_create(existing_species):
+    assert_that(existing_species.id, equal_to(1), "Async create must refresh the entity so its generated id is available")
+
+
+async def should_return_none_from_async_create_when_species_is_missing(async_services):
+    created = await async_services["garden"]["create_bonsai"](bonsai=Bonsai(name="ghost", species_id=999))
+
+    assert_that(created, equal_to(None), "Async create_bonsai must keep the store contract for unknown species")
+
+
+async def should_reject_async_call_without_session_factory():
+    services = create_async_data_services(None)
+
+    with pytest.raises(ValueError):
+        await services["garden"]["list_bonsai"]()
+
+
+async def should_store_replace_and_delete_telegram_file_ids(async_services):
+    telegram_file = async_services["telegram_file"]
+    await telegram_file["save_telegram_file_id"](content_hash="abc", file_id="first")
+    await telegram_file["save_telegram_file_id"](content_hash="abc", file_id="second")
+    await telegram_file["save_telegram_file_id"](content_hash="def", file_id="other")
+    await telegram_file["delete_telegram_file_ids"](content_hashes=["def"])
+
+    file_ids = await telegram_file["get_telegram_file_ids"](content_hashes=["abc", "def", "missing"])
+
+    assert_that(file_ids, equal_to({"abc": "second"}), "Saving a known hash must replace its file_id")
+
+
+def should_expose_same_service_names_for_sync_and_async_registries():
+    sync_names = {group: sorted(functions) for group, functions in create_data_services(None).items()}
+    async_names = {group: sorted(functions) for group, functions in create_async_data_services(None).items()}
+
+    assert_that(async_names, equal_to(sync_names), "Async registry must mirror every sync service")
+
+
+@pytest.fixture
+async def existing_species(async_services):
+    return await async_services["herbarium"]["create_species"](species=Species(name="hinoki", scientific_name="Chamaecyparis obtusa"))
+
+
+@pytest.fixture
+async def async_services(async_engine):
+    return create_async_data_services(lambda: AsyncSession(async_engine, expire_on_commit=False))
+
+
+@pytest.fixture
+async def async_engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    async with engine.begin() as connection:
+        await connection.run_sync(
+            lambda sync_connection: SQLModel.metadata.create_all(
+                sync_connection, tables=[UserSettings.__table__, Species.__table__, Bonsai.__table__, TelegramFile.__table__]
+            )
+        )
+    yield engine
+    await engine.dispose()
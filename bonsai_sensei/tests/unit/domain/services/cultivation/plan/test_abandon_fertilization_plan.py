@@ -1,4 +1,5 @@
 from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
 import pytest
 from hamcrest import assert_that, equal_to, contains_string
 
@@ -44,7 +45,7 @@ async def should_return_error_when_no_active_plan(tool_context, get_bonsai_by_na
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=ask_human_func,
         build_bonsai_name_question=build_bonsai_name_question_func,
         ask_confirmation=ask_confirmation_confirm,
@@ -65,7 +66,7 @@ async def should_return_cancelled_when_user_declines(tool_context, get_bonsai_by
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=ask_human_func,
         build_bonsai_name_question=build_bonsai_name_question_func,
         ask_confirmation=ask_confirmation_cancel,
@@ -91,7 +92,7 @@ async def should_mark_plan_as_abandoned_on_confirm(tool_context, get_bonsai_by_n
         update_fertilization_plan_func=update_plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=ask_human_func,
         build_bonsai_name_question=build_bonsai_name_question_func,
         ask_confirmation=ask_confirmation_confirm,
@@ -119,7 +120,7 @@ async def should_delete_future_works_on_confirm(tool_context, get_bonsai_by_name
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=delete_future_works,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=ask_human_func,
         build_bonsai_name_question=build_bonsai_name_question_func,
         ask_confirmation=ask_confirmation_confirm,
@@ -142,7 +143,7 @@ async def should_update_wiki_page_with_abandonment_section_on_confirm(tool_conte
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: written_pages.update({path: content}) or {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: written_pages.update({path: content}) or {"status": "success"}),
         ask_human=ask_human_func,
         build_bonsai_name_question=build_bonsai_name_question_func,
         ask_confirmation=ask_confirmation_confirm,
@@ -198,7 +199,7 @@ def build_abandon_confirmation_message():
 
 @pytest.fixture
 def read_wiki_page_func():
-    return lambda path: {"status": "error", "message": "page_not_found"}
+    return AsyncMock(return_value={"status": "error", "message": "page_not_found"})
 
 
 @pytest.fixture
@@ -221,7 +222,7 @@ def tool(get_bonsai_by_name_func, ask_human_func, build_bonsai_name_question_fun
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=ask_human_func,
         build_bonsai_name_question=build_bonsai_name_question_func,
         ask_confirmation=ask_confirmation_confirm,
@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock
+
 import pytest
 from hamcrest import assert_that, equal_to, not_none, contains_string
 
@@ -38,9 +40,9 @@ async def should_return_error_when_no_fertilizers_available(get_bonsai_by_name_f
         update_fertilization_plan_func=lambda plan: plan,
         create_planned_work_func=lambda work: work,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
-        read_wiki_page_func=lambda path: {"status": "error"},
-        write_wiki_page_func=lambda path, content: {"status": "success"},
-        list_wiki_files_func=lambda directory, pattern="*.md": [],
+        read_wiki_page_func=AsyncMock(side_effect=lambda path: {"status": "error"}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
+        list_wiki_files_func=AsyncMock(side_effect=lambda directory, pattern="*.md": []),
         run_clarification_loop=stub_run_clarification_loop,
         run_plan_proposal=stub_run_plan_proposal,
         ask_human=ask_human_func,
@@ -81,9 +83,9 @@ async def should_return_cancelled_when_user_declines(get_bonsai_by_name_func, li
         update_fertilization_plan_func=lambda plan: plan,
         create_planned_work_func=lambda work: work,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
-        read_wiki_page_func=lambda path: {"status": "error"},
-        write_wiki_page_func=lambda path, content: {"status": "success"},
-        list_wiki_files_func=lambda directory, pattern="*.md": [],
+        read_wiki_page_func=AsyncMock(side_effect=lambda path: {"status": "error"}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
+        list_wiki_files_func=AsyncMock(side_effect=lambda directory, pattern="*.md": []),
         run_clarification_loop=stub_run_clarification_loop,
         run_plan_proposal=stub_run_plan_proposal_cancelled,
         ask_human=ask_human_func,
@@ -110,9 +112,9 @@ async def should_not_create_records_when_user_cancels(get_bonsai_by_name_func, l
         update_fertilization_plan_func=lambda plan: plan,
         create_planned_work_func=lambda work: created_works.append(work) or work,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
-        read_wiki_page_func=lambda path: {"status": "error"},
-        write_wiki_page_func=lambda path, content: {"status": "success"},
-        list_wiki_files_func=lambda directory, pattern="*.md": [],
+        read_wiki_page_func=AsyncMock(side_effect=lambda path: {"status": "error"}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
+        list_wiki_files_func=AsyncMock(side_effect=lambda directory, pattern="*.md": []),
         run_clarification_loop=stub_run_clarification_loop,
         run_plan_proposal=stub_run_plan_proposal_cancelled,
         ask_human=ask_human_func,
@@ -154,9 +156,9 @@ async def should_write_wiki_page_on_confirm(get_bonsai_by_name_func, list_fertil
         update_fertilization_plan_func=lambda plan: plan,
         create_planned_work_func=lambda work: work,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
-        read_wiki_page_func=lambda path: {"status": "error"},
-        write_wiki_page_func=lambda path, content: written_pages.update({path: content}) or {"status": "success"},
-        list_wiki_files_func=lambda directory, pattern="*.md": [],
+        read_wiki_page_func=AsyncMock(side_effect=lambda path: {"status": "error"}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: written_pages.update({path: content}) or {"status": "success"}),
+        list_wiki_files_func=AsyncMock(side_effect=lambda directory, pattern="*.md": []),
         run_clarification_loop=stub_run_clarification_loop,
         run_plan_proposal=stub_run_plan_proposal,
         ask_human=ask_human_func,
@@ -188,9 +190,9 @@ async def should_abandon_existing_plan_when_creating_new_one(get_bonsai_by_name_
         update_fertilization_plan_func=lambda plan: updated_plans.append(plan) or plan,
         create_planned_work_func=lambda work: work,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: deleted_future_works_calls.append(plan_id) or 0,
-        read_wiki_page_func=lambda path: {"status": "success", "content": "**Status:** active\nsome content"},
-        write_wiki_page_func=lambda path, content: {"status": "success"},
-        list_wiki_files_func=lambda directory, pattern="*.md": [],
+        read_wiki_page_func=AsyncMock(side_effect=lambda path: {"status": "success", "content": "**Status:** active\nsome content"}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
+        list_wiki_files_func=AsyncMock(side_effect=lambda directory, pattern="*.md": []),
         run_clarification_loop=stub_run_clarification_loop,
         run_plan_proposal=stub_run_plan_proposal,
         ask_human=ask_human_func,
@@ -221,9 +223,9 @@ async def should_pass_bonsai_name_and_period_to_clarification_prompt(get_bonsai_
         update_fertilization_plan_func=lambda plan: plan,
         create_planned_work_func=lambda work: work,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
-        read_wiki_page_func=lambda path: {"status": "error"},
-        write_wiki_page_func=lambda path, content: {"status": "success"},
-        list_wiki_files_func=lambda directory, pattern="*.md": [],
+        read_wiki_page_func=AsyncMock(side_effect=lambda path: {"status": "error"}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
+        list_wiki_files_func=AsyncMock(side_effect=lambda directory, pattern="*.md": []),
         run_clarification_loop=capturing_clarification,
         run_plan_proposal=stub_run_plan_proposal,
         ask_human=ask_human_func,
@@ -328,9 +330,9 @@ def tool(get_bonsai_by_name_func, list_fertilizers_func, created_plans, created_
         update_fertilization_plan_func=lambda plan: plan,
         create_planned_work_func=create_planned_work,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
-        read_wiki_page_func=lambda path: {"status": "error"},
-        write_wiki_page_func=lambda path, content: {"status": "success"},
-        list_wiki_files_func=lambda directory, pattern="*.md": [],
+        read_wiki_page_func=AsyncMock(side_effect=lambda path: {"status": "error"}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
+        list_wiki_files_func=AsyncMock(side_effect=lambda directory, pattern="*.md": []),
         run_clarification_loop=stub_run_clarification_loop,
         run_plan_proposal=stub_run_plan_proposal,
         ask_human=ask_human_func,
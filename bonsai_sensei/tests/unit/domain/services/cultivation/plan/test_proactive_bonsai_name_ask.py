@@ -1,4 +1,5 @@
 from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
 import pytest
 from hamcrest import assert_that, equal_to
 
@@ -24,7 +25,7 @@ async def should_ask_for_bonsai_name_when_not_provided(tool_context, get_bonsai_
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=ask_human_capture,
         build_bonsai_name_question=lambda: "¿Para qué bonsái?",
         ask_confirmation=ask_confirmation_confirm,
@@ -51,7 +52,7 @@ async def should_not_ask_for_bonsai_name_when_already_provided(tool_context, get
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=ask_human_capture,
         build_bonsai_name_question=lambda: "¿Para qué bonsái?",
         ask_confirmation=ask_confirmation_confirm,
@@ -78,7 +79,7 @@ async def should_use_asked_bonsai_name_to_look_up_bonsai(tool_context, ask_confi
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=lambda question, tool_context=None: _async_return("Shikamaru"),
         build_bonsai_name_question=lambda: "¿Para qué bonsái?",
         ask_confirmation=ask_confirmation_confirm,
@@ -109,7 +110,7 @@ async def should_not_ask_when_bonsai_name_in_session_state(ask_confirmation_conf
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=ask_human_capture,
         build_bonsai_name_question=lambda: "¿Para qué bonsái?",
         ask_confirmation=ask_confirmation_confirm,
@@ -136,7 +137,7 @@ async def should_store_resolved_name_in_session_state(ask_confirmation_confirm,
         update_fertilization_plan_func=lambda plan: plan,
         delete_future_planned_works_func=lambda plan_id, cutoff_date: 0,
         read_wiki_page_func=read_wiki_page_func,
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         ask_human=lambda question, tool_context=None: _async_return("Shikamaru"),
         build_bonsai_name_question=lambda: "¿Para qué bonsái?",
         ask_confirmation=ask_confirmation_confirm,
@@ -187,7 +188,7 @@ def build_abandon_confirmation_message():
 
 @pytest.fixture
 def read_wiki_page_func():
-    return lambda path: {"status": "error", "message": "page_not_found"}
+    return AsyncMock(return_value={"status": "error", "message": "page_not_found"})
 
 
 def _active_plan(bonsai_id=1):
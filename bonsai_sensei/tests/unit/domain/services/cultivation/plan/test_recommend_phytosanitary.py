@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock
+
 import pytest
 from hamcrest import assert_that, equal_to, contains_string
 
@@ -22,8 +24,8 @@ async def should_return_error_when_no_products_available(get_bonsai_by_name_func
         get_bonsai_by_name_func=get_bonsai_by_name_func,
         list_bonsai_events_func=lambda bonsai_id: [],
         list_phytosanitary_func=lambda user_id=None: [],
-        read_wiki_page_func=lambda path: {"status": "error", "message": "page_not_found"},
-        write_wiki_page_func=lambda path, content: {"status": "success"},
+        read_wiki_page_func=AsyncMock(side_effect=lambda path: {"status": "error", "message": "page_not_found"}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: {"status": "success"}),
         run_recommendation=stub_run_recommendation,
     )
 
@@ -37,7 +39,7 @@ async def should_return_error_when_no_products_available(get_bonsai_by_name_func
 async def should_write_wiki_page_after_recommendation(get_bonsai_by_name_func, list_phytosanitary_func, list_bonsai_events_func, read_wiki_page_func):
     written_pages = {}
 
-    def write_wiki_page(path, content):
+    async def write_wiki_page(path, content):
         written_pages[path] = content
         return {"status": "success"}
 
@@ -155,12 +157,12 @@ def list_bonsai_events_func():
 
 @pytest.fixture
 def read_wiki_page_func():
-    return lambda path: {"status": "error", "message": "page_not_found"}
+    return AsyncMock(return_value={"status": "error", "message": "page_not_found"})
 
 
 @pytest.fixture
 def write_wiki_page_func():
-    return lambda path, content: {"status": "success"}
+    return AsyncMock(return_value={"status": "success"})
 
 
 @pytest.fixture
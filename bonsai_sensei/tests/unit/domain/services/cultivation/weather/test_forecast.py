@@ -0,0 +1,78 @@
+from datetime import date, datetime
+
+from hamcrest import assert_that, contains_string, equal_to, has_length, none
+
+from bonsai_sensei.domain.services.cultivation.weather.forecast import (
+    RiskWindow,
+    assess_risks,
+    format_risk_summary,
+    parse_forecast,
+)
+
+MILD = {"tempC": "12", "chanceoffrost": "0", "precipMM": "0.0", "chanceofrain": "0", "windspeedKmph": "5"}
+
+
+def should_parse_every_day_into_flat_arrays():
+    forecast = parse_forecast("Madrid", _j1([[MILD] * 8, [MILD] * 8, [MILD] * 8]))
+
+    assert_that(forecast.hourly.temperature_c, has_length(24))
+    assert_that([day.day for day in forecast.days], equal_to([date(2026, 1, 15), date(2026, 1, 16), date(2026, 1, 17)]))
+    assert_that(str(forecast.hourly.times[9]), equal_to("2026-01-16T03:00"))
+
+
+def should_merge_consecutive_frost_slots_across_midnight():
+    night = {**MILD, "tempC": "-2", "chanceoffrost": "70"}
+    first_day = [MILD] * 6 + [night, {**night, "tempC": "-4"}]
+    second_day = [night, night] + [MILD] * 6
+
+    risks = assess_risks(parse_forecast("Madrid", _j1([first_day, second_day])))
+
+    assert_that(risks.frost, equal_to([
+        RiskWindow(datetime(2026, 1, 15, 18), datetime(2026, 1, 16, 6), -4.0),
+    ]))
+
+
+def should_ignore_slots_that_ended_before_the_observation_time():
+    hot_until_noon = [{**MILD, "tempC": "35"}] * 4 + [MILD] * 4
+
+    risks = assess_risks(parse_forecast("Sevilla", _j1([hot_until_noon], observed="2026-01-15 10:00 AM")))
+
+    assert_that(risks.heat, equal_to([RiskWindow(datetime(2026, 1, 15, 9), datetime(2026, 1, 15, 12), 35.0)]))
+
+
+def should_find_first_spray_window_with_six_dry_hours_ahead():
+    rain = {**MILD, "precipMM": "4.5", "chanceofrain": "90"}
+    day = [MILD, MILD, rain, MILD, MILD, MILD, MILD, MILD]
+
+    risks = assess_risks(parse_forecast("Madrid", _j1([day])))
+
+    assert_that(risks.rain, equal_to([RiskWindow(datetime(2026, 1, 15, 6), datetime(2026, 1, 15, 9), 4.5)]))
+    assert_that(risks.spray_window, equal_to(datetime(2026, 1, 15, 9)),
+        "Slots followed by rain within six hours are not spray windows")
+
+
+def should_report_no_spray_window_when_rain_never_stops():
+    rain = {**MILD, "precipMM": "2.0", "chanceofrain": "80"}
+
+    risks = assess_risks(parse_forecast("Madrid", _j1([[rain] * 8])))
+
+    assert_that(risks.spray_window, none())
+    assert_that(format_risk_summary(risks), contains_string("Next spray window (6h dry, calm): none in the forecast"))
+
+
+def _j1(days: list[list[dict]], observed: str | None = None) -> dict:
+    current = {"temp_C": "12", "weatherDesc": [{"value": "Clear"}]}
+    if observed:
+        current["localObsDateTime"] = observed
+    return {
+        "current_condition": [current],
+        "weather": [
+            {
+                "date": f"2026-01-{15 + index}",
+                "mintempC": "0",
+                "maxtempC": "20",
+                "hourly": [{**slot, "time": str(position * 300)} for position, slot in enumerate(slots)],
+            }
+            for index, slots in enumerate(days)
+        ],
+    }
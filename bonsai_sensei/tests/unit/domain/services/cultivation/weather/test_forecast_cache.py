@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+from hamcrest import assert_that, equal_to, none
+
+from bonsai_sensei.domain.services.cultivation.weather.weather import (
+    ForecastCache,
+    create_forecast_cache,
+    prefetch_forecasts,
+)
+
+BASE_URL = "https://wttr.in"
+
+
+@pytest.mark.asyncio
+async def should_reuse_forecast_for_same_normalized_location(weather_api):
+    cache = ForecastCache(weather_api)
+
+    first = await cache.get("Madrid", BASE_URL)
+    second = await cache.get("  madrid ", BASE_URL)
+
+    assert_that(second, equal_to(first))
+    assert_that(weather_api.requests, equal_to(["Madrid"]))
+
+
+@pytest.mark.asyncio
+async def should_share_one_request_between_concurrent_callers(weather_api):
+    weather_api.delay = 0.05
+    cache = ForecastCache(weather_api)
+
+    results = await asyncio.gather(*(cache.get("Madrid", BASE_URL) for _ in range(10)))
+
+    assert_that(len(weather_api.requests), equal_to(1), "Concurrent misses should coalesce into one fetch")
+    assert_that(results, equal_to([results[0]] * 10))
+
+
+@pytest.mark.asyncio
+async def should_serve_stale_forecast_while_refreshing(weather_api, clock):
+    cache = ForecastCache(weather_api, ttl_seconds=60, stale_seconds=600, clock=clock)
+    await cache.get("Madrid", BASE_URL)
+    clock.now += 120
+
+    stale = await cache.get("Madrid", BASE_URL)
+    await asyncio.sleep(0.01)
+    refreshed = await cache.get("Madrid", BASE_URL)
+
+    assert_that(stale, equal_to({"location": "Madrid", "version": 1}), "Expired entry should be served at once")
+    assert_that(refreshed, equal_to({"location": "Madrid", "version": 2}), "The background refresh should replace it")
+
+
+@pytest.mark.asyncio
+async def should_fetch_again_once_stale_window_has_passed(weather_api, clock):
+    cache = ForecastCache(weather_api, ttl_seconds=60, stale_seconds=600, clock=clock)
+    await cache.get("Madrid", BASE_URL)
+    clock.now += 700
+
+    result = await cache.get("Madrid", BASE_URL)
+
+    assert_that(result, equal_to({"location": "Madrid", "version": 2}))
+
+
+@pytest.mark.asyncio
+async def should_not_cache_failed_fetches(weather_api):
+    weather_api.available = False
+    cache = ForecastCache(weather_api)
+
+    assert_that(await cache.get("Madrid", BASE_URL), none())
+    weather_api.available = True
+    await cache.get("Madrid", BASE_URL)
+
+    assert_that(len(weather_api.requests), equal_to(2))
+
+
+@pytest.mark.asyncio
+async def should_prefetch_each_distinct_location_once():
+    async with respx.mock:
+        madrid = respx.get(f"{BASE_URL}/Madrid?format=j1").mock(return_value=Response(200, json={}))
+        sevilla = respx.get(f"{BASE_URL}/Sevilla?format=j1").mock(return_value=Response(200, json={}))
+
+        fetched = await prefetch_forecasts(create_forecast_cache(), ["Madrid", "madrid", "Sevilla", ""], BASE_URL)
+
+    assert_that(fetched, equal_to(2))
+    assert_that((madrid.call_count, sevilla.call_count), equal_to((1, 1)))
+
+
+class FakeWeatherApi:
+    def __init__(self):
+        self.requests: list[str] = []
+        self.delay = 0.0
+        self.available = True
+
+    async def __call__(self, location: str, base_url: str) -> dict | None:
+        self.requests.append(location)
+        await asyncio.sleep(self.delay)
+        if not self.available:
+            return None
+        return {"location": location, "version": len(self.requests)}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def weather_api():
+    return FakeWeatherApi()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
@@ -3,7 +3,7 @@ import pytest
 import pytest_asyncio
 import respx
 from httpx import Response
-from hamcrest import assert_that, contains_string, equal_to, starts_with
+from hamcrest import assert_that, contains_string, equal_to, not_, starts_with
 from bonsai_sensei.domain.services.cultivation.weather.weather import get_weather
 
 
@@ -46,21 +46,29 @@ async def should_include_frost_chance(weather_success_result):
 
 
 @pytest.mark.asyncio
-async def should_include_midnight_forecast(weather_success_result):
+async def should_report_todays_frost_chance_next_to_todays_range(weather_with_frosty_tomorrow):
     assert_that(
-        weather_success_result["result"]["result"]["summary"],
-        contains_string("00:00h: 10°C"),
+        weather_with_frosty_tomorrow["result"]["max_frost_chance"],
+        equal_to(50),
+        "Tomorrow's frost chance must not be reported as today's",
     )
 
 
 @pytest.mark.asyncio
-async def should_include_noon_forecast(weather_success_result):
+async def should_include_frost_risk_window(weather_success_result):
     assert_that(
         weather_success_result["result"]["result"]["summary"],
-        contains_string("12:00h: 18°C, Frost chance: 50%"),
+        contains_string("Frost: 15/01 12:00-15:00 (min 18°C)"),
     )
 
 
+@pytest.mark.asyncio
+async def should_summarize_daily_range_instead_of_hourly_readings(weather_success_result):
+    summary = weather_success_result["result"]["result"]["summary"]
+    assert_that(summary, contains_string("Days: 15/01 10..20°C"))
+    assert_that(summary, not_(contains_string("00:00h")))
+
+
 @pytest.mark.asyncio
 async def should_return_message_when_location_missing():
     result = await get_weather("")
@@ -111,6 +119,7 @@ async def weather_success_result():
         ],
         "weather": [
             {
+                "date": "2026-01-15",
                 "mintempC": "10",
                 "maxtempC": "20",
                 "hourly": [
@@ -131,6 +140,42 @@ async def weather_success_result():
     return {"location": location, "result": result, "route_called": route_called}
 
 
+@pytest_asyncio.fixture
+async def weather_with_frosty_tomorrow():
+    location = "Soria"
+    mock_response = {
+        "current_condition": [
+            {"temp_C": "15", "weatherDesc": [{"value": "Partly cloudy"}]}
+        ],
+        "weather": [
+            {
+                "date": "2026-01-15",
+                "mintempC": "10",
+                "maxtempC": "20",
+                "hourly": [
+                    {"time": "0", "tempC": "10", "chanceoffrost": "0"},
+                    {"time": "1200", "tempC": "18", "chanceoffrost": "50"},
+                ],
+            },
+            {
+                "date": "2026-01-16",
+                "mintempC": "-5",
+                "maxtempC": "4",
+                "hourly": [
+                    {"time": "0", "tempC": "-5", "chanceoffrost": "90"},
+                    {"time": "1200", "tempC": "4", "chanceoffrost": "20"},
+                ],
+            },
+        ],
+    }
+
+    async with respx.mock:
+        respx.get(f"https://wttr.in/{location}?format=j1").mock(
+            return_value=Response(200, json=mock_response)
+        )
+        return await get_weather(location)
+
+
 @pytest_asyncio.fixture
 async def weather_api_error_result():
     location = "UnknownCity"
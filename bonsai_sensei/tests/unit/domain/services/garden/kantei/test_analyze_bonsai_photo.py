@@ -1,4 +1,5 @@
 from datetime import date
+from unittest.mock import AsyncMock
 
 import pytest
 from hamcrest import assert_that, equal_to, has_key, contains_string
@@ -78,7 +79,7 @@ async def should_use_latest_photo_when_no_date_hint(tool_context, existing_bonsa
         list_bonsai_photos_func=lambda bonsai_id: photos if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: used_paths.append(path) or b"bytes",
         run_photo_analysis=run_photo_analysis,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
 
@@ -107,7 +108,7 @@ async def should_select_photo_by_month_hint(tool_context, existing_bonsai):
         list_bonsai_photos_func=lambda bonsai_id: photos if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: used_paths.append(path) or b"bytes",
         run_photo_analysis=run_photo_analysis,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
 
@@ -211,7 +212,7 @@ def _make_tool_with_captures(
         list_bonsai_photos_func=lambda bonsai_id: [existing_photo] if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: b"photo_bytes",
         run_photo_analysis=run_photo_analysis,
-        write_wiki_page_func=lambda path, content: pages.update({path: content}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: pages.update({path: content})),
         update_reports_index_func=update_reports_index or _noop_update_index,
     )
 
@@ -244,7 +245,7 @@ def analyze_tool(existing_bonsai, existing_photo):
         list_bonsai_photos_func=lambda bonsai_id: [existing_photo] if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: b"photo_bytes",
         run_photo_analysis=run_photo_analysis,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
 
@@ -262,7 +263,7 @@ def analyze_tool_no_photos(existing_bonsai):
         list_bonsai_photos_func=lambda bonsai_id: [],
         load_photo_bytes=lambda path: b"photo_bytes",
         run_photo_analysis=run_photo_analysis,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
 
@@ -280,6 +281,6 @@ def analyze_tool_missing_file(existing_bonsai, existing_photo):
         list_bonsai_photos_func=lambda bonsai_id: [existing_photo] if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: None,
         run_photo_analysis=run_photo_analysis,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
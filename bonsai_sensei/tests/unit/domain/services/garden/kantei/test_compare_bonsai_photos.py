@@ -1,4 +1,5 @@
 from datetime import date
+from unittest.mock import AsyncMock
 
 import pytest
 from hamcrest import assert_that, equal_to, less_than, contains_string
@@ -57,7 +58,7 @@ async def should_return_error_when_older_photo_file_not_found(tool_context, exis
         list_bonsai_photos_func=lambda bonsai_id: two_photos if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=load_photo_bytes_first_missing,
         run_photo_comparison=run_photo_comparison,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
 
@@ -86,7 +87,7 @@ async def should_return_error_when_newer_photo_file_not_found(tool_context, exis
         list_bonsai_photos_func=lambda bonsai_id: two_photos if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=load_photo_bytes_second_missing,
         run_photo_comparison=run_photo_comparison,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
 
@@ -145,7 +146,7 @@ async def should_save_wiki_report_with_wikilinks_after_comparison(tool_context,
         list_bonsai_photos_func=lambda bonsai_id: two_photos if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: b"photo_bytes",
         run_photo_comparison=run_photo_comparison,
-        write_wiki_page_func=lambda path, content: written_pages.update({path: content}),
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: written_pages.update({path: content})),
         update_reports_index_func=noop_update_index,
     )
 
@@ -171,7 +172,7 @@ async def should_update_reports_index_after_comparison(tool_context, existing_bo
         list_bonsai_photos_func=lambda bonsai_id: two_photos if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: b"photo_bytes",
         run_photo_comparison=run_photo_comparison,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=track_update_index,
     )
 
@@ -212,7 +213,7 @@ def compare_tool(existing_bonsai, two_photos):
         list_bonsai_photos_func=lambda bonsai_id: two_photos if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: b"photo_bytes",
         run_photo_comparison=run_photo_comparison,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
 
@@ -230,7 +231,7 @@ def compare_tool_no_photos(existing_bonsai):
         list_bonsai_photos_func=lambda bonsai_id: [],
         load_photo_bytes=lambda path: b"photo_bytes",
         run_photo_comparison=run_photo_comparison,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
 
@@ -250,6 +251,6 @@ def compare_tool_one_photo(existing_bonsai):
         list_bonsai_photos_func=lambda bonsai_id: [single_photo] if bonsai_id == existing_bonsai.id else [],
         load_photo_bytes=lambda path: b"photo_bytes",
         run_photo_comparison=run_photo_comparison,
-        write_wiki_page_func=lambda path, content: None,
+        write_wiki_page_func=AsyncMock(side_effect=lambda path, content: None),
         update_reports_index_func=noop_update_index,
     )
@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock
+
 import pytest
 from hamcrest import assert_that, equal_to
 
@@ -212,7 +214,7 @@ def build_confirmation_message():
 
 @pytest.fixture
 def write_wiki_page_func():
-    return lambda path, content: {"status": "success"}
+    return AsyncMock(return_value={"status": "success"})
 
 
 @pytest.fixture
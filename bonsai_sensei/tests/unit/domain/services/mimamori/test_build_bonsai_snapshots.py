@@ -5,7 +5,8 @@ from hamcrest import assert_that, equal_to, none, not_none
 from bonsai_sensei.domain.bonsai import Bonsai
 from bonsai_sensei.domain.development_plan import DevelopmentPlan
 from bonsai_sensei.domain.fertilization_plan import FertilizationPlan
-from bonsai_sensei.domain.services.mimamori.context import build_bonsai_snapshots
+from bonsai_sensei.domain.bonsai_event import BonsaiEvent
+from bonsai_sensei.domain.services.mimamori.context import build_bonsai_snapshots, build_bonsai_snapshots_batched
 
 
 def should_include_bonsai_name_in_snapshot():
@@ -114,6 +115,60 @@ def should_have_none_last_event_when_no_events():
     assert_that(result[0]["last_event_type"], none())
 
 
+def should_build_same_snapshot_from_batched_data_as_per_bonsai_loop():
+    bonsai = _make_bonsai(1, "Hanako", species_id=1)
+    dev_plan = _make_dev_plan(current_phase="refinamiento", design_goal="new goal", created_at=_dt(2025, 6, 1))
+    fert_plan = _make_fert_plan(goal="old goal", created_at=_dt(2025, 1, 1))
+    pest_event = BonsaiEvent(bonsai_id=1, event_type="pest_detection", payload={"pest_name": "pulgón"}, occurred_at=_dt(2026, 5, 15))
+    looped = _build_snapshots(
+        bonsais=[bonsai],
+        species_map={1: "Pinus"},
+        list_bonsai_events_func=lambda **_: [{"event_type": "pest_detection", "occurred_at": "2026-05-15T00:00:00+00:00"}],
+        get_active_development_plan_func=lambda **_: dev_plan,
+        get_active_fertilization_plan_func=lambda **_: fert_plan,
+        get_recent_unlinked_pest_events_func=lambda **_: [pest_event],
+        get_recently_abandoned_fertilization_plans_func=lambda **_: [fert_plan],
+    )
+    batched = build_bonsai_snapshots_batched(
+        bonsais=[bonsai],
+        species_map={1: "Pinus"},
+        load_bonsai_snapshot_data_func=lambda **_: {
+            1: {
+                "last_event": pest_event,
+                "active_development_plan": dev_plan,
+                "active_fertilization_plan": fert_plan,
+                "unlinked_pest_events": [pest_event],
+                "has_abandoned_fertilization_plan": True,
+                "has_abandoned_development_plan": False,
+            }
+        },
+    )
+    assert_that(batched, equal_to(looped), "Batched snapshots must match the per-bonsai loop output")
+
+
+def should_request_snapshot_data_for_all_bonsai_at_once():
+    requested_ids = []
+    bonsais = [_make_bonsai(1, "Hanako", species_id=1), _make_bonsai(2, "Taro", species_id=1)]
+
+    def load_bonsai_snapshot_data(bonsai_ids):
+        requested_ids.append(bonsai_ids)
+        return {bonsai_id: _empty_snapshot_data() for bonsai_id in bonsai_ids}
+
+    build_bonsai_snapshots_batched(bonsais=bonsais, species_map={}, load_bonsai_snapshot_data_func=load_bonsai_snapshot_data)
+    assert_that(requested_ids, equal_to([[1, 2]]), "Snapshot data must be loaded in a single call for every bonsai")
+
+
+def _empty_snapshot_data() -> dict:
+    return {
+        "last_event": None,
+        "active_development_plan": None,
+        "active_fertilization_plan": None,
+        "unlinked_pest_events": [],
+        "has_abandoned_fertilization_plan": False,
+        "has_abandoned_development_plan": False,
+    }
+
+
 def _build_snapshots(bonsais, species_map, **overrides):
     defaults = {
         "list_bonsai_events_func": lambda **_: [],
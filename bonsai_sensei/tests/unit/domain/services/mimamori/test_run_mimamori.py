@@ -0,0 +1,201 @@
+import asyncio
+import json
+from datetime import date
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from hamcrest import assert_that, contains_inanyorder, equal_to
+
+from bonsai_sensei.domain.services.mimamori.runner import run_mimamori
+from bonsai_sensei.metrics import MIMAMORI_QUEUE_DEPTH
+
+
+@pytest.mark.asyncio
+async def should_build_snapshots_only_from_each_users_bonsai(mimamori_dependencies):
+    await _collect(run_mimamori(**mimamori_dependencies))
+
+    assert_that(
+        mimamori_dependencies["build_bonsai_snapshots_func"].calls,
+        contains_inanyorder(["hanako"], ["taro", "kumo"]),
+        "Each user's reflection must only include that user's bonsai",
+    )
+
+
+@pytest.mark.asyncio
+async def should_pass_only_the_users_upcoming_works_to_context(mimamori_dependencies):
+    await _collect(run_mimamori(**mimamori_dependencies))
+
+    upcoming_by_user = {
+        call["user_settings"].user_id: [summary["bonsai_name"] for summary in call["upcoming_summaries"]]
+        for call in mimamori_dependencies["build_reflection_context_func"].calls
+    }
+    assert_that(upcoming_by_user, equal_to({"alice": ["hanako"], "bob": ["kumo"]}), "Works of other users' bonsai must be filtered out")
+
+
+@pytest.mark.asyncio
+async def should_skip_users_without_telegram_chat(mimamori_dependencies):
+    results = await _collect(run_mimamori(**mimamori_dependencies))
+
+    assert_that([result["user_id"] for result in results], contains_inanyorder("alice", "bob"), "Users without chat id must not get a reflection")
+
+
+@pytest.mark.asyncio
+async def should_report_per_user_bonsai_count(mimamori_dependencies):
+    results = await _collect(run_mimamori(**mimamori_dependencies))
+
+    assert_that({result["user_id"]: result["bonsai_count"] for result in results}, equal_to({"alice": 1, "bob": 2}), "Bonsai count must be scoped per user")
+
+
+@pytest.mark.asyncio
+async def should_not_exceed_concurrency_limit(mimamori_dependencies):
+    tracker = {"active": 0, "peak": 0}
+
+    async def slow_reflection(context, user_id):
+        tracker["active"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["active"])
+        await asyncio.sleep(0.01)
+        tracker["active"] -= 1
+        return "ok"
+
+    mimamori_dependencies["list_all_user_settings_func"] = lambda: [_user(f"user-{index}", chat_id=str(index)) for index in range(6)]
+    mimamori_dependencies["run_mimamori_reflection"] = slow_reflection
+
+    await _collect(run_mimamori(**mimamori_dependencies, concurrency=2))
+
+    assert_that(tracker["peak"], equal_to(2), "No more than `concurrency` users may run at the same time")
+
+
+@pytest.mark.asyncio
+async def should_report_timeout_for_slow_user_and_continue(mimamori_dependencies):
+    async def reflection(context, user_id):
+        if user_id == "alice":
+            await asyncio.sleep(1)
+        return "ok"
+
+    mimamori_dependencies["run_mimamori_reflection"] = reflection
+
+    results = await _collect(run_mimamori(**mimamori_dependencies, user_timeout_seconds=0.05))
+
+    assert_that(
+        {result["user_id"]: result.get("status", "success") for result in results},
+        equal_to({"alice": "timeout", "bob": "success"}),
+        "A timed-out user must be reported without blocking other users",
+    )
+
+
+@pytest.mark.asyncio
+async def should_report_error_for_failing_user_and_continue(mimamori_dependencies):
+    async def reflection(context, user_id):
+        if user_id == "alice":
+            raise httpx.ConnectError("memory service unreachable")
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    mimamori_dependencies["run_mimamori_reflection"] = reflection
+
+    results = await _collect(run_mimamori(**mimamori_dependencies))
+
+    assert_that(
+        {result["user_id"]: result.get("status", "success") for result in results},
+        equal_to({"alice": "error", "bob": "success"}),
+        "A failing user must be reported without cancelling other users",
+    )
+
+
+@pytest.mark.asyncio
+async def should_report_error_for_user_with_unexpected_failure_and_continue(mimamori_dependencies):
+    def build_bonsai_snapshots(bonsais, species_map):
+        if bonsais[0].name == "hanako":
+            raise KeyError("species_id")
+        return []
+
+    async def reflection(context, user_id):
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    mimamori_dependencies["build_bonsai_snapshots_func"] = build_bonsai_snapshots
+    mimamori_dependencies["run_mimamori_reflection"] = reflection
+
+    results = await _collect(run_mimamori(**mimamori_dependencies))
+
+    assert_that(
+        {result["user_id"]: result.get("status", "success") for result in results},
+        equal_to({"alice": "error", "bob": "success"}),
+        "Any failure of one user must be reported without cancelling other users",
+    )
+
+
+@pytest.mark.asyncio
+async def should_release_queue_depth_of_users_cancelled_while_waiting(mimamori_dependencies):
+    async def reflection(context, user_id):
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    mimamori_dependencies["list_all_user_settings_func"] = lambda: [_user(f"user-{index}", chat_id=str(index)) for index in range(6)]
+    mimamori_dependencies["run_mimamori_reflection"] = reflection
+    depth_before = MIMAMORI_QUEUE_DEPTH._value.get()
+    stream = run_mimamori(**mimamori_dependencies, concurrency=1)
+
+    await anext(stream)
+    await stream.aclose()
+
+    assert_that(MIMAMORI_QUEUE_DEPTH._value.get(), equal_to(depth_before), "Closing a run must only remove its own users from the queue gauge")
+
+
+@pytest.fixture
+def mimamori_dependencies():
+    bonsai_by_user = {
+        "alice": [_bonsai(1, "hanako")],
+        "bob": [_bonsai(2, "taro"), _bonsai(3, "kumo")],
+        "carol": [_bonsai(4, "yuki")],
+    }
+    upcoming_works = [_work(1), _work(3), _work(4)]
+
+    def list_planned_works_in_date_range(start_date, end_date):
+        return upcoming_works if start_date >= date.today() else []
+
+    async def build_reflection_context(**kwargs):
+        build_reflection_context.calls.append(kwargs)
+        return "context"
+
+    build_reflection_context.calls = []
+
+    def build_bonsai_snapshots(bonsais, species_map):
+        build_bonsai_snapshots.calls.append([bonsai.name for bonsai in bonsais])
+        return []
+
+    build_bonsai_snapshots.calls = []
+
+    async def run_reflection(context, user_id):
+        return f"reflection for {user_id}"
+
+    async def send_message(chat_id, text):
+        return None
+
+    return {
+        "run_mimamori_reflection": run_reflection,
+        "build_bonsai_snapshots_func": build_bonsai_snapshots,
+        "build_reflection_context_func": build_reflection_context,
+        "list_all_user_settings_func": lambda: [_user("alice", chat_id="1"), _user("bob", chat_id="2"), _user("carol", chat_id=None)],
+        "list_bonsai_func": lambda user_id=None: bonsai_by_user.get(user_id, []),
+        "list_species_func": lambda: [],
+        "list_planned_works_in_date_range_func": list_planned_works_in_date_range,
+        "send_telegram_message_func": send_message,
+    }
+
+
+async def _collect(stream) -> list[dict]:
+    return [json.loads(item) async for item in stream]
+
+
+def _user(user_id: str, chat_id: str | None):
+    return SimpleNamespace(user_id=user_id, telegram_chat_id=chat_id, location=None)
+
+
+def _bonsai(bonsai_id: int, name: str):
+    return SimpleNamespace(id=bonsai_id, name=name, species_id=1)
+
+
+def _work(bonsai_id: int):
+    return SimpleNamespace(bonsai_id=bonsai_id, work_type="pruning", scheduled_date=date.today())
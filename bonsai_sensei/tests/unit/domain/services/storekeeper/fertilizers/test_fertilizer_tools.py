@@ -15,8 +15,8 @@ def should_list_fertilizers(list_fertilizers_tool):
     }), "Should list fertilizers with only id and name")
 
 
-def should_get_fertilizer_by_name(get_fertilizer_tool):
-    result = get_fertilizer_tool("fertilizer")
+async def should_get_fertilizer_by_name(get_fertilizer_tool):
+    result = await get_fertilizer_tool("fertilizer")
 
     assert_that(result, equal_to({
         "status": "success",
@@ -29,8 +29,8 @@ def should_get_fertilizer_by_name(get_fertilizer_tool):
     }), "Should return fertilizer with id, name, recommended_amount and wiki content (None when file not found)")
 
 
-def should_return_error_when_fertilizer_not_found(get_fertilizer_tool):
-    result = get_fertilizer_tool("Unknown")
+async def should_return_error_when_fertilizer_not_found(get_fertilizer_tool):
+    result = await get_fertilizer_tool("Unknown")
 
     assert_that(result, equal_to({"status": "error", "message": "fertilizer_not_found"}),
         "Should return fertilizer_not_found error for unknown name")
@@ -70,5 +70,8 @@ def list_fertilizers_tool(list_fertilizers_func):
 
 
 @pytest.fixture
-def get_fertilizer_tool(get_fertilizer_by_name_func, tmp_path):
-    return create_get_fertilizer_by_name_tool(get_fertilizer_by_name_func, wiki_root=str(tmp_path))
+def get_fertilizer_tool(get_fertilizer_by_name_func):
+    async def read_wiki_page(path: str) -> dict:
+        return {"status": "error", "message": "page_not_found"}
+
+    return create_get_fertilizer_by_name_tool(get_fertilizer_by_name_func, read_wiki_page_func=read_wiki_page)
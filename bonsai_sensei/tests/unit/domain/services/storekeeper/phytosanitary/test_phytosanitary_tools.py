@@ -15,8 +15,8 @@ def should_list_phytosanitary(list_phytosanitary_tool):
     }), "Should list phytosanitary with only id and name")
 
 
-def should_get_phytosanitary_by_name(get_phytosanitary_tool):
-    result = get_phytosanitary_tool("phytosanitary")
+async def should_get_phytosanitary_by_name(get_phytosanitary_tool):
+    result = await get_phytosanitary_tool("phytosanitary")
 
     assert_that(result, equal_to({
         "status": "success",
@@ -29,8 +29,8 @@ def should_get_phytosanitary_by_name(get_phytosanitary_tool):
     }), "Should return phytosanitary with id, name, recommended_amount and wiki content (None when file not found)")
 
 
-def should_return_error_when_phytosanitary_not_found(get_phytosanitary_tool):
-    result = get_phytosanitary_tool("Unknown")
+async def should_return_error_when_phytosanitary_not_found(get_phytosanitary_tool):
+    result = await get_phytosanitary_tool("Unknown")
 
     assert_that(result, equal_to({"status": "error", "message": "phytosanitary_not_found"}),
         "Should return phytosanitary_not_found error for unknown name")
@@ -70,5 +70,8 @@ def list_phytosanitary_tool(list_phytosanitary_func):
 
 
 @pytest.fixture
-def get_phytosanitary_tool(get_phytosanitary_by_name_func, tmp_path):
-    return create_get_phytosanitary_by_name_tool(get_phytosanitary_by_name_func, wiki_root=str(tmp_path))
+def get_phytosanitary_tool(get_phytosanitary_by_name_func):
+    async def read_wiki_page(path: str) -> dict:
+        return {"status": "error", "message": "page_not_found"}
+
+    return create_get_phytosanitary_by_name_tool(get_phytosanitary_by_name_func, read_wiki_page_func=read_wiki_page)
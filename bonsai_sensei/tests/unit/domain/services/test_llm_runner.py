@@ -0,0 +1,61 @@
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from hamcrest import assert_that, empty, equal_to
+
+from bonsai_sensei.domain.services.llm_runner import create_single_turn_llm_runner
+from bonsai_sensei.domain.services.mimamori.mimamori_agent_runner import create_mimamori_agent_runner
+
+
+class StubLlm(BaseLlm):
+    model: str = "stub"
+
+    async def generate_content_async(self, llm_request, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text="listo")]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(prompt_token_count=1, candidates_token_count=1),
+        )
+
+
+@pytest.mark.asyncio
+async def should_delete_single_turn_session_after_run(session_service):
+    run_llm = create_single_turn_llm_runner(
+        StubLlm(), app_name="stub_runner", instruction="Responde", session_service=session_service
+    )
+    message = types.Content(role="user", parts=[types.Part(text="hola")])
+
+    for _ in range(3):
+        async for _ in run_llm(message):
+            pass
+    remaining = await session_service.list_sessions(app_name="stub_runner")
+
+    assert_that(remaining.sessions, empty(), "Finished runs must not leave sessions behind")
+
+
+@pytest.mark.asyncio
+async def should_return_mimamori_reflection_text(session_service):
+    run_reflection = create_mimamori_agent_runner(StubLlm(), session_service=session_service)
+
+    reflection = await run_reflection("reflexiona", "user-1")
+
+    assert_that(reflection, equal_to("listo"), "Should return the text of the reflection")
+
+
+@pytest.mark.asyncio
+async def should_reuse_mimamori_runner_without_retaining_sessions(session_service):
+    run_reflection = create_mimamori_agent_runner(StubLlm(), session_service=session_service)
+
+    await run_reflection("reflexiona", "user-1")
+    await run_reflection("reflexiona", "user-2")
+    remaining = await session_service.list_sessions(app_name="mimamori")
+
+    assert_that(remaining.sessions, empty(), "Reflections must not leave sessions behind")
+
+
+@pytest.fixture
+def session_service():
+    return InMemorySessionService()
@@ -0,0 +1,174 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from hamcrest import assert_that, contains_exactly, equal_to, none
+from sqlmodel import Session, SQLModel, create_engine
+
+from bonsai_sensei.domain.bonsai import Bonsai
+from bonsai_sensei.domain.bonsai_event import BonsaiEvent
+from bonsai_sensei.domain.bonsai_snapshot_store import load_bonsai_snapshot_data
+from bonsai_sensei.domain.development_plan import DevelopmentPlan
+from bonsai_sensei.domain.fertilization_plan import FertilizationPlan
+from bonsai_sensei.domain.species import Species
+from bonsai_sensei.domain.user_settings import UserSettings
+
+
+def should_return_latest_event_per_bonsai(create_session, two_bonsai_ids):
+    first_id, second_id = two_bonsai_ids
+    _add(create_session, BonsaiEvent(bonsai_id=first_id, event_type="watering", payload={}, occurred_at=_days_ago(10)))
+    _add(create_session, BonsaiEvent(bonsai_id=first_id, event_type="pruning", payload={}, occurred_at=_days_ago(2)))
+    _add(create_session, BonsaiEvent(bonsai_id=second_id, event_type="transplant", payload={}, occurred_at=_days_ago(5)))
+
+    result = load_bonsai_snapshot_data(bonsai_ids=[first_id, second_id], create_session=create_session)
+
+    assert_that(
+        [result[first_id]["last_event"].event_type, result[second_id]["last_event"].event_type],
+        contains_exactly("pruning", "transplant"),
+        "Each bonsai must get its own most recent event",
+    )
+
+
+def should_return_none_last_event_for_bonsai_without_events(create_session, two_bonsai_ids):
+    result = load_bonsai_snapshot_data(bonsai_ids=list(two_bonsai_ids), create_session=create_session)
+
+    assert_that(result[two_bonsai_ids[0]]["last_event"], none(), "Bonsai without events must have no last event")
+
+
+def should_return_active_development_plan_only(create_session, two_bonsai_ids):
+    first_id, _ = two_bonsai_ids
+    _add(create_session, _development_plan(first_id, status="abandoned", current_phase="engorde"))
+    _add(create_session, _development_plan(first_id, status="active", current_phase="refinamiento"))
+
+    result = load_bonsai_snapshot_data(bonsai_ids=list(two_bonsai_ids), create_session=create_session)
+
+    assert_that(result[first_id]["active_development_plan"].current_phase, equal_to("refinamiento"), "Only the active development plan must be returned")
+
+
+def should_return_active_fertilization_plan_per_bonsai(create_session, two_bonsai_ids):
+    _, second_id = two_bonsai_ids
+    _add(create_session, _fertilization_plan(second_id, status="active", goal="engorde"))
+
+    result = load_bonsai_snapshot_data(bonsai_ids=list(two_bonsai_ids), create_session=create_session)
+
+    assert_that(result[second_id]["active_fertilization_plan"].goal, equal_to("engorde"), "Active fertilization plan must be attached to its bonsai")
+
+
+def should_exclude_pest_events_linked_to_phytosanitary_application(create_session, two_bonsai_ids):
+    first_id, _ = two_bonsai_ids
+    treated = _add(create_session, BonsaiEvent(bonsai_id=first_id, event_type="pest_detection", payload={"pest_name": "pulgón"}, occurred_at=_days_ago(3)))
+    _add(create_session, BonsaiEvent(bonsai_id=first_id, event_type="pest_detection", payload={"pest_name": "cochinilla"}, occurred_at=_days_ago(1)))
+    _add(create_session, BonsaiEvent(bonsai_id=first_id, event_type="phytosanitary_application", payload={"pest_event_id": treated.id}, occurred_at=_days_ago(1)))
+
+    result = load_bonsai_snapshot_data(bonsai_ids=list(two_bonsai_ids), create_session=create_session)
+
+    assert_that(
+        [event.payload["pest_name"] for event in result[first_id]["unlinked_pest_events"]],
+        contains_exactly("cochinilla"),
+        "Treated pest events must not be reported as unlinked",
+    )
+
+
+def should_ignore_pest_events_older_than_window(create_session, two_bonsai_ids):
+    first_id, _ = two_bonsai_ids
+    _add(create_session, BonsaiEvent(bonsai_id=first_id, event_type="pest_detection", payload={"pest_name": "araña roja"}, occurred_at=_days_ago(40)))
+
+    result = load_bonsai_snapshot_data(bonsai_ids=list(two_bonsai_ids), create_session=create_session)
+
+    assert_that(result[first_id]["unlinked_pest_events"], equal_to([]), "Pest events outside the 720h window must be ignored")
+
+
+def should_flag_recently_abandoned_fertilization_plan(create_session, two_bonsai_ids):
+    first_id, _ = two_bonsai_ids
+    plan = _fertilization_plan(first_id, status="abandoned", goal="engorde")
+    plan.abandonment_reason = "disease_pause: pulgón"
+    plan.abandoned_at = _days_ago(5)
+    _add(create_session, plan)
+
+    result = load_bonsai_snapshot_data(bonsai_ids=list(two_bonsai_ids), create_session=create_session)
+
+    assert_that(result[first_id]["has_abandoned_fertilization_plan"], equal_to(True), "Disease-paused fertilization plans must be flagged")
+
+
+def should_not_flag_plan_abandoned_for_other_reason(create_session, two_bonsai_ids):
+    first_id, _ = two_bonsai_ids
+    plan = _development_plan(first_id, status="abandoned", current_phase="engorde")
+    plan.abandonment_reason = "user_request"
+    plan.abandoned_at = _days_ago(5)
+    _add(create_session, plan)
+
+    result = load_bonsai_snapshot_data(bonsai_ids=list(two_bonsai_ids), create_session=create_session)
+
+    assert_that(result[first_id]["has_abandoned_development_plan"], equal_to(False), "Only disease-paused plans must be flagged")
+
+
+def should_return_empty_mapping_for_no_bonsai(create_session):
+    result = load_bonsai_snapshot_data(bonsai_ids=[], create_session=create_session)
+
+    assert_that(result, equal_to({}), "No bonsai ids must produce an empty mapping")
+
+
+@pytest.fixture
+def two_bonsai_ids(create_session):
+    species = _add(create_session, Species(name="olmo", scientific_name="Ulmus"))
+    first = _add(create_session, Bonsai(name="hanako", species_id=species.id))
+    second = _add(create_session, Bonsai(name="taro", species_id=species.id))
+    return first.id, second.id
+
+
+@pytest.fixture
+def create_session(in_memory_engine):
+    return lambda: Session(in_memory_engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def in_memory_engine():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(
+        engine,
+        tables=[
+            UserSettings.__table__,
+            Species.__table__,
+            Bonsai.__table__,
+            BonsaiEvent.__table__,
+            DevelopmentPlan.__table__,
+            FertilizationPlan.__table__,
+        ],
+    )
+    return engine
+
+
+def _add(create_session, entity):
+    with create_session() as session:
+        session.add(entity)
+        session.commit()
+        session.refresh(entity)
+    return entity
+
+
+def _development_plan(bonsai_id: int, status: str, current_phase: str) -> DevelopmentPlan:
+    return DevelopmentPlan(
+        bonsai_id=bonsai_id,
+        development_path="planton",
+        current_phase=current_phase,
+        target_style="moyogi",
+        design_goal="goal",
+        period_start=date(2025, 1, 1),
+        period_end=date(2025, 12, 31),
+        status=status,
+        wiki_path="plans/design.md",
+    )
+
+
+def _fertilization_plan(bonsai_id: int, status: str, goal: str) -> FertilizationPlan:
+    return FertilizationPlan(
+        bonsai_id=bonsai_id,
+        period_start=date(2025, 1, 1),
+        period_end=date(2025, 12, 31),
+        status=status,
+        goal=goal,
+        wiki_path="plans/fertilization.md",
+    )
+
+
+def _days_ago(days: int) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=days)
@@ -0,0 +1,230 @@
+import asyncio
+
+import pytest
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.adk.sessions import DatabaseSessionService
+from hamcrest import assert_that, equal_to, none, is_not
+from sqlalchemy.exc import OperationalError
+
+from bonsai_sensei.infrastructure.session_service import WriteBehindSessionService
+
+APP_NAME = "bonsai_sensei"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class GatedDatabaseSessionService(DatabaseSessionService):
+    def __init__(self, db_url: str):
+        super().__init__(db_url=db_url)
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.append_started = asyncio.Event()
+        self.errors = []
+
+    async def append_event(self, session, event):
+        self.append_started.set()
+        await self.gate.wait()
+        try:
+            return await super().append_event(session, event)
+        except Exception as error:
+            self.errors.append(error)
+            raise
+
+
+class FlakyDatabaseSessionService(DatabaseSessionService):
+    def __init__(self, db_url: str):
+        super().__init__(db_url=db_url)
+        self.failing = False
+
+    async def append_event(self, session, event):
+        if self.failing:
+            raise OperationalError("INSERT INTO events", {}, Exception("database is locked"))
+        return await super().append_event(session, event)
+
+
+async def should_keep_conversation_across_service_restart(database_url):
+    service = WriteBehindSessionService(DatabaseSessionService(db_url=database_url))
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1", state={"name": "Ana"})
+    await service.append_event(session, _state_event({"last_topic": "ficus"}))
+    await service.close()
+
+    restarted = WriteBehindSessionService(DatabaseSessionService(db_url=database_url))
+    reloaded = await restarted.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await restarted.close()
+
+    assert_that(reloaded.state["last_topic"], equal_to("ficus"), "Should persist state deltas written behind")
+    assert_that(len(reloaded.events), equal_to(1), "Should persist buffered events on close")
+
+
+async def should_not_write_events_before_flush(database_url):
+    durable = DatabaseSessionService(db_url=database_url)
+    service = WriteBehindSessionService(durable, write_behind_interval_seconds=3600)
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+
+    await service.append_event(session, _state_event({"step": 1}))
+    stored_before = await durable.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.flush()
+    stored_after = await durable.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.close()
+
+    assert_that(len(stored_before.events), equal_to(0), "Should buffer appended events in memory")
+    assert_that(len(stored_after.events), equal_to(1), "Should write buffered events on flush")
+
+
+async def should_bound_resident_sessions_and_reload_evicted_ones(database_url):
+    service = WriteBehindSessionService(DatabaseSessionService(db_url=database_url), max_resident=2)
+    for user_id in ["u1", "u2", "u3"]:
+        session = await service.create_session(app_name=APP_NAME, user_id=user_id, session_id=user_id)
+        await service.append_event(session, _state_event({"owner": user_id}))
+
+    resident_after_creates = service.resident_count
+    reloaded = await service.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.close()
+
+    assert_that(resident_after_creates, equal_to(2), "Should never hold more than max_resident sessions")
+    assert_that(reloaded.state["owner"], equal_to("u1"), "Should reload an evicted session from the database")
+
+
+async def should_evict_idle_sessions(database_url):
+    clock = FakeClock()
+    service = WriteBehindSessionService(
+        DatabaseSessionService(db_url=database_url), idle_ttl_seconds=60, clock=clock
+    )
+    await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    clock.now = 30
+    await service.create_session(app_name=APP_NAME, user_id="u2", session_id="u2")
+
+    clock.now = 75
+    await service.evict_idle()
+    resident_count = service.resident_count
+    await service.close()
+
+    assert_that(resident_count, equal_to(1), "Should evict only sessions idle longer than the TTL")
+
+
+async def should_delete_session_from_memory_and_database(database_url):
+    service = WriteBehindSessionService(DatabaseSessionService(db_url=database_url))
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.append_event(session, _state_event({"step": 1}))
+
+    await service.delete_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    deleted = await service.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.close()
+
+    assert_that(deleted, none(), "Should not find a deleted session")
+
+
+async def should_continue_appending_to_caller_session_after_eviction(database_url):
+    service = WriteBehindSessionService(DatabaseSessionService(db_url=database_url), max_resident=1)
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.create_session(app_name=APP_NAME, user_id="u2", session_id="u2")
+
+    await service.append_event(session, _state_event({"step": 2}))
+    await service.flush()
+    reloaded = await service.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.close()
+
+    assert_that(reloaded, is_not(none()), "Should reload the evicted session on append")
+    assert_that(reloaded.state["step"], equal_to(2), "Should keep events appended after eviction")
+
+
+async def should_admit_new_session_when_oldest_cannot_be_flushed(database_url):
+    durable = FlakyDatabaseSessionService(database_url)
+    service = WriteBehindSessionService(durable, max_resident=1, write_behind_interval_seconds=3600)
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.append_event(session, _state_event({"step": 1}))
+    durable.failing = True
+
+    await asyncio.wait_for(service.create_session(app_name=APP_NAME, user_id="u2", session_id="u2"), timeout=5)
+    resident_count = service.resident_count
+    await service.close()
+
+    assert_that(resident_count, equal_to(2), "Should keep an unflushable session resident instead of looping")
+
+
+async def should_drop_event_after_max_flush_attempts(database_url):
+    durable = FlakyDatabaseSessionService(database_url)
+    service = WriteBehindSessionService(durable, max_flush_attempts=2, write_behind_interval_seconds=3600)
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.append_event(session, _state_event({"step": 1}))
+    durable.failing = True
+    await service.flush()
+    await service.flush()
+    durable.failing = False
+
+    await service.append_event(session, _state_event({"step": 2}))
+    await service.flush()
+    stored = await durable.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.close()
+
+    assert_that(len(stored.events), equal_to(1), "Should dead-letter the failing event and write later ones")
+
+
+async def should_retry_failed_event_before_max_flush_attempts(database_url):
+    durable = FlakyDatabaseSessionService(database_url)
+    service = WriteBehindSessionService(durable, max_flush_attempts=2, write_behind_interval_seconds=3600)
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.append_event(session, _state_event({"step": 1}))
+    durable.failing = True
+    await service.flush()
+    durable.failing = False
+
+    await service.flush()
+    stored = await durable.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.close()
+
+    assert_that(stored.state.get("step"), equal_to(1), "Should write a re-queued event once the database recovers")
+
+
+async def should_reload_session_written_out_of_band_instead_of_dropping_events(database_url):
+    durable = DatabaseSessionService(db_url=database_url)
+    service = WriteBehindSessionService(durable, max_flush_attempts=1, write_behind_interval_seconds=3600)
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.append_event(session, _state_event({"step": 1}))
+    await service.flush()
+    other_replica = DatabaseSessionService(db_url=database_url)
+    other_session = await other_replica.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await other_replica.append_event(other_session, _state_event({"replica": "b"}))
+    await other_replica.close()
+
+    await service.append_event(session, _state_event({"step": 2}))
+    await service.append_event(session, _state_event({"step": 3}))
+    await service.flush()
+    stored = await durable.get_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.close()
+
+    assert_that(len(stored.events), equal_to(4), "Should write every event after another writer bumped the session")
+
+
+async def should_wait_for_running_flush_before_deleting_session(database_url):
+    durable = GatedDatabaseSessionService(database_url)
+    service = WriteBehindSessionService(durable, write_behind_interval_seconds=3600)
+    session = await service.create_session(app_name=APP_NAME, user_id="u1", session_id="u1")
+    await service.append_event(session, _state_event({"step": 1}))
+    durable.gate.clear()
+    flushing = asyncio.create_task(service.flush())
+    await durable.append_started.wait()
+
+    deleting = asyncio.create_task(service.delete_session(app_name=APP_NAME, user_id="u1", session_id="u1"))
+    await asyncio.sleep(0.01)
+    durable.gate.set()
+    await asyncio.gather(flushing, deleting)
+    await service.close()
+
+    assert_that(durable.errors, equal_to([]), "Should not flush into a session deleted mid-flush")
+
+
+def _state_event(delta: dict) -> Event:
+    return Event(invocation_id="test", author="advisor", actions=EventActions(state_delta=delta))
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path / 'sessions.db'}"
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from hamcrest import assert_that, equal_to, is_not, less_than_or_equal_to
+from PIL import Image
+
+from bonsai_sensei.infrastructure.thumbnail_cache import THUMBNAIL_MAX_SIZE, ThumbnailCache
+
+
+async def should_render_thumbnail_as_jpeg(cache, photo):
+    thumbnail = await cache.get(str(photo), "📅 01/05/2026")
+
+    with Image.open(thumbnail) as image:
+        assert_that(image.format, equal_to("JPEG"), "Thumbnails should be stored as JPEG")
+
+
+async def should_render_thumbnail_within_max_size(cache, photo):
+    thumbnail = await cache.get(str(photo), "📅 01/05/2026")
+
+    with Image.open(thumbnail) as image:
+        assert_that(max(image.size), equal_to(max(THUMBNAIL_MAX_SIZE)), "Thumbnails should fit the max size")
+
+
+async def should_serve_cached_thumbnail_without_rendering_again(cache, photo, executor):
+    await cache.get(str(photo), "📅 01/05/2026")
+    await cache.get(str(photo), "📅 01/05/2026")
+
+    assert_that(executor.submitted, equal_to(1), "A cached thumbnail should not be rendered again")
+
+
+async def should_share_one_render_between_concurrent_callers(cache, photo, executor):
+    executor.release.clear()
+
+    pending = asyncio.gather(*(cache.get(str(photo), "📅 01/05/2026") for _ in range(5)))
+    await asyncio.sleep(0.01)
+    executor.release.set()
+    await pending
+
+    assert_that(executor.submitted, equal_to(1), "Concurrent misses should coalesce into one render")
+
+
+async def should_key_thumbnails_by_label(cache, photo):
+    original = await cache.get(str(photo), "📅 01/05/2026")
+
+    other_label = await cache.get(str(photo), "📅 02/05/2026")
+
+    assert_that(other_label, is_not(equal_to(original)), "Each label should get its own thumbnail")
+
+
+async def should_key_thumbnails_by_photo_version(cache, photo):
+    original = await cache.get(str(photo), "📅 01/05/2026")
+    Image.new("RGB", (800, 800), (200, 30, 30)).save(photo, format="WEBP")
+
+    replaced = await cache.get(str(photo), "📅 01/05/2026")
+
+    assert_that(replaced, is_not(equal_to(original)), "A photo overwritten in place should get a new thumbnail")
+
+
+async def should_build_labeled_thumbnails_from_warmed_base(tmp_path, photo, executor):
+    cache = ThumbnailCache(tmp_path / "thumbnails", executor_factory=lambda: executor)
+    cache.warm(str(photo))
+    executor.shutdown(wait=True)
+    base = cache.path_for(str(photo))
+    Image.new("RGB", (480, 360), (10, 10, 200)).save(base, format="JPEG")
+    fresh_executor = ThreadPoolExecutor(max_workers=1)
+    cache = ThumbnailCache(tmp_path / "thumbnails", executor_factory=lambda: fresh_executor)
+
+    thumbnail = await cache.get(str(photo), "📅 01/05/2026")
+    fresh_executor.shutdown()
+
+    with Image.open(thumbnail) as image:
+        red, green, blue = image.getpixel((5, 5))
+    assert_that(blue > 150 and red < 60, equal_to(True), "Labeled thumbnails should start from the cached base")
+
+
+async def should_evict_least_recently_used_thumbnails_beyond_max_bytes(tmp_path, noisy_photos, thumbnail_bytes, executor):
+    cache_dir = tmp_path / "thumbnails"
+    cache = ThumbnailCache(cache_dir, max_bytes=int(thumbnail_bytes * 2.5), executor_factory=lambda: executor)
+
+    for photo in noisy_photos[1:]:
+        await asyncio.sleep(0.01)
+        await cache.get(str(photo))
+
+    remaining = sorted(path.name for path in cache_dir.glob("*.jpg"))
+    expected = sorted(cache.path_for(str(photo)).name for photo in noisy_photos[2:])
+    assert_that(remaining, equal_to(expected), "The oldest thumbnails should be evicted first")
+
+
+async def should_keep_thumbnails_within_max_bytes(tmp_path, noisy_photos, thumbnail_bytes, executor):
+    cache_dir = tmp_path / "thumbnails"
+    cache = ThumbnailCache(cache_dir, max_bytes=int(thumbnail_bytes * 2.5), executor_factory=lambda: executor)
+
+    for photo in noisy_photos[1:]:
+        await asyncio.sleep(0.01)
+        await cache.get(str(photo))
+
+    total = sum(path.stat().st_size for path in cache_dir.glob("*.jpg"))
+    assert_that(total, less_than_or_equal_to(int(thumbnail_bytes * 2.5)), "The cache should stay within max_bytes")
+
+
+async def should_render_in_default_process_pool(tmp_path, photo):
+    cache = ThumbnailCache(tmp_path / "thumbnails")
+    try:
+        thumbnail = await cache.get(str(photo), "📅 01/05/2026")
+    finally:
+        cache.shutdown()
+
+    assert_that(Path(thumbnail).exists(), equal_to(True), "The default process pool should render thumbnails")
+
+
+@pytest.fixture
+def photo(tmp_path) -> Path:
+    path = tmp_path / "photos" / "ficus.webp"
+    path.parent.mkdir()
+    Image.new("RGB", (1600, 1200), (40, 120, 60)).save(path, format="WEBP")
+    return path
+
+
+@pytest.fixture
+def noisy_photos(tmp_path) -> list[Path]:
+    photos = []
+    for index in range(4):
+        path = tmp_path / f"photo-{index}.png"
+        Image.effect_noise((600, 600), 80 + index).save(path)
+        photos.append(path)
+    return photos
+
+
+@pytest.fixture
+async def thumbnail_bytes(tmp_path, noisy_photos, executor) -> int:
+    probe = ThumbnailCache(tmp_path / "thumbnails", executor_factory=lambda: executor)
+    await probe.get(str(noisy_photos[0]))
+    return probe.path_for(str(noisy_photos[0])).stat().st_size
+
+
+@pytest.fixture
+def cache(tmp_path, executor) -> ThumbnailCache:
+    return ThumbnailCache(tmp_path / "thumbnails", executor_factory=lambda: executor)
+
+
+@pytest.fixture
+def executor():
+    class CountingExecutor(ThreadPoolExecutor):
+        def __init__(self):
+            super().__init__(max_workers=2)
+            self.submitted = 0
+            self.release = threading.Event()
+            self.release.set()
+
+        def submit(self, fn, *args, **kwargs):
+            self.submitted += 1
+            return super().submit(self._gated, fn, *args, **kwargs)
+
+        def _gated(self, fn, *args, **kwargs):
+            self.release.wait()
+            return fn(*args, **kwargs)
+
+    pool = CountingExecutor()
+    yield pool
+    pool.release.set()
+    pool.shutdown()
@@ -0,0 +1,65 @@
+import httpx
+import pytest
+from hamcrest import assert_that, equal_to
+
+from bonsai_sensei.infrastructure.wiki_client import (
+    create_http_list_wiki_files_tool,
+    create_http_read_wiki_page_tool,
+    create_http_write_wiki_page_tool,
+)
+
+KB_BASE_URL = "http://kb.test"
+
+
+@pytest.mark.asyncio
+async def should_return_page_content_from_read(client):
+    read_wiki_page = create_http_read_wiki_page_tool(KB_BASE_URL, client=client)
+
+    result = await read_wiki_page(path="species/ficus.md")
+
+    assert_that(result, equal_to({"status": "success", "content": "# Ficus"}), "Read must return the page content")
+
+
+@pytest.mark.asyncio
+async def should_return_page_not_found_from_read(client):
+    read_wiki_page = create_http_read_wiki_page_tool(KB_BASE_URL, client=client)
+
+    result = await read_wiki_page(path="missing.md")
+
+    assert_that(result, equal_to({"status": "error", "message": "page_not_found"}), "Read must map 404 to page_not_found")
+
+
+@pytest.mark.asyncio
+async def should_return_invalid_path_from_write(client):
+    write_wiki_page = create_http_write_wiki_page_tool(KB_BASE_URL, client=client)
+
+    result = await write_wiki_page(path="../escape.md", content="x")
+
+    assert_that(result, equal_to({"status": "error", "message": "invalid_path"}), "Write must map 400 to invalid_path")
+
+
+@pytest.mark.asyncio
+async def should_return_empty_list_when_listing_fails(client):
+    list_wiki_files = create_http_list_wiki_files_tool(KB_BASE_URL, client=client)
+
+    result = await list_wiki_files(directory="broken")
+
+    assert_that(result, equal_to([]), "List must return an empty list on error responses")
+
+
+def _handle(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/wiki" and request.method == "GET":
+        if request.url.params["path"] == "species/ficus.md":
+            return httpx.Response(200, json={"content": "# Ficus"})
+        return httpx.Response(404)
+    if request.url.path == "/api/wiki" and request.method == "PUT":
+        return httpx.Response(400)
+    return httpx.Response(500)
+
+
+@pytest.fixture
+async def client():
+    async_client = httpx.AsyncClient(transport=httpx.MockTransport(_handle))
+    yield async_client
+    await async_client.aclose()
+
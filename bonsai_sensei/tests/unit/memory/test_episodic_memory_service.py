@@ -0,0 +1,65 @@
+import functools
+
+import httpx
+import pytest
+from hamcrest import assert_that, equal_to
+
+from bonsai_sensei.memory import episodic_memory_service
+from bonsai_sensei.memory.episodic_memory_service import create_search_memory_func
+
+MEMORY_BASE_URL = "http://memory.test"
+
+
+@pytest.mark.asyncio
+async def should_answer_repeated_memory_search_from_cache(memory_requests):
+    search_memory = create_search_memory_func(MEMORY_BASE_URL)
+
+    first = await search_memory("user-1", "riego del ficus")
+    second = await search_memory("user-1", "  Riego del FICUS ")
+
+    assert_that(first, equal_to("Riega el ficus cada dos días"))
+    assert_that(second, equal_to(first), "Cached result must match the original")
+    assert_that(len(memory_requests), equal_to(1), "Repeated normalized query must not hit the service again")
+
+
+@pytest.mark.asyncio
+async def should_search_again_after_cache_ttl(memory_requests):
+    clock = FakeClock()
+    search_memory = create_search_memory_func(MEMORY_BASE_URL, cache_ttl_seconds=30, clock=clock)
+
+    await search_memory("user-1", "riego")
+    clock.now += 31
+    await search_memory("user-1", "riego")
+
+    assert_that(len(memory_requests), equal_to(2), "Expired entries must be refreshed")
+
+
+@pytest.mark.asyncio
+async def should_not_share_cached_memories_between_users(memory_requests):
+    search_memory = create_search_memory_func(MEMORY_BASE_URL)
+
+    await search_memory("user-1", "riego")
+    await search_memory("user-2", "riego")
+
+    assert_that(len(memory_requests), equal_to(2), "Cache must be keyed by user")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def memory_requests(monkeypatch):
+    requests = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"memories": ["Riega el ficus cada dos días"]})
+
+    client_class = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handle))
+    monkeypatch.setattr(episodic_memory_service.httpx, "AsyncClient", client_class)
+    return requests
@@ -0,0 +1,207 @@
+from types import SimpleNamespace
+
+import pytest
+from hamcrest import assert_that, contains_exactly, equal_to, instance_of
+from sqlalchemy.exc import OperationalError
+from telegram.error import BadRequest
+
+from bonsai_sensei.telegram.bot import TelegramBot
+from bonsai_sensei.telegram.file_ids import TelegramFileIds
+
+
+async def should_send_photo_options_as_one_album(telegram, store, photos):
+    bot = _bot(telegram, store)
+
+    await bot.send_selection_with_photos("42", "¿Qué foto?", ["Foto A", "Foto B", "Foto C"], photos, "sel-1")
+
+    assert_that(len(telegram.albums), equal_to(1), "All photo options should go out as one media group")
+
+
+async def should_not_send_photo_options_one_by_one(telegram, store, photos):
+    bot = _bot(telegram, store)
+
+    await bot.send_selection_with_photos("42", "¿Qué foto?", ["Foto A", "Foto B", "Foto C"], photos, "sel-1")
+
+    assert_that(telegram.sent_photos, equal_to([]), "Photo options should not be sent as single photos")
+
+
+async def should_put_option_buttons_in_the_question(telegram, store, photos):
+    bot = _bot(telegram, store)
+
+    await bot.send_selection_with_photos("42", "¿Qué foto?", ["Foto A", "Foto B", "Foto C"], photos, "sel-1")
+
+    buttons = [row[0].text for row in telegram.messages[0][1].inline_keyboard]
+    assert_that(
+        buttons,
+        contains_exactly("✅ Foto A", "✅ Foto B", "✅ Foto C", "🚫 Ninguna de las anteriores"),
+        "The question should carry one button per option plus none of them",
+    )
+
+
+async def should_reuse_file_ids_instead_of_uploading_again(telegram, store, photos):
+    await _bot(telegram, store).send_photos("42", photos)
+
+    await _bot(telegram, store).send_photos("42", photos)
+
+    assert_that(telegram.albums[1], equal_to(["file-1", "file-2", "file-3"]), "A restarted bot should reuse stored file_ids")
+
+
+async def should_store_one_file_id_per_photo(telegram, store, photos):
+    await _bot(telegram, store).send_photos("42", photos)
+
+    assert_that(len(store.rows), equal_to(3), "Every uploaded photo should store its file_id")
+
+
+async def should_send_single_photo_without_album(telegram, store, photos):
+    await _bot(telegram, store).send_photos("42", photos[:1])
+
+    assert_that(telegram.albums, equal_to([]), "A single photo should not be sent as a media group")
+
+
+async def should_upload_single_photo_the_first_time(telegram, store, photos):
+    await _bot(telegram, store).send_photos("42", photos[:1])
+
+    assert_that(telegram.sent_photos[0], instance_of(bytes), "A new photo should be uploaded")
+
+
+async def should_reuse_file_id_of_single_photo(telegram, store, photos):
+    bot = _bot(telegram, store)
+
+    await bot.send_photos("42", photos[:1])
+    await bot.send_photos("42", photos[:1])
+
+    assert_that(telegram.sent_photos[1], equal_to("file-1"), "A photo sent before should reuse its file_id")
+
+
+async def should_split_albums_at_telegram_limit(telegram, store, tmp_path):
+    paths = []
+    for index in range(12):
+        path = tmp_path / f"many-{index}.jpg"
+        path.write_bytes(f"photo {index}".encode())
+        paths.append(str(path))
+
+    await _bot(telegram, store).send_photos("42", paths)
+
+    assert_that([len(album) for album in telegram.albums], equal_to([10, 2]), "Albums should hold at most ten photos")
+
+
+async def should_upload_again_when_telegram_rejects_file_id(telegram, store, photos):
+    bot = _bot(telegram, store)
+    await bot.send_photos("42", photos)
+    telegram.rejected_file_ids = {"file-1"}
+
+    await bot.send_photos("42", photos)
+
+    assert_that(any(isinstance(photo, str) for photo in telegram.albums[-1]), equal_to(False), "The retry should upload every photo")
+
+
+async def should_replace_rejected_file_ids_in_store(telegram, store, photos):
+    bot = _bot(telegram, store)
+    await bot.send_photos("42", photos)
+    telegram.rejected_file_ids = {"file-1"}
+
+    await bot.send_photos("42", photos)
+
+    assert_that(sorted(store.rows.values()), equal_to(["file-4", "file-5", "file-6"]), "The store should keep the new file_ids")
+
+
+async def should_skip_missing_photo_files(telegram, store, photos, tmp_path):
+    await _bot(telegram, store).send_photos("42", [photos[0], str(tmp_path / "missing.jpg"), photos[1]])
+
+    assert_that(len(telegram.albums[0]), equal_to(2), "Missing photo files should be left out of the album")
+
+
+async def should_keep_sending_when_file_id_store_fails(telegram, photos):
+    async def failing_get(content_hashes):
+        raise OperationalError("SELECT", {}, Exception("database down"))
+
+    bot = TelegramBot(file_ids=TelegramFileIds(get_file_ids_func=failing_get))
+    bot.application = SimpleNamespace(bot=telegram)
+
+    await bot.send_photos("42", photos)
+    await bot.send_photos("42", photos)
+
+    assert_that(telegram.albums[1], equal_to(["file-1", "file-2", "file-3"]), "In-memory ids should still be reused")
+
+
+async def should_raise_file_id_store_errors_that_are_not_database_errors(telegram, photos):
+    async def failing_get(content_hashes):
+        raise TypeError("unexpected keyword argument")
+
+    bot = TelegramBot(file_ids=TelegramFileIds(get_file_ids_func=failing_get))
+    bot.application = SimpleNamespace(bot=telegram)
+
+    with pytest.raises(TypeError) as error:
+        await bot.send_photos("42", photos)
+    assert_that(str(error.value), equal_to("unexpected keyword argument"), "Programming errors should not be swallowed")
+
+
+@pytest.fixture
+def telegram():
+    return FakeTelegram()
+
+
+@pytest.fixture
+def store():
+    return FakeFileIdStore()
+
+
+@pytest.fixture
+def photos(tmp_path) -> list[str]:
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"photo-{index}.jpg"
+        path.write_bytes(f"jpeg bytes {index}".encode())
+        paths.append(str(path))
+    return paths
+
+
+def _bot(telegram, store) -> TelegramBot:
+    bot = TelegramBot(file_ids=TelegramFileIds(store.get, store.save, store.delete))
+    bot.application = SimpleNamespace(bot=telegram)
+    return bot
+
+
+class FakeTelegram:
+    def __init__(self):
+        self.sent_photos = []
+        self.albums = []
+        self.messages = []
+        self.rejected_file_ids = set()
+        self._uploads = 0
+
+    async def send_photo(self, chat_id, photo, caption=None, **_):
+        self.sent_photos.append(photo)
+        return self._message(photo)
+
+    async def send_media_group(self, chat_id, media):
+        self.albums.append([item.media for item in media])
+        return tuple(self._message(item.media) for item in media)
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.messages.append((text, kwargs.get("reply_markup")))
+
+    def _message(self, photo):
+        if isinstance(photo, str):
+            if photo in self.rejected_file_ids:
+                raise BadRequest("Wrong file identifier/http url specified")
+            file_id = photo
+        else:
+            self._uploads += 1
+            file_id = f"file-{self._uploads}"
+        return SimpleNamespace(photo=(SimpleNamespace(file_id=f"{file_id}-small"), SimpleNamespace(file_id=file_id)))
+
+
+class FakeFileIdStore:
+    def __init__(self):
+        self.rows = {}
+
+    async def get(self, content_hashes):
+        return {content_hash: self.rows[content_hash] for content_hash in content_hashes if content_hash in self.rows}
+
+    async def save(self, content_hash, file_id):
+        self.rows[content_hash] = file_id
+
+    async def delete(self, content_hashes):
+        for content_hash in content_hashes:
+            self.rows.pop(content_hash, None)
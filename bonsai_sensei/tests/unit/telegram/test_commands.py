@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from hamcrest import assert_that, contains_string, equal_to
+
+from bonsai_sensei.telegram.commands import handle_mis_bonsais, handle_plan
+
+
+async def should_list_bonsai_from_async_stores(update):
+    await handle_mis_bonsais(
+        update,
+        SimpleNamespace(args=[]),
+        list_bonsai_func=AsyncMock(return_value=[SimpleNamespace(name="hanako", species_id=1)]),
+        list_species_func=AsyncMock(return_value=[SimpleNamespace(id=1, name="ficus")]),
+    )
+
+    assert_that(update.message.reply_text.await_args.args[0], contains_string("Hanako"), "The bonsai list should come from the awaited stores")
+
+
+async def should_not_list_works_of_unknown_bonsai(update):
+    list_planned_works = AsyncMock(return_value=[])
+
+    await handle_plan(
+        update,
+        SimpleNamespace(args=["kumo"]),
+        get_bonsai_by_name_func=AsyncMock(return_value=None),
+        list_planned_works_func=list_planned_works,
+    )
+
+    assert_that(list_planned_works.await_count, equal_to(0), "Works should only be listed for a bonsai that exists")
+
+
+@pytest.fixture
+def update():
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=42),
+        message=SimpleNamespace(reply_text=AsyncMock()),
+    )
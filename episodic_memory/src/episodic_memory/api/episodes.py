@@ -1,8 +1,12 @@
-from datetime import datetime, timezone
+import json
+from datetime import datetime
 
-from fastapi import APIRouter, BackgroundTasks, Request
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from episodic_memory.graphiti_store import OBSERVATIONS_PAGE_SIZE, decode_cursor
+
 router = APIRouter(tags=["episodes"])
 
 
@@ -14,6 +18,7 @@ class Message(BaseModel):
 class AddEpisodeRequest(BaseModel):
     user_id: str
     messages: list[Message]
+    end_of_session: bool = False
 
 
 class MemorySearchResponse(BaseModel):
@@ -23,20 +28,31 @@ class MemorySearchResponse(BaseModel):
 class ObservationItem(BaseModel):
     user_id: str
     content: str
+    cursor: str | None = None
 
 
 class ObservationsResponse(BaseModel):
     observations: list[ObservationItem]
+    next_cursor: str | None = None
 
 
 @router.post("/episodes", status_code=202)
-async def add_episode(body: AddEpisodeRequest, request: Request, background_tasks: BackgroundTasks):
-    """Queue a conversation episode for async Graphiti extraction."""
+async def add_episode(body: AddEpisodeRequest, request: Request):
+    """Buffer conversation messages into the user's episode window for async Graphiti extraction.
+
+    end_of_session=true seals the window immediately; messages may be empty in that case.
+    """
     messages = [{"role": message.role, "content": message.content} for message in body.messages]
-    background_tasks.add_task(request.app.state.store.add_episode, body.user_id, messages)
+    await request.app.state.episode_queue.enqueue(body.user_id, messages, end_of_session=body.end_of_session)
     return {"status": "accepted"}
 
 
+@router.get("/episodes/dead-letter")
+async def list_dead_letter_episodes(request: Request, limit: int = 100):
+    """Return episodes that exhausted their ingestion retries."""
+    return {"episodes": request.app.state.episode_queue.dead_letters(limit)}
+
+
 @router.get("/memory", response_model=MemorySearchResponse)
 async def search_memory(user_id: str, query: str, request: Request):
     """Return relevant facts for a user given a query."""
@@ -45,8 +61,45 @@ async def search_memory(user_id: str, query: str, request: Request):
 
 
 @router.get("/observations", response_model=ObservationsResponse)
-async def get_observations(request: Request, since: str | None = None):
-    """Return episode content for all users since the given ISO datetime."""
-    since_dt = datetime.fromisoformat(since) if since else datetime.min.replace(tzinfo=timezone.utc)
-    observations = await request.app.state.store.get_new_episodes(since_dt)
-    return ObservationsResponse(observations=observations)
+async def get_observations(
+    request: Request,
+    since: str | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+):
+    """Return episode content for all users after cursor, or created after the given ISO datetime.
+
+    With Accept: application/x-ndjson the feed is streamed one observation per line, paging
+    through the graph until limit items (or the whole backlog when no limit) are sent; resume
+    from the cursor of the last line received. Otherwise one page of at most limit
+    (default OBSERVATIONS_PAGE_SIZE) observations is returned with next_cursor.
+    """
+    try:
+        since_dt = datetime.fromisoformat(since) if since else None
+        if cursor is not None:
+            decode_cursor(cursor)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    if limit is not None and limit <= 0:
+        raise HTTPException(status_code=400, detail="limit must be positive")
+    store = request.app.state.store
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_observations(store, since_dt, cursor, limit), media_type="application/x-ndjson"
+        )
+    observations, next_cursor = await store.get_episode_page(
+        since=since_dt, cursor=cursor, limit=limit or OBSERVATIONS_PAGE_SIZE
+    )
+    return ObservationsResponse(observations=observations, next_cursor=next_cursor)
+
+
+async def _stream_observations(store, since: datetime | None, cursor: str | None, limit: int | None):
+    remaining = limit
+    page_size = min(limit, OBSERVATIONS_PAGE_SIZE) if limit else OBSERVATIONS_PAGE_SIZE
+    async for observations, _ in store.iter_episode_pages(since=since, cursor=cursor, page_size=page_size):
+        for observation in observations[:remaining]:
+            yield json.dumps(observation, ensure_ascii=False) + "\n"
+        if remaining is not None:
+            remaining -= len(observations)
+            if remaining <= 0:
+                return
@@ -0,0 +1,312 @@
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from episodic_memory.logging_config import get_logger
+from episodic_memory.metrics import (
+    EPISODE_QUEUE_DEAD_LETTER,
+    EPISODE_QUEUE_DEPTH,
+    EPISODE_QUEUE_LAG_SECONDS,
+    EPISODE_RETRIES_TOTAL,
+    EPISODE_WINDOW_MESSAGES,
+    EPISODE_WINDOWS_FLUSHED_TOTAL,
+)
+
+logger = get_logger(__name__)
+
+EPISODE_QUEUE_PATH = os.getenv("EPISODE_QUEUE_PATH", "./data/episode_queue.db")
+EPISODE_QUEUE_WORKERS = int(os.getenv("EPISODE_QUEUE_WORKERS", "2"))
+EPISODE_QUEUE_MAX_ATTEMPTS = int(os.getenv("EPISODE_QUEUE_MAX_ATTEMPTS", "5"))
+EPISODE_QUEUE_BACKOFF_SECONDS = float(os.getenv("EPISODE_QUEUE_BACKOFF_SECONDS", "5"))
+EPISODE_QUEUE_MAX_BACKOFF_SECONDS = float(os.getenv("EPISODE_QUEUE_MAX_BACKOFF_SECONDS", "300"))
+EPISODE_QUEUE_POLL_SECONDS = float(os.getenv("EPISODE_QUEUE_POLL_SECONDS", "1"))
+EPISODE_WINDOW_MAX_MESSAGES = int(os.getenv("EPISODE_WINDOW_MAX_MESSAGES", "20"))
+EPISODE_WINDOW_IDLE_SECONDS = float(os.getenv("EPISODE_WINDOW_IDLE_SECONDS", "300"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episode_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    messages TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS episode_jobs_user_status ON episode_jobs (user_id, status, id);
+CREATE INDEX IF NOT EXISTS episode_jobs_status_available ON episode_jobs (status, available_at);
+"""
+
+_OPEN_WINDOW_QUERY = "SELECT id, messages FROM episode_jobs WHERE user_id = ? AND status = 'open'"
+
+_CLAIM_QUERY = """
+SELECT id, user_id, messages, enqueued_at, attempts FROM episode_jobs AS job
+WHERE status = 'pending'
+  AND available_at <= ?
+  AND id = (
+    SELECT MIN(id) FROM episode_jobs
+    WHERE user_id = job.user_id AND status IN ('pending', 'processing')
+  )
+ORDER BY id
+LIMIT 1
+"""
+
+
+@dataclass
+class EpisodeJob:
+    id: int
+    user_id: str
+    messages: list[dict]
+    enqueued_at: float
+    attempts: int
+
+
+class EpisodeQueue:
+    """Durable episode ingestion queue stored in a local SQLite file.
+
+    Episodes are processed by a bounded pool of workers instead of one background task
+    per request. A user's episodes are handled strictly in enqueue order: a job is only
+    claimable while it is the oldest unfinished job of its user, so at most one worker
+    works on a given user at a time and a failing job holds back that user's later ones
+    until it succeeds or is dead-lettered. Failures are retried with exponential backoff;
+    after max_attempts the job moves to the dead-letter list. Jobs left 'processing' by a
+    crash are returned to 'pending' on start, so nothing accepted is lost on restart.
+
+    Consecutive posts of one user are coalesced into a single episode so a conversation
+    costs one Graphiti extraction instead of one per turn. Messages accumulate in the
+    user's 'open' window row (its available_at tracks the last append) and the window is
+    sealed into a claimable 'pending' job when it reaches window_max_messages, when it has
+    been idle for window_idle_seconds, when the client signals the end of the session, or
+    on flush_windows() at shutdown. Open windows are stored in the same file, so they also
+    survive a restart. window_max_messages <= 1 disables coalescing.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = EPISODE_QUEUE_PATH,
+        workers: int = EPISODE_QUEUE_WORKERS,
+        max_attempts: int = EPISODE_QUEUE_MAX_ATTEMPTS,
+        backoff_seconds: float = EPISODE_QUEUE_BACKOFF_SECONDS,
+        max_backoff_seconds: float = EPISODE_QUEUE_MAX_BACKOFF_SECONDS,
+        poll_seconds: float = EPISODE_QUEUE_POLL_SECONDS,
+        window_max_messages: int = EPISODE_WINDOW_MAX_MESSAGES,
+        window_idle_seconds: float = EPISODE_WINDOW_IDLE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._poll_seconds = poll_seconds
+        self._window_max_messages = window_max_messages
+        self._window_idle_seconds = window_idle_seconds
+        self._clock = clock
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def enqueue(self, user_id: str, messages: list[dict], end_of_session: bool = False) -> int | None:
+        """Persist messages for later ingestion, coalescing them into the user's open window.
+
+        Returns the id of the job holding the messages, or None when there was nothing to
+        store or seal.
+        """
+        if self._window_max_messages <= 1:
+            if not messages:
+                return None
+            job_id = await asyncio.to_thread(self._insert, user_id, messages)
+        else:
+            job_id = await asyncio.to_thread(self._append_to_window, user_id, messages, end_of_session)
+        self._wakeup.set()
+        return job_id
+
+    async def seal_idle_windows(self) -> int:
+        """Seal windows that received no message within the idle timeout. Returns how many were sealed."""
+        cutoff = self._clock() - self._window_idle_seconds
+        return await asyncio.to_thread(self._seal_windows, "idle", "AND available_at <= ?", (cutoff,))
+
+    async def flush_windows(self) -> int:
+        """Seal every open window; the shutdown hook, so buffered turns are ingested on the next run at the latest."""
+        return await asyncio.to_thread(self._seal_windows, "shutdown")
+
+    def start(self, process: Callable[[str, list[dict]], Awaitable[None]]) -> None:
+        """Recover interrupted jobs and start the worker pool."""
+        self._execute("UPDATE episode_jobs SET status = 'pending' WHERE status = 'processing'")
+        self._refresh_gauges()
+        self._tasks = [asyncio.create_task(self._work(process)) for _ in range(self._workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers. Jobs in flight return to 'pending' and are retried on next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._execute("UPDATE episode_jobs SET status = 'pending' WHERE status = 'processing'")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    async def process_next(self, process: Callable[[str, list[dict]], Awaitable[None]]) -> bool:
+        """Claim and process one ready job. Returns False when nothing was ready."""
+        job = await asyncio.to_thread(self._claim)
+        if job is None:
+            return False
+        try:
+            await process(job.user_id, job.messages)
+        except Exception as error:
+            await asyncio.to_thread(self._fail, job, repr(error))
+        else:
+            await asyncio.to_thread(self._ack, job)
+        return True
+
+    def dead_letters(self, limit: int = 100) -> list[dict]:
+        rows = self._execute(
+            "SELECT id, user_id, messages, attempts, last_error FROM episode_jobs "
+            "WHERE status = 'dead' ORDER BY id LIMIT ?",
+            (limit,),
+        )
+        return [
+            {"id": row[0], "user_id": row[1], "messages": json.loads(row[2]), "attempts": row[3], "last_error": row[4]}
+            for row in rows
+        ]
+
+    def depth(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM episode_jobs WHERE status IN ('pending', 'processing')")[0][0]
+
+    async def _work(self, process: Callable[[str, list[dict]], Awaitable[None]]) -> None:
+        while True:
+            try:
+                await self.seal_idle_windows()
+                processed = await self.process_next(process)
+            except Exception:
+                logger.exception("Episode queue worker failed")
+                processed = False
+            if processed:
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def _insert(self, user_id: str, messages: list[dict]) -> int:
+        now = self._clock()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO episode_jobs (user_id, messages, enqueued_at, available_at) VALUES (?, ?, ?, ?)",
+                (user_id, json.dumps(messages), now, now),
+            )
+        self._refresh_gauges()
+        return cursor.lastrowid
+
+    def _append_to_window(self, user_id: str, messages: list[dict], end_of_session: bool) -> int | None:
+        now = self._clock()
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(_OPEN_WINDOW_QUERY, (user_id,)).fetchone()
+                if row is None and not messages:
+                    self._connection.execute("COMMIT")
+                    return None
+                if row is None:
+                    window = list(messages)
+                    job_id = self._connection.execute(
+                        "INSERT INTO episode_jobs (user_id, messages, enqueued_at, available_at, status) "
+                        "VALUES (?, ?, ?, ?, 'open')",
+                        (user_id, json.dumps(window), now, now),
+                    ).lastrowid
+                else:
+                    job_id, window = row[0], json.loads(row[1]) + list(messages)
+                    self._connection.execute(
+                        "UPDATE episode_jobs SET messages = ?, available_at = ? WHERE id = ?",
+                        (json.dumps(window), now, job_id),
+                    )
+                reason = "session_end" if end_of_session else "max_messages" if len(window) >= self._window_max_messages else None
+                if reason is not None:
+                    self._connection.execute("UPDATE episode_jobs SET status = 'pending' WHERE id = ?", (job_id,))
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        if reason is not None:
+            EPISODE_WINDOWS_FLUSHED_TOTAL.labels(reason=reason).inc()
+            EPISODE_WINDOW_MESSAGES.observe(len(window))
+        self._refresh_gauges()
+        return job_id
+
+    def _seal_windows(self, reason: str, condition: str = "", params: tuple = ()) -> int:
+        with self._lock:
+            rows = self._connection.execute(
+                f"UPDATE episode_jobs SET status = 'pending', available_at = ? WHERE status = 'open' {condition} "
+                "RETURNING json_array_length(messages)",
+                (self._clock(), *params),
+            ).fetchall()
+        for (message_count,) in rows:
+            EPISODE_WINDOWS_FLUSHED_TOTAL.labels(reason=reason).inc()
+            EPISODE_WINDOW_MESSAGES.observe(message_count)
+        if rows:
+            self._refresh_gauges()
+        return len(rows)
+
+    def _claim(self) -> EpisodeJob | None:
+        with self._lock:
+            row = self._connection.execute(_CLAIM_QUERY, (self._clock(),)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE episode_jobs SET status = 'processing' WHERE id = ?", (row[0],))
+        return EpisodeJob(id=row[0], user_id=row[1], messages=json.loads(row[2]), enqueued_at=row[3], attempts=row[4])
+
+    def _ack(self, job: EpisodeJob) -> None:
+        self._execute("DELETE FROM episode_jobs WHERE id = ?", (job.id,))
+        self._refresh_gauges()
+
+    def _fail(self, job: EpisodeJob, error: str) -> None:
+        attempts = job.attempts + 1
+        if attempts >= self._max_attempts:
+            logger.error("Episode job %d for user_id=%s dead-lettered after %d attempts: %s", job.id, job.user_id, attempts, error)
+            self._execute(
+                "UPDATE episode_jobs SET status = 'dead', attempts = ?, last_error = ? WHERE id = ?",
+                (attempts, error, job.id),
+            )
+        else:
+            delay = min(self._backoff_seconds * 2 ** (attempts - 1), self._max_backoff_seconds)
+            delay *= random.uniform(0.8, 1.2)
+            logger.warning("Episode job %d for user_id=%s failed (attempt %d), retrying in %.1fs: %s", job.id, job.user_id, attempts, delay, error)
+            EPISODE_RETRIES_TOTAL.inc()
+            self._execute(
+                "UPDATE episode_jobs SET status = 'pending', attempts = ?, last_error = ?, available_at = ? WHERE id = ?",
+                (attempts, error, self._clock() + delay, job.id),
+            )
+        self._refresh_gauges()
+
+    def _refresh_gauges(self) -> None:
+        rows = self._execute(
+            "SELECT status, COUNT(*), MIN(enqueued_at) FROM episode_jobs GROUP BY status"
+        )
+        by_status = {row[0]: (row[1], row[2]) for row in rows}
+        EPISODE_QUEUE_DEPTH.set(by_status.get("pending", (0, None))[0] + by_status.get("processing", (0, None))[0])
+        EPISODE_QUEUE_DEAD_LETTER.set(by_status.get("dead", (0, None))[0])
+        oldest = [by_status[status][1] for status in ("pending", "processing") if status in by_status]
+        EPISODE_QUEUE_LAG_SECONDS.set(max(self._clock() - min(oldest), 0.0) if oldest else 0.0)
+
+    def _execute(self, query: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(query, params).fetchall()
+
+
+def create_episode_queue(path: str | Path = EPISODE_QUEUE_PATH, **kwargs) -> EpisodeQueue:
+    """Create the durable episode ingestion queue."""
+    return EpisodeQueue(path, **kwargs)
@@ -1,7 +1,14 @@
+import base64
+import json
 import logging
+import os
+import re
 import time
+import unicodedata
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
+from typing import AsyncIterator, Callable
 
 from graphiti_core import Graphiti
 from graphiti_core.cross_encoder.gemini_reranker_client import GeminiRerankerClient
@@ -17,13 +24,51 @@ from episodic_memory.metrics import (
     EPISODE_DURATION_SECONDS,
     EPISODES_TOTAL,
     OBSERVATIONS_RETURNED_TOTAL,
+    SEARCH_CACHE_LOOKUPS_TOTAL,
     SEARCH_REQUESTS_TOTAL,
 )
 
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "600"))
+OBSERVATIONS_PAGE_SIZE = int(os.getenv("OBSERVATIONS_PAGE_SIZE", "500"))
+
+_EPISODES_AFTER_QUERY = """
+MATCH (e:Episodic)
+WHERE e.created_at >= $after_created_at
+  AND (e.created_at > $after_created_at OR e.uuid > $after_uuid)
+RETURN e.uuid AS uuid, e.group_id AS group_id, e.content AS content, e.created_at AS created_at
+ORDER BY e.created_at, e.uuid
+LIMIT $limit
+"""
+
+
+def normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", query)).strip().casefold()
+
 
 class GraphitiStore:
-    def __init__(self, graphiti: Graphiti):
+    """Graphiti-backed episodic memory.
+
+    search() results are kept in a bounded LRU cache with TTL keyed by (user_id,
+    normalized query), so the near-identical lookups issued by the advisor and its tools
+    skip the hybrid search and reranking. A user's entries are dropped as soon as one of
+    their episodes is ingested; a per-user generation counter keeps a search that was in
+    flight during ingestion from caching pre-ingestion facts.
+    """
+
+    def __init__(
+        self,
+        graphiti: Graphiti,
+        cache_size: int = SEARCH_CACHE_SIZE,
+        cache_ttl_seconds: float = SEARCH_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self._graphiti = graphiti
+        self._cache_size = cache_size
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._clock = clock
+        self._search_cache: OrderedDict[tuple[str, str], tuple[float, list[str]]] = OrderedDict()
+        self._user_generations: dict[str, int] = {}
 
     async def initialize(self) -> None:
         """Build indices and constraints on startup."""
@@ -53,45 +98,106 @@ class GraphitiStore:
         finally:
             EPISODE_DURATION_SECONDS.observe(time.perf_counter() - start)
             EPISODES_TOTAL.labels(status=status).inc()
+            self.invalidate_user(user_id)
 
     async def search(self, user_id: str, query: str) -> list[str]:
         """Return relevant facts for a user, filtered by group_id."""
+        key = (user_id, normalize_query(query))
+        cached = self._search_cache.get(key)
+        if cached is not None and self._clock() - cached[0] < self._cache_ttl_seconds:
+            self._search_cache.move_to_end(key)
+            SEARCH_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc()
+            SEARCH_REQUESTS_TOTAL.labels(status="success").inc()
+            return list(cached[1])
+        SEARCH_CACHE_LOOKUPS_TOTAL.labels(result="miss").inc()
+        generation = self._user_generations.get(user_id, 0)
         status = "success"
         try:
             edges = await self._graphiti.search(query, group_ids=[user_id])
-            return [edge.fact for edge in edges if edge.fact]
+            facts = [edge.fact for edge in edges if edge.fact]
+            if self._cache_size > 0 and self._user_generations.get(user_id, 0) == generation:
+                self._search_cache[key] = (self._clock(), facts)
+                self._search_cache.move_to_end(key)
+                while len(self._search_cache) > self._cache_size:
+                    self._search_cache.popitem(last=False)
+            return list(facts)
         except Exception:
             status = "error"
             raise
         finally:
             SEARCH_REQUESTS_TOTAL.labels(status=status).inc()
 
-    async def get_new_episodes(self, since: datetime) -> list[dict]:
-        """Return episode content with user_id for all users with valid_at > since."""
-        episodes = await self._graphiti.retrieve_episodes(
-            reference_time=datetime.now(timezone.utc),
-            last_n=500,
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop cached search results of a user whose memory changed."""
+        self._user_generations[user_id] = self._user_generations.get(user_id, 0) + 1
+        for key in [key for key in self._search_cache if key[0] == user_id]:
+            del self._search_cache[key]
+
+    async def get_episode_page(
+        self, since: datetime | None = None, cursor: str | None = None, limit: int = OBSERVATIONS_PAGE_SIZE
+    ) -> tuple[list[dict], str | None]:
+        """Return up to limit observations after cursor (or created after since) and the cursor of the next page.
+
+        Episodes are read in (created_at, uuid) order straight from the Episodic created_at
+        index, so paging is stable and no episode is skipped however large the backlog.
+        Each observation carries its own cursor so a consumer can resume after any item.
+        The next cursor is None once the feed is exhausted.
+        """
+        if cursor is not None:
+            after_created_at, after_uuid = decode_cursor(cursor)
+        else:
+            since = since or datetime.min.replace(tzinfo=timezone.utc)
+            since_aware = since if since.tzinfo is not None else since.replace(tzinfo=timezone.utc)
+            after_created_at, after_uuid = since_aware.astimezone(timezone.utc).isoformat(), None
+        records, _, _ = await self._graphiti.driver.execute_query(
+            _EPISODES_AFTER_QUERY, after_created_at=after_created_at, after_uuid=after_uuid, limit=limit
         )
-        logger.info("retrieve_episodes returned %d episodes, filtering since=%s", len(episodes), since)
-        for episode in episodes:
-            valid_at = episode.valid_at
-            if valid_at.tzinfo is None:
-                valid_at = valid_at.replace(tzinfo=timezone.utc)
-            logger.debug("episode uuid=%s valid_at=%s content_len=%d", episode.uuid, valid_at, len(episode.content or ""))
-        since_aware = since if since.tzinfo is not None else since.replace(tzinfo=timezone.utc)
         observations = [
-            {"user_id": episode.group_id, "content": episode.content}
-            for episode in episodes
-            if episode.content and (episode.valid_at.replace(tzinfo=timezone.utc) if episode.valid_at.tzinfo is None else episode.valid_at) > since_aware
+            {
+                "user_id": record["group_id"],
+                "content": record["content"],
+                "cursor": encode_cursor(record["created_at"], record["uuid"]),
+            }
+            for record in records
+            if record["content"]
         ]
-        logger.info("Returning %d observations (since=%s)", len(observations), since_aware)
+        next_cursor = encode_cursor(records[-1]["created_at"], records[-1]["uuid"]) if len(records) == limit else None
+        logger.info("Returning %d observations (after=%s)", len(observations), after_created_at)
         OBSERVATIONS_RETURNED_TOTAL.inc(len(observations))
-        return observations
+        return observations, next_cursor
+
+    async def iter_episode_pages(
+        self,
+        since: datetime | None = None,
+        cursor: str | None = None,
+        page_size: int = OBSERVATIONS_PAGE_SIZE,
+    ) -> AsyncIterator[tuple[list[dict], str | None]]:
+        """Yield (observations, next_cursor) pages until the feed is exhausted."""
+        while True:
+            observations, cursor = await self.get_episode_page(since=since, cursor=cursor, limit=page_size)
+            yield observations, cursor
+            if cursor is None:
+                return
 
     async def close(self) -> None:
         await self._graphiti.close()
 
 
+def encode_cursor(created_at, episode_uuid: str) -> str:
+    """Encode an opaque feed position from an episode's created_at and uuid."""
+    created_at = created_at.isoformat() if isinstance(created_at, datetime) else created_at
+    return base64.urlsafe_b64encode(json.dumps([created_at, episode_uuid]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Decode a cursor from encode_cursor. Raises ValueError when it is malformed."""
+    try:
+        created_at, episode_uuid = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as error:
+        raise ValueError(f"Invalid observations cursor: {cursor!r}") from error
+    return created_at, episode_uuid
+
+
 def create_graphiti_store(host: str, port: int, gemini_api_key: str, model: str) -> GraphitiStore:
     """Create a GraphitiStore backed by FalkorDB and Gemini."""
     driver = FalkorDriver(host=host, port=port)
@@ -8,6 +8,7 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from episodic_memory.api.episodes import router
+from episodic_memory.episode_queue import create_episode_queue
 from episodic_memory.graphiti_store import create_graphiti_store
 from episodic_memory.logging_config import configure_logging, get_logger
 
@@ -31,10 +32,16 @@ async def lifespan(application: FastAPI):
     )
     await store.initialize()
     application.state.store = store
+    episode_queue = create_episode_queue()
+    episode_queue.start(store.add_episode)
+    application.state.episode_queue = episode_queue
     logger.info("Episodic memory service started (FalkorDB at %s:%d)", falkordb_host, falkordb_port)
 
     yield
 
+    await episode_queue.flush_windows()
+    await episode_queue.stop()
+    episode_queue.close()
     await store.close()
     logger.info("Episodic memory service stopped")
 
@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 EPISODE_DURATION_SECONDS = Histogram(
     "em_episode_duration_seconds",
@@ -18,7 +18,45 @@ SEARCH_REQUESTS_TOTAL = Counter(
     ["status"],
 )
 
+SEARCH_CACHE_LOOKUPS_TOTAL = Counter(
+    "em_search_cache_lookups_total",
+    "Memory search lookups answered from the result cache (hit) or by Graphiti (miss)",
+    ["result"],
+)
+
 OBSERVATIONS_RETURNED_TOTAL = Counter(
     "em_observations_returned_total",
     "Total number of observations returned to the dreamer",
 )
+
+EPISODE_QUEUE_DEPTH = Gauge(
+    "em_episode_queue_depth",
+    "Episodes waiting in or being processed from the ingestion queue",
+)
+
+EPISODE_QUEUE_LAG_SECONDS = Gauge(
+    "em_episode_queue_lag_seconds",
+    "Age of the oldest unfinished episode in the ingestion queue",
+)
+
+EPISODE_QUEUE_DEAD_LETTER = Gauge(
+    "em_episode_queue_dead_letter",
+    "Episodes moved to the dead-letter list after exhausting retries",
+)
+
+EPISODE_RETRIES_TOTAL = Counter(
+    "em_episode_retries_total",
+    "Total number of episode ingestion retries scheduled",
+)
+
+EPISODE_WINDOWS_FLUSHED_TOTAL = Counter(
+    "em_episode_windows_flushed_total",
+    "Conversation windows sealed into an episode, by trigger",
+    ["reason"],
+)
+
+EPISODE_WINDOW_MESSAGES = Histogram(
+    "em_episode_window_messages",
+    "Number of messages coalesced into one episode",
+    buckets=[1, 2, 4, 8, 12, 16, 20, 30, 50],
+)
@@ -0,0 +1,181 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from hamcrest import assert_that, equal_to, has_length
+
+from episodic_memory.episode_queue import EpisodeQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+async def should_process_episodes_of_a_user_in_enqueue_order(queue):
+    processed = []
+
+    async def process(user_id, messages):
+        processed.append(messages[0]["content"])
+
+    await queue.enqueue("user-1", [{"role": "user", "content": "first"}])
+    await queue.enqueue("user-1", [{"role": "user", "content": "second"}])
+    while await queue.process_next(process):
+        pass
+
+    assert_that(processed, equal_to(["first", "second"]), "Should keep per-user ordering")
+
+
+async def should_not_hand_out_a_users_next_episode_while_one_is_in_flight(queue):
+    await queue.enqueue("user-1", [{"role": "user", "content": "first"}])
+    await queue.enqueue("user-1", [{"role": "user", "content": "second"}])
+    await queue.enqueue("user-2", [{"role": "user", "content": "other"}])
+    seen = []
+
+    async def process(user_id, messages):
+        seen.append(messages[0]["content"])
+        if messages[0]["content"] == "first":
+            await queue.process_next(process)
+
+    await queue.process_next(process)
+
+    assert_that(seen, equal_to(["first", "other"]), "Should skip to another user while the first user's job is processing")
+
+
+async def should_retry_failed_episode_after_backoff(queue, clock):
+    process = AsyncMock(side_effect=[RuntimeError("llm down"), None])
+    await queue.enqueue("user-1", [{"role": "user", "content": "hola"}])
+
+    await queue.process_next(process)
+    retried_too_early = await queue.process_next(process)
+    clock.now += 60
+    retried = await queue.process_next(process)
+
+    assert_that(retried_too_early, equal_to(False), "Should wait for the backoff delay before retrying")
+    assert_that(retried, equal_to(True), "Should retry once the backoff has elapsed")
+    assert_that(queue.depth(), equal_to(0), "Should remove the job after a successful retry")
+
+
+async def should_move_episode_to_dead_letter_after_max_attempts(queue, clock):
+    process = AsyncMock(side_effect=RuntimeError("bad payload"))
+    await queue.enqueue("user-1", [{"role": "user", "content": "hola"}])
+
+    for _ in range(3):
+        await queue.process_next(process)
+        clock.now += 3600
+
+    assert_that(queue.dead_letters(), has_length(1), "Should dead-letter the job after exhausting attempts")
+    assert_that(queue.depth(), equal_to(0), "Dead-lettered jobs should not count as queued")
+
+
+async def should_recover_jobs_interrupted_by_a_restart(tmp_path, clock):
+    path = tmp_path / "queue.db"
+    first = EpisodeQueue(path, window_max_messages=1, clock=clock)
+    await first.enqueue("user-1", [{"role": "user", "content": "hola"}])
+    first._claim()
+    first.close()
+
+    restarted = EpisodeQueue(path, workers=0, window_max_messages=1, clock=clock)
+    restarted.start(AsyncMock())
+    process = AsyncMock()
+    processed = await restarted.process_next(process)
+    await restarted.stop()
+    restarted.close()
+
+    assert_that(processed, equal_to(True), "Should process the job that was in flight when the process stopped")
+
+
+async def should_process_queued_episodes_with_worker_pool(queue):
+    process = AsyncMock()
+    queue.start(process)
+    for index in range(5):
+        await queue.enqueue(f"user-{index}", [{"role": "user", "content": "hola"}])
+
+    for _ in range(50):
+        if queue.depth() == 0:
+            break
+        await asyncio.sleep(0.01)
+    await queue.stop()
+
+    assert_that(process.await_count, equal_to(5), "Workers should drain the queue")
+
+
+async def should_coalesce_consecutive_turns_into_one_episode(windowed_queue, clock):
+    process = AsyncMock()
+    for turn in range(3):
+        await windowed_queue.enqueue("user-1", [{"role": "user", "content": f"turn {turn}"}])
+        clock.now += 10
+
+    processed_before_idle = await windowed_queue.process_next(process)
+    clock.now += 60
+    sealed = await windowed_queue.seal_idle_windows()
+    await windowed_queue.process_next(process)
+
+    assert_that(processed_before_idle, equal_to(False), "Should keep an active window buffered")
+    assert_that(sealed, equal_to(1), "Should seal the window once it has been idle")
+    assert_that(process.await_count, equal_to(1), "Should ingest the whole window as a single episode")
+    assert_that(process.await_args.args[1], has_length(3), "Should keep every message of the window in order")
+
+
+async def should_seal_window_when_it_reaches_max_messages(windowed_queue):
+    process = AsyncMock()
+    await windowed_queue.enqueue("user-1", [{"role": "user", "content": "a"}, {"role": "assistant", "content": "b"}])
+    await windowed_queue.enqueue("user-1", [{"role": "user", "content": "c"}, {"role": "assistant", "content": "d"}])
+    await windowed_queue.enqueue("user-1", [{"role": "user", "content": "e"}])
+
+    await windowed_queue.process_next(process)
+
+    assert_that(process.await_args.args[1], has_length(4), "Should flush exactly the full window")
+    assert_that(windowed_queue.depth(), equal_to(0), "The overflow message should start a new open window")
+
+
+async def should_seal_window_on_session_end(windowed_queue):
+    process = AsyncMock()
+    await windowed_queue.enqueue("user-1", [{"role": "user", "content": "hola"}])
+    await windowed_queue.enqueue("user-1", [], end_of_session=True)
+
+    processed = await windowed_queue.process_next(process)
+
+    assert_that(processed, equal_to(True), "Should ingest the window as soon as the session ends")
+
+
+async def should_flush_open_windows_on_shutdown(tmp_path, clock):
+    path = tmp_path / "queue.db"
+    first = EpisodeQueue(path, window_max_messages=10, clock=clock)
+    await first.enqueue("user-1", [{"role": "user", "content": "hola"}])
+    await first.enqueue("user-2", [{"role": "user", "content": "konnichiwa"}])
+    flushed = await first.flush_windows()
+    first.close()
+
+    restarted = EpisodeQueue(path, window_max_messages=10, clock=clock)
+    process = AsyncMock()
+    while await restarted.process_next(process):
+        pass
+    restarted.close()
+
+    assert_that(flushed, equal_to(2), "Should seal every open window")
+    assert_that(process.await_count, equal_to(2), "Sealed windows should be ingested after the restart")
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    episode_queue = EpisodeQueue(
+        tmp_path / "queue.db", workers=2, max_attempts=3, backoff_seconds=10, window_max_messages=1, clock=clock
+    )
+    yield episode_queue
+    episode_queue.close()
+
+
+@pytest.fixture
+def windowed_queue(tmp_path, clock):
+    episode_queue = EpisodeQueue(tmp_path / "queue.db", window_max_messages=4, window_idle_seconds=30, clock=clock)
+    yield episode_queue
+    episode_queue.close()
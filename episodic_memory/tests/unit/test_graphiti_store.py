@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from hamcrest import assert_that, equal_to, has_length
 
-from episodic_memory.graphiti_store import GraphitiStore
+from episodic_memory.graphiti_store import GraphitiStore, decode_cursor
 
 
 async def should_add_episode_formats_messages_as_role_content():
@@ -37,31 +37,115 @@ async def should_search_returns_facts_for_user():
     assert_that(facts, equal_to(["Tanaka tiene hojas amarillas"]), "Should exclude edges with no fact")
 
 
-async def should_get_new_episodes_filters_by_valid_at():
+async def should_answer_repeated_search_from_cache():
     graphiti = MagicMock()
-    since = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    edge = MagicMock()
+    edge.fact = "Tanaka tiene hojas amarillas"
+    graphiti.search = AsyncMock(return_value=[edge])
+    store = GraphitiStore(graphiti)
+
+    await store.search("user-1", "hojas amarillas")
+    facts = await store.search("user-1", "  Hojas   AMARILLAS ")
+
+    assert_that(graphiti.search.await_count, equal_to(1), "Should reuse the result for the same normalized query")
+    assert_that(facts, equal_to(["Tanaka tiene hojas amarillas"]))
+
+
+async def should_expire_cached_search_after_ttl():
+    graphiti = MagicMock()
+    graphiti.search = AsyncMock(return_value=[])
+    clock = MagicMock(return_value=0.0)
+    store = GraphitiStore(graphiti, cache_ttl_seconds=60, clock=clock)
+
+    await store.search("user-1", "riego")
+    clock.return_value = 61.0
+    await store.search("user-1", "riego")
+
+    assert_that(graphiti.search.await_count, equal_to(2), "Should search again once the entry expired")
+
+
+async def should_invalidate_user_cache_when_episode_is_ingested():
+    graphiti = MagicMock()
+    graphiti.search = AsyncMock(return_value=[])
+    graphiti.add_episode = AsyncMock()
+    store = GraphitiStore(graphiti)
+
+    await store.search("user-1", "riego")
+    await store.search("user-2", "riego")
+    await store.add_episode("user-1", [{"role": "user", "content": "riego cada dos días"}])
+    await store.search("user-1", "riego")
+    await store.search("user-2", "riego")
+
+    assert_that(graphiti.search.await_count, equal_to(3), "Should only refresh the user whose memory changed")
+
+
+async def should_not_cache_search_that_raced_with_ingestion():
+    graphiti = MagicMock()
+    store = GraphitiStore(graphiti)
+
+    async def search_while_ingesting(query, group_ids):
+        store.invalidate_user("user-1")
+        return []
+
+    graphiti.search = AsyncMock(side_effect=search_while_ingesting)
+
+    await store.search("user-1", "riego")
+    await store.search("user-1", "riego")
+
+    assert_that(graphiti.search.await_count, equal_to(2), "Should not cache facts read before the ingestion finished")
+
+
+def _episode_record(episode_uuid, created_at, content="hola", group_id="user-1"):
+    return {"uuid": episode_uuid, "group_id": group_id, "content": content, "created_at": created_at}
+
+
+async def should_get_episode_page_queries_episodes_created_after_since():
+    graphiti = MagicMock()
+    graphiti.driver.execute_query = AsyncMock(return_value=([
+        _episode_record("a", "2024-07-01T00:00:00+00:00", content="new content"),
+        _episode_record("b", "2024-07-02T00:00:00+00:00", content="", group_id="user-2"),
+    ], None, None))
+    store = GraphitiStore(graphiti)
+
+    observations, next_cursor = await store.get_episode_page(since=datetime(2024, 6, 1, tzinfo=timezone.utc), limit=10)
+
+    query_kwargs = graphiti.driver.execute_query.call_args.kwargs
+    assert_that(query_kwargs["after_created_at"], equal_to("2024-06-01T00:00:00+00:00"), "Should filter on created_at in the graph")
+    assert_that([(item["user_id"], item["content"]) for item in observations], equal_to([("user-1", "new content")]), "Should skip empty episodes")
+    assert_that(next_cursor, equal_to(None), "Should signal the end of the feed on a short page")
+
+
+async def should_get_episode_page_resumes_after_cursor():
+    graphiti = MagicMock()
+    graphiti.driver.execute_query = AsyncMock(return_value=([
+        _episode_record("a", "2024-07-01T00:00:00+00:00"),
+        _episode_record("b", "2024-07-01T00:00:00+00:00"),
+    ], None, None))
+    store = GraphitiStore(graphiti)
 
-    old_episode = MagicMock()
-    old_episode.content = "old content"
-    old_episode.group_id = "user-old"
-    old_episode.valid_at = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    _, next_cursor = await store.get_episode_page(limit=2)
+    await store.get_episode_page(cursor=next_cursor, limit=2)
 
-    new_episode = MagicMock()
-    new_episode.content = "new content"
-    new_episode.group_id = "user-1"
-    new_episode.valid_at = datetime(2024, 7, 1, tzinfo=timezone.utc)
+    query_kwargs = graphiti.driver.execute_query.call_args.kwargs
+    assert_that(decode_cursor(next_cursor), equal_to(("2024-07-01T00:00:00+00:00", "b")), "Should point the cursor at the last row of a full page")
+    assert_that((query_kwargs["after_created_at"], query_kwargs["after_uuid"]), equal_to(("2024-07-01T00:00:00+00:00", "b")), "Should continue after the cursor position")
 
-    empty_episode = MagicMock()
-    empty_episode.content = ""
-    empty_episode.group_id = "user-2"
-    empty_episode.valid_at = datetime(2024, 7, 2, tzinfo=timezone.utc)
 
-    graphiti.retrieve_episodes = AsyncMock(return_value=[old_episode, new_episode, empty_episode])
+async def should_iter_episode_pages_through_whole_backlog():
+    graphiti = MagicMock()
+    full_page = [_episode_record(f"e{index}", f"2024-07-01T00:00:0{index}+00:00") for index in range(2)]
+    last_page = [_episode_record("e2", "2024-07-01T00:00:02+00:00")]
+    graphiti.driver.execute_query = AsyncMock(side_effect=[(full_page, None, None), (last_page, None, None)])
     store = GraphitiStore(graphiti)
 
-    observations = await store.get_new_episodes(since)
+    observations = [item async for page, _ in store.iter_episode_pages(page_size=2) for item in page]
+
+    assert_that(observations, has_length(3), "Should not drop episodes beyond the first page")
+
 
-    assert_that(observations, equal_to([{"user_id": "user-1", "content": "new content"}]), "Should include only new non-empty episodes with user_id")
+def should_reject_malformed_cursor():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
 
 
 @pytest.fixture
@@ -69,7 +153,6 @@ def store():
     graphiti = MagicMock()
     graphiti.add_episode = AsyncMock()
     graphiti.search = AsyncMock(return_value=[])
-    graphiti.retrieve_episodes = AsyncMock(return_value=[])
     graphiti.build_indices_and_constraints = AsyncMock()
     graphiti.close = AsyncMock()
     return GraphitiStore(graphiti)
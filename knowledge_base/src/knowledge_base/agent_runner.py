@@ -0,0 +1,49 @@
+from collections.abc import AsyncGenerator
+from typing import Callable, Optional
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.memory import InMemoryMemoryService
+from google.adk.runners import RunConfig, Runner
+from google.adk.sessions import BaseSessionService, InMemorySessionService
+from google.genai import types
+
+
+def create_agent_runner(
+    agent: Agent, session_service: Optional[BaseSessionService] = None
+) -> Callable[..., AsyncGenerator]:
+    """Build one long-lived runner for agent and return a single-turn run callable.
+
+    Returns an async generator callable (prompt, max_llm_calls, state=None) -> events.
+    Every call runs in a fresh session that is deleted once the run finishes or fails,
+    so the runner's in-memory session store does not grow with the number of calls.
+    Per-call inputs for tools go in state and are read through tool_context.state.
+    """
+    runner = Runner(
+        app_name=agent.name,
+        agent=agent,
+        artifact_service=InMemoryArtifactService(),
+        session_service=session_service or InMemorySessionService(),
+        memory_service=InMemoryMemoryService(),
+    )
+
+    async def run(prompt: str, max_llm_calls: int, state: Optional[dict] = None) -> AsyncGenerator:
+        session = await runner.session_service.create_session(
+            app_name=agent.name, user_id=agent.name, state=state
+        )
+        message = types.Content(role="user", parts=[types.Part(text=prompt)])
+        try:
+            async for event in runner.run_async(
+                user_id=agent.name,
+                session_id=session.id,
+                new_message=message,
+                run_config=RunConfig(max_llm_calls=max_llm_calls),
+            ):
+                yield event
+        finally:
+            await runner.session_service.delete_session(
+                app_name=agent.name, user_id=agent.name, session_id=session.id
+            )
+
+    return run
+
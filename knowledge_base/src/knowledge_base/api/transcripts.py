@@ -6,7 +6,9 @@ from pathlib import Path
 from fastapi import APIRouter, BackgroundTasks, Request
 from pydantic import BaseModel
 
+from knowledge_base.change_index import CARDS_TREE
 from knowledge_base.dreamer.memory_reader import append_local_observation, update_high_watermark
+from knowledge_base.dreamer.runner import CARDS_PHASE, OBSERVATIONS_PHASE
 
 router = APIRouter(prefix="/wiki/transcripts", tags=["transcripts"])
 
@@ -35,7 +37,7 @@ async def run_wiki_dreamer(request: Request, background_tasks: BackgroundTasks):
     """Trigger the wiki dreamer manually to maintain wiki coherence.
 
     Reads all knowledge cards and updates or creates topic pages in the main wiki.
-    Runs asynchronously in the background.
+    Runs asynchronously in the background, after any run already in progress.
     """
     background_tasks.add_task(request.app.state.run_wiki_dreamer)
     return {"status": "running"}
@@ -58,7 +60,7 @@ class ObservationRequest(BaseModel):
 
 
 @router.post("/observations", status_code=200)
-def submit_local_observation(body: ObservationRequest):
+def submit_local_observation(body: ObservationRequest, request: Request):
     """Submit a local observation for the dreamer to process on its next run.
 
     Used in acceptance tests to inject observations without a Honcho connection.
@@ -66,6 +68,7 @@ def submit_local_observation(body: ObservationRequest):
     """
     wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
     append_local_observation(wiki_root, body.text, user_id=body.user_id)
+    request.app.state.wiki_dreamer_scheduler.trigger(OBSERVATIONS_PHASE)
     return {"status": "queued", "text": body.text}
 
 
@@ -91,7 +94,7 @@ class CardRequest(BaseModel):
 
 
 @router.post("/cards", status_code=200)
-def create_knowledge_card(body: CardRequest):
+def create_knowledge_card(body: CardRequest, request: Request):
     """Write a knowledge card file for acceptance tests.
 
     Creates a card at transcripts/cards/{path} so the dreamer can pick it up
@@ -102,67 +105,47 @@ def create_knowledge_card(body: CardRequest):
     card_path = transcripts_root / "cards" / body.path
     card_path.parent.mkdir(parents=True, exist_ok=True)
     card_path.write_text(body.content, encoding="utf-8")
-    return {"status": "created", "path": str(card_path.relative_to(transcripts_root / "cards"))}
+    relative_path = str(card_path.relative_to(transcripts_root / "cards"))
+    request.app.state.change_index.record(CARDS_TREE, [relative_path])
+    request.app.state.wiki_dreamer_scheduler.trigger(CARDS_PHASE)
+    return {"status": "created", "path": relative_path}
 
 
 @router.delete("/cards", status_code=200)
-def delete_knowledge_card(path: str):
+def delete_knowledge_card(path: str, request: Request):
     """Delete a knowledge card file. Used in acceptance test teardown."""
     transcripts_root = Path(os.getenv("TRANSCRIPTS_PATH", "./transcripts"))
     card_path = transcripts_root / "cards" / path
     if card_path.exists():
         card_path.unlink()
+    request.app.state.change_index.remove(CARDS_TREE, [path])
     return {"status": "deleted", "path": path}
 
 
 @router.get("/wiki-dreamer/wikilinks/tracker", status_code=200)
-def get_wikilink_tracker():
-    """Return the current wikilink processed tracker. Used in acceptance tests."""
-    import json
-    from knowledge_base.dreamer.runner import _PROCESSED_WIKILINKS_FILE
-    wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
-    tracker_file = wiki_root / _PROCESSED_WIKILINKS_FILE
-    if not tracker_file.exists():
-        return {}
-    return json.loads(tracker_file.read_text())
+def get_wikilink_tracker(request: Request):
+    """Return the pages already processed for wikilinks, with their mtime. Used in acceptance tests."""
+    return request.app.state.change_index.wikilinks_processed()
 
 
 @router.post("/wiki-dreamer/wikilinks/reset", status_code=200)
-def reset_wikilink_tracker():
-    """Clear the wikilink processed tracker. Used in acceptance tests."""
-    from knowledge_base.dreamer.runner import _PROCESSED_WIKILINKS_FILE
-    wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
-    tracker = wiki_root / _PROCESSED_WIKILINKS_FILE
-    tracker.unlink(missing_ok=True)
+def reset_wikilink_tracker(request: Request):
+    """Mark every page as pending for wikilinks. Used in acceptance tests."""
+    request.app.state.change_index.clear_wikilinks_processed()
     return {"status": "reset"}
 
 
 @router.delete("/wiki-dreamer/wikilinks/pages", status_code=200)
-def remove_page_from_wikilink_tracker(path: str):
+def remove_page_from_wikilink_tracker(path: str, request: Request):
     """Remove a single page from the wikilink tracker so it gets re-processed."""
-    import json
-    from knowledge_base.dreamer.runner import _PROCESSED_WIKILINKS_FILE
-    wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
-    tracker_file = wiki_root / _PROCESSED_WIKILINKS_FILE
-    if not tracker_file.exists():
-        return {"status": "not_found"}
-    data = json.loads(tracker_file.read_text())
-    data.pop(path, None)
-    tracker_file.write_text(json.dumps(data))
+    request.app.state.change_index.clear_wikilinks_processed([path])
     return {"status": "removed", "path": path}
 
 
 @router.post("/wiki-dreamer/wikilinks/pages", status_code=200)
-def mark_page_as_wikilink_processed(path: str):
-    """Mark a page as already processed for wikilinks (using current mtime). Used in acceptance tests."""
-    import json
-    from knowledge_base.dreamer.runner import _PROCESSED_WIKILINKS_FILE
-    wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
-    tracker_file = wiki_root / _PROCESSED_WIKILINKS_FILE
-    data = json.loads(tracker_file.read_text()) if tracker_file.exists() else {}
-    page = wiki_root / path
-    data[path] = page.stat().st_mtime if page.exists() else 0.0
-    tracker_file.write_text(json.dumps(data))
+def mark_page_as_wikilink_processed(path: str, request: Request):
+    """Mark a page as already processed for wikilinks (at its current content). Used in acceptance tests."""
+    request.app.state.change_index.mark_wikilinks_processed([path])
     return {"status": "marked", "path": path}
 
 
@@ -1,9 +1,11 @@
 import os
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
+from knowledge_base.change_index import WIKI_TREE
+
 router = APIRouter()
 
 
@@ -13,7 +15,7 @@ class WriteWikiPageRequest(BaseModel):
 
 
 @router.put("/wiki", status_code=200)
-def write_wiki_page(body: WriteWikiPageRequest):
+def write_wiki_page(body: WriteWikiPageRequest, request: Request):
     """Write content to a wiki page at the given path. Creates parent directories if needed."""
     wiki_root = Path(os.getenv("WIKI_PATH", "./wiki")).resolve()
     resolved = (wiki_root / body.path).resolve()
@@ -23,6 +25,7 @@ def write_wiki_page(body: WriteWikiPageRequest):
 
     resolved.parent.mkdir(parents=True, exist_ok=True)
     resolved.write_text(body.content, encoding="utf-8")
+    request.app.state.change_index.record(WIKI_TREE, [str(resolved.relative_to(wiki_root))])
     return {"status": "written", "path": body.path}
 
 
@@ -41,7 +44,7 @@ def get_wiki_page(path: str):
 
 
 @router.delete("/wiki")
-def delete_wiki_page(path: str):
+def delete_wiki_page(path: str, request: Request):
     wiki_root = Path(os.getenv("WIKI_PATH", "./wiki")).resolve()
     resolved = (wiki_root / path).resolve()
 
@@ -52,6 +55,7 @@ def delete_wiki_page(path: str):
         raise HTTPException(status_code=404, detail="page_not_found")
 
     resolved.unlink()
+    request.app.state.change_index.remove(WIKI_TREE, [str(resolved.relative_to(wiki_root))])
     return {"status": "deleted", "path": path}
 
 
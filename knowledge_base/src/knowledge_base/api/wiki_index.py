@@ -11,14 +11,43 @@ router = APIRouter(prefix="/wiki/index", tags=["wiki-index"])
 
 @router.post("/rebuild", status_code=200)
 async def rebuild_wiki_index(request: Request):
-    """Rebuild the full wiki semantic index. Embeds all .md pages. May take 30-60s."""
+    """Incrementally rebuild the wiki semantic index. Only new or changed pages are embedded."""
     embed = getattr(request.app.state, "embed_text", None)
     save_entry = getattr(request.app.state, "save_entry", None)
     if embed is None or save_entry is None:
         raise HTTPException(status_code=503, detail="indexer_not_configured")
     wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
-    count = await build_full_index(wiki_root, embed, save_entry)
-    return {"indexed_pages": count}
+    report = await build_full_index(
+        wiki_root,
+        embed,
+        save_entry,
+        embed_many=getattr(request.app.state, "embed_many", None),
+        load_content_hashes=getattr(request.app.state, "load_content_hashes", None),
+        delete_entries=getattr(request.app.state, "delete_entries", None),
+        save_entries=getattr(request.app.state, "save_entries", None),
+    )
+    return {
+        "indexed_pages": report.indexed_pages,
+        "added": report.added,
+        "updated": report.updated,
+        "unchanged": report.unchanged,
+        "deleted": report.deleted,
+    }
+
+
+@router.get("/pages", status_code=200)
+async def list_indexed_pages(request: Request):
+    """List every indexed page with its user scope and outgoing links. Embeddings are not loaded."""
+    load_all_entries = getattr(request.app.state, "load_all_entries", None)
+    if load_all_entries is None:
+        raise HTTPException(status_code=503, detail="indexer_not_configured")
+    entries = load_all_entries(with_embeddings=False)
+    return {
+        "pages": [
+            {"page_path": entry.page_path, "user_id": entry.user_id, "links": entry.links}
+            for entry in entries
+        ]
+    }
 
 
 class WikiSearchRequest(BaseModel):
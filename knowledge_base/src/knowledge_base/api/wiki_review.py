@@ -1,11 +1,9 @@
-import os
 import uuid
-from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
 
+from knowledge_base.change_index import WIKI_TREE
 from knowledge_base.wiki_review_session import WikiReviewSession
-from knowledge_base import wiki_git
 
 router = APIRouter(prefix="/wiki/review", tags=["wiki-review"])
 
@@ -40,12 +38,12 @@ def revert_page(review_id: str, page_index: int, request: Request):
     """Revert a page to its state before the dreamer commit. Removes it from pending."""
     session = _get_session_or_404(review_id, request)
     page_path = _get_page_or_404(session, page_index)
-    wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
 
     try:
-        wiki_git.revert_page(wiki_root, page_path, session.commit_hash)
+        request.app.state.wiki_repository.revert_page(page_path, session.commit_hash)
     except Exception as error:
         raise HTTPException(status_code=500, detail=f"git revert failed: {error}")
+    request.app.state.change_index.record(WIKI_TREE, [page_path], uncommitted=False)
 
     session.resolve_page(page_path, reverted=True)
     _cleanup_if_complete(review_id, session, request)
@@ -59,17 +57,20 @@ def create_test_review_session(request: Request):
     For use in acceptance tests only. Simulates what the wiki dreamer does after a run
     without invoking the LLM agent.
     """
-    wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
-    commit_hash = wiki_git.commit_wiki_changes(wiki_root, "test: stage wiki changes for review")
-    if not commit_hash:
+    change_index = request.app.state.change_index
+    uncommitted_pages, up_to_seq = change_index.uncommitted(WIKI_TREE)
+    commit = request.app.state.wiki_repository.commit_changes(
+        "test: stage wiki changes for review", paths=uncommitted_pages
+    )
+    change_index.mark_committed(WIKI_TREE, up_to_seq)
+    if not commit:
         raise HTTPException(status_code=422, detail="no_uncommitted_changes")
 
-    changed_files = wiki_git.get_changed_files(wiki_root, commit_hash)
-    reviewable = [path for path in changed_files if path.endswith(".md")]
+    reviewable = [path for path in commit.changed_files if path.endswith(".md")]
     review_id = uuid.uuid4().hex[:8]
     session = WikiReviewSession(
         review_id=review_id,
-        commit_hash=commit_hash,
+        commit_hash=commit.commit_hash,
         pending=reviewable,
     )
     request.app.state.wiki_review_sessions[review_id] = session
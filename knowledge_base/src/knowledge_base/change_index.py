@@ -0,0 +1,368 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from knowledge_base.wiki_git import WikiRepository
+from knowledge_base.logging_config import get_logger
+from knowledge_base.metrics import CHANGE_INDEX_FILES_HASHED_TOTAL
+
+logger = get_logger(__name__)
+
+CHANGE_INDEX_FILENAME = ".change_index.db"
+CHANGE_INDEX_WATCH = os.getenv("CHANGE_INDEX_WATCH", "false").lower() == "true"
+
+WIKI_TREE = "wiki"
+CARDS_TREE = "cards"
+
+_GIT_HEAD_KEY = "git_head:{tree}"
+_QUERY_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    tree TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    wikilinks_hash TEXT,
+    PRIMARY KEY (tree, path)
+);
+CREATE INDEX IF NOT EXISTS files_by_mtime ON files (tree, mtime);
+CREATE INDEX IF NOT EXISTS files_pending_wikilinks ON files (tree, path)
+    WHERE wikilinks_hash IS NOT content_hash;
+CREATE TABLE IF NOT EXISTS uncommitted (
+    tree TEXT NOT NULL,
+    path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (tree, path)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Text of each wiki page, keyed by the rowid of its files row. The trigram tokenizer
+# answers case-insensitive substring queries; it needs SQLite 3.34 built with FTS5.
+_PAGE_TEXT_SCHEMA = "CREATE VIRTUAL TABLE page_text USING fts5(content, tokenize = 'trigram')"
+_MIN_SEARCH_TERM_LENGTH = 3
+
+
+class ChangeIndex:
+    """Persistent SQLite index of the markdown files under the wiki and cards trees.
+
+    Each row holds a file's path, mtime and content hash, plus the hash the wikilinks
+    phase last saw, so the dreamer answers "cards since T" and "pages needing wikilinks"
+    with indexed queries instead of walking and stat-ing every file on each tick.
+
+    The index is kept current by the writers themselves: record() is the write hook for
+    wiki tools, the card extractor and the API; sync_git() replays the files changed by
+    commits made since the last sync. reconcile() does a full walk and is only needed at
+    startup, to pick up edits made while the service was down. Paths changed through
+    record(), remove() or reconcile() are also kept as uncommitted until mark_committed(),
+    so the dreamer stages exactly those instead of scanning the wiki. The text of wiki
+    pages is kept in a trigram full-text table, so pages_containing() narrows wiki editor
+    searches to the pages that can match. With CHANGE_INDEX_WATCH
+    enabled and watchdog installed, start_watching() also records changes from
+    inotify (or the platform equivalent) as they happen.
+    """
+
+    def __init__(
+        self, db_path: Path, roots: dict[str, Path], repositories: Optional[dict[str, WikiRepository]] = None
+    ):
+        self._roots = {tree: Path(root) for tree, root in roots.items()}
+        self._repositories = repositories or {}
+        self._lock = threading.Lock()
+        self._observer = None
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._text_search = self._create_page_text()
+
+    def record(self, tree: str, paths: list[str], uncommitted: bool = True) -> None:
+        """Refresh the rows for paths (relative to the tree root) from disk.
+
+        Missing files are removed; files whose mtime matches the stored one are not re-hashed.
+        Changed paths are marked uncommitted unless uncommitted is False.
+        """
+        root = self._roots[tree]
+        with self._lock:
+            known = self._known_mtimes(tree, paths)
+            changed = [
+                path for path in paths
+                if path.endswith(".md") and self._refresh(tree, root, path, known.get(path))
+            ]
+            if uncommitted:
+                self._mark_uncommitted(tree, changed)
+
+    def remove(self, tree: str, paths: list[str]) -> None:
+        with self._lock:
+            self._delete_rows(tree, paths)
+            self._mark_uncommitted(tree, paths)
+
+    def reconcile(self, tree: str) -> int:
+        """Walk the whole tree once and bring the index in line with it. Returns files refreshed."""
+        root = self._roots[tree]
+        on_disk = {
+            str(file.relative_to(root)): file.stat().st_mtime
+            for file in root.rglob("*.md")
+        } if root.exists() else {}
+        with self._lock:
+            known = dict(self._connection.execute("SELECT path, mtime FROM files WHERE tree = ?", (tree,)))
+            changed = [path for path, mtime in on_disk.items() if known.get(path) != mtime]
+            for path in changed:
+                self._refresh(tree, root, path, known.get(path))
+            removed = list(known.keys() - on_disk.keys())
+            self._delete_rows(tree, removed)
+            self._mark_uncommitted(tree, changed + removed)
+        logger.info("Change index reconciled %s: %d files, %d refreshed", tree, len(on_disk), len(changed))
+        return len(changed)
+
+    def sync_git(self, tree: str = WIKI_TREE) -> None:
+        """Record the files changed by commits since the last sync of a git-backed tree.
+
+        Falls back to a full reconcile the first time, or when the last synced commit is
+        no longer reachable. Trees without a repository are left alone.
+        """
+        repository = self._repositories.get(tree)
+        if repository is None:
+            return
+        head = repository.head_commit()
+        if head is None:
+            return
+        key = _GIT_HEAD_KEY.format(tree=tree)
+        row = self._connection.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        last_synced = row[0] if row else None
+        if last_synced == head:
+            return
+        if last_synced is None:
+            self.reconcile(tree)
+        else:
+            try:
+                self.record(tree, repository.files_changed_between(last_synced, head), uncommitted=False)
+            except KeyError:
+                self.reconcile(tree)
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, head),
+            )
+
+    def changed_since(self, tree: str, since: datetime) -> list[str]:
+        """Paths in tree whose mtime is at or after since, sorted."""
+        rows = self._connection.execute(
+            "SELECT path FROM files WHERE tree = ? AND mtime >= ? ORDER BY path",
+            (tree, since.timestamp()),
+        )
+        return [path for (path,) in rows]
+
+    def pages_needing_wikilinks(self, limit: int, excluded_prefixes: tuple[str, ...] = ()) -> list[str]:
+        """First limit wiki pages, by path, whose content changed since wikilinks last processed them."""
+        exclusions = "".join(" AND path NOT GLOB ?" for _ in excluded_prefixes)
+        rows = self._connection.execute(
+            "SELECT path FROM files WHERE tree = ? AND wikilinks_hash IS NOT content_hash"
+            f"{exclusions} ORDER BY path LIMIT ?",
+            (WIKI_TREE, *(f"{prefix}*" for prefix in excluded_prefixes), limit),
+        )
+        return [path for (path,) in rows]
+
+    def pages_containing(self, alternatives: list[list[str]]) -> Optional[list[str]]:
+        """Wiki pages, by path, containing every string of at least one alternative, ignoring case.
+
+        Returns None when the index cannot narrow the search: full-text search is unavailable
+        or an alternative has no string of at least three characters. Results reflect the
+        indexed text, so callers verify matches against the files.
+        """
+        if not self._text_search or not alternatives:
+            return None
+        clauses = []
+        for strings in alternatives:
+            terms = [string for string in strings if len(string) >= _MIN_SEARCH_TERM_LENGTH]
+            if not terms:
+                return None
+            clauses.append("(" + " AND ".join('"' + term.replace('"', '""') + '"' for term in terms) + ")")
+        rows = self._connection.execute(
+            "SELECT files.path FROM page_text JOIN files ON files.rowid = page_text.rowid "
+            "WHERE page_text MATCH ? ORDER BY files.path",
+            (" OR ".join(clauses),),
+        )
+        return [path for (path,) in rows]
+
+    def mark_wikilinks_processed(self, paths: list[str]) -> None:
+        """Record the current content of paths as already processed by the wikilinks phase."""
+        self.record(WIKI_TREE, paths)
+        with self._lock:
+            self._connection.executemany(
+                "UPDATE files SET wikilinks_hash = content_hash WHERE tree = ? AND path = ?",
+                [(WIKI_TREE, path) for path in paths],
+            )
+
+    def uncommitted(self, tree: str) -> tuple[list[str], int]:
+        """Paths changed since they were last committed, and the sequence number to pass to mark_committed."""
+        rows = self._connection.execute(
+            "SELECT path, seq FROM uncommitted WHERE tree = ? ORDER BY path", (tree,)
+        ).fetchall()
+        return [path for path, _ in rows], max((seq for _, seq in rows), default=0)
+
+    def mark_committed(self, tree: str, up_to_seq: int) -> None:
+        """Forget uncommitted paths up to up_to_seq; paths changed again since then are kept."""
+        with self._lock:
+            self._connection.execute("DELETE FROM uncommitted WHERE tree = ? AND seq <= ?", (tree, up_to_seq))
+
+    def clear_wikilinks_processed(self, paths: Optional[list[str]] = None) -> None:
+        """Queue paths (every page when None) for the wikilinks phase again."""
+        with self._lock:
+            if paths is None:
+                self._connection.execute("UPDATE files SET wikilinks_hash = NULL WHERE tree = ?", (WIKI_TREE,))
+                return
+            self._connection.executemany(
+                "UPDATE files SET wikilinks_hash = NULL WHERE tree = ? AND path = ?",
+                [(WIKI_TREE, path) for path in paths],
+            )
+
+    def wikilinks_processed(self) -> dict[str, float]:
+        """Pages whose current content was processed by the wikilinks phase, with their mtime."""
+        rows = self._connection.execute(
+            "SELECT path, mtime FROM files WHERE tree = ? AND wikilinks_hash = content_hash ORDER BY path",
+            (WIKI_TREE,),
+        )
+        return dict(rows)
+
+    def start_watching(self) -> bool:
+        """Record file changes from filesystem notifications. Returns False if watchdog is unavailable."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.warning("CHANGE_INDEX_WATCH is set but watchdog is not installed; relying on write hooks")
+            return False
+
+        index = self
+
+        class _RecordChanges(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for changed in (event.src_path, getattr(event, "dest_path", "")):
+                    if changed:
+                        index._record_absolute(Path(os.fsdecode(changed)))
+
+        self._observer = Observer()
+        for root in self._roots.values():
+            root.mkdir(parents=True, exist_ok=True)
+            self._observer.schedule(_RecordChanges(), str(root), recursive=True)
+        self._observer.start()
+        logger.info("Change index watching %s", ", ".join(str(root) for root in self._roots.values()))
+        return True
+
+    def close(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        self._connection.close()
+
+    def _record_absolute(self, file: Path) -> None:
+        for tree, root in self._roots.items():
+            if file.is_relative_to(root):
+                self.record(tree, [str(file.relative_to(root))])
+                return
+
+    def _known_mtimes(self, tree: str, paths: list[str]) -> dict[str, float]:
+        known = {}
+        for start in range(0, len(paths), _QUERY_CHUNK_SIZE):
+            chunk = paths[start:start + _QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(self._connection.execute(
+                f"SELECT path, mtime FROM files WHERE tree = ? AND path IN ({placeholders})", (tree, *chunk)
+            ))
+        return known
+
+    def _create_page_text(self) -> bool:
+        exists = self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'page_text'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            self._connection.execute(_PAGE_TEXT_SCHEMA)
+        except sqlite3.OperationalError as error:
+            logger.warning("Change index full-text search unavailable (%s); wiki searches scan every page", error)
+            return False
+        rows = self._connection.execute("SELECT rowid, path FROM files WHERE tree = ?", (WIKI_TREE,)).fetchall()
+        root = self._roots[WIKI_TREE]
+        for rowid, path in rows:
+            try:
+                self._index_text(rowid, (root / path).read_bytes())
+            except FileNotFoundError:
+                continue
+        logger.info("Change index full-text table created for %d wiki pages", len(rows))
+        return True
+
+    def _index_text(self, rowid: int, content: bytes) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO page_text (rowid, content) VALUES (?, ?)",
+            (rowid, content.decode("utf-8", errors="replace")),
+        )
+
+    def _delete_rows(self, tree: str, paths: list[str]) -> None:
+        rows = [(tree, path) for path in paths]
+        if self._text_search and tree == WIKI_TREE:
+            self._connection.executemany(
+                "DELETE FROM page_text WHERE rowid = (SELECT rowid FROM files WHERE tree = ? AND path = ?)", rows
+            )
+        self._connection.executemany("DELETE FROM files WHERE tree = ? AND path = ?", rows)
+
+    def _mark_uncommitted(self, tree: str, paths: list[str]) -> None:
+        self._connection.executemany(
+            "INSERT INTO uncommitted (tree, path, seq) "
+            "VALUES (?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM uncommitted)) "
+            "ON CONFLICT (tree, path) DO UPDATE SET seq = excluded.seq",
+            [(tree, path) for path in paths],
+        )
+
+    def _refresh(self, tree: str, root: Path, path: str, known_mtime: Optional[float]) -> bool:
+        file = root / path
+        try:
+            mtime = file.stat().st_mtime
+            if mtime == known_mtime:
+                return False
+            content = file.read_bytes()
+        except FileNotFoundError:
+            self._delete_rows(tree, [path])
+            return known_mtime is not None
+        CHANGE_INDEX_FILES_HASHED_TOTAL.labels(tree=tree).inc()
+        (rowid,) = self._connection.execute(
+            "INSERT INTO files (tree, path, mtime, content_hash) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (tree, path) DO UPDATE SET mtime = excluded.mtime, content_hash = excluded.content_hash "
+            "RETURNING rowid",
+            (tree, path, mtime, hashlib.sha256(content).hexdigest()),
+        ).fetchone()
+        if self._text_search and tree == WIKI_TREE:
+            self._index_text(rowid, content)
+        return True
+
+
+def open_change_index(wiki_root: Path, transcripts_root: Path, wiki_repository: WikiRepository) -> ChangeIndex:
+    """Open the change index for the wiki and cards trees and bring it up to date.
+
+    The database lives in the wiki root (excluded from the wiki repository). Both trees
+    are reconciled once here; afterwards the index is maintained by write hooks and git
+    syncs, plus filesystem notifications when CHANGE_INDEX_WATCH is enabled.
+    """
+    change_index = ChangeIndex(
+        wiki_root / CHANGE_INDEX_FILENAME,
+        {WIKI_TREE: wiki_root, CARDS_TREE: transcripts_root / "cards"},
+        {WIKI_TREE: wiki_repository},
+    )
+    change_index.reconcile(WIKI_TREE)
+    change_index.reconcile(CARDS_TREE)
+    if CHANGE_INDEX_WATCH:
+        change_index.start_watching()
+    return change_index
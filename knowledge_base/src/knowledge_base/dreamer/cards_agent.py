@@ -29,11 +29,12 @@ def create_cards_agent(
     wiki_root: Path,
     embed: Optional[Callable] = None,
     search_by_embedding: Optional[Callable] = None,
+    on_write: Optional[Callable[[list[str]], None]] = None,
 ) -> Agent:
     list_cards = create_list_cards_tool(transcripts_root)
     read_card = create_read_card_tool(transcripts_root)
     read_wiki_page = create_read_wiki_page_tool(str(wiki_root))
-    write_wiki_page = create_write_wiki_page_tool(wiki_root)
+    write_wiki_page = create_write_wiki_page_tool(wiki_root, on_write=on_write)
 
     if embed is not None and search_by_embedding is not None:
         search_wiki_knowledge = create_search_wiki_knowledge_tool(embed, search_by_embedding)
@@ -1,4 +1,5 @@
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -9,21 +10,42 @@ _LOCAL_OBSERVATIONS_FILE = "pending-observations.jsonl"
 _ADMIN_CORRECTIONS_FILE = "pending-corrections.jsonl"
 _DEFAULT_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
+DREAMER_OBSERVATIONS_LIMIT = int(os.getenv("DREAMER_OBSERVATIONS_LIMIT", "500"))
 
-async def read_new_observations(episodic_memory_url: str, wiki_root: Path) -> list[dict]:
-    """Read observations from the episodic memory service since the last dreamer run.
 
-    Returns list of {"user_id": str, "content": str} dicts.
+async def read_new_observations(
+    episodic_memory_url: str, wiki_root: Path, limit: int = DREAMER_OBSERVATIONS_LIMIT
+) -> tuple[list[dict], str | None]:
+    """Stream observations from the episodic memory feed, resuming where the last dreamer run stopped.
+
+    Reads at most limit observations as NDJSON; a larger backlog is consumed over the
+    following runs. Returns ({"user_id": str, "content": str} dicts, feed cursor after the
+    last observation read). Persist the cursor with update_high_watermark once the batch
+    has been integrated.
     """
-    last_run = read_high_watermark(wiki_root)
+    cursor = read_observations_cursor(wiki_root)
+    params: dict = {"limit": limit}
+    if cursor is not None:
+        params["cursor"] = cursor
+    else:
+        params["since"] = read_high_watermark(wiki_root).isoformat()
+    observations = []
     async with httpx.AsyncClient() as client:
-        response = await client.get(
+        async with client.stream(
+            "GET",
             f"{episodic_memory_url.rstrip('/')}/observations",
-            params={"since": last_run.isoformat()},
+            params=params,
+            headers={"Accept": "application/x-ndjson"},
             timeout=30,
-        )
-        response.raise_for_status()
-    return response.json().get("observations", [])
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                observation = json.loads(line)
+                cursor = observation.pop("cursor", None) or cursor
+                observations.append(observation)
+    return observations, cursor
 
 
 def read_local_observations(wiki_root: Path) -> list[dict]:
@@ -70,11 +92,17 @@ def append_admin_correction(wiki_root: Path, text: str) -> None:
         file.write(json.dumps(text) + "\n")
 
 
-def update_high_watermark(wiki_root: Path) -> None:
+def update_high_watermark(
+    wiki_root: Path, observations_cursor: str | None = None, processed_at: datetime | None = None
+) -> None:
+    """Record the run time (now unless processed_at is given) and, when given, the observation
+    feed position (else the stored one is kept)."""
     sync_file = wiki_root / _SYNC_FILE_NAME
-    sync_file.write_text(
-        json.dumps({"last_processed_at": datetime.now(timezone.utc).isoformat()})
-    )
+    observations_cursor = observations_cursor or read_observations_cursor(wiki_root)
+    state = {"last_processed_at": (processed_at or datetime.now(timezone.utc)).isoformat()}
+    if observations_cursor is not None:
+        state["observations_cursor"] = observations_cursor
+    sync_file.write_text(json.dumps(state))
 
 
 def read_high_watermark(wiki_root: Path) -> datetime:
@@ -83,3 +111,10 @@ def read_high_watermark(wiki_root: Path) -> datetime:
         return _DEFAULT_START
     data = json.loads(sync_file.read_text())
     return datetime.fromisoformat(data["last_processed_at"])
+
+
+def read_observations_cursor(wiki_root: Path) -> str | None:
+    sync_file = wiki_root / _SYNC_FILE_NAME
+    if not sync_file.exists():
+        return None
+    return json.loads(sync_file.read_text()).get("observations_cursor")
@@ -1,17 +1,22 @@
+import asyncio
 import functools
 import json
+import os
 import re
-import uuid
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 from google.adk.agents.invocation_context import LlmCallsLimitExceededError
 from google.adk.agents.llm_agent import Agent
-from google.adk.runners import InMemoryRunner, RunConfig
-from google.genai import types
 from jinja2 import Environment, FileSystemLoader
+from pydantic import BaseModel, ValidationError
 
+from knowledge_base.agent_runner import create_agent_runner
 from knowledge_base.logging_config import get_logger
+from knowledge_base.metrics import DREAMER_CLASSIFY_FALLBACKS_TOTAL, DREAMER_OBSERVATION_STAGE_DURATION_SECONDS
 from knowledge_base.wiki_page_tools import create_read_wiki_page_tool, create_write_wiki_page_tool
 
 logger = get_logger(__name__)
@@ -20,47 +25,152 @@ _TEMPLATE_DIR = Path(__file__).parent / "templates"
 _MAX_CLASSIFY_CALLS = 3
 _MAX_ENRICH_CALLS = 10
 
+OBSERVATIONS_CONCURRENCY = int(os.getenv("OBSERVATIONS_CONCURRENCY", "8"))
+OBSERVATIONS_CLASSIFY_BATCH_SIZE = int(os.getenv("OBSERVATIONS_CLASSIFY_BATCH_SIZE", "20"))
+
 _REQUIRES_USER_ID = {"bonsai", "profile"}
 _ENTITY_TYPES = {"species", "techniques", "diseases", "pests"}
 
 
+class ObservationClassification(BaseModel):
+    index: int
+    type: str
+    entity_name: str = ""
+
+
+class ObservationClassificationBatch(BaseModel):
+    classifications: list[ObservationClassification]
+
+
+@dataclass
+class _RoutedObservation:
+    content: str
+    wiki_path: str
+
+
 async def execute_integrate_observations(
     observations: list[dict],
     classify_observation: Callable,
     enrich_wiki_page: Callable,
     read_wiki_page_func: Callable,
     write_wiki_page_func: Callable,
+    concurrency: int = OBSERVATIONS_CONCURRENCY,
+    classify_observations: Callable | None = None,
+    classify_batch_size: int = OBSERVATIONS_CLASSIFY_BATCH_SIZE,
 ) -> None:
-    for obs in observations:
-        content = obs.get("content", "")
-        user_id = obs.get("user_id")
-        if not content:
-            continue
-        try:
-            classification = await classify_observation(content, user_id)
-        except Exception:
-            logger.warning("Failed to classify observation, skipping")
-            continue
-        if not classification:
-            continue
-        wiki_path = _build_observation_path(
-            classification.get("type"),
-            classification.get("entity_name", ""),
-            user_id,
+    """Integrate observations into wiki pages as a bounded concurrent pipeline.
+
+    All observations are classified with at most `concurrency` LLM calls in flight;
+    when classify_observations is given they are sent classify_batch_size at a time, and
+    any observation the batch answer does not cover is classified on its own. They are
+    then grouped by target wiki_path, so every observation for a page is merged in a
+    single enrich call, and pages are read, enriched and written concurrently under the
+    same bound. One page is only ever handled by one task, so writes never race.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    pending = [obs for obs in observations if obs.get("content")]
+    if classify_observations is None:
+        classifications = await asyncio.gather(
+            *(_classify_one(obs, classify_observation, semaphore) for obs in pending)
+        )
+    else:
+        chunks = [pending[start:start + classify_batch_size] for start in range(0, len(pending), max(classify_batch_size, 1))]
+        chunk_results = await asyncio.gather(
+            *(_classify_chunk(chunk, classify_observations, classify_observation, semaphore) for chunk in chunks)
         )
-        if not wiki_path:
-            logger.debug("No wiki path for type=%s entity=%s, skipping", classification.get("type"), classification.get("entity_name"))
-            continue
-        existing_page = read_wiki_page_func(path=wiki_path)
+        classifications = [classification for chunk_result in chunk_results for classification in chunk_result]
+
+    by_path: dict[str, list[str]] = {}
+    for obs, classification in zip(pending, classifications):
+        observation = _route(obs, classification)
+        if observation is not None:
+            by_path.setdefault(observation.wiki_path, []).append(observation.content)
+    await asyncio.gather(
+        *(
+            _integrate_page(wiki_path, contents, enrich_wiki_page, read_wiki_page_func, write_wiki_page_func, semaphore)
+            for wiki_path, contents in by_path.items()
+        )
+    )
+
+
+async def _classify_one(obs: dict, classify_observation: Callable, semaphore: asyncio.Semaphore) -> dict | None:
+    try:
+        async with semaphore:
+            with _stage_timer("classify"):
+                return await classify_observation(obs["content"], obs.get("user_id"))
+    except Exception:
+        logger.warning("Failed to classify observation, skipping")
+        return None
+
+
+async def _classify_chunk(
+    chunk: list[dict],
+    classify_observations: Callable,
+    classify_observation: Callable,
+    semaphore: asyncio.Semaphore,
+) -> list[dict | None]:
+    try:
+        async with semaphore:
+            with _stage_timer("classify_batch"):
+                by_index = await classify_observations(chunk)
+    except Exception:
+        logger.warning("Failed to classify a batch of %d observations, classifying one by one", len(chunk))
+        by_index = {}
+    missing = [index for index in range(len(chunk)) if index not in by_index]
+    if missing:
+        DREAMER_CLASSIFY_FALLBACKS_TOTAL.inc(len(missing))
+        fallbacks = await asyncio.gather(
+            *(_classify_one(chunk[index], classify_observation, semaphore) for index in missing)
+        )
+        by_index = {**by_index, **dict(zip(missing, fallbacks))}
+    return [by_index[index] for index in range(len(chunk))]
+
+
+def _route(obs: dict, classification: dict | None) -> _RoutedObservation | None:
+    if not classification:
+        return None
+    wiki_path = _build_observation_path(
+        classification.get("type"),
+        classification.get("entity_name", ""),
+        obs.get("user_id"),
+    )
+    if not wiki_path:
+        logger.debug("No wiki path for type=%s entity=%s, skipping", classification.get("type"), classification.get("entity_name"))
+        return None
+    return _RoutedObservation(content=obs["content"], wiki_path=wiki_path)
+
+
+async def _integrate_page(
+    wiki_path: str,
+    contents: list[str],
+    enrich_wiki_page: Callable,
+    read_wiki_page_func: Callable,
+    write_wiki_page_func: Callable,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    async with semaphore:
+        with _stage_timer("read"):
+            existing_page = await asyncio.to_thread(read_wiki_page_func, path=wiki_path)
         existing_content = existing_page.get("content", "") if isinstance(existing_page, dict) and existing_page.get("status") == "success" else ""
         try:
-            enriched = await enrich_wiki_page(wiki_path, existing_content, content)
+            with _stage_timer("enrich"):
+                enriched = await enrich_wiki_page(wiki_path, existing_content, "\n\n".join(contents))
         except Exception:
             logger.warning("Failed to enrich wiki page %s, skipping", wiki_path)
-            continue
+            return
         if enriched:
-            write_wiki_page_func(path=wiki_path, content=enriched)
-            logger.info("Integrated observation into %s", wiki_path)
+            with _stage_timer("write"):
+                await asyncio.to_thread(write_wiki_page_func, path=wiki_path, content=enriched)
+            logger.info("Integrated %d observation(s) into %s", len(contents), wiki_path)
+
+
+@contextmanager
+def _stage_timer(stage: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        DREAMER_OBSERVATION_STAGE_DURATION_SECONDS.labels(stage=stage).observe(time.perf_counter() - start)
 
 
 def _build_observation_path(obs_type: str | None, entity_name: str, user_id: str | None) -> str | None:
@@ -92,7 +202,11 @@ def _build_observation_path(obs_type: str | None, entity_name: str, user_id: str
                 return None
 
 
-def create_observations_runner(model, wiki_root: Path) -> Callable:
+def create_observations_runner(
+    model,
+    wiki_root: Path,
+    on_write: Optional[Callable[[list[str]], None]] = None,
+) -> Callable:
     env = Environment(
         loader=FileSystemLoader(str(_TEMPLATE_DIR)),
         trim_blocks=True,
@@ -103,28 +217,37 @@ def create_observations_runner(model, wiki_root: Path) -> Callable:
     enrich_instruction = env.get_template("observation_enrich.j2").render()
     enrich_prompt_template = env.get_template("observation_enrich_prompt.j2")
 
+    classify_batch_instruction = env.get_template("observation_classify_batch.j2").render()
+    classify_batch_prompt_template = env.get_template("observation_classify_batch_prompt.j2")
+
     classify_agent = Agent(model=model, name="obs_classifier", instruction=classify_instruction)
+    classify_batch_agent = Agent(
+        model=model,
+        name="obs_batch_classifier",
+        instruction=classify_batch_instruction,
+        output_schema=ObservationClassificationBatch,
+    )
     enrich_agent = Agent(model=model, name="obs_enricher", instruction=enrich_instruction)
 
     return functools.partial(
         execute_integrate_observations,
         classify_observation=_create_classify_func(classify_agent, classify_prompt_template),
+        classify_observations=_create_batch_classify_func(classify_batch_agent, classify_batch_prompt_template),
         enrich_wiki_page=_create_enrich_func(enrich_agent, enrich_prompt_template),
         read_wiki_page_func=create_read_wiki_page_tool(str(wiki_root)),
-        write_wiki_page_func=create_write_wiki_page_tool(wiki_root),
+        write_wiki_page_func=create_write_wiki_page_tool(wiki_root, on_write=on_write),
     )
 
 
 def _create_classify_func(agent: Agent, prompt_template) -> Callable:
+    run_agent = create_agent_runner(agent)
+
     async def classify_observation(content: str, user_id: str | None) -> dict | None:
         prompt = prompt_template.render(content=content, user_id=user_id)
-        text = await _run_llm_for_text(agent, prompt, _MAX_CLASSIFY_CALLS)
+        text = await _run_llm_for_text(run_agent, agent.name, prompt, _MAX_CLASSIFY_CALLS)
         if not text:
             return None
-        cleaned = text.strip()
-        if cleaned.startswith("```"):
-            lines = cleaned.split("\n")
-            cleaned = "\n".join(lines[1:-1]).strip()
+        cleaned = _strip_code_fence(text)
         try:
             return json.loads(cleaned)
         except (json.JSONDecodeError, ValueError):
@@ -133,32 +256,57 @@ def _create_classify_func(agent: Agent, prompt_template) -> Callable:
     return classify_observation
 
 
+def _create_batch_classify_func(agent: Agent, prompt_template) -> Callable:
+    run_agent = create_agent_runner(agent)
+
+    async def classify_observations(observations: list[dict]) -> dict[int, dict]:
+        """Classify many observations in one LLM call.
+
+        Returns {position in observations: {"type", "entity_name"}}; positions missing from
+        the answer are left out so the caller can classify them individually. Raises
+        ValueError when the answer is not a valid classification batch.
+        """
+        prompt = prompt_template.render(observations=observations)
+        text = await _run_llm_for_text(run_agent, agent.name, prompt, _MAX_CLASSIFY_CALLS)
+        if not text:
+            raise ValueError("Empty batch classification response")
+        try:
+            batch = ObservationClassificationBatch.model_validate_json(_strip_code_fence(text))
+        except ValidationError as error:
+            raise ValueError(f"Invalid batch classification JSON: {text[:200]}") from error
+        return {
+            item.index: {"type": item.type, "entity_name": item.entity_name}
+            for item in batch.classifications
+            if 0 <= item.index < len(observations)
+        }
+    return classify_observations
+
+
+def _strip_code_fence(text: str) -> str:
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        lines = cleaned.split("\n")
+        cleaned = "\n".join(lines[1:-1]).strip()
+    return cleaned
+
+
 def _create_enrich_func(agent: Agent, prompt_template) -> Callable:
+    run_agent = create_agent_runner(agent)
+
     async def enrich_wiki_page(path: str, existing_content: str, observation: str) -> str | None:
         prompt = prompt_template.render(path=path, existing_content=existing_content, observation=observation)
-        return await _run_llm_for_text(agent, prompt, _MAX_ENRICH_CALLS)
+        return await _run_llm_for_text(run_agent, agent.name, prompt, _MAX_ENRICH_CALLS)
     return enrich_wiki_page
 
 
-async def _run_llm_for_text(agent: Agent, prompt: str, max_llm_calls: int) -> str | None:
-    runner = InMemoryRunner(agent=agent, app_name=agent.name)
-    session_id = str(uuid.uuid4())
-    await runner.session_service.create_session(
-        app_name=agent.name, user_id=agent.name, session_id=session_id
-    )
-    message = types.Content(role="user", parts=[types.Part(text=prompt)])
+async def _run_llm_for_text(run_agent: Callable, agent_name: str, prompt: str, max_llm_calls: int) -> str | None:
     last_text = None
     try:
-        async for event in runner.run_async(
-            user_id=agent.name,
-            session_id=session_id,
-            new_message=message,
-            run_config=RunConfig(max_llm_calls=max_llm_calls),
-        ):
+        async for event in run_agent(prompt, max_llm_calls):
             if hasattr(event, "content") and event.content:
                 for part in event.content.parts:
                     if hasattr(part, "text") and part.text:
                         last_text = part.text
     except LlmCallsLimitExceededError:
-        logger.warning("LLM calls limit reached for agent %s", agent.name)
+        logger.warning("LLM calls limit reached for agent %s", agent_name)
     return last_text
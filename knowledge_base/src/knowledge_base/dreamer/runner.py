@@ -1,15 +1,13 @@
 import functools
 import json
-import uuid
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Awaitable, Callable, Optional
+from typing import AsyncGenerator, Awaitable, Callable, Optional
 
 from google.adk.agents.invocation_context import LlmCallsLimitExceededError
-from google.adk.agents.llm_agent import Agent
-from google.adk.runners import InMemoryRunner, RunConfig
-from google.genai import types
 from jinja2 import Environment, FileSystemLoader
+from knowledge_base.change_index import CARDS_TREE, WIKI_TREE, ChangeIndex, open_change_index
 from knowledge_base.dreamer.memory_reader import (
     read_admin_corrections,
     read_high_watermark,
@@ -18,17 +16,22 @@ from knowledge_base.dreamer.memory_reader import (
     update_high_watermark,
 )
 from knowledge_base.dreamer.observations import execute_integrate_observations
-from knowledge_base import wiki_git
-from knowledge_base.wiki_index.indexer import update_page_index
+from knowledge_base.wiki_git import WikiRepository
+from knowledge_base.wiki_index.indexer import update_pages_index
 from knowledge_base.logging_config import get_logger
 from knowledge_base.metrics import DREAMER_RUNS_TOTAL, DREAMER_PAGES_CHANGED_TOTAL
 
 logger = get_logger(__name__)
 
-_MAX_LLM_CALLS_OBSERVATIONS = 20
-_MAX_LLM_CALLS_CARDS = 60
-_MAX_LLM_CALLS_WIKILINKS = 50
-_WIKILINKS_BATCH_SIZE = 5
+OBSERVATIONS_PHASE = "observations"
+CARDS_PHASE = "cards"
+WIKILINKS_PHASE = "wikilinks"
+ALL_PHASES = frozenset({OBSERVATIONS_PHASE, CARDS_PHASE, WIKILINKS_PHASE})
+
+DREAMER_CARDS_MAX_LLM_CALLS = int(os.getenv("DREAMER_CARDS_MAX_LLM_CALLS", "60"))
+DREAMER_WIKILINKS_MAX_LLM_CALLS = int(os.getenv("DREAMER_WIKILINKS_MAX_LLM_CALLS", "50"))
+DREAMER_WIKILINKS_BATCH_SIZE = int(os.getenv("DREAMER_WIKILINKS_BATCH_SIZE", "5"))
+_WIKILINKS_EXCLUDED_PREFIXES = ("bonsai/", "wiki-index/", "users/")
 _PROCESSED_WIKILINKS_FILE = "dreamer-processed-wikilinks.json"
 
 _prompt_env = Environment(
@@ -40,55 +43,78 @@ _prompt_env = Environment(
 
 def create_wiki_dreamer(
     observations_runner: Callable,
-    cards_agent: Agent,
-    wikilinks_agent: Agent,
+    run_cards_agent: Callable[..., AsyncGenerator],
+    run_wikilinks_agent: Callable[..., AsyncGenerator],
     wiki_root: Path,
     transcripts_root: Path,
     notify_admin: Optional[Callable[[list[str], str], None]] = None,
     embed: Optional[Callable] = None,
-    save_entry: Optional[Callable] = None,
+    save_entries: Optional[Callable] = None,
     episodic_memory_url: str = "",
+    change_index: Optional[ChangeIndex] = None,
+    wiki_repository: Optional[WikiRepository] = None,
 ) -> Callable[[], None]:
-    """Assemble agents and I/O dependencies into a zero-argument callable that runs the wiki dreamer.
+    """Assemble agent runners and I/O dependencies into a zero-argument callable that runs the wiki dreamer.
 
     Acts as a composition root: resolves raw config (paths, URLs) into callables and binds
     them into run_wiki_dreamer via partial application.
 
     Args:
         observations_runner: Deterministic callable that integrates conversation observations.
-        cards_agent: Agent that enriches the wiki from knowledge cards.
-        wikilinks_agent: Agent that adds wikilinks to knowledge pages.
+        run_cards_agent: Run callable of the agent that enriches the wiki from knowledge cards.
+        run_wikilinks_agent: Run callable of the agent that adds wikilinks to knowledge pages.
         wiki_root: Root directory of the wiki.
         transcripts_root: Root directory for transcripts (cards are read from here).
         notify_admin: Optional async callable (changed_files, commit_hash) -> None.
+        change_index: Index used to find new cards and pages pending wikilinks; opened
+            from wiki_root and transcripts_root when not given.
+        wiki_repository: Git history of the wiki, shared with every other wiki writer;
+            opened from wiki_root when not given.
 
     Returns:
         Async callable: () -> None
     """
-    wiki_git.init_wiki_repo(wiki_root)
+    if wiki_repository is None:
+        wiki_repository = WikiRepository(wiki_root)
+    wiki_repository.init()
+    if change_index is None:
+        change_index = open_change_index(wiki_root, transcripts_root, wiki_repository)
+    _import_processed_wikilinks(change_index, wiki_root)
+
+    observations_cursor = None
 
     async def read_observations() -> list[dict]:
-        remote = await read_new_observations(episodic_memory_url, wiki_root) if episodic_memory_url else []
+        nonlocal observations_cursor
+        remote = []
+        if episodic_memory_url:
+            remote, observations_cursor = await read_new_observations(episodic_memory_url, wiki_root)
         local = read_local_observations(wiki_root)
         admin = [{"user_id": None, "content": text} for text in read_admin_corrections(wiki_root)]
         return remote + local + admin
 
-    def save_run_state(wikilinks_batch: list[str]) -> None:
-        update_high_watermark(wiki_root)
+    def read_wikilinks_batch() -> list[str]:
+        change_index.sync_git()
+        return change_index.pages_needing_wikilinks(DREAMER_WIKILINKS_BATCH_SIZE, _WIKILINKS_EXCLUDED_PREFIXES)
+
+    def save_run_state(phases: frozenset[str], started_at: datetime, wikilinks_batch: list[str]) -> None:
+        processed_at = started_at if CARDS_PHASE in phases else read_high_watermark(wiki_root)
+        update_high_watermark(wiki_root, observations_cursor, processed_at=processed_at)
         if wikilinks_batch:
-            _mark_wikilinks_processed(wiki_root, wikilinks_batch)
+            change_index.mark_wikilinks_processed(wikilinks_batch)
 
     return functools.partial(
         run_wiki_dreamer,
         read_observations,
-        functools.partial(_get_new_cards, transcripts_root),
-        functools.partial(_get_wikilinks_batch, wiki_root, _WIKILINKS_BATCH_SIZE),
+        functools.partial(change_index.changed_since, CARDS_TREE),
+        read_wikilinks_batch,
         functools.partial(read_high_watermark, wiki_root),
         functools.partial(_integrate_observations, observations_runner),
-        functools.partial(_enrich_from_knowledge_cards, cards_agent),
-        functools.partial(_add_wikilinks, wikilinks_agent),
+        functools.partial(_enrich_from_knowledge_cards, run_cards_agent),
+        functools.partial(_add_wikilinks, run_wikilinks_agent),
         save_run_state,
-        functools.partial(_commit_index_and_notify, wiki_root, embed, save_entry, notify_admin),
+        functools.partial(
+            _commit_index_and_notify, wiki_root, wiki_repository, change_index, embed, save_entries, notify_admin
+        ),
     )
 
 
@@ -100,16 +126,24 @@ async def run_wiki_dreamer(
     integrate_observations: Callable[[list[str]], Awaitable[None]],
     enrich_from_knowledge_cards: Callable[[list[str]], Awaitable[None]],
     add_wikilinks: Callable[[list[str]], Awaitable[None]],
-    save_run_state: Callable[[list[str]], None],
+    save_run_state: Callable[[frozenset[str], datetime, list[str]], None],
     commit_and_notify: Callable[[], Awaitable[None]],
+    phases: frozenset[str] = ALL_PHASES,
 ) -> None:
-    last_run = read_last_run()
-    observations = await read_observations()
-    new_cards = read_new_cards(last_run)
-    wikilinks_batch = read_wikilinks_batch()
+    """Run the selected phases (observations, cards, wikilinks, in that order) and commit.
+
+    Only the inputs of the selected phases are read, so a run triggered by a new card does
+    not consume the observation feed and vice versa. The cards watermark only advances
+    when the cards phase ran, and then to the run start, so cards written mid-run are
+    picked up by the next one.
+    """
+    started_at = datetime.now(timezone.utc)
+    observations = await read_observations() if OBSERVATIONS_PHASE in phases else []
+    new_cards = read_new_cards(read_last_run()) if CARDS_PHASE in phases else []
+    wikilinks_batch = read_wikilinks_batch() if WIKILINKS_PHASE in phases else []
 
     if not observations and not new_cards and not wikilinks_batch:
-        logger.info("Wiki dreamer skipped: no new cards, observations, or pending wikilinks since %s", last_run)
+        logger.info("Wiki dreamer skipped: no new cards, observations, or pending wikilinks (phases=%s)", sorted(phases))
         DREAMER_RUNS_TOTAL.labels(outcome="no_changes").inc()
         return
 
@@ -122,30 +156,31 @@ async def run_wiki_dreamer(
     await enrich_from_knowledge_cards(new_cards)
     await add_wikilinks(wikilinks_batch)
 
-    save_run_state(wikilinks_batch)
+    save_run_state(phases, started_at, wikilinks_batch)
     await commit_and_notify()
     logger.info("Wiki dreamer run completed")
 
 
 async def _commit_index_and_notify(
     wiki_root: Path,
+    wiki_repository: WikiRepository,
+    change_index: ChangeIndex,
     embed: Optional[Callable],
-    save_entry: Optional[Callable],
+    save_entries: Optional[Callable],
     notify_admin: Optional[Callable[[list[str], str], None]],
 ) -> None:
-    commit_hash = wiki_git.commit_wiki_changes(wiki_root, "dreamer: update wiki pages")
-    if commit_hash:
-        changed_files = wiki_git.get_changed_files(wiki_root, commit_hash)
-        if changed_files and embed is not None:
-            for file_path in changed_files:
-                if file_path.endswith(".md"):
-                    await update_page_index(file_path, wiki_root, embed, save_entry)
-        
-        if changed_files:
-            DREAMER_RUNS_TOTAL.labels(outcome="changed").inc()
-            DREAMER_PAGES_CHANGED_TOTAL.inc(len(changed_files))
-            if notify_admin:
-                await notify_admin(changed_files, commit_hash)
+    uncommitted_pages, up_to_seq = change_index.uncommitted(WIKI_TREE)
+    commit = wiki_repository.commit_changes("dreamer: update wiki pages", paths=uncommitted_pages)
+    change_index.mark_committed(WIKI_TREE, up_to_seq)
+    if commit:
+        if embed is not None:
+            changed_pages = [file_path for file_path in commit.changed_files if file_path.endswith(".md")]
+            await update_pages_index(changed_pages, wiki_root, embed, save_entries)
+
+        DREAMER_RUNS_TOTAL.labels(outcome="changed").inc()
+        DREAMER_PAGES_CHANGED_TOTAL.inc(len(commit.changed_files))
+        if notify_admin:
+            await notify_admin(commit.changed_files, commit.commit_hash)
     else:
         DREAMER_RUNS_TOTAL.labels(outcome="no_changes").inc()
 
@@ -158,77 +193,42 @@ async def _integrate_observations(run_observations: Callable, observations: list
     logger.info("Wiki dreamer phase completed: integrate observations")
 
 
-async def _enrich_from_knowledge_cards(agent: Agent, new_cards: list[str]) -> None:
+async def _enrich_from_knowledge_cards(run_agent: Callable, new_cards: list[str]) -> None:
     if not new_cards:
         return
     
     prompt = _prompt_env.get_template("cards_prompt.jinja2").render(new_cards=new_cards).strip()
-    await _run_phase(agent, prompt, _MAX_LLM_CALLS_CARDS, "enrich from knowledge cards")
+    await _run_phase(run_agent, prompt, DREAMER_CARDS_MAX_LLM_CALLS, "enrich from knowledge cards")
 
 
-async def _add_wikilinks(agent: Agent, wikilinks_batch: list[str]) -> None:
+async def _add_wikilinks(run_agent: Callable, wikilinks_batch: list[str]) -> None:
     if not wikilinks_batch:
         return
     
     prompt = _prompt_env.get_template("wikilinks_prompt.jinja2").render(wikilinks_batch=wikilinks_batch).strip()
-    await _run_phase(agent, prompt, _MAX_LLM_CALLS_WIKILINKS, "add wikilinks")
+    await _run_phase(run_agent, prompt, DREAMER_WIKILINKS_MAX_LLM_CALLS, "add wikilinks")
 
 
-async def _run_phase(agent: Agent, prompt: str, max_llm_calls: int, phase_name: str) -> None:
+async def _run_phase(run_agent: Callable, prompt: str, max_llm_calls: int, phase_name: str) -> None:
     logger.info("Wiki dreamer phase starting: %s", phase_name)
-    runner = InMemoryRunner(agent=agent, app_name=agent.name)
-    session_id = str(uuid.uuid4())
-    await runner.session_service.create_session(app_name=agent.name, user_id=agent.name, session_id=session_id)
-    message = types.Content(role="user", parts=[types.Part(text=prompt)])
     try:
-        async for _ in runner.run_async(
-            user_id=agent.name,
-            session_id=session_id,
-            new_message=message,
-            run_config=RunConfig(max_llm_calls=max_llm_calls),
-        ):
+        async for _ in run_agent(prompt, max_llm_calls):
             pass
     except LlmCallsLimitExceededError:
         logger.warning("Wiki dreamer phase hit LLM calls limit, partial progress kept: %s (limit=%d)", phase_name, max_llm_calls)
     logger.info("Wiki dreamer phase completed: %s", phase_name)
 
 
-def _get_new_cards(transcripts_root: Path, since: datetime) -> list[str]:
-    cards_root = transcripts_root / "cards"
-    if not cards_root.exists():
-        return []
-    return sorted(
-        str(card.relative_to(cards_root))
-        for card in cards_root.rglob("*.md")
-        if datetime.fromtimestamp(card.stat().st_mtime, tz=timezone.utc) >= since
-    )
-
-
-def _get_wikilinks_batch(wiki_root: Path, batch_size: int) -> list[str]:
-    processed = _read_processed_wikilinks(wiki_root)
-    pending = []
-    for page in wiki_root.rglob("*.md"):
-        rel = str(page.relative_to(wiki_root))
-        if rel.startswith(("bonsai/", "wiki-index/", "users/")):
-            continue
-        mtime = page.stat().st_mtime
-        if processed.get(rel) != mtime:
-            pending.append(rel)
-    return sorted(pending)[:batch_size]
-
-
-def _read_processed_wikilinks(wiki_root: Path) -> dict[str, float]:
+def _import_processed_wikilinks(change_index: ChangeIndex, wiki_root: Path) -> None:
+    """Carry over pages recorded in the legacy JSON tracker, then drop the tracker."""
     wikilinks_file = wiki_root / _PROCESSED_WIKILINKS_FILE
     if not wikilinks_file.exists():
-        return {}
-    return json.loads(wikilinks_file.read_text())
-
-
-def _mark_wikilinks_processed(wiki_root: Path, pages: list[str]) -> None:
-    processed = _read_processed_wikilinks(wiki_root)
-    for rel in pages:
-        page = wiki_root / rel
-        if page.exists():
-            processed[rel] = page.stat().st_mtime
-    wikilinks_file = wiki_root / _PROCESSED_WIKILINKS_FILE
-    wikilinks_file.write_text(json.dumps(processed))
+        return
+    processed = json.loads(wikilinks_file.read_text())
+    unchanged = [
+        rel for rel, mtime in processed.items()
+        if (wiki_root / rel).exists() and (wiki_root / rel).stat().st_mtime == mtime
+    ]
+    change_index.mark_wikilinks_processed(unchanged)
+    wikilinks_file.unlink()
+    logger.info("Imported %d processed wikilinks pages into the change index", len(unchanged))
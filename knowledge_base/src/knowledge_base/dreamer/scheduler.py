@@ -1,25 +1,134 @@
-import logging
-from typing import Callable
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Optional
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from knowledge_base.dreamer.runner import ALL_PHASES
+from knowledge_base.logging_config import get_logger
+from knowledge_base.metrics import DREAMER_TRIGGERS_TOTAL
 
+logger = get_logger(__name__)
 
-async def _run_wiki_dreamer(run_wiki_dreamer: Callable) -> None:
-    logging.info("Running scheduled wiki dreamer")
-    await run_wiki_dreamer()
+WIKI_DREAMER_DEBOUNCE_SECONDS = float(os.getenv("WIKI_DREAMER_DEBOUNCE_SECONDS", "30"))
+WIKI_DREAMER_MAX_DELAY_SECONDS = float(os.getenv("WIKI_DREAMER_MAX_DELAY_SECONDS", "300"))
 
 
-def create_wiki_dreamer_scheduler(run_wiki_dreamer: Callable, interval_seconds: int) -> AsyncIOScheduler:
-    """Create and start an APScheduler that runs the wiki dreamer at a configurable interval.
+class WikiDreamerScheduler:
+    """Runs wiki dreamer phases when they have work, never more than one run at a time.
 
-    The scheduler must be shut down by the caller.
+    trigger(phase, ...) marks phases as having new input (a card was written, an observation
+    or an admin correction arrived). Triggers are debounced: a run starts debounce_seconds
+    after the last trigger, or max_delay_seconds after the first one if triggers keep coming,
+    and covers every phase triggered so far. Triggers arriving during a run are coalesced
+    into the next one. run_now() runs phases immediately and consumes their pending
+    triggers. Every run holds the same lock, so manual, ingestion and triggered runs never
+    overlap on the wiki repository, and nothing runs while no phase is pending.
+
+    Episodic memory observations are not pushed to this service, so all phases are also
+    triggered every poll_interval_seconds; a run without work only reads the observation
+    feed and queries the change index. Call shutdown() on exit.
+    """
+
+    def __init__(
+        self,
+        run_wiki_dreamer: Callable[..., Awaitable[None]],
+        poll_interval_seconds: float,
+        debounce_seconds: float = WIKI_DREAMER_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = WIKI_DREAMER_MAX_DELAY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._run_wiki_dreamer = run_wiki_dreamer
+        self._poll_interval_seconds = poll_interval_seconds
+        self._debounce_seconds = debounce_seconds
+        self._max_delay_seconds = max_delay_seconds
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._pending: set[str] = set()
+        self._first_trigger_at: Optional[float] = None
+        self._last_trigger_at: Optional[float] = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def pending_phases(self) -> frozenset[str]:
+        return frozenset(self._pending)
+
+    def trigger(self, *phases: str) -> None:
+        """Schedule a debounced run of phases (all phases when none are given)."""
+        now = self._clock()
+        if not self._pending:
+            self._first_trigger_at = now
+        self._last_trigger_at = now
+        for phase in phases or ALL_PHASES:
+            self._pending.add(phase)
+            DREAMER_TRIGGERS_TOTAL.labels(phase=phase).inc()
+        self._wakeup.set()
+
+    async def run_now(self, phases: frozenset[str] = ALL_PHASES) -> None:
+        """Run phases as soon as no other run is active; their pending triggers are consumed."""
+        async with self._lock:
+            self._pending -= phases
+            await self._run_wiki_dreamer(phases=phases)
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._debounce_loop()),
+            asyncio.create_task(self._poll_loop()),
+        ]
+
+    async def shutdown(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def _seconds_until_due(self) -> float:
+        if not self._pending:
+            return 0.0
+        due_at = min(
+            self._last_trigger_at + self._debounce_seconds,
+            self._first_trigger_at + self._max_delay_seconds,
+        )
+        return due_at - self._clock()
+
+    async def _debounce_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            delay = self._seconds_until_due()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            async with self._lock:
+                self._wakeup.clear()
+                phases = frozenset(self._pending)
+                self._pending.clear()
+                if not phases:
+                    continue
+                logger.info("Running triggered wiki dreamer: phases=%s", sorted(phases))
+                try:
+                    await self._run_wiki_dreamer(phases=phases)
+                except Exception:
+                    logger.exception("Triggered wiki dreamer run failed: phases=%s", sorted(phases))
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval_seconds)
+            self.trigger(*ALL_PHASES)
+
+
+def create_wiki_dreamer_scheduler(
+    run_wiki_dreamer: Callable[..., Awaitable[None]],
+    interval_seconds: float,
+    **kwargs,
+) -> WikiDreamerScheduler:
+    """Create and start a trigger-driven scheduler for the wiki dreamer.
+
+    interval_seconds is the safety-net poll period. The scheduler must be shut down by the caller.
     """
-    scheduler = AsyncIOScheduler()
-    scheduler.add_job(
-        _run_wiki_dreamer,
-        trigger=IntervalTrigger(seconds=interval_seconds),
-        kwargs={"run_wiki_dreamer": run_wiki_dreamer},
-    )
+    scheduler = WikiDreamerScheduler(run_wiki_dreamer, poll_interval_seconds=interval_seconds, **kwargs)
     scheduler.start()
     return scheduler
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Callable, Optional
 
 from google.adk.agents.llm_agent import Agent
 from jinja2 import Environment, FileSystemLoader
@@ -15,10 +16,14 @@ _templates_env = Environment(
 )
 
 
-def create_wikilinks_agent(model: object, wiki_root: Path) -> Agent:
+def create_wikilinks_agent(
+    model: object,
+    wiki_root: Path,
+    on_write: Optional[Callable[[list[str]], None]] = None,
+) -> Agent:
     list_wiki_pages = create_list_wiki_pages_tool(wiki_root)
     read_wiki_page = create_read_wiki_page_tool(str(wiki_root))
-    write_wiki_page = create_write_wiki_page_tool(wiki_root)
+    write_wiki_page = create_write_wiki_page_tool(wiki_root, on_write=on_write)
     return Agent(
         model=model,
         name=APP_NAME,
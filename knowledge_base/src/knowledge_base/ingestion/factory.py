@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 from knowledge_base.ingestion.knowledge_card_extractor import create_card_extractor
 from knowledge_base.ingestion.transcript_cleaner import create_transcript_cleaner
@@ -12,6 +12,7 @@ def create_ingestion_pipeline(
     download_transcript: Callable,
     run_wiki_dreamer: Callable,
     orchestrator_model: object = None,
+    on_card_written: Optional[Callable[[list[str]], None]] = None,
 ) -> Callable[[str, str], None]:
     """Create an async pipeline that ingests a YouTube video into the wiki.
 
@@ -26,13 +27,14 @@ def create_ingestion_pipeline(
         download_transcript: Callable that downloads a YouTube transcript to disk.
         run_wiki_dreamer: Dreamer instance shared with the admin bot (includes notify_admin).
         orchestrator_model: Unused, kept for backwards compatibility.
+        on_card_written: Optional hook called with the new card's path relative to the cards directory.
 
     Returns:
         Async callable: (url, channel, on_step?) -> None
         on_step is an optional async callable(message: str) -> None for progress notifications.
     """
     clean_transcript = create_transcript_cleaner(model)
-    extract_card = create_card_extractor(model)
+    extract_card = create_card_extractor(model, on_write=on_card_written)
 
     async def ingest(url: str, channel: str, on_step: Callable | None = None) -> None:
         async def notify(message: str) -> None:
@@ -1,17 +1,17 @@
-import uuid
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 from google.adk.agents.llm_agent import Agent
-from google.adk.runners import InMemoryRunner, RunConfig
-from google.genai import types
+from google.adk.tools.tool_context import ToolContext
 
+from knowledge_base.agent_runner import create_agent_runner
 from knowledge_base.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 _APP_NAME = "card_extractor"
 _MAX_LLM_CALLS = 10
+_CARD_PATH_STATE_KEY = "card_path"
 
 _EXTRACTOR_INSTRUCTION = """
 Eres un extractor de conocimiento especializado en bonsái. Recibes la transcripción limpia de un vídeo de un experto.
@@ -48,15 +48,39 @@ Omite secciones que no tengan contenido relevante en el vídeo.
 """
 
 
-def create_card_extractor(model: object) -> Callable[[Path, Path], Path]:
+def create_card_extractor(
+    model: object,
+    on_write: Optional[Callable[[list[str]], None]] = None,
+) -> Callable[[Path, Path], Path]:
     """Create an extractor that uses an LLM to produce a structured knowledge card from a clean transcript.
 
     Args:
         model: LLM model to use for the extractor agent.
+        on_write: Optional hook called with the new card's path relative to transcripts_root/cards.
 
     Returns:
         Async callable: (clean_path, transcripts_root) -> card_path
     """
+    def save_knowledge_card(content: str, tool_context: ToolContext) -> dict:
+        """Save the structured knowledge card to disk.
+
+        Args:
+            content: Full markdown content of the knowledge card.
+
+        Returns:
+            {"status": "success"} on success.
+        """
+        Path(tool_context.state[_CARD_PATH_STATE_KEY]).write_text(content, encoding="utf-8")
+        return {"status": "success"}
+
+    agent = Agent(
+        model=model,
+        name=_APP_NAME,
+        instruction=_EXTRACTOR_INSTRUCTION,
+        tools=[save_knowledge_card],
+    )
+    run_agent = create_agent_runner(agent)
+
     async def extract_card(clean_path: Path, transcripts_root: Path) -> Path:
         clean_text = clean_path.read_text(encoding="utf-8")
 
@@ -72,37 +96,11 @@ def create_card_extractor(model: object) -> Callable[[Path, Path], Path]:
 
         card_path.parent.mkdir(parents=True, exist_ok=True)
 
-        def save_knowledge_card(content: str) -> dict:
-            """Save the structured knowledge card to disk.
-
-            Args:
-                content: Full markdown content of the knowledge card.
-
-            Returns:
-                {"status": "success"} on success.
-            """
-            card_path.write_text(content, encoding="utf-8")
-            return {"status": "success"}
-
-        agent = Agent(
-            model=model,
-            name=_APP_NAME,
-            instruction=_EXTRACTOR_INSTRUCTION,
-            tools=[save_knowledge_card],
-        )
-        runner = InMemoryRunner(agent=agent, app_name=_APP_NAME)
-        session_id = str(uuid.uuid4())
-        await runner.session_service.create_session(app_name=_APP_NAME, user_id=_APP_NAME, session_id=session_id)
-
         prompt = f"Extrae la ficha de conocimiento de esta transcripción y guárdala con save_knowledge_card:\n\n{clean_text}"
-        message = types.Content(role="user", parts=[types.Part(text=prompt)])
-        async for _ in runner.run_async(
-            user_id=_APP_NAME,
-            session_id=session_id,
-            new_message=message,
-            run_config=RunConfig(max_llm_calls=_MAX_LLM_CALLS),
-        ):
+        async for _ in run_agent(prompt, _MAX_LLM_CALLS, state={_CARD_PATH_STATE_KEY: str(card_path)}):
             pass
+        if on_write is not None:
+            on_write([str(card_path.relative_to(transcripts_root / "cards"))])
 
         logger.info("Knowledge card saved: %s", card_path)
         return card_path
@@ -13,11 +13,13 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from telegram.ext import CallbackQueryHandler
 
 from knowledge_base.admin_config import load_admin_chat_id, load_review_sessions
+from knowledge_base.agent_runner import create_agent_runner
 from knowledge_base.api.transcripts import router as transcripts_router
 from knowledge_base.api.wiki import router as wiki_router
 from knowledge_base.api.wiki_index import router as wiki_index_router
 from knowledge_base.api.wiki_review import router as wiki_review_router
-from knowledge_base.dreamer.runner import create_wiki_dreamer
+from knowledge_base.change_index import CARDS_TREE, WIKI_TREE, open_change_index
+from knowledge_base.dreamer.runner import CARDS_PHASE, create_wiki_dreamer
 from knowledge_base.dreamer.observations import create_observations_runner
 from knowledge_base.dreamer.cards_agent import create_cards_agent
 from knowledge_base.dreamer.wikilinks_agent import create_wikilinks_agent
@@ -29,8 +31,18 @@ from knowledge_base.telegram.admin_bot import AdminBotManager
 from knowledge_base.telegram.bot import TelegramBot
 from knowledge_base.telegram.handle_wiki_review_callback import handle_wiki_review_callback
 from knowledge_base.wiki_editor.runner import create_wiki_editor
-from knowledge_base.wiki_index.embedder import create_embed_text
-from knowledge_base.wiki_index.store import initialize_schema, create_save_entry
+from knowledge_base.wiki_git import WikiRepository
+from knowledge_base.wiki_index.embedder import create_embedder
+from knowledge_base.wiki_index.store import (
+    initialize_schema,
+    create_save_entry,
+    create_save_entries,
+    create_load_content_hashes,
+    create_delete_entries,
+    create_load_all_entries,
+    create_load_embedding_matrix,
+)
+from knowledge_base.wiki_index.memory_index import InMemoryVectorIndex
 from knowledge_base.wiki_index.searcher import create_search_by_embedding
 
 from youtube_transcript_api import YouTubeTranscriptApi
@@ -53,9 +65,16 @@ async def _generic_exception_handler(request, exc):
 async def lifespan(app: FastAPI):
     wiki_root = Path(os.getenv("WIKI_PATH", "./wiki"))
     transcripts_root = Path(os.getenv("TRANSCRIPTS_PATH", "./transcripts"))
-
-    embed_text = create_embed_text()
+    wiki_repository = WikiRepository(wiki_root)
+    wiki_repository.init()
+    app.state.wiki_repository = wiki_repository
+    change_index = open_change_index(wiki_root, transcripts_root, wiki_repository)
+    app.state.change_index = change_index
+    record_wiki_pages = partial(change_index.record, WIKI_TREE)
+
+    embed_text, embed_many = create_embedder()
     app.state.embed_text = embed_text
+    app.state.embed_many = embed_many
 
     import falkordb as falkordb_lib
     falkordb_client = falkordb_lib.FalkorDB(
@@ -64,8 +83,19 @@ async def lifespan(app: FastAPI):
     )
     wiki_graph = falkordb_client.select_graph(os.getenv("WIKI_INDEX_GRAPH", "wiki_index"))
     initialize_schema(wiki_graph)
-    app.state.save_entry = create_save_entry(wiki_graph)
-    app.state.search_by_embedding = create_search_by_embedding(wiki_graph)
+    vector_index = None
+    if os.getenv("WIKI_INDEX_IN_MEMORY", "false").lower() == "true":
+        vector_index = InMemoryVectorIndex()
+        vector_index.load(*create_load_embedding_matrix(wiki_graph)())
+        logging.info("In-memory wiki vector index loaded: %d pages", len(vector_index))
+    on_saved = vector_index.upsert if vector_index is not None else None
+    on_deleted = vector_index.remove if vector_index is not None else None
+    app.state.save_entry = create_save_entry(wiki_graph, on_saved=on_saved)
+    app.state.save_entries = create_save_entries(wiki_graph, on_saved=on_saved)
+    app.state.load_content_hashes = create_load_content_hashes(wiki_graph)
+    app.state.delete_entries = create_delete_entries(wiki_graph, on_deleted=on_deleted)
+    app.state.load_all_entries = create_load_all_entries(wiki_graph)
+    app.state.search_by_embedding = create_search_by_embedding(wiki_graph, vector_index=vector_index)
 
     episodic_memory_url = os.getenv("EPISODIC_MEMORY_URL", "")
 
@@ -89,6 +119,8 @@ async def lifespan(app: FastAPI):
         send_review_status=admin_bot_instance.send_wiki_review_status,
         wiki_root=wiki_root,
         admin_chat_id=admin_chat_id,
+        wiki_repository=wiki_repository,
+        change_index=change_index,
     )
 
     admin_bot_manager = AdminBotManager(
@@ -100,26 +132,47 @@ async def lifespan(app: FastAPI):
         wiki_review_handler=wiki_review_handler,
         embed=embed_text,
         save_entry=app.state.save_entry,
+        embed_many=embed_many,
+        load_content_hashes=app.state.load_content_hashes,
+        delete_entries=app.state.delete_entries,
+        save_entries=app.state.save_entries,
     )
     admin_bot_manager.set_chat_id(admin_chat_id)
     app.state.admin_bot_manager = admin_bot_manager
 
-    app.state.run_wiki_dreamer = create_wiki_dreamer(
-        observations_runner=create_observations_runner(effective_model, wiki_root),
-        cards_agent=create_cards_agent(
+    wiki_dreamer = create_wiki_dreamer(
+        observations_runner=create_observations_runner(effective_model, wiki_root, on_write=record_wiki_pages),
+        run_cards_agent=create_agent_runner(create_cards_agent(
             effective_model, transcripts_root, wiki_root,
             embed=embed_text,
             search_by_embedding=app.state.search_by_embedding,
+            on_write=record_wiki_pages,
+        )),
+        run_wikilinks_agent=create_agent_runner(
+            create_wikilinks_agent(effective_model, wiki_root, on_write=record_wiki_pages)
         ),
-        wikilinks_agent=create_wikilinks_agent(effective_model, wiki_root),
         wiki_root=wiki_root,
         transcripts_root=transcripts_root,
         notify_admin=admin_bot_manager.notify_wiki_changes,
         embed=embed_text,
-        save_entry=app.state.save_entry,
+        save_entries=app.state.save_entries,
         episodic_memory_url=episodic_memory_url,
+        change_index=change_index,
+        wiki_repository=wiki_repository,
     )
+    wiki_dreamer_interval = int(os.getenv("WIKI_DREAMER_INTERVAL_SECONDS", str(30 * 60)))
+    wiki_dreamer_scheduler = create_wiki_dreamer_scheduler(
+        run_wiki_dreamer=wiki_dreamer,
+        interval_seconds=wiki_dreamer_interval,
+    )
+    app.state.wiki_dreamer_scheduler = wiki_dreamer_scheduler
+    app.state.run_wiki_dreamer = wiki_dreamer_scheduler.run_now
     admin_bot_manager.set_run_wiki_dreamer(app.state.run_wiki_dreamer)
+    admin_bot_manager.set_trigger_wiki_dreamer(wiki_dreamer_scheduler.trigger)
+
+    def on_card_written(card_paths: list[str]) -> None:
+        change_index.record(CARDS_TREE, card_paths)
+        wiki_dreamer_scheduler.trigger(CARDS_PHASE)
 
     download_transcript = create_transcript_downloader(YouTubeTranscriptApi())
     fetch_channel_slug = create_channel_slug_fetcher(httpx.Client())
@@ -128,6 +181,7 @@ async def lifespan(app: FastAPI):
         download_transcript=download_transcript,
         run_wiki_dreamer=app.state.run_wiki_dreamer,
         orchestrator_model=orchestrator_model,
+        on_card_written=on_card_written,
     )
     admin_bot_manager.set_ingest_transcript(app.state.ingest_transcript)
     admin_bot_manager.set_fetch_channel_slug(fetch_channel_slug)
@@ -140,10 +194,12 @@ async def lifespan(app: FastAPI):
     app.state.wiki_editor = create_wiki_editor(
         effective_model,
         wiki_root,
+        wiki_repository,
         notify_admin=admin_bot_manager.notify_wiki_changes,
         embed=embed_text,
         save_entry=app.state.save_entry,
         web_searcher=web_searcher,
+        change_index=change_index,
     )
     admin_bot_manager._wiki_editor = app.state.wiki_editor
 
@@ -164,16 +220,11 @@ async def lifespan(app: FastAPI):
         ("feedback", "Incorporar una corrección en la wiki"),
     ])
 
-    wiki_dreamer_interval = int(os.getenv("WIKI_DREAMER_INTERVAL_SECONDS", str(30 * 60)))
-    wiki_dreamer_scheduler = create_wiki_dreamer_scheduler(
-        run_wiki_dreamer=app.state.run_wiki_dreamer,
-        interval_seconds=wiki_dreamer_interval,
-    )
-
     yield
 
-    wiki_dreamer_scheduler.shutdown()
+    await wiki_dreamer_scheduler.shutdown()
     await admin_bot_instance.shutdown()
+    change_index.close()
 
 
 configure_logging()
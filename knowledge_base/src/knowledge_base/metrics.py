@@ -25,13 +25,47 @@ DREAMER_RUNS_TOTAL = Counter(
     ["outcome"],
 )
 
+DREAMER_TRIGGERS_TOTAL = Counter(
+    "kb_dreamer_triggers_total",
+    "Wiki dreamer phase triggers received by the scheduler",
+    ["phase"],
+)
+
 DREAMER_PAGES_CHANGED_TOTAL = Counter(
     "kb_dreamer_pages_changed_total",
     "Total wiki pages changed by the dreamer",
 )
 
+DREAMER_OBSERVATION_STAGE_DURATION_SECONDS = Histogram(
+    "kb_dreamer_observation_stage_duration_seconds",
+    "Duration of one observation integration step, by pipeline stage",
+    ["stage"],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+)
+
+DREAMER_CLASSIFY_FALLBACKS_TOTAL = Counter(
+    "kb_dreamer_classify_fallbacks_total",
+    "Observations classified one by one because the batch classification did not cover them",
+)
+
+CHANGE_INDEX_FILES_HASHED_TOTAL = Counter(
+    "kb_change_index_files_hashed_total",
+    "Files read and hashed to refresh the change index",
+    ["tree"],
+)
+
 WIKI_REVIEW_ACTIONS_TOTAL = Counter(
     "kb_wiki_review_actions_total",
     "Total wiki page review decisions by the admin",
     ["action"],
 )
+
+EMBEDDING_CACHE_HITS_TOTAL = Counter(
+    "kb_embedding_cache_hits_total",
+    "Query embeddings served from the in-process cache",
+)
+
+EMBEDDING_CACHE_MISSES_TOTAL = Counter(
+    "kb_embedding_cache_misses_total",
+    "Query embeddings computed by the local model",
+)
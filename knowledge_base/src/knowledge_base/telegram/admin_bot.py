@@ -8,6 +8,7 @@ import telegram
 from telegram.ext import CallbackQueryHandler, CommandHandler, MessageHandler, filters
 
 from knowledge_base.admin_config import save_admin_chat_id, save_review_sessions
+from knowledge_base.dreamer.runner import OBSERVATIONS_PHASE
 from knowledge_base.wiki_review_session import WikiReviewSession
 from knowledge_base.wiki_index.indexer import build_full_index
 from knowledge_base.logging_config import get_logger
@@ -31,17 +32,26 @@ class AdminBotManager:
         wiki_editor: Optional[Callable] = None,
         embed: Optional[Callable] = None,
         save_entry: Optional[Callable] = None,
+        embed_many: Optional[Callable] = None,
+        load_content_hashes: Optional[Callable] = None,
+        delete_entries: Optional[Callable] = None,
+        save_entries: Optional[Callable] = None,
     ):
         self._bot = bot
         self._wiki_root = wiki_root
         self._wiki_review_sessions = wiki_review_sessions
         self._run_wiki_dreamer = run_wiki_dreamer
+        self._trigger_wiki_dreamer = None
         self._ingest_transcript = ingest_transcript
         self._wiki_review_handler = wiki_review_handler
         self._fetch_channel_slug = fetch_channel_slug
         self._wiki_editor = wiki_editor
         self._embed = embed
         self._save_entry = save_entry
+        self._embed_many = embed_many
+        self._load_content_hashes = load_content_hashes
+        self._delete_entries = delete_entries
+        self._save_entries = save_entries
         self._chat_id: str | None = None
 
     def set_chat_id(self, chat_id: str | None) -> None:
@@ -50,6 +60,9 @@ class AdminBotManager:
     def set_run_wiki_dreamer(self, run_wiki_dreamer: Callable) -> None:
         self._run_wiki_dreamer = run_wiki_dreamer
 
+    def set_trigger_wiki_dreamer(self, trigger_wiki_dreamer: Callable[..., None]) -> None:
+        self._trigger_wiki_dreamer = trigger_wiki_dreamer
+
     def set_ingest_transcript(self, ingest_transcript: Callable) -> None:
         self._ingest_transcript = ingest_transcript
 
@@ -85,8 +98,20 @@ class AdminBotManager:
                 await update.message.reply_text("⚠️ El indexador no está configurado.")
                 return
             await update.message.reply_text("🔍 Indexando wiki...")
-            count = await build_full_index(self._wiki_root, self._embed, self._save_entry)
-            await update.message.reply_text(f"✅ Índice construido: {count} páginas indexadas.")
+            report = await build_full_index(
+                self._wiki_root,
+                self._embed,
+                self._save_entry,
+                embed_many=self._embed_many,
+                load_content_hashes=self._load_content_hashes,
+                delete_entries=self._delete_entries,
+                save_entries=self._save_entries,
+            )
+            await update.message.reply_text(
+                f"✅ Índice construido: {report.indexed_pages} páginas indexadas "
+                f"({report.added} nuevas, {report.updated} actualizadas, "
+                f"{report.unchanged} sin cambios, {report.deleted} eliminadas)."
+            )
 
         async def ingest_command(update, context):
             args = update.message.text.removeprefix("/ingest").strip()
@@ -107,6 +132,8 @@ class AdminBotManager:
                 return
             from knowledge_base.dreamer.memory_reader import append_admin_correction
             append_admin_correction(self._wiki_root, feedback_text)
+            if self._trigger_wiki_dreamer is not None:
+                self._trigger_wiki_dreamer(OBSERVATIONS_PHASE)
             await update.message.reply_text("✅ Corrección guardada. Se incorporará en la próxima pasada del dreamer.")
 
         async def wiki_editor_handler(update, telegram_context):
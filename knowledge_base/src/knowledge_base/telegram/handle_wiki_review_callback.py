@@ -6,9 +6,10 @@ from telegram import Update
 from telegram.ext import ContextTypes
 
 from knowledge_base.admin_config import save_review_sessions
-from knowledge_base import wiki_git
+from knowledge_base.change_index import WIKI_TREE, ChangeIndex
 from knowledge_base.logging_config import get_logger
 from knowledge_base.metrics import WIKI_REVIEW_ACTIONS_TOTAL
+from knowledge_base.wiki_git import WikiRepository
 
 logger = get_logger(__name__)
 
@@ -21,6 +22,8 @@ async def handle_wiki_review_callback(
     send_review_status: Callable | None = None,
     wiki_root: str = "./wiki",
     admin_chat_id: str | None = None,
+    wiki_repository: WikiRepository | None = None,
+    change_index: ChangeIndex | None = None,
 ):
     query = update.callback_query
     if not query:
@@ -58,7 +61,7 @@ async def handle_wiki_review_callback(
 
     if action == "select":
         await query.edit_message_reply_markup(reply_markup=None)
-        diff = wiki_git.get_page_diff(Path(wiki_root), page_path, session.commit_hash)
+        diff = wiki_repository.page_diff(page_path, session.commit_hash)
         diff_summary = _format_diff_for_display(diff, page_path)
         if send_page_diff_message:
             await send_page_diff_message(chat_id, page_path, diff_summary, review_id, page_index)
@@ -71,7 +74,9 @@ async def handle_wiki_review_callback(
 
     elif action == "revert":
         try:
-            wiki_git.revert_page(Path(wiki_root), page_path, session.commit_hash)
+            wiki_repository.revert_page(page_path, session.commit_hash)
+            if change_index is not None:
+                change_index.record(WIKI_TREE, [page_path], uncommitted=False)
             session.resolve_page(page_path, reverted=True)
             WIKI_REVIEW_ACTIONS_TOTAL.labels(action="reject").inc()
             logger.info("Admin reverted wiki page %s (review %s)", page_path, review_id)
@@ -1,9 +1,11 @@
 from pathlib import Path
+from typing import Optional
 
 from google.adk.agents.llm_agent import Agent
 from google.adk.tools import FunctionTool
 from jinja2 import ChoiceLoader, Environment, FileSystemLoader
 
+from knowledge_base.change_index import WIKI_TREE, ChangeIndex
 from knowledge_base.wiki_editor.tools.read_page import read_wiki_page
 from knowledge_base.wiki_editor.tools.write_page import write_wiki_page
 from knowledge_base.wiki_editor.tools.list_pages import list_wiki_pages
@@ -24,22 +26,33 @@ _templates_env = Environment(
 _WIKI_EDITOR_INSTRUCTION = _templates_env.get_template("wiki_editor_instruction.jinja2").render()
 
 
-def create_wiki_editor_agent(model: object, wiki_root: Path, web_searcher=None) -> Agent:
+def create_wiki_editor_agent(
+    model: object,
+    wiki_root: Path,
+    web_searcher=None,
+    change_index: Optional[ChangeIndex] = None,
+) -> Agent:
     def read_page(page_path: str) -> str:
         """Read the content of a wiki page. Returns the markdown content or an error message if not found."""
         return read_wiki_page(page_path, wiki_root)
 
     def write_page(page_path: str, content: str) -> str:
         """Write or update a wiki page with the given markdown content. Creates the file if it doesn't exist. Returns confirmation."""
-        return write_wiki_page(page_path, content, wiki_root)
+        result = write_wiki_page(page_path, content, wiki_root)
+        if change_index is not None and not result.startswith("Error"):
+            change_index.record(WIKI_TREE, [page_path])
+        return result
 
     def list_pages() -> str:
         """List all markdown pages in the wiki. Returns a newline-separated list of page paths."""
         return list_wiki_pages(wiki_root)
 
-    def search_pages(pattern: str) -> str:
-        """Search wiki pages using a regular expression (Python regex, case-insensitive). Returns matching lines as 'path:line_number:content'. Use this before reading pages to locate relevant content. Examples: 'Biorren', '\\bficus\\b', 'error.*página'."""
-        return search_wiki_pages(pattern, wiki_root)
+    def search_pages(pattern: str, offset: int = 0) -> str:
+        """Search wiki pages using a regular expression (Python regex, case-insensitive). Returns matching lines as 'path:line_number:content'. Use this before reading pages to locate relevant content. Examples: 'Biorren', '\\bficus\\b', 'error.*página'.
+
+        Returns up to 50 lines; when there are more, the last line gives the offset to pass to get the next ones.
+        """
+        return search_wiki_pages(pattern, wiki_root, change_index, offset=offset)
 
     def bulk_replace(pattern: str, replacement: str, max_pages: int = 5) -> str:
         """Replace all regex matches across wiki pages, processing up to max_pages per call.
@@ -52,7 +65,7 @@ def create_wiki_editor_agent(model: object, wiki_root: Path, web_searcher=None)
             replacement: Literal replacement string. E.g. 'Biorend', 'Biogold'.
             max_pages: Pages to fix in this call (default 5).
         """
-        return replace_in_pages(pattern, replacement, wiki_root, max_pages)
+        return replace_in_pages(pattern, replacement, wiki_root, max_pages, change_index)
 
     tools = [
         FunctionTool(func=read_page),
@@ -5,10 +5,11 @@ from typing import Callable, Optional
 from google.adk.runners import InMemoryRunner, RunConfig
 from google.genai import types
 
-from knowledge_base import wiki_git
+from knowledge_base.change_index import WIKI_TREE, ChangeIndex
 from knowledge_base.wiki_editor.agent import _APP_NAME, create_wiki_editor_agent
 from knowledge_base.wiki_index.indexer import update_page_index
 from knowledge_base.logging_config import get_logger
+from knowledge_base.wiki_git import WikiRepository
 
 logger = get_logger(__name__)
 
@@ -18,21 +19,26 @@ _MAX_LLM_CALLS = 80
 def create_wiki_editor(
     model: object,
     wiki_root: Path,
+    wiki_repository: WikiRepository,
     notify_admin: Optional[Callable] = None,
     embed: Optional[Callable] = None,
     save_entry: Optional[Callable] = None,
     web_searcher: Optional[Callable] = None,
+    change_index: Optional[ChangeIndex] = None,
 ) -> Callable:
     """Creates the wiki editor runner, a conversational agent for admin wiki management.
 
     Manages one ADK session per admin chat_id. After each interaction, commits any
     changed wiki files and calls notify_admin(changed_files, commit_hash) if provided.
+    With a change index, page searches and bulk replacements only read pages whose
+    indexed text can match, and pages written by the editor are recorded in it, so
+    only the recorded pages are committed instead of scanning the whole wiki.
 
     Returns:
         Async callable: (chat_id: str, text: str) -> str (agent response text)
     """
-    wiki_git.init_wiki_repo(wiki_root)
-    agent = create_wiki_editor_agent(model, wiki_root, web_searcher=web_searcher)
+    wiki_repository.init()
+    agent = create_wiki_editor_agent(model, wiki_root, web_searcher=web_searcher, change_index=change_index)
     runner = InMemoryRunner(agent=agent, app_name=_APP_NAME)
     chat_id_to_session_id: dict[str, str] = {}
 
@@ -52,21 +58,29 @@ def create_wiki_editor(
                 if candidate_text:
                     last_text = candidate_text
 
-        commit_hash = wiki_git.commit_wiki_changes(wiki_root, "wiki-editor: admin update")
-        if commit_hash:
-            changed_files = wiki_git.get_changed_files(wiki_root, commit_hash)
-            if changed_files and embed is not None:
-                for file_path in changed_files:
+        commit = _commit_editor_changes(wiki_repository, change_index)
+        if commit:
+            if embed is not None:
+                for file_path in commit.changed_files:
                     if file_path.endswith(".md"):
                         await update_page_index(file_path, wiki_root, embed, save_entry)
-            if changed_files and notify_admin:
-                await notify_admin(changed_files, commit_hash)
+            if notify_admin:
+                await notify_admin(commit.changed_files, commit.commit_hash)
 
         return last_text
 
     return run_wiki_editor
 
 
+def _commit_editor_changes(wiki_repository: WikiRepository, change_index: Optional[ChangeIndex]):
+    if change_index is None:
+        return wiki_repository.commit_changes("wiki-editor: admin update")
+    uncommitted_pages, up_to_seq = change_index.uncommitted(WIKI_TREE)
+    commit = wiki_repository.commit_changes("wiki-editor: admin update", paths=uncommitted_pages)
+    change_index.mark_committed(WIKI_TREE, up_to_seq)
+    return commit
+
+
 async def _get_or_create_session(runner: InMemoryRunner, chat_id: str, chat_id_to_session_id: dict[str, str]) -> str:
     if chat_id not in chat_id_to_session_id:
         session_id = str(uuid.uuid4())
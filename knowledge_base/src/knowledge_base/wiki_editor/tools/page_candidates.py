@@ -0,0 +1,217 @@
+import re
+from pathlib import Path
+from typing import Optional
+
+from knowledge_base.change_index import ChangeIndex
+
+_MAX_ALTERNATIVES = 16
+_NON_LITERAL_ESCAPES = frozenset("AbBdDsSwWZ")
+_LOOKAROUNDS = ("?=", "?!", "?<=", "?<!")
+_GROUP_FLAGS = frozenset("aiLmsux-")
+_BOUNDED_REPEAT = re.compile(r"\{(\d*)(,\d*)?\}")
+
+
+def candidate_pages(pattern: str, wiki_root: Path, change_index: Optional[ChangeIndex] = None) -> list[Path]:
+    """Pages that may contain a match for pattern, sorted by path.
+
+    With a change index, the literal text every match must contain is looked up in its
+    full-text table, so only those pages are read; otherwise every page is a candidate.
+    Callers still verify each candidate with the regex.
+    """
+    wiki_root_resolved = wiki_root.resolve()
+    alternatives = required_literals(pattern) if change_index is not None else None
+    paths = change_index.pages_containing(alternatives) if alternatives else None
+    if paths is None:
+        return sorted(wiki_root_resolved.rglob("*.md"))
+    return [wiki_root_resolved / path for path in paths if (wiki_root_resolved / path).is_file()]
+
+
+def required_literals(pattern: str) -> Optional[list[list[str]]]:
+    """Alternatives of literal strings such that every match of pattern contains all strings of one of them.
+
+    Returns None when some match needs no literal of three or more characters, e.g. for
+    '\\d+', 'a|bcd' or an invalid pattern, and for syntax the tokenizer does not model
+    (verbose mode, conditionals, numeric escapes), so callers fall back to a full scan.
+    """
+    try:
+        if re.compile(pattern, re.IGNORECASE).flags & re.VERBOSE:
+            return None
+        items = _PatternTokenizer(pattern).parse()
+    except (re.error, _UnsupportedPattern):
+        return None
+    alternatives = _sequence_literals(items)
+    if any(not literals for literals in alternatives):
+        return None
+    return alternatives
+
+
+class _UnsupportedPattern(Exception):
+    pass
+
+
+class _PatternTokenizer:
+    """Parses the subset of regex syntax that decides which literals a match must contain.
+
+    Produces ("literal", char), ("group", items), ("branch", [items, ...]),
+    ("repeat", min_count, items) and ("other",) for anything that matches no fixed text,
+    such as classes, anchors and lookarounds. Only runs on patterns re already compiled.
+    """
+
+    def __init__(self, pattern: str):
+        self._pattern = pattern
+        self._position = 0
+
+    def parse(self) -> list[tuple]:
+        items = self._alternation()
+        if self._position != len(self._pattern):
+            raise _UnsupportedPattern(self._pattern)
+        return items
+
+    def _alternation(self) -> list[tuple]:
+        branches = [self._sequence()]
+        while self._peek() == "|":
+            self._position += 1
+            branches.append(self._sequence())
+        return branches[0] if len(branches) == 1 else [("branch", branches)]
+
+    def _sequence(self) -> list[tuple]:
+        items = []
+        while self._position < len(self._pattern) and self._peek() not in "|)":
+            items.append(self._quantified(self._atom()))
+        return items
+
+    def _atom(self) -> tuple:
+        char = self._take()
+        if char == "(":
+            return self._group()
+        if char == "[":
+            self._skip_class()
+            return ("other",)
+        if char == "\\":
+            return self._escape()
+        if char in ".^$":
+            return ("other",)
+        return ("literal", char)
+
+    def _group(self) -> tuple:
+        if self._peek() != "?":
+            return self._group_body()
+        rest = self._pattern[self._position:]
+        if rest.startswith(("?:", "?>")):
+            self._position += 2
+            return self._group_body()
+        if rest.startswith("?P<"):
+            self._position = self._pattern.index(">", self._position) + 1
+            return self._group_body()
+        if rest.startswith(_LOOKAROUNDS):
+            self._position += 3 if rest.startswith("?<") else 2
+            self._group_body()
+            return ("other",)
+        if rest.startswith(("?#", "?P=")):
+            self._position = self._pattern.index(")", self._position) + 1
+            return ("other",)
+        flags_end = self._position + 1
+        while flags_end < len(self._pattern) and self._pattern[flags_end] in _GROUP_FLAGS:
+            flags_end += 1
+        if flags_end == len(self._pattern) or "x" in self._pattern[self._position:flags_end]:
+            raise _UnsupportedPattern(self._pattern)
+        self._position = flags_end + 1
+        if self._pattern[flags_end] == ")":
+            return ("other",)
+        if self._pattern[flags_end] != ":":
+            raise _UnsupportedPattern(self._pattern)
+        return self._group_body()
+
+    def _group_body(self) -> tuple:
+        items = self._alternation()
+        if self._take() != ")":
+            raise _UnsupportedPattern(self._pattern)
+        return ("group", items)
+
+    def _skip_class(self) -> None:
+        if self._peek() == "^":
+            self._position += 1
+        if self._peek() == "]":
+            self._position += 1
+        while True:
+            char = self._take()
+            if char == "\\":
+                self._take()
+            elif char == "]":
+                return
+
+    def _escape(self) -> tuple:
+        char = self._take()
+        if char in _NON_LITERAL_ESCAPES:
+            return ("other",)
+        if char.isalnum():
+            raise _UnsupportedPattern(self._pattern)
+        return ("literal", char)
+
+    def _quantified(self, atom: tuple) -> tuple:
+        char = self._peek()
+        if char in ("*", "?"):
+            min_count = 0
+            self._position += 1
+        elif char == "+":
+            min_count = 1
+            self._position += 1
+        elif char == "{" and (bounds := _BOUNDED_REPEAT.match(self._pattern, self._position)):
+            min_count = int(bounds.group(1) or 0)
+            self._position = bounds.end()
+        else:
+            return atom
+        if self._peek() in ("?", "+"):
+            self._position += 1
+        return ("repeat", min_count, [atom])
+
+    def _peek(self) -> str:
+        return self._pattern[self._position] if self._position < len(self._pattern) else ""
+
+    def _take(self) -> str:
+        if self._position >= len(self._pattern):
+            raise _UnsupportedPattern(self._pattern)
+        char = self._pattern[self._position]
+        self._position += 1
+        return char
+
+
+def _sequence_literals(items: list[tuple]) -> list[list[str]]:
+    alternatives: list[list[str]] = [[]]
+    run: list[str] = []
+
+    def flush_run():
+        nonlocal alternatives
+        if len(run) >= 3:
+            alternatives = [literals + ["".join(run)] for literals in alternatives]
+        run.clear()
+
+    for item in items:
+        kind = item[0]
+        if kind == "literal":
+            run.append(item[1])
+            continue
+        flush_run()
+        if kind == "group":
+            inner = _sequence_literals(item[1])
+        elif kind == "branch":
+            inner = _branch_literals(item[1])
+        elif kind == "repeat" and item[1] >= 1:
+            inner = _sequence_literals(item[2])
+        else:
+            continue
+        combined = [literals + more for literals in alternatives for more in inner]
+        if len(combined) <= _MAX_ALTERNATIVES:
+            alternatives = combined
+    flush_run()
+    return alternatives
+
+
+def _branch_literals(branches: list[list[tuple]]) -> list[list[str]]:
+    alternatives = []
+    for branch in branches:
+        branch_alternatives = _sequence_literals(branch)
+        if any(not literals for literals in branch_alternatives):
+            return [[]]
+        alternatives.extend(branch_alternatives)
+    return alternatives if len(alternatives) <= _MAX_ALTERNATIVES else [[]]
@@ -1,8 +1,18 @@
 import re
 from pathlib import Path
+from typing import Optional
 
+from knowledge_base.change_index import WIKI_TREE, ChangeIndex
+from knowledge_base.wiki_editor.tools.page_candidates import candidate_pages
 
-def replace_in_pages(pattern: str, replacement: str, wiki_root: Path, max_pages: int = 5) -> str:
+
+def replace_in_pages(
+    pattern: str,
+    replacement: str,
+    wiki_root: Path,
+    max_pages: int = 5,
+    change_index: Optional[ChangeIndex] = None,
+) -> str:
     """Replace all regex matches in wiki pages, processing up to max_pages pages per call.
 
     Use this for bulk corrections across many pages (e.g. fixing a misspelling everywhere).
@@ -13,6 +23,8 @@ def replace_in_pages(pattern: str, replacement: str, wiki_root: Path, max_pages:
         pattern: Python regex to search for (case-insensitive).
         replacement: Literal string to replace each match with.
         max_pages: Maximum pages to process in this call (default 5).
+        change_index: When given, narrows the pages read to those that can match and
+            records the fixed pages, so repeated calls only read the pages still pending.
     """
     wiki_root_resolved = wiki_root.resolve()
     try:
@@ -21,7 +33,7 @@ def replace_in_pages(pattern: str, replacement: str, wiki_root: Path, max_pages:
         return f"Invalid regex pattern: {regex_error}"
 
     pages_with_matches = [
-        page for page in sorted(wiki_root_resolved.rglob("*.md"))
+        page for page in candidate_pages(pattern, wiki_root_resolved, change_index)
         if compiled.search(page.read_text(encoding="utf-8"))
     ]
 
@@ -35,6 +47,8 @@ def replace_in_pages(pattern: str, replacement: str, wiki_root: Path, max_pages:
         content = page.read_text(encoding="utf-8")
         page.write_text(compiled.sub(replacement, content), encoding="utf-8")
         fixed.append(str(page.relative_to(wiki_root_resolved)))
+    if change_index is not None:
+        change_index.record(WIKI_TREE, fixed)
 
     still_pending = total_remaining - len(batch)
     summary = f"Fixed {len(fixed)} page(s): {', '.join(fixed)}."
@@ -1,9 +1,25 @@
 import re
 from pathlib import Path
+from typing import Optional
 
+from knowledge_base.change_index import ChangeIndex
+from knowledge_base.wiki_editor.tools.page_candidates import candidate_pages
 
-def search_wiki_pages(pattern: str, wiki_root: Path) -> str:
-    """Search wiki pages using a regular expression. Returns matching lines as 'path:line_number:content'. Case-insensitive. Pattern is a Python regex (e.g. 'Biorren|biorren', '\\bficus\\b', 'error.*página')."""
+SEARCH_RESULTS_LIMIT = 50
+
+
+def search_wiki_pages(
+    pattern: str,
+    wiki_root: Path,
+    change_index: Optional[ChangeIndex] = None,
+    offset: int = 0,
+    limit: int = SEARCH_RESULTS_LIMIT,
+) -> str:
+    """Search wiki pages using a regular expression. Returns matching lines as 'path:line_number:content'. Case-insensitive. Pattern is a Python regex (e.g. 'Biorren|biorren', '\\bficus\\b', 'error.*página').
+
+    At most limit lines are returned, starting at offset; a trailing note gives the offset
+    of the next batch when there are more.
+    """
     wiki_root_resolved = wiki_root.resolve()
     if not wiki_root_resolved.exists():
         return "No results found."
@@ -12,9 +28,16 @@ def search_wiki_pages(pattern: str, wiki_root: Path) -> str:
     except re.error as regex_error:
         return f"Invalid regex pattern: {regex_error}"
     results = []
-    for page in sorted(wiki_root_resolved.rglob("*.md")):
+    for page in candidate_pages(pattern, wiki_root_resolved, change_index):
         relative_path = str(page.relative_to(wiki_root_resolved))
         for line_number, line in enumerate(page.read_text(encoding="utf-8").splitlines(), start=1):
             if compiled.search(line):
                 results.append(f"{relative_path}:{line_number}:{line}")
-    return "\n".join(results) if results else "No results found."
+        if len(results) > offset + limit:
+            break
+    batch = results[offset:offset + limit]
+    if not batch:
+        return "No more results." if offset and results else "No results found."
+    if len(results) > offset + limit:
+        batch.append(f"[Showing results {offset + 1}-{offset + limit}; call again with offset={offset + limit} for more.]")
+    return "\n".join(batch)
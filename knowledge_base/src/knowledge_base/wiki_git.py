@@ -1,95 +1,279 @@
+import os
 import subprocess
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
+from dulwich.diff_tree import tree_changes
+from dulwich.ignore import IgnoreFilterManager
+from dulwich.index import blob_from_path_and_stat, cleanup_mode
+from dulwich.object_store import commit_tree_changes, iter_tree_contents
+from dulwich.objects import Commit
+from dulwich.repo import Repo
 
-def init_wiki_repo(wiki_root: Path) -> None:
-    wiki_root.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "config", "--global", "safe.directory", "*"], check=True, capture_output=True)
-    already_initialized = (wiki_root / ".git").exists()
-    if not already_initialized:
-        subprocess.run(["git", "init"], cwd=wiki_root, check=True, capture_output=True)
-    subprocess.run(["git", "config", "--local", "user.email", "dreamer@bonsai-sensei"], cwd=wiki_root, check=True, capture_output=True)
-    subprocess.run(["git", "config", "--local", "user.name", "Wiki Dreamer"], cwd=wiki_root, check=True, capture_output=True)
-    subprocess.run(["git", "config", "--local", "commit.gpgsign", "false"], cwd=wiki_root, check=True, capture_output=True)
-    subprocess.run(["git", "config", "--local", "tag.gpgsign", "false"], cwd=wiki_root, check=True, capture_output=True)
-    if already_initialized:
-        return
-    subprocess.run(
-        ["git", "commit", "--allow-empty", "-m", "init: wiki repository"],
-        cwd=wiki_root,
-        check=True,
-        capture_output=True,
-    )
+# Local bookkeeping files kept next to the pages but never committed.
+LOCAL_STATE_PATTERNS = (".change_index.db*",)
 
+_IDENTITY = {
+    (b"user",): {b"email": b"dreamer@bonsai-sensei", b"name": b"Wiki Dreamer"},
+    (b"commit",): {b"gpgsign": b"false"},
+    (b"tag",): {b"gpgsign": b"false"},
+}
 
-def commit_wiki_changes(wiki_root: Path, message: str) -> str | None:
-    """Stage all changes and commit. Returns the new commit hash, or None if nothing changed."""
-    subprocess.run(["git", "add", "-A"], cwd=wiki_root, check=True, capture_output=True)
-    nothing_staged = subprocess.run(
-        ["git", "diff", "--cached", "--quiet"], cwd=wiki_root, capture_output=True
-    )
-    if nothing_staged.returncode == 0:
-        return None
-    subprocess.run(["git", "commit", "-m", message], cwd=wiki_root, check=True, capture_output=True)
-    result = subprocess.run(
-        ["git", "rev-parse", "HEAD"], cwd=wiki_root, check=True, capture_output=True, text=True
-    )
-    return result.stdout.strip()
 
+@dataclass(frozen=True)
+class WikiCommit:
+    commit_hash: str
+    changed_files: list[str]
 
-def get_changed_files(wiki_root: Path, commit_hash: str) -> list[str]:
-    """Return paths of files changed in the given commit, relative to wiki_root."""
-    result = subprocess.run(
-        ["git", "diff-tree", "--no-commit-id", "-r", "--name-only", commit_hash],
-        cwd=wiki_root,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    return [line for line in result.stdout.strip().splitlines() if line]
 
+class WikiRepository:
+    """Git history of one wiki working tree, committed in-process with dulwich.
 
-def get_page_diff(wiki_root: Path, page_path: str, commit_hash: str) -> str:
-    """Return the unified diff for page_path introduced by commit_hash."""
-    result = subprocess.run(
-        ["git", "diff", f"{commit_hash}~1", commit_hash, "--", page_path],
-        cwd=wiki_root,
-        capture_output=True,
-        text=True,
-    )
-    return result.stdout
+    Holds the open repository, the blob hashes of working files keyed by size and mtime,
+    and the lock that serializes writers, so build a single instance per wiki and share it.
+    Commits are built straight from the working files. The .git index of the committed
+    paths and page diffs go through the git CLI, which rewrites the index and diffs large
+    trees faster than dulwich does in Python.
+    """
+
+    def __init__(self, wiki_root: Path):
+        self._wiki_root = wiki_root
+        self._lock = threading.RLock()
+        self._repo: Repo | None = None
+        self._file_hashes: dict[bytes, tuple[int, int, bytes]] = {}
+
+    @property
+    def wiki_root(self) -> Path:
+        return self._wiki_root
+
+    def init(self) -> None:
+        self._wiki_root.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            already_initialized = (self._wiki_root / ".git").exists()
+            self._repo = Repo(str(self._wiki_root)) if already_initialized else Repo.init(str(self._wiki_root))
+            _configure_identity(self._repo)
+            _exclude_local_state(self._wiki_root)
+            if already_initialized:
+                return
+            self._repo.get_worktree().commit(message=b"init: wiki repository")
+
+    def commit_changes(self, message: str, paths: list[str] | None = None) -> WikiCommit | None:
+        """Commit changed files. Returns the new commit and the files it changed, or None if nothing changed.
+
+        With paths (relative to the wiki root), only those are committed: written files are
+        added and missing ones removed, and the new tree reuses every untouched subtree of
+        HEAD. Without paths, the whole working tree is compared against HEAD, the way
+        `git add -A` does; file hashes are cached by size and mtime so unchanged pages are
+        not re-read.
+        """
+        with self._lock:
+            repo = self._open()
+            if paths is None:
+                paths = self._working_tree_changes(repo)
+            if not paths:
+                return None
+            head_id = repo.head()
+            objects = _ObjectsView(repo.object_store)
+            head_tree = objects[repo[head_id].tree]
+            root = os.fsencode(str(self._wiki_root))
+            blobs, changes, changed_files = [], [], []
+            for path in sorted(set(paths)):
+                tree_path = path.encode("utf-8")
+                try:
+                    _, old_id = head_tree.lookup_path(objects.__getitem__, tree_path)
+                except KeyError:
+                    old_id = None
+                fs_path = os.path.join(root, tree_path)
+                try:
+                    st = os.lstat(fs_path)
+                except (FileNotFoundError, NotADirectoryError):
+                    if old_id is not None:
+                        changes.append((tree_path, None, None))
+                        changed_files.append(path)
+                    continue
+                blob = blob_from_path_and_stat(fs_path, st)
+                if blob.id != old_id:
+                    blobs.append((blob, None))
+                    changes.append((tree_path, cleanup_mode(st.st_mode), blob.id))
+                    changed_files.append(path)
+            if not changes:
+                return None
+            repo.object_store.add_objects(blobs)
+            commit_id = _write_commit(repo, head_id, commit_tree_changes(objects, head_tree.id, changes), message)
+            _git(
+                self._wiki_root,
+                "update-index", "--add", "--remove", "-z", "--stdin",
+                stdin="".join(f"{path}\0" for path in changed_files),
+            )
+            return WikiCommit(commit_id.decode("ascii"), changed_files)
+
+    def changed_files(self, commit_hash: str) -> list[str]:
+        """Return paths of files changed in the given commit, relative to the wiki root."""
+        with self._lock:
+            repo = self._open()
+            commit = repo[commit_hash.encode("ascii")]
+            parent_tree = repo[commit.parents[0]].tree if commit.parents else None
+            return _changed_paths(repo, parent_tree, commit.tree)
+
+    def head_commit(self) -> str | None:
+        """Return the hash of HEAD, or None if the repository has no commits."""
+        with self._lock:
+            try:
+                return self._open().head().decode("ascii")
+            except KeyError:
+                return None
+
+    def files_changed_between(self, from_commit: str, to_commit: str) -> list[str]:
+        """Return paths changed between two commits, relative to the wiki root.
 
+        Renames are reported as a deletion of the old path plus an addition of the new one.
+        Raises KeyError when either commit does not exist.
+        """
+        with self._lock:
+            repo = self._open()
+            return _changed_paths(
+                repo, repo[from_commit.encode("ascii")].tree, repo[to_commit.encode("ascii")].tree
+            )
 
-def revert_page(wiki_root: Path, page_path: str, commit_hash: str) -> None:
-    """Restore page_path to its state before commit_hash and create a revert commit.
+    def page_diff(self, page_path: str, commit_hash: str) -> str:
+        """Return the unified diff for page_path introduced by commit_hash."""
+        return _git(self._wiki_root, "diff", f"{commit_hash}~1", commit_hash, "--", page_path, check=False)
 
-    If the page was newly created by that commit, deletes it instead.
+    def revert_page(self, page_path: str, commit_hash: str) -> None:
+        """Restore page_path to its state before commit_hash and create a revert commit.
+
+        If the page was newly created by that commit, deletes it instead.
+        """
+        with self._lock:
+            repo = self._open()
+            parent_tree = repo[repo[commit_hash.encode("ascii")].parents[0]].tree
+            full_path = self._wiki_root / page_path
+            try:
+                _, blob_id = repo[parent_tree].lookup_path(repo.object_store.__getitem__, page_path.encode("utf-8"))
+            except KeyError:
+                full_path.unlink(missing_ok=True)
+            else:
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                full_path.write_bytes(repo[blob_id].data)
+            self.commit_changes(f"revert: dreamer change to {page_path}", paths=[page_path])
+
+    def _open(self) -> Repo:
+        if self._repo is None:
+            self._repo = Repo(str(self._wiki_root))
+        return self._repo
+
+    def _working_tree_changes(self, repo: Repo) -> list[str]:
+        """Paths whose file content differs from HEAD, including new and deleted files."""
+        head_entries = {
+            entry.path: entry.sha for entry in iter_tree_contents(repo.object_store, repo[repo.head()].tree)
+        }
+        ignore = IgnoreFilterManager.from_repo(repo)
+        root = os.fsencode(str(self._wiki_root))
+        changed, seen = [], set()
+        for directory, subdirectories, files in os.walk(root):
+            subdirectories[:] = [name for name in subdirectories if name != b".git"]
+            for name in files:
+                fs_path = os.path.join(directory, name)
+                tree_path = os.path.relpath(fs_path, root).replace(os.fsencode(os.sep), b"/")
+                if tree_path not in head_entries and ignore.is_ignored(tree_path.decode("utf-8")):
+                    continue
+                seen.add(tree_path)
+                st = os.lstat(fs_path)
+                cached = self._file_hashes.get(tree_path)
+                if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+                    blob_id = cached[2]
+                else:
+                    blob_id = blob_from_path_and_stat(fs_path, st).id
+                    self._file_hashes[tree_path] = (st.st_size, st.st_mtime_ns, blob_id)
+                if head_entries.get(tree_path) != blob_id:
+                    changed.append(tree_path.decode("utf-8"))
+        changed.extend(path.decode("utf-8") for path in head_entries if path not in seen)
+        return changed
+
+
+def _configure_identity(repo: Repo) -> None:
+    config = repo.get_config()
+    changed = False
+    for section, values in _IDENTITY.items():
+        for name, value in values.items():
+            try:
+                current = config.get(section, name)
+            except KeyError:
+                current = None
+            if current != value:
+                config.set(section, name, value)
+                changed = True
+    if changed:
+        config.write_to_path()
+
+
+def _exclude_local_state(wiki_root: Path) -> None:
+    exclude_file = wiki_root / ".git" / "info" / "exclude"
+    exclude_file.parent.mkdir(parents=True, exist_ok=True)
+    existing = exclude_file.read_text().splitlines() if exclude_file.exists() else []
+    missing = [pattern for pattern in LOCAL_STATE_PATTERNS if pattern not in existing]
+    if missing:
+        exclude_file.write_text("\n".join(existing + missing) + "\n")
+
+
+class _ObjectsView:
+    """Object store view that parses each object once during a single commit.
+
+    Large directory trees are otherwise re-read for every path lookup. commit_tree_changes
+    edits the trees it reads in place, so a view must not outlive the commit it serves.
     """
-    parent_exists = subprocess.run(
-        ["git", "cat-file", "-e", f"{commit_hash}~1:{page_path}"],
-        cwd=wiki_root,
-        capture_output=True,
+
+    def __init__(self, object_store):
+        self._object_store = object_store
+        self._objects = {}
+
+    def __getitem__(self, object_id: bytes):
+        obj = self._objects.get(object_id)
+        if obj is None:
+            obj = self._objects[object_id] = self._object_store[object_id]
+        return obj
+
+    def add_object(self, obj) -> None:
+        self._object_store.add_object(obj)
+        self._objects[obj.id] = obj
+
+
+def _write_commit(repo: Repo, parent_id: bytes, tree_id: bytes, message: str) -> bytes:
+    identity = _IDENTITY[(b"user",)]
+    commit = Commit()
+    commit.tree = tree_id
+    commit.parents = [parent_id]
+    commit.author = commit.committer = identity[b"name"] + b" <" + identity[b"email"] + b">"
+    commit.author_time = commit.commit_time = int(time.time())
+    commit.author_timezone = commit.commit_timezone = time.localtime().tm_gmtoff
+    commit.encoding = b"UTF-8"
+    commit.message = message.encode("utf-8")
+    repo.object_store.add_object(commit)
+    if not repo.refs.set_if_equals(b"HEAD", parent_id, commit.id):
+        raise RuntimeError("Wiki HEAD moved while committing")
+    return commit.id
+
+
+def _changed_paths(repo: Repo, old_tree, new_tree) -> list[str]:
+    return sorted(
+        _entry_path(change.new, change.old).decode("utf-8")
+        for change in tree_changes(repo.object_store, old_tree, new_tree)
     )
-    if parent_exists.returncode == 0:
-        subprocess.run(
-            ["git", "checkout", f"{commit_hash}~1", "--", page_path],
-            cwd=wiki_root,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(["git", "add", "--", page_path], cwd=wiki_root, check=True, capture_output=True)
-    else:
-        full_path = wiki_root / page_path
-        full_path.unlink(missing_ok=True)
-        subprocess.run(
-            ["git", "rm", "--force", "--ignore-unmatch", "--", page_path],
-            cwd=wiki_root,
-            check=True,
-            capture_output=True,
-        )
-    subprocess.run(
-        ["git", "commit", "-m", f"revert: dreamer change to {page_path}"],
+
+
+def _entry_path(*entries) -> bytes:
+    return next(entry.path for entry in entries if entry is not None and entry.path is not None)
+
+
+def _git(wiki_root: Path, *args: str, stdin: str | None = None, check: bool = True) -> str:
+    result = subprocess.run(
+        ["git", "-c", "safe.directory=*", *args],
         cwd=wiki_root,
-        check=True,
+        input=stdin,
         capture_output=True,
+        text=True,
+        check=check,
     )
+    return result.stdout
@@ -1,19 +1,76 @@
 import asyncio
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
 from typing import Callable
 
 from fastembed import TextEmbedding
 
+from knowledge_base.metrics import EMBEDDING_CACHE_HITS_TOTAL, EMBEDDING_CACHE_MISSES_TOTAL
+
 _EMBEDDING_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
 EMBEDDING_DIM = 384
 
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+EMBED_CACHE_SIZE = int(os.getenv("EMBED_CACHE_SIZE", "2048"))
+EMBED_CACHE_TTL_SECONDS = float(os.getenv("EMBED_CACHE_TTL_SECONDS", "3600"))
 
-def create_embed_text() -> Callable:
-    """Create an async callable that generates text embeddings using a local model."""
-    model = TextEmbedding(_EMBEDDING_MODEL)
+
+def normalize_embedding_text(text: str) -> str:
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def create_embedder(
+    model=None,
+    batch_size: int = EMBED_BATCH_SIZE,
+    cache_size: int = EMBED_CACHE_SIZE,
+    cache_ttl_seconds: float = EMBED_CACHE_TTL_SECONDS,
+    clock: Callable[[], float] = time.monotonic,
+) -> tuple[Callable, Callable]:
+    """Create (embed_text, embed_many) callables sharing one local embedding model.
+
+    embed_text serves interactive lookups (searches, entity names) through a bounded
+    LRU cache with TTL, since the same queries repeat many times within a dreamer run.
+    embed_many is the bulk path for indexing: it feeds the model in chunks and skips the
+    cache so a full rebuild does not evict the hot query entries.
+    """
+    embedding_model = model or TextEmbedding(_EMBEDDING_MODEL)
+    cache: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+
+    async def embed_many(texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for many texts, batching calls into the local model."""
+        normalized_texts = [normalize_embedding_text(text) for text in texts]
+        embeddings: list[list[float]] = []
+        for start in range(0, len(normalized_texts), batch_size):
+            chunk = normalized_texts[start:start + batch_size]
+            chunk_embeddings = await asyncio.to_thread(
+                lambda: list(embedding_model.embed(chunk, batch_size=len(chunk)))
+            )
+            embeddings.extend(embedding.tolist() for embedding in chunk_embeddings)
+        return embeddings
 
     async def embed_text(text: str) -> list[float]:
         """Generate a text embedding using the local multilingual model."""
-        embeddings = await asyncio.to_thread(lambda: list(model.embed([text])))
-        return embeddings[0].tolist()
+        key = normalize_embedding_text(text)
+        cached = cache.get(key)
+        if cached is not None and clock() - cached[0] < cache_ttl_seconds:
+            cache.move_to_end(key)
+            EMBEDDING_CACHE_HITS_TOTAL.inc()
+            return cached[1]
+        EMBEDDING_CACHE_MISSES_TOTAL.inc()
+        embedding = (await embed_many([key]))[0]
+        cache[key] = (clock(), embedding)
+        cache.move_to_end(key)
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+        return embedding
+
+    return embed_text, embed_many
 
+
+def create_embed_text() -> Callable:
+    """Create an async callable that generates text embeddings using a local model."""
+    embed_text, _ = create_embedder()
     return embed_text
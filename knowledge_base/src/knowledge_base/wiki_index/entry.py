@@ -1,3 +1,4 @@
+import hashlib
 import re
 from dataclasses import dataclass
 
@@ -9,6 +10,12 @@ class IndexEntry:
     links: list[str]
     embedding: list[float]
     user_id: str | None = None
+    content_hash: str | None = None
+
+
+def compute_content_hash(content: str) -> str:
+    """Return the sha256 hex digest used to detect changed pages between index rebuilds."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
 def extract_abstract(content: str) -> str:
@@ -1,7 +1,26 @@
+import asyncio
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
-from knowledge_base.wiki_index.entry import IndexEntry, extract_abstract, extract_links
+from knowledge_base.wiki_index.entry import IndexEntry, compute_content_hash, extract_abstract, extract_links
+
+INDEX_WORKERS = int(os.getenv("INDEX_WORKERS", "4"))
+INDEX_EMBED_BATCH_SIZE = int(os.getenv("INDEX_EMBED_BATCH_SIZE", "64"))
+
+
+@dataclass
+class IndexRebuildReport:
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    skipped: int = 0
+
+    @property
+    def indexed_pages(self) -> int:
+        return self.added + self.updated + self.unchanged
 
 
 async def update_page_index(
@@ -24,10 +43,65 @@ async def update_page_index(
     links = extract_links(content)
     embedding = await embed(abstract)
     user_id = _extract_user_id_from_path(page_path)
-    entry = IndexEntry(page_path=page_path, abstract=abstract, links=links, embedding=embedding, user_id=user_id)
+    entry = IndexEntry(
+        page_path=page_path,
+        abstract=abstract,
+        links=links,
+        embedding=embedding,
+        user_id=user_id,
+        content_hash=compute_content_hash(content),
+    )
     save_entry(entry)
 
 
+async def update_pages_index(
+    page_paths: list[str],
+    wiki_root: Path,
+    embed: Callable,
+    save_entries: Optional[Callable[[list[IndexEntry]], None]] = None,
+    embed_many: Optional[Callable] = None,
+) -> int:
+    """Index several pages and persist them with one bulk save_entries call. Returns count of saved entries.
+
+    Missing pages and pages without an abstract are skipped, as in update_page_index.
+    """
+    if save_entries is None:
+        return 0
+    pages = [
+        _read_page(wiki_root, page_path)
+        for page_path in page_paths
+        if (wiki_root / page_path).exists()
+    ]
+    pages = [page for page in pages if page[2].strip()]
+    entries = await _build_entries(pages, embed, embed_many)
+    if entries:
+        save_entries(entries)
+    return len(entries)
+
+
+async def _build_entries(
+    pages: list[tuple[str, str, str, list[str]]],
+    embed: Callable,
+    embed_many: Optional[Callable],
+) -> list[IndexEntry]:
+    abstracts = [abstract for _, _, abstract, _ in pages]
+    if embed_many is not None:
+        embeddings = await embed_many(abstracts)
+    else:
+        embeddings = [await embed(abstract) for abstract in abstracts]
+    return [
+        IndexEntry(
+            page_path=page_path,
+            abstract=abstract,
+            links=links,
+            embedding=embedding,
+            user_id=_extract_user_id_from_path(page_path),
+            content_hash=content_hash,
+        )
+        for (page_path, content_hash, abstract, links), embedding in zip(pages, embeddings)
+    ]
+
+
 def _extract_user_id_from_path(page_path: str) -> str | None:
     parts = page_path.split("/")
     if len(parts) >= 2 and parts[0] == "users":
@@ -35,17 +109,78 @@ def _extract_user_id_from_path(page_path: str) -> str | None:
     return None
 
 
+def _read_page(wiki_root: Path, page_path: str) -> tuple[str, str, str, list[str]]:
+    content = (wiki_root / page_path).read_text(encoding="utf-8")
+    return page_path, compute_content_hash(content), extract_abstract(content), extract_links(content)
+
+
 async def build_full_index(
     wiki_root: Path,
     embed: Callable,
     save_entry: Optional[Callable[[IndexEntry], None]] = None,
-) -> int:
-    """Index all .md files under wiki_root. Returns count of indexed pages."""
-    if save_entry is None:
-        return 0
-    indexed_count = 0
-    for md_file in wiki_root.rglob("*.md"):
-        relative_path = md_file.relative_to(wiki_root)
-        await update_page_index(str(relative_path), wiki_root, embed, save_entry)
-        indexed_count += 1
-    return indexed_count
+    embed_many: Optional[Callable] = None,
+    load_content_hashes: Optional[Callable[[], dict]] = None,
+    delete_entries: Optional[Callable[[list[str]], None]] = None,
+    save_entries: Optional[Callable[[list[IndexEntry]], None]] = None,
+    workers: int = INDEX_WORKERS,
+    batch_size: int = INDEX_EMBED_BATCH_SIZE,
+) -> IndexRebuildReport:
+    """Incrementally index all .md files under wiki_root.
+
+    Each page's content hash is compared with the manifest stored on its WikiPage node
+    (load_content_hashes); only new or changed pages are embedded and saved. Pages that
+    disappeared from disk, or whose abstract is now empty, are removed through delete_entries. Without a manifest every
+    page is treated as new, which matches a from-scratch rebuild.
+
+    Pages are read and hashed, and changed pages embedded and saved in batches, on a pool
+    of at most `workers` concurrent tasks. When save_entries is provided each batch is
+    written with one bulk query instead of one save_entry call per page.
+    """
+    report = IndexRebuildReport()
+    if save_entry is None and save_entries is None:
+        return report
+    if save_entries is None:
+        def save_entries(entries: list[IndexEntry]) -> None:
+            for entry in entries:
+                save_entry(entry)
+
+    stored_hashes = await asyncio.to_thread(load_content_hashes) if load_content_hashes else {}
+    page_paths = sorted(str(md_file.relative_to(wiki_root)) for md_file in wiki_root.rglob("*.md"))
+    semaphore = asyncio.Semaphore(workers)
+
+    async def read_page(page_path: str):
+        async with semaphore:
+            return await asyncio.to_thread(_read_page, wiki_root, page_path)
+
+    pages = await asyncio.gather(*(read_page(page_path) for page_path in page_paths))
+
+    pending: list[tuple[str, str, str, list[str]]] = []
+    indexable_paths: set[str] = set()
+    for page_path, content_hash, abstract, links in pages:
+        if not abstract.strip():
+            report.skipped += 1
+            continue
+        indexable_paths.add(page_path)
+        if page_path not in stored_hashes:
+            report.added += 1
+        elif stored_hashes[page_path] != content_hash:
+            report.updated += 1
+        else:
+            report.unchanged += 1
+            continue
+        pending.append((page_path, content_hash, abstract, links))
+
+    async def index_batch(batch: list[tuple[str, str, str, list[str]]]) -> None:
+        async with semaphore:
+            entries = await _build_entries(batch, embed, embed_many)
+            await asyncio.to_thread(save_entries, entries)
+
+    await asyncio.gather(*(
+        index_batch(pending[start:start + batch_size]) for start in range(0, len(pending), batch_size)
+    ))
+
+    removed_paths = sorted(set(stored_hashes) - indexable_paths)
+    if removed_paths and delete_entries is not None:
+        await asyncio.to_thread(delete_entries, removed_paths)
+        report.deleted = len(removed_paths)
+    return report
@@ -0,0 +1,133 @@
+import threading
+
+import numpy as np
+
+from knowledge_base.wiki_index.embedder import EMBEDDING_DIM
+from knowledge_base.wiki_index.entry import IndexEntry
+
+_GLOBAL_USER_CODE = -1
+
+
+class InMemoryVectorIndex:
+    """Process-local copy of the WikiPage vectors for exact cosine top-k search.
+
+    Rows live in a preallocated float32 matrix of unit-normalized embeddings, with aligned
+    page_path, abstract and user code arrays. Each user_id is mapped to an integer code
+    (global pages use -1) so the user filter is a vectorized mask applied before top-k
+    selection. Writes keep the matrix in sync with the graph through the store's
+    on_saved/on_deleted hooks.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM, initial_capacity: int = 1024):
+        self._dim = dim
+        self._lock = threading.Lock()
+        self._matrix = np.zeros((initial_capacity, dim), dtype=np.float32)
+        self._user_codes = np.full(initial_capacity, _GLOBAL_USER_CODE, dtype=np.int32)
+        self._page_paths: list[str] = []
+        self._abstracts: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._user_code_by_id: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._page_paths)
+
+    def load(self, entries: list[IndexEntry], matrix: np.ndarray) -> None:
+        """Replace the index contents with entries whose embeddings are the rows of matrix."""
+        with self._lock:
+            self._matrix = np.zeros((max(len(entries), 1024), self._dim), dtype=np.float32)
+            self._user_codes = np.full(len(self._matrix), _GLOBAL_USER_CODE, dtype=np.int32)
+            self._page_paths = []
+            self._abstracts = []
+            self._rows = {}
+            if len(entries):
+                self._matrix[:len(entries)] = _normalize_rows(matrix)
+            for row, entry in enumerate(entries):
+                self._page_paths.append(entry.page_path)
+                self._abstracts.append(entry.abstract)
+                self._rows[entry.page_path] = row
+                self._user_codes[row] = self._user_code(entry.user_id)
+
+    def upsert(self, entries: list[IndexEntry]) -> None:
+        """Insert or replace entries; used as the store's on_saved hook."""
+        with self._lock:
+            for entry in entries:
+                if not entry.embedding:
+                    continue
+                row = self._rows.get(entry.page_path)
+                if row is None:
+                    row = len(self._page_paths)
+                    self._ensure_capacity(row + 1)
+                    self._page_paths.append(entry.page_path)
+                    self._abstracts.append(entry.abstract)
+                    self._rows[entry.page_path] = row
+                else:
+                    self._abstracts[row] = entry.abstract
+                self._matrix[row] = _normalize_rows(np.asarray([entry.embedding], dtype=np.float32))[0]
+                self._user_codes[row] = self._user_code(entry.user_id)
+
+    def remove(self, page_paths: list[str]) -> None:
+        """Drop entries by page_path; used as the store's on_deleted hook."""
+        with self._lock:
+            for page_path in page_paths:
+                row = self._rows.pop(page_path, None)
+                if row is None:
+                    continue
+                last_row = len(self._page_paths) - 1
+                if row != last_row:
+                    moved_path = self._page_paths[last_row]
+                    self._matrix[row] = self._matrix[last_row]
+                    self._user_codes[row] = self._user_codes[last_row]
+                    self._page_paths[row] = moved_path
+                    self._abstracts[row] = self._abstracts[last_row]
+                    self._rows[moved_path] = row
+                self._page_paths.pop()
+                self._abstracts.pop()
+
+    def search(self, query_embedding: list[float], top_k: int = 5, user_id: str | None = None) -> list[tuple[str, str, float]]:
+        """Return top_k (page_path, abstract, score) tuples visible to user_id, by cosine similarity descending.
+
+        Visibility matches the FalkorDB search: global pages, plus the user's own pages when
+        user_id is given. Filtering happens before ranking, so exactly min(top_k, visible)
+        results are returned.
+        """
+        query = _normalize_rows(np.asarray([query_embedding], dtype=np.float32))[0]
+        with self._lock:
+            size = len(self._page_paths)
+            user_codes = self._user_codes[:size]
+            visible = user_codes == _GLOBAL_USER_CODE
+            if user_id is not None and user_id in self._user_code_by_id:
+                visible |= user_codes == self._user_code_by_id[user_id]
+            visible_count = int(np.count_nonzero(visible))
+            if top_k <= 0 or not visible_count:
+                return []
+            scores = self._matrix[:size] @ query
+            scores[~visible] = -np.inf
+            k = min(top_k, visible_count)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [
+                (self._page_paths[row], self._abstracts[row], round(float(scores[row]), 6))
+                for row in top
+            ]
+
+    def _user_code(self, user_id: str | None) -> int:
+        if user_id is None:
+            return _GLOBAL_USER_CODE
+        return self._user_code_by_id.setdefault(user_id, len(self._user_code_by_id))
+
+    def _ensure_capacity(self, size: int) -> None:
+        if size <= len(self._matrix):
+            return
+        capacity = max(size, len(self._matrix) * 2)
+        matrix = np.zeros((capacity, self._dim), dtype=np.float32)
+        matrix[:len(self._matrix)] = self._matrix
+        user_codes = np.full(capacity, _GLOBAL_USER_CODE, dtype=np.int32)
+        user_codes[:len(self._user_codes)] = self._user_codes
+        self._matrix = matrix
+        self._user_codes = user_codes
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
@@ -1,16 +1,25 @@
-from typing import Callable
+from typing import Callable, Optional
 
 import falkordb
 
+from knowledge_base.wiki_index.memory_index import InMemoryVectorIndex
 
-def create_search_by_embedding(graph: falkordb.Graph) -> Callable[[list[float], int, str | None], list[tuple[str, str, float]]]:
+
+def create_search_by_embedding(
+    graph: falkordb.Graph,
+    vector_index: Optional[InMemoryVectorIndex] = None,
+) -> Callable[[list[float], int, str | None], list[tuple[str, str, float]]]:
     """Return a callable that performs KNN vector search over WikiPage nodes.
 
     When user_id is None, returns only global pages (user_id IS NULL).
     When user_id is provided, returns global pages plus that user's pages.
+    When vector_index is provided, searches are answered in-process from it instead of
+    querying FalkorDB.
     """
     def search_by_embedding(query_embedding: list[float], top_k: int = 5, user_id: str | None = None) -> list[tuple[str, str, float]]:
         """Return top_k (page_path, abstract, score) tuples sorted by cosine similarity descending."""
+        if vector_index is not None:
+            return vector_index.search(query_embedding, top_k, user_id=user_id)
         if user_id is not None:
             cypher = (
                 "CALL db.idx.vector.queryNodes('WikiPage', 'embedding', $k, vecf32($embedding)) "
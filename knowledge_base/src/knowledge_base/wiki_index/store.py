@@ -1,6 +1,8 @@
-from typing import Callable
+import os
+from typing import Callable, Optional
 
 import falkordb
+import numpy as np
 from redis.exceptions import ResponseError
 
 from knowledge_base.wiki_index.embedder import EMBEDDING_DIM
@@ -34,65 +36,156 @@ def _migrate_index_if_dim_changed(graph: falkordb.Graph) -> None:
     graph.create_node_vector_index('WikiPage', 'embedding', dim=EMBEDDING_DIM, similarity_function='cosine')
 
 
-def create_save_entry(graph: falkordb.Graph) -> Callable[[IndexEntry], None]:
-    """Return a callable that persists an IndexEntry to FalkorDB."""
+SAVE_ENTRIES_BATCH_SIZE = int(os.getenv("WIKI_INDEX_SAVE_BATCH_SIZE", "200"))
+
+_SAVE_ENTRIES_QUERY = (
+    "UNWIND $entries AS entry "
+    "MERGE (node:WikiPage {page_path: entry.page_path}) "
+    "SET node.abstract = entry.abstract, node.embedding = vecf32(entry.embedding), "
+    "node.user_id = entry.user_id, node.content_hash = entry.content_hash "
+    "WITH node, entry "
+    "OPTIONAL MATCH (node)-[stale:LINKS_TO]->() "
+    "DELETE stale "
+    "WITH DISTINCT node, entry "
+    "UNWIND entry.links AS link "
+    "MERGE (target:WikiPage {page_path: link}) "
+    "MERGE (node)-[:LINKS_TO]->(target)"
+)
+
+
+def create_save_entries(
+    graph: falkordb.Graph,
+    batch_size: int = SAVE_ENTRIES_BATCH_SIZE,
+    on_saved: Optional[Callable[[list[IndexEntry]], None]] = None,
+) -> Callable[[list[IndexEntry]], None]:
+    """Return a callable that upserts many IndexEntry rows with one UNWIND query per batch.
+
+    Each entry's outgoing LINKS_TO set is replaced, so links removed from a page are
+    dropped from the graph instead of accumulating. on_saved is called with each batch
+    after it is written (e.g. to keep an in-memory vector index in sync).
+    """
+    def save_entries(entries: list[IndexEntry]) -> None:
+        for start in range(0, len(entries), batch_size):
+            batch = entries[start:start + batch_size]
+            graph.query(_SAVE_ENTRIES_QUERY, {'entries': [_entry_params(entry) for entry in batch]})
+            if on_saved is not None:
+                on_saved(batch)
+    return save_entries
+
+
+def create_save_entry(
+    graph: falkordb.Graph, on_saved: Optional[Callable[[list[IndexEntry]], None]] = None
+) -> Callable[[IndexEntry], None]:
+    """Return a callable that persists a single IndexEntry to FalkorDB."""
+    save_entries = create_save_entries(graph, on_saved=on_saved)
+
     def save_entry(entry: IndexEntry) -> None:
+        save_entries([entry])
+    return save_entry
+
+
+def _entry_params(entry: IndexEntry) -> dict:
+    return {
+        'page_path': entry.page_path,
+        'abstract': entry.abstract,
+        'embedding': entry.embedding,
+        'user_id': entry.user_id,
+        'content_hash': entry.content_hash,
+        'links': list(dict.fromkeys(entry.links)),
+    }
+
+
+def create_load_content_hashes(graph: falkordb.Graph) -> Callable[[], dict[str, str | None]]:
+    """Return a callable that loads the page_path -> content_hash manifest of indexed pages.
+
+    Only nodes with an abstract are returned; nodes that exist solely as link targets are not
+    indexed pages. Pages indexed before hashes were stored map to None.
+    """
+    def load_content_hashes() -> dict[str, str | None]:
+        result = graph.query(
+            "MATCH (node:WikiPage) WHERE node.abstract IS NOT NULL RETURN node.page_path, node.content_hash"
+        )
+        return {row[0]: row[1] for row in result.result_set}
+    return load_content_hashes
+
+
+def create_delete_entries(
+    graph: falkordb.Graph, on_deleted: Optional[Callable[[list[str]], None]] = None
+) -> Callable[[list[str]], None]:
+    """Return a callable that removes WikiPage nodes (and their relationships) for the given paths."""
+    def delete_entries(page_paths: list[str]) -> None:
+        if not page_paths:
+            return
         graph.query(
-            "MERGE (node:WikiPage {page_path: $page_path}) "
-            "SET node.abstract = $abstract, node.embedding = vecf32($embedding), node.user_id = $user_id",
-            {'page_path': entry.page_path, 'abstract': entry.abstract, 'embedding': entry.embedding, 'user_id': entry.user_id},
+            "UNWIND $page_paths AS page_path "
+            "MATCH (node:WikiPage {page_path: page_path}) DETACH DELETE node",
+            {'page_paths': page_paths},
         )
-        for link in entry.links:
-            graph.query(
-                "MATCH (source:WikiPage {page_path: $source_path}) "
-                "MERGE (target:WikiPage {page_path: $target_path}) "
-                "MERGE (source)-[:LINKS_TO]->(target)",
-                {'source_path': entry.page_path, 'target_path': link},
-            )
-    return save_entry
+        if on_deleted is not None:
+            on_deleted(page_paths)
+    return delete_entries
+
+
+_LOAD_ENTRIES_QUERY = (
+    "MATCH (node:WikiPage) WHERE {where} "
+    "OPTIONAL MATCH (node)-[:LINKS_TO]->(target:WikiPage) "
+    "RETURN node.page_path, node.abstract, node.user_id, node.content_hash, "
+    "collect(target.page_path){embedding_column}"
+)
 
 
 def create_load_entry(graph: falkordb.Graph) -> Callable[[str], IndexEntry | None]:
-    """Return a callable that loads a single IndexEntry by page_path."""
+    """Return a callable that loads a single IndexEntry, with its links, by page_path."""
     def load_entry(page_path: str) -> IndexEntry | None:
-        result = graph.query(
-            "MATCH (node:WikiPage {page_path: $page_path}) RETURN node",
-            {'page_path': page_path},
-        )
-        if not result.result_set:
+        rows = _query_entries(graph, with_embeddings=True, page_path=page_path)
+        if not rows:
             return None
-        node = result.result_set[0][0]
-        return IndexEntry(
-            page_path=node.properties['page_path'],
-            abstract=node.properties.get('abstract', ''),
-            links=_load_links(graph, page_path),
-            embedding=list(node.properties.get('embedding', [])),
-            user_id=node.properties.get('user_id'),
-        )
+        return _entry_from_row(rows[0], with_embeddings=True)
     return load_entry
 
 
-def create_load_all_entries(graph: falkordb.Graph) -> Callable[[], list[IndexEntry]]:
-    """Return a callable that loads all IndexEntry records from FalkorDB."""
-    def load_all_entries() -> list[IndexEntry]:
-        result = graph.query("MATCH (node:WikiPage) WHERE node.abstract IS NOT NULL RETURN node")
-        return [
-            IndexEntry(
-                page_path=node.properties['page_path'],
-                abstract=node.properties.get('abstract', ''),
-                links=_load_links(graph, node.properties['page_path']),
-                embedding=list(node.properties.get('embedding', [])),
-                user_id=node.properties.get('user_id'),
-            )
-            for row in result.result_set
-            for node in [row[0]]
-        ]
+def create_load_all_entries(graph: falkordb.Graph) -> Callable[..., list[IndexEntry]]:
+    """Return a callable that loads all IndexEntry records, links included, in a single query.
+
+    With with_embeddings=False the embedding column is not projected at all, which keeps
+    listings of the whole index cheap; entries then carry an empty embedding.
+    """
+    def load_all_entries(with_embeddings: bool = True) -> list[IndexEntry]:
+        rows = _query_entries(graph, with_embeddings=with_embeddings)
+        return [_entry_from_row(row, with_embeddings=with_embeddings) for row in rows]
     return load_all_entries
 
 
-def _load_links(graph: falkordb.Graph, page_path: str) -> list[str]:
-    result = graph.query(
-        "MATCH (:WikiPage {page_path: $page_path})-[:LINKS_TO]->(target:WikiPage) RETURN target.page_path",
-        {'page_path': page_path},
+def create_load_embedding_matrix(graph: falkordb.Graph) -> Callable[[], tuple[list[IndexEntry], np.ndarray]]:
+    """Return a callable that loads all entries plus their embeddings packed as a float32 matrix.
+
+    Row i of the matrix is the embedding of entries[i]; the entries themselves carry an empty
+    embedding so vectors are held once, in the contiguous array callers do math on.
+    """
+    def load_embedding_matrix() -> tuple[list[IndexEntry], np.ndarray]:
+        rows = [row for row in _query_entries(graph, with_embeddings=True) if row[5]]
+        entries = [_entry_from_row(row, with_embeddings=False) for row in rows]
+        matrix = np.asarray([row[5] for row in rows], dtype=np.float32).reshape(len(rows), -1 if rows else EMBEDDING_DIM)
+        return entries, matrix
+    return load_embedding_matrix
+
+
+def _query_entries(graph: falkordb.Graph, with_embeddings: bool, page_path: str | None = None) -> list:
+    where = "node.page_path = $page_path" if page_path is not None else "node.abstract IS NOT NULL"
+    query = _LOAD_ENTRIES_QUERY.format(
+        where=where,
+        embedding_column=", node.embedding" if with_embeddings else "",
+    )
+    params = {'page_path': page_path} if page_path is not None else None
+    return graph.query(query, params).result_set
+
+
+def _entry_from_row(row: list, with_embeddings: bool) -> IndexEntry:
+    return IndexEntry(
+        page_path=row[0],
+        abstract=row[1] or '',
+        user_id=row[2],
+        content_hash=row[3],
+        links=list(row[4]),
+        embedding=list(row[5] or []) if with_embeddings else [],
     )
-    return [row[0] for row in result.result_set]
@@ -1,12 +1,16 @@
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 
-def create_write_wiki_page_tool(wiki_root: str | Path) -> Callable:
+def create_write_wiki_page_tool(
+    wiki_root: str | Path,
+    on_write: Optional[Callable[[list[str]], None]] = None,
+) -> Callable:
     """Create a tool that writes content to a wiki page at the given relative path.
 
     Args:
         wiki_root: Absolute path to the root directory of the wiki.
+        on_write: Optional hook called with the written page's path relative to wiki_root.
     """
     wiki_root_path = Path(wiki_root).resolve()
 
@@ -29,6 +33,8 @@ def create_write_wiki_page_tool(wiki_root: str | Path) -> Callable:
             return {"status": "error", "message": "invalid_path"}
         resolved.parent.mkdir(parents=True, exist_ok=True)
         resolved.write_text(content, encoding="utf-8")
+        if on_write is not None:
+            on_write([str(resolved.relative_to(wiki_root_path))])
         return {"status": "success", "path": path}
 
     return write_wiki_page
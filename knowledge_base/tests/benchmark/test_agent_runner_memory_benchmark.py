@@ -0,0 +1,60 @@
+import asyncio
+import logging
+import os
+import sys
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.agents.llm_agent import Agent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from hamcrest import assert_that, less_than
+
+from knowledge_base.agent_runner import create_agent_runner
+
+INVOCATIONS = int(os.getenv("BENCHMARK_AGENT_INVOCATIONS", "10000"))
+WARMUP_INVOCATIONS = int(os.getenv("BENCHMARK_AGENT_WARMUP_INVOCATIONS", "500"))
+MAX_RSS_GROWTH_MB = float(os.getenv("BENCHMARK_AGENT_MAX_RSS_GROWTH_MB", "20"))
+
+logger = logging.getLogger(__name__)
+
+
+class StubLlm(BaseLlm):
+    model: str = "stub"
+
+    async def generate_content_async(self, llm_request, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text="listo " * 200)]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(prompt_token_count=1, candidates_token_count=1),
+        )
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads RSS from /proc")
+def should_keep_memory_flat_across_agent_invocations():
+    run_agent = create_agent_runner(Agent(model=StubLlm(), name="memory_benchmark_agent", instruction="Responde"))
+
+    async def invoke(count: int) -> None:
+        for _ in range(count):
+            async for _ in run_agent("hola " * 200, 3):
+                pass
+
+    async def measure() -> tuple[float, float]:
+        await invoke(WARMUP_INVOCATIONS)
+        baseline = _rss_mb()
+        await invoke(INVOCATIONS)
+        return baseline, _rss_mb()
+
+    baseline_mb, final_mb = asyncio.run(measure())
+
+    logger.info("RSS after %d warm-up runs %.1fMB, after %d more runs %.1fMB", WARMUP_INVOCATIONS, baseline_mb, INVOCATIONS, final_mb)
+    assert_that(final_mb - baseline_mb, less_than(MAX_RSS_GROWTH_MB), "RSS should stay flat")
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status", encoding="utf-8") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from hamcrest import assert_that, greater_than
+
+from knowledge_base.dreamer.observations import execute_integrate_observations
+
+OBSERVATION_COUNT = int(os.getenv("BENCHMARK_OBSERVATION_COUNT", "300"))
+PAGE_COUNT = int(os.getenv("BENCHMARK_OBSERVATION_PAGES", "60"))
+LLM_LATENCY_SECONDS = float(os.getenv("BENCHMARK_LLM_LATENCY_SECONDS", "0.02"))
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.integration
+def should_integrate_observation_backlog_faster_than_sequential():
+    observations = [
+        {"user_id": "user-1", "content": f"Observación {index} sobre especie {index % PAGE_COUNT}"}
+        for index in range(OBSERVATION_COUNT)
+    ]
+
+    sequential_seconds, sequential_calls = _run(observations, concurrency=1, merge=False)
+    parallel_seconds, parallel_calls = _run(observations, concurrency=8, merge=True)
+    batched_seconds, batched_calls = _run(observations, concurrency=8, merge=True, batch_size=20)
+
+    logger.info(
+        "%d observations: sequential %.2fs (%d LLM calls), pipeline %.2fs (%d LLM calls), "
+        "batched classification %.2fs (%d LLM calls)",
+        OBSERVATION_COUNT, sequential_seconds, sequential_calls, parallel_seconds, parallel_calls,
+        batched_seconds, batched_calls,
+    )
+    assert_that(sequential_seconds / parallel_seconds, greater_than(4), "Pipeline should be several times faster")
+
+
+def _run(observations: list[dict], concurrency: int, merge: bool, batch_size: int = 0) -> tuple[float, int]:
+    calls = 0
+
+    async def stub_llm():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(LLM_LATENCY_SECONDS)
+
+    async def classify(content, user_id):
+        await stub_llm()
+        return {"type": "species", "entity_name": content.rsplit(" ", 1)[-1] if merge else content}
+
+    async def classify_batch(chunk):
+        await stub_llm()
+        return {index: {"type": "species", "entity_name": obs["content"].rsplit(" ", 1)[-1]} for index, obs in enumerate(chunk)}
+
+    async def enrich(path, existing_content, observation):
+        await stub_llm()
+        return f"# {path}\n\n{observation}"
+
+    start = time.perf_counter()
+    asyncio.run(execute_integrate_observations(
+        observations,
+        classify_observation=classify,
+        enrich_wiki_page=enrich,
+        read_wiki_page_func=MagicMock(return_value={"status": "not_found"}),
+        write_wiki_page_func=MagicMock(),
+        concurrency=concurrency,
+        classify_observations=classify_batch if batch_size else None,
+        classify_batch_size=batch_size,
+    ))
+    return time.perf_counter() - start, calls
@@ -0,0 +1,96 @@
+import logging
+import os
+import time
+
+import pytest
+from hamcrest import assert_that, equal_to, less_than
+
+from knowledge_base.wiki_index.entry import IndexEntry
+from knowledge_base.wiki_index.store import create_save_entries
+
+PAGE_COUNT = int(os.getenv("BENCHMARK_PAGE_COUNT", "1000"))
+LINKS_PER_PAGE = int(os.getenv("BENCHMARK_LINKS_PER_PAGE", "10"))
+
+logger = logging.getLogger(__name__)
+
+
+class CountingGraph:
+    def __init__(self, graph):
+        self._graph = graph
+        self.round_trips = 0
+
+    def query(self, *args, **kwargs):
+        self.round_trips += 1
+        return self._graph.query(*args, **kwargs)
+
+
+@pytest.mark.integration
+def should_save_pages_with_fewer_round_trips_than_per_link_writes(falkordb_graph):
+    entries = _build_entries(PAGE_COUNT, LINKS_PER_PAGE)
+
+    per_link_graph = CountingGraph(falkordb_graph)
+    per_link_start = time.perf_counter()
+    for entry in entries:
+        _save_entry_per_link(per_link_graph, entry)
+    per_link_seconds = time.perf_counter() - per_link_start
+
+    falkordb_graph.query("MATCH (node:WikiPage) DETACH DELETE node")
+
+    bulk_graph = CountingGraph(falkordb_graph)
+    bulk_start = time.perf_counter()
+    create_save_entries(bulk_graph)(entries)
+    bulk_seconds = time.perf_counter() - bulk_start
+
+    logger.info(
+        "Saving %d pages x %d links: per-link %d round-trips / %.2fs, bulk %d round-trips / %.2fs",
+        PAGE_COUNT, LINKS_PER_PAGE,
+        per_link_graph.round_trips, per_link_seconds,
+        bulk_graph.round_trips, bulk_seconds,
+    )
+    link_count = falkordb_graph.query("MATCH (:WikiPage)-[link:LINKS_TO]->() RETURN count(link)").result_set[0][0]
+    assert_that(link_count, equal_to(PAGE_COUNT * LINKS_PER_PAGE), "Bulk writer should persist every link once")
+    assert_that(bulk_graph.round_trips, less_than(per_link_graph.round_trips), "Bulk writer should need fewer round-trips")
+
+
+def _save_entry_per_link(graph, entry: IndexEntry) -> None:
+    graph.query(
+        "MERGE (node:WikiPage {page_path: $page_path}) "
+        "SET node.abstract = $abstract, node.embedding = vecf32($embedding), node.user_id = $user_id",
+        {'page_path': entry.page_path, 'abstract': entry.abstract, 'embedding': entry.embedding, 'user_id': entry.user_id},
+    )
+    for link in entry.links:
+        graph.query(
+            "MATCH (source:WikiPage {page_path: $source_path}) "
+            "MERGE (target:WikiPage {page_path: $target_path}) "
+            "MERGE (source)-[:LINKS_TO]->(target)",
+            {'source_path': entry.page_path, 'target_path': link},
+        )
+
+
+def _build_entries(page_count: int, links_per_page: int) -> list[IndexEntry]:
+    return [
+        IndexEntry(
+            page_path=f"species/page-{index}.md",
+            abstract=f"Page {index}",
+            links=[f"species/page-{(index + offset) % page_count}.md" for offset in range(1, links_per_page + 1)],
+            embedding=[float(index % 7)] * 8,
+            content_hash=str(index),
+        )
+        for index in range(page_count)
+    ]
+
+
+@pytest.fixture
+def falkordb_graph():
+    falkordb = pytest.importorskip("falkordb")
+    try:
+        client = falkordb.FalkorDB(
+            host=os.getenv("FALKORDB_HOST", "localhost"),
+            port=int(os.getenv("FALKORDB_PORT", "6379")),
+        )
+        graph = client.select_graph("wiki_index_benchmark")
+        graph.query("MATCH (node:WikiPage) DETACH DELETE node")
+    except Exception as error:
+        pytest.skip(f"FalkorDB not reachable: {error}")
+    yield graph
+    graph.delete()
@@ -0,0 +1,99 @@
+import logging
+import os
+import time
+
+import numpy as np
+import pytest
+from hamcrest import assert_that, equal_to
+
+from knowledge_base.wiki_index.embedder import EMBEDDING_DIM
+from knowledge_base.wiki_index.entry import IndexEntry
+from knowledge_base.wiki_index.memory_index import InMemoryVectorIndex
+from knowledge_base.wiki_index.searcher import create_search_by_embedding
+from knowledge_base.wiki_index.store import create_save_entries, initialize_schema
+
+PAGE_COUNTS = [int(count) for count in os.getenv("BENCHMARK_INDEX_SIZES", "1000,10000,100000").split(",")]
+QUERY_COUNT = int(os.getenv("BENCHMARK_QUERY_COUNT", "50"))
+TOP_K = 5
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("page_count", PAGE_COUNTS)
+def should_search_in_memory_index(page_count):
+    entries, matrix = _build_corpus(page_count)
+    index = InMemoryVectorIndex()
+    index.load(entries, matrix)
+    queries = _queries()
+
+    latencies = _measure(lambda query: index.search(query, TOP_K, user_id="user-1"), queries)
+
+    logger.info("In-memory search over %d pages: p50 %.2fms, p95 %.2fms", page_count, *_percentiles(latencies))
+    assert_that(len(index.search(queries[0], TOP_K, user_id="user-1")), equal_to(TOP_K), "Should return exactly k results")
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("page_count", PAGE_COUNTS)
+def should_search_falkordb_index(page_count, falkordb_graph):
+    entries, matrix = _build_corpus(page_count)
+    initialize_schema(falkordb_graph)
+    for entry, embedding in zip(entries, matrix):
+        entry.embedding = embedding.tolist()
+    create_save_entries(falkordb_graph, batch_size=1000)(entries)
+    search_by_embedding = create_search_by_embedding(falkordb_graph)
+    queries = _queries()
+
+    latencies = _measure(lambda query: search_by_embedding(query, TOP_K, user_id="user-1"), queries)
+
+    logger.info("FalkorDB search over %d pages: p50 %.2fms, p95 %.2fms", page_count, *_percentiles(latencies))
+
+
+def _build_corpus(page_count: int) -> tuple[list[IndexEntry], np.ndarray]:
+    generator = np.random.default_rng(42)
+    matrix = generator.standard_normal((page_count, EMBEDDING_DIM), dtype=np.float32)
+    entries = [
+        IndexEntry(
+            page_path=f"page-{index}.md",
+            abstract=f"Page {index}",
+            links=[],
+            embedding=[],
+            user_id=f"user-{index % 20}" if index % 2 else None,
+        )
+        for index in range(page_count)
+    ]
+    return entries, matrix
+
+
+def _queries() -> list[list[float]]:
+    generator = np.random.default_rng(7)
+    return generator.standard_normal((QUERY_COUNT, EMBEDDING_DIM), dtype=np.float32).tolist()
+
+
+def _measure(search, queries) -> list[float]:
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _percentiles(latencies: list[float]) -> tuple[float, float]:
+    return float(np.percentile(latencies, 50)), float(np.percentile(latencies, 95))
+
+
+@pytest.fixture
+def falkordb_graph():
+    falkordb = pytest.importorskip("falkordb")
+    try:
+        client = falkordb.FalkorDB(
+            host=os.getenv("FALKORDB_HOST", "localhost"),
+            port=int(os.getenv("FALKORDB_PORT", "6379")),
+        )
+        graph = client.select_graph("wiki_index_search_benchmark")
+        graph.query("MATCH (node:WikiPage) DETACH DELETE node")
+    except Exception as error:
+        pytest.skip(f"FalkorDB not reachable: {error}")
+    yield graph
+    graph.delete()
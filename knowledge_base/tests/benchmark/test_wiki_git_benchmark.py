@@ -0,0 +1,72 @@
+import logging
+import os
+import shutil
+import subprocess
+import time
+
+import pytest
+from hamcrest import assert_that, less_than
+
+from knowledge_base.wiki_git import WikiRepository
+
+PAGES = int(os.getenv("BENCHMARK_WIKI_GIT_PAGES", "10000"))
+EDITED_PAGES = int(os.getenv("BENCHMARK_WIKI_GIT_EDITED_PAGES", "5"))
+COMMITS = int(os.getenv("BENCHMARK_WIKI_GIT_COMMITS", "20"))
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(shutil.which("git") is None, reason="baseline needs the git CLI")
+def should_commit_known_changes_faster_than_git_cli(tmp_path):
+    wiki_root = tmp_path / "wiki"
+    repository = WikiRepository(wiki_root)
+    repository.init()
+    pages = [f"species/page-{index:05d}.md" for index in range(PAGES)]
+    for page in pages:
+        (wiki_root / page).parent.mkdir(parents=True, exist_ok=True)
+        (wiki_root / page).write_text(f"# {page}\n\nContenido inicial.\n")
+    repository.commit_changes("seed")
+
+    def edit(round_number: int) -> list[str]:
+        edited = pages[round_number * EDITED_PAGES:(round_number + 1) * EDITED_PAGES]
+        for page in edited:
+            (wiki_root / page).write_text(f"# {page}\n\nRevisión {round_number}.\n")
+        return edited
+
+    started = time.perf_counter()
+    for round_number in range(COMMITS):
+        edit(round_number)
+        _git_cli_commit(wiki_root, f"cli {round_number}")
+    cli_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for round_number in range(COMMITS, 2 * COMMITS):
+        repository.commit_changes(f"known {round_number}", paths=edit(round_number))
+    known_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for round_number in range(2 * COMMITS, 3 * COMMITS):
+        edit(round_number)
+        repository.commit_changes(f"scan {round_number}")
+    scan_seconds = time.perf_counter() - started
+
+    logger.info(
+        "%d pages, %d commits of %d edits: git CLI %.3fs, known paths %.3fs, full scan %.3fs",
+        PAGES, COMMITS, EDITED_PAGES, cli_seconds, known_seconds, scan_seconds,
+    )
+    assert_that(known_seconds, less_than(cli_seconds), "Staging known paths should beat git add -A")
+
+
+def _git_cli_commit(wiki_root, message: str) -> list[str]:
+    """The previous subprocess sequence: add -A, diff --cached, commit, rev-parse, diff-tree."""
+    subprocess.run(["git", "add", "-A"], cwd=wiki_root, check=True, capture_output=True)
+    subprocess.run(["git", "diff", "--cached", "--quiet"], cwd=wiki_root, capture_output=True)
+    subprocess.run(["git", "commit", "-m", message], cwd=wiki_root, check=True, capture_output=True)
+    commit_hash = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=wiki_root, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return subprocess.run(
+        ["git", "diff-tree", "--no-commit-id", "-r", "--name-only", commit_hash],
+        cwd=wiki_root, check=True, capture_output=True, text=True,
+    ).stdout.split()
@@ -0,0 +1,60 @@
+import logging
+import os
+import shutil
+import time
+
+import pytest
+from hamcrest import assert_that, equal_to, less_than
+
+from knowledge_base.change_index import WIKI_TREE, ChangeIndex
+from knowledge_base.wiki_editor.tools.replace_in_pages import replace_in_pages
+from knowledge_base.wiki_editor.tools.search_pages import search_wiki_pages
+
+PAGES = int(os.getenv("BENCHMARK_WIKI_SEARCH_PAGES", "10000"))
+MISSPELLED_PAGES = int(os.getenv("BENCHMARK_WIKI_SEARCH_MISSPELLED_PAGES", "50"))
+PAGES_PER_CALL = 5
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.integration
+def should_bulk_replace_faster_with_text_index(tmp_path):
+    seed_root = tmp_path / "seed"
+    for index in range(PAGES):
+        name = "Biorren" if index % (PAGES // MISSPELLED_PAGES) == 0 else "Biogold"
+        page = seed_root / "species" / f"page-{index:05d}.md"
+        page.parent.mkdir(parents=True, exist_ok=True)
+        page.write_text(f"# Especie {index}\n\nAbonar con {name} en primavera.\n", encoding="utf-8")
+
+    scan_root = tmp_path / "scan"
+    shutil.copytree(seed_root, scan_root)
+    started = time.perf_counter()
+    search_wiki_pages("Biorren", scan_root)
+    scan_calls = _replace_until_done(scan_root, None)
+    scan_seconds = time.perf_counter() - started
+
+    indexed_root = tmp_path / "indexed"
+    shutil.copytree(seed_root, indexed_root)
+    change_index = ChangeIndex(tmp_path / "change_index.db", {WIKI_TREE: indexed_root})
+    change_index.reconcile(WIKI_TREE)
+    started = time.perf_counter()
+    search_wiki_pages("Biorren", indexed_root, change_index)
+    indexed_calls = _replace_until_done(indexed_root, change_index)
+    indexed_seconds = time.perf_counter() - started
+    change_index.close()
+
+    logger.info(
+        "%d pages, %d to fix in %d calls: full scan %.3fs, text index %.3fs",
+        PAGES, MISSPELLED_PAGES, indexed_calls, scan_seconds, indexed_seconds,
+    )
+    assert_that(indexed_calls, equal_to(scan_calls))
+    assert_that(indexed_seconds, less_than(scan_seconds / 10), "The text index should avoid reading every page")
+
+
+def _replace_until_done(wiki_root, change_index) -> int:
+    calls = 0
+    while True:
+        calls += 1
+        result = replace_in_pages("Biorren", "Biorend", wiki_root, PAGES_PER_CALL, change_index)
+        if "still have matches" not in result:
+            return calls
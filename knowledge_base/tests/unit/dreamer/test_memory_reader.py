@@ -0,0 +1,68 @@
+import functools
+import json
+
+import httpx
+import pytest
+from hamcrest import assert_that, equal_to
+
+from knowledge_base.dreamer import memory_reader
+from knowledge_base.dreamer.memory_reader import (
+    read_new_observations,
+    read_observations_cursor,
+    update_high_watermark,
+)
+
+
+async def should_stream_observations_and_return_last_cursor(tmp_path, episodic_memory):
+    episodic_memory.lines = [
+        {"user_id": "u1", "content": "Eren tiene ramas amarillas", "cursor": "c1"},
+        {"user_id": "u2", "content": "Riega por la mañana", "cursor": "c2"},
+    ]
+
+    observations, cursor = await read_new_observations("http://memory", tmp_path, limit=50)
+
+    assert_that(observations, equal_to([
+        {"user_id": "u1", "content": "Eren tiene ramas amarillas"},
+        {"user_id": "u2", "content": "Riega por la mañana"},
+    ]))
+    assert_that(cursor, equal_to("c2"), "Should resume after the last observation read")
+    assert_that(episodic_memory.requests[0].headers["accept"], equal_to("application/x-ndjson"))
+    assert_that(episodic_memory.requests[0].url.params["limit"], equal_to("50"))
+
+
+async def should_resume_from_persisted_cursor(tmp_path, episodic_memory):
+    update_high_watermark(tmp_path, observations_cursor="c2")
+
+    observations, cursor = await read_new_observations("http://memory", tmp_path)
+
+    params = episodic_memory.requests[0].url.params
+    assert_that(params.get("cursor"), equal_to("c2"), "Should page from the stored feed position")
+    assert_that("since" in params, equal_to(False))
+    assert_that((observations, cursor), equal_to(([], "c2")), "Should keep the cursor when nothing new arrived")
+
+
+def should_keep_stored_cursor_when_watermark_updates_without_one(tmp_path):
+    update_high_watermark(tmp_path, observations_cursor="c1")
+
+    update_high_watermark(tmp_path)
+
+    assert_that(read_observations_cursor(tmp_path), equal_to("c1"))
+
+
+class FakeEpisodicMemory:
+    def __init__(self):
+        self.lines: list[dict] = []
+        self.requests: list[httpx.Request] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = "".join(json.dumps(line) + "\n" for line in self.lines)
+        return httpx.Response(200, text=body, headers={"content-type": "application/x-ndjson"})
+
+
+@pytest.fixture
+def episodic_memory(monkeypatch):
+    fake = FakeEpisodicMemory()
+    client_class = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(fake.handle))
+    monkeypatch.setattr(memory_reader.httpx, "AsyncClient", client_class)
+    return fake
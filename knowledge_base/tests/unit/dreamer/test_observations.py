@@ -1,8 +1,13 @@
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from hamcrest import assert_that, equal_to, none, contains_string
 
-from knowledge_base.dreamer.observations import _build_observation_path, execute_integrate_observations
+from knowledge_base.dreamer.observations import (
+    _build_observation_path,
+    _create_batch_classify_func,
+    execute_integrate_observations,
+)
 
 
 def should_build_bonsai_path():
@@ -135,3 +140,126 @@ async def should_pass_existing_content_to_enrich_when_page_exists():
     call_args = enrich.call_args
     second_arg = call_args.args[1] if len(call_args.args) > 1 else call_args.kwargs.get("existing_content", "")
     assert_that(second_arg, contains_string("Contenido previo."))
+
+
+async def should_merge_observations_for_the_same_page_into_one_enrich_call():
+    classify = AsyncMock(return_value={"type": "bonsai", "entity_name": "Tanaka"})
+    enrich = AsyncMock(return_value="# Tanaka")
+    write_page = MagicMock()
+
+    await execute_integrate_observations(
+        observations=[
+            {"user_id": "user1", "content": "Tanaka tiene hojas amarillas"},
+            {"user_id": "user1", "content": "Tanaka fue trasplantado"},
+        ],
+        classify_observation=classify,
+        enrich_wiki_page=enrich,
+        read_wiki_page_func=MagicMock(return_value={"status": "not_found"}),
+        write_wiki_page_func=write_page,
+    )
+
+    assert_that(enrich.await_count, equal_to(1), "Observations for one page should be enriched together")
+    assert_that(enrich.call_args.args[2], equal_to("Tanaka tiene hojas amarillas\n\nTanaka fue trasplantado"))
+    write_page.assert_called_once_with(path="users/user1/bonsai/tanaka/index.md", content="# Tanaka")
+
+
+async def should_classify_observations_with_bounded_parallelism():
+    in_flight = 0
+    peak = 0
+
+    async def classify(content, user_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"type": "species", "entity_name": content}
+
+    write_page = MagicMock()
+
+    await execute_integrate_observations(
+        observations=[{"user_id": None, "content": f"especie {index}"} for index in range(10)],
+        classify_observation=classify,
+        enrich_wiki_page=AsyncMock(return_value="# Especie"),
+        read_wiki_page_func=MagicMock(return_value={"status": "not_found"}),
+        write_wiki_page_func=write_page,
+        concurrency=3,
+    )
+
+    assert_that(peak, equal_to(3), "Should run up to the concurrency bound at once")
+    assert_that(write_page.call_count, equal_to(10), "Should write every distinct page")
+
+
+async def should_classify_observations_in_batches():
+    classify_batch = AsyncMock(side_effect=lambda chunk: {
+        index: {"type": "species", "entity_name": obs["content"]} for index, obs in enumerate(chunk)
+    })
+    classify = AsyncMock()
+    write_page = MagicMock()
+
+    await execute_integrate_observations(
+        observations=[{"user_id": None, "content": f"especie {index}"} for index in range(5)],
+        classify_observation=classify,
+        enrich_wiki_page=AsyncMock(return_value="# Especie"),
+        read_wiki_page_func=MagicMock(return_value={"status": "not_found"}),
+        write_wiki_page_func=write_page,
+        classify_observations=classify_batch,
+        classify_batch_size=2,
+    )
+
+    assert_that(classify_batch.await_count, equal_to(3), "Should send observations batch_size at a time")
+    assert_that(classify.await_count, equal_to(0), "Should not classify individually when the batch answers all items")
+    assert_that(write_page.call_count, equal_to(5))
+
+
+async def should_fall_back_to_single_classification_when_batch_fails():
+    classify_batch = AsyncMock(side_effect=ValueError("Invalid batch classification JSON"))
+    classify = AsyncMock(return_value={"type": "bonsai", "entity_name": "Tanaka"})
+    write_page = MagicMock()
+
+    await execute_integrate_observations(
+        observations=[{"user_id": "user1", "content": "Tanaka tiene hojas amarillas"}],
+        classify_observation=classify,
+        enrich_wiki_page=AsyncMock(return_value="# Tanaka"),
+        read_wiki_page_func=MagicMock(return_value={"status": "not_found"}),
+        write_wiki_page_func=write_page,
+        classify_observations=classify_batch,
+    )
+
+    classify.assert_awaited_once_with("Tanaka tiene hojas amarillas", "user1")
+    write_page.assert_called_once_with(path="users/user1/bonsai/tanaka/index.md", content="# Tanaka")
+
+
+async def should_classify_individually_only_items_missing_from_batch_answer():
+    classify_batch = AsyncMock(return_value={0: {"type": "species", "entity_name": "ficus"}})
+    classify = AsyncMock(return_value={"type": "species", "entity_name": "pino"})
+
+    await execute_integrate_observations(
+        observations=[{"user_id": None, "content": "ficus"}, {"user_id": None, "content": "pino"}],
+        classify_observation=classify,
+        enrich_wiki_page=AsyncMock(return_value="# Especie"),
+        read_wiki_page_func=MagicMock(return_value={"status": "not_found"}),
+        write_wiki_page_func=MagicMock(),
+        classify_observations=classify_batch,
+    )
+
+    classify.assert_awaited_once_with("pino", None)
+
+
+async def should_parse_batch_classification_response():
+    agent = MagicMock()
+    prompt_template = MagicMock()
+    response = '```json\n{"classifications": [{"index": 1, "type": "pests", "entity_name": "pulgón"}, {"index": 7, "type": "ignore"}]}\n```'
+
+    with patch("knowledge_base.dreamer.observations._run_llm_for_text", AsyncMock(return_value=response)):
+        classify_observations = _create_batch_classify_func(agent, prompt_template)
+        result = await classify_observations([{"content": "a"}, {"content": "b"}])
+
+    assert_that(result, equal_to({1: {"type": "pests", "entity_name": "pulgón"}}), "Should keep only positions of the batch")
+
+
+async def should_reject_unparseable_batch_classification_response():
+    with patch("knowledge_base.dreamer.observations._run_llm_for_text", AsyncMock(return_value="no es JSON")):
+        classify_observations = _create_batch_classify_func(MagicMock(), MagicMock())
+        with pytest.raises(ValueError):
+            await classify_observations([{"content": "a"}])
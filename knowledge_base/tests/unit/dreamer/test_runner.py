@@ -6,6 +6,7 @@ import pytest
 from hamcrest import assert_that, equal_to
 
 from knowledge_base.dreamer.runner import (
+    CARDS_PHASE,
     _add_wikilinks,
     _enrich_from_knowledge_cards,
     _integrate_observations,
@@ -133,6 +134,27 @@ async def should_call_save_run_state_after_phases(mock_agent, mock_commit):
     assert_that(save_run_state.called, equal_to(True))
 
 
+async def should_read_only_inputs_of_selected_phases(mock_agent, mock_commit):
+    phases, mock_integrate = _make_phases(mock_agent)
+    read_observations = AsyncMock(return_value=[{"user_id": "u1", "content": "Eren tiene ramas amarillas"}])
+    save_run_state = Mock()
+    with patch("knowledge_base.dreamer.runner._run_phase") as run_phase:
+        await run_wiki_dreamer(
+            read_observations=read_observations,
+            read_new_cards=Mock(return_value=["junipero.md"]),
+            read_wikilinks_batch=Mock(return_value=["species/junipero.md"]),
+            read_last_run=Mock(return_value=_NOW),
+            **phases,
+            save_run_state=save_run_state,
+            commit_and_notify=mock_commit,
+            phases=frozenset({CARDS_PHASE}),
+        )
+
+    assert_that(read_observations.called, equal_to(False), "Should not consume the observation feed")
+    assert_that(_phases_run(mock_integrate, run_phase), equal_to(["enrich from knowledge cards"]))
+    assert_that(save_run_state.call_args.args[0], equal_to(frozenset({CARDS_PHASE})))
+
+
 @pytest.fixture
 def mock_agent():
     agent = MagicMock()
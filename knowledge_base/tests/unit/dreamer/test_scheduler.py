@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from knowledge_base.dreamer.runner import CARDS_PHASE, OBSERVATIONS_PHASE, WIKILINKS_PHASE
+from knowledge_base.dreamer.scheduler import WikiDreamerScheduler
+
+
+async def should_coalesce_burst_of_triggers_into_one_run(dreamer, scheduler):
+    scheduler.trigger(CARDS_PHASE)
+    scheduler.trigger(OBSERVATIONS_PHASE)
+    scheduler.trigger(CARDS_PHASE)
+
+    await asyncio.sleep(0.2)
+
+    assert_that(dreamer.runs, equal_to([frozenset({CARDS_PHASE, OBSERVATIONS_PHASE})]))
+
+
+async def should_not_run_while_nothing_is_triggered(dreamer, scheduler):
+    await asyncio.sleep(0.2)
+
+    assert_that(dreamer.runs, equal_to([]))
+
+
+async def should_run_triggers_received_during_a_run_afterwards(dreamer, scheduler):
+    dreamer.duration = 0.1
+    scheduler.trigger(CARDS_PHASE)
+    await asyncio.sleep(0.08)
+
+    scheduler.trigger(WIKILINKS_PHASE)
+    await asyncio.sleep(0.3)
+
+    assert_that(dreamer.runs, equal_to([frozenset({CARDS_PHASE}), frozenset({WIKILINKS_PHASE})]))
+
+
+async def should_never_overlap_manual_and_triggered_runs(dreamer, scheduler):
+    dreamer.duration = 0.1
+    scheduler.trigger(CARDS_PHASE)
+    await asyncio.sleep(0.06)
+
+    await scheduler.run_now()
+    await asyncio.sleep(0.1)
+
+    assert_that(dreamer.max_concurrent_runs, equal_to(1))
+    assert_that(len(dreamer.runs), equal_to(2))
+
+
+async def should_consume_pending_triggers_on_manual_run(dreamer, scheduler):
+    scheduler.trigger(CARDS_PHASE)
+
+    await scheduler.run_now()
+    await asyncio.sleep(0.2)
+
+    assert_that(len(dreamer.runs), equal_to(1), "The pending cards trigger should be covered by the manual run")
+    assert_that(scheduler.pending_phases, equal_to(frozenset()))
+
+
+class FakeDreamer:
+    def __init__(self):
+        self.runs: list[frozenset[str]] = []
+        self.duration = 0.0
+        self.active_runs = 0
+        self.max_concurrent_runs = 0
+
+    async def __call__(self, phases: frozenset[str]) -> None:
+        self.active_runs += 1
+        self.max_concurrent_runs = max(self.max_concurrent_runs, self.active_runs)
+        self.runs.append(phases)
+        await asyncio.sleep(self.duration)
+        self.active_runs -= 1
+
+
+@pytest.fixture
+def dreamer():
+    return FakeDreamer()
+
+
+@pytest.fixture
+async def scheduler(dreamer):
+    scheduler = WikiDreamerScheduler(dreamer, poll_interval_seconds=3600, debounce_seconds=0.05, max_delay_seconds=1)
+    scheduler.start()
+    yield scheduler
+    await scheduler.shutdown()
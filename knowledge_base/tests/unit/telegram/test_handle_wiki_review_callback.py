@@ -3,11 +3,13 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from hamcrest import assert_that, equal_to, empty
 
+from knowledge_base.change_index import CHANGE_INDEX_FILENAME, WIKI_TREE, ChangeIndex
 from knowledge_base.wiki_review_session import WikiReviewSession
 from knowledge_base.telegram.handle_wiki_review_callback import handle_wiki_review_callback
+from knowledge_base.wiki_git import WikiRepository
 
 
-async def should_call_send_page_diff_message_when_page_selected(review_session, wiki_review_sessions, send_page_diff_message, send_review_status, wiki_root):
+async def should_call_send_page_diff_message_when_page_selected(review_session, wiki_review_sessions, send_page_diff_message, send_review_status, wiki_root, wiki_repository):
     update = _make_update(f"wiki:select:{review_session.review_id}:0")
 
     await handle_wiki_review_callback(
@@ -18,6 +20,7 @@ async def should_call_send_page_diff_message_when_page_selected(review_session,
         send_review_status=send_review_status,
         wiki_root=str(wiki_root),
         admin_chat_id="admin_chat",
+        wiki_repository=wiki_repository,
     )
 
     send_page_diff_message.assert_awaited_once()
@@ -97,6 +100,30 @@ async def should_do_nothing_when_session_not_found(wiki_review_sessions, send_pa
     send_review_status.assert_not_called()
 
 
+async def should_record_reverted_page_in_change_index(wiki_root, wiki_repository, change_index, send_review_status):
+    page = wiki_root / "ficus.md"
+    page.write_text("# Ficus retusa")
+    wiki_repository.commit_changes("add ficus")
+    page.write_text("# Ficus microcarpa")
+    commit = wiki_repository.commit_changes("dreamer: update wiki pages")
+    change_index.record(WIKI_TREE, ["ficus.md"], uncommitted=False)
+    sessions = {"rev001": WikiReviewSession(review_id="rev001", commit_hash=commit.commit_hash, pending=["ficus.md"])}
+
+    await handle_wiki_review_callback(
+        update=_make_update("wiki:revert:rev001:0"),
+        context=MagicMock(),
+        wiki_review_sessions=sessions,
+        send_review_status=send_review_status,
+        wiki_root=str(wiki_root),
+        admin_chat_id="admin_chat",
+        wiki_repository=wiki_repository,
+        change_index=change_index,
+    )
+
+    assert_that(change_index.pages_containing([["retusa"]]), equal_to(["ficus.md"]),
+        "Page searches should see the reverted content")
+
+
 def _make_update(callback_data: str) -> MagicMock:
     query = MagicMock()
     query.data = callback_data
@@ -122,6 +149,20 @@ def wiki_root(tmp_path):
     return tmp_path
 
 
+@pytest.fixture
+def wiki_repository(wiki_root):
+    repository = WikiRepository(wiki_root)
+    repository.init()
+    return repository
+
+
+@pytest.fixture
+def change_index(wiki_root):
+    index = ChangeIndex(wiki_root / CHANGE_INDEX_FILENAME, {WIKI_TREE: wiki_root})
+    yield index
+    index.close()
+
+
 @pytest.fixture
 def review_session():
     return WikiReviewSession(
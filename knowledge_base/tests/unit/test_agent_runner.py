@@ -0,0 +1,65 @@
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.agents.llm_agent import Agent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from hamcrest import assert_that, empty, equal_to
+
+from knowledge_base.agent_runner import create_agent_runner
+
+
+class StubLlm(BaseLlm):
+    model: str = "stub"
+    fail: bool = False
+
+    async def generate_content_async(self, llm_request, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text="listo")]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(prompt_token_count=1, candidates_token_count=1),
+        )
+
+
+async def should_yield_model_text_on_each_run(session_service):
+    run_agent = create_agent_runner(Agent(model=StubLlm(), name="stub_agent", instruction="Responde"), session_service)
+
+    texts = []
+    for _ in range(3):
+        async for event in run_agent("hola", 3):
+            if event.content and event.content.parts and event.content.parts[0].text:
+                texts.append(event.content.parts[0].text)
+
+    assert_that(texts, equal_to(["listo"] * 3), "Should run the agent on every call of the shared runner")
+
+
+async def should_delete_session_after_each_run(session_service):
+    run_agent = create_agent_runner(Agent(model=StubLlm(), name="stub_agent", instruction="Responde"), session_service)
+
+    for _ in range(3):
+        async for _ in run_agent("hola", 3):
+            pass
+    remaining = await session_service.list_sessions(app_name="stub_agent")
+
+    assert_that(remaining.sessions, empty(), "Should not keep sessions of finished runs")
+
+
+async def should_delete_session_when_run_fails(session_service):
+    run_agent = create_agent_runner(
+        Agent(model=StubLlm(fail=True), name="failing_agent", instruction="Responde"), session_service
+    )
+
+    with pytest.raises(RuntimeError):
+        async for _ in run_agent("hola", 3):
+            pass
+    remaining = await session_service.list_sessions(app_name="failing_agent")
+
+    assert_that(remaining.sessions, empty(), "Should clean up the session of a failed run")
+
+
+@pytest.fixture
+def session_service():
+    return InMemorySessionService()
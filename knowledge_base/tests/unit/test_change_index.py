@@ -0,0 +1,121 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from knowledge_base.change_index import CARDS_TREE, WIKI_TREE, ChangeIndex
+from knowledge_base.wiki_git import WikiRepository
+
+
+def should_return_cards_written_since_timestamp(change_index, cards_root):
+    _write(cards_root / "old" / "v1.md", "# Vieja", mtime=1_000)
+    _write(cards_root / "new" / "v2.md", "# Nueva", mtime=2_000)
+    change_index.reconcile(CARDS_TREE)
+
+    new_cards = change_index.changed_since(CARDS_TREE, datetime.fromtimestamp(1_500, tz=timezone.utc))
+
+    assert_that(new_cards, equal_to(["new/v2.md"]))
+
+
+def should_list_pending_pages_in_path_order_up_to_limit(change_index, wiki_root):
+    for name in ["c.md", "a.md", "users/u1/notes.md", "b.md"]:
+        _write(wiki_root / name, f"# {name}")
+    change_index.reconcile(WIKI_TREE)
+
+    pending = change_index.pages_needing_wikilinks(2, excluded_prefixes=("users/",))
+
+    assert_that(pending, equal_to(["a.md", "b.md"]))
+
+
+def should_requeue_page_only_when_its_content_changes(change_index, wiki_root):
+    page = wiki_root / "species.md"
+    _write(page, "# Ficus", mtime=1_000)
+    change_index.reconcile(WIKI_TREE)
+    change_index.mark_wikilinks_processed(["species.md"])
+
+    _write(page, "# Ficus", mtime=2_000)
+    change_index.record(WIKI_TREE, ["species.md"])
+    assert_that(change_index.pages_needing_wikilinks(5), equal_to([]), "A touch without edits should not requeue")
+
+    _write(page, "# Ficus retusa", mtime=3_000)
+    change_index.record(WIKI_TREE, ["species.md"])
+    assert_that(change_index.pages_needing_wikilinks(5), equal_to(["species.md"]))
+
+
+def should_pick_up_committed_changes_from_git(change_index, wiki_root, wiki_repository):
+    _write(wiki_root / "kept.md", "# Kept")
+    _write(wiki_root / "gone.md", "# Gone")
+    wiki_repository.commit_changes("add pages")
+    change_index.sync_git()
+    change_index.mark_wikilinks_processed(["kept.md", "gone.md"])
+
+    (wiki_root / "gone.md").unlink()
+    _write(wiki_root / "added.md", "# Added")
+    wiki_repository.commit_changes("edit pages")
+    change_index.sync_git()
+
+    assert_that(change_index.pages_needing_wikilinks(5), equal_to(["added.md"]))
+    assert_that(list(change_index.wikilinks_processed()), equal_to(["kept.md"]))
+
+
+def should_remove_rows_for_files_deleted_while_offline(change_index, cards_root):
+    _write(cards_root / "v1.md", "# Card")
+    change_index.reconcile(CARDS_TREE)
+
+    (cards_root / "v1.md").unlink()
+    change_index.reconcile(CARDS_TREE)
+
+    assert_that(change_index.changed_since(CARDS_TREE, datetime.fromtimestamp(0, tz=timezone.utc)), equal_to([]))
+
+
+def should_find_pages_by_indexed_text_as_it_changes(change_index, wiki_root):
+    _write(wiki_root / "ficus.md", "# Ficus retusa", mtime=1_000)
+    _write(wiki_root / "olea.md", "# Olea europaea")
+    change_index.reconcile(WIKI_TREE)
+
+    _write(wiki_root / "ficus.md", "# Ficus microcarpa", mtime=2_000)
+    change_index.record(WIKI_TREE, ["ficus.md"])
+    change_index.remove(WIKI_TREE, ["olea.md"])
+
+    assert_that(change_index.pages_containing([["RETUSA"], ["europaea"]]), equal_to([]))
+    assert_that(change_index.pages_containing([["ficus", "microcarpa"]]), equal_to(["ficus.md"]))
+
+
+def _write(path, content, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def wiki_root(tmp_path):
+    root = tmp_path / "wiki"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture
+def cards_root(tmp_path):
+    root = tmp_path / "transcripts" / "cards"
+    root.mkdir(parents=True)
+    return root
+
+
+@pytest.fixture
+def wiki_repository(wiki_root):
+    repository = WikiRepository(wiki_root)
+    repository.init()
+    return repository
+
+
+@pytest.fixture
+def change_index(tmp_path, wiki_root, cards_root, wiki_repository):
+    index = ChangeIndex(
+        tmp_path / "change_index.db",
+        {WIKI_TREE: wiki_root, CARDS_TREE: cards_root},
+        {WIKI_TREE: wiki_repository},
+    )
+    yield index
+    index.close()
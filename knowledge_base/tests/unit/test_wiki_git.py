@@ -3,107 +3,162 @@ import subprocess
 import pytest
 from hamcrest import assert_that, equal_to, not_none, none, contains_string
 
-from knowledge_base.wiki_git import (
-    commit_wiki_changes,
-    get_changed_files,
-    get_page_diff,
-    init_wiki_repo,
-    revert_page,
-)
+from knowledge_base.wiki_git import WikiRepository
 
 
 def should_create_git_repo_when_directory_has_no_git(wiki_root):
-    init_wiki_repo(wiki_root)
+    WikiRepository(wiki_root).init()
 
-    assert_that((wiki_root / ".git").exists(), equal_to(True), "init_wiki_repo should create a .git directory")
+    assert_that((wiki_root / ".git").exists(), equal_to(True), "init should create a .git directory")
 
 
 def should_not_fail_when_repo_already_initialized(wiki_root):
-    init_wiki_repo(wiki_root)
-    init_wiki_repo(wiki_root)
+    WikiRepository(wiki_root).init()
+    WikiRepository(wiki_root).init()
 
     assert_that((wiki_root / ".git").exists(), equal_to(True), "Calling init twice should leave repo intact")
 
 
-def should_return_none_when_nothing_to_commit(wiki_root):
-    init_wiki_repo(wiki_root)
-
-    result = commit_wiki_changes(wiki_root, "empty commit")
+def should_return_none_when_nothing_to_commit(repository):
+    result = repository.commit_changes("empty commit")
 
     assert_that(result, none(), "Should return None when there are no staged changes")
 
 
-def should_return_commit_hash_when_changes_exist(wiki_root):
-    init_wiki_repo(wiki_root)
+def should_return_commit_when_changes_exist(repository, wiki_root):
+    (wiki_root / "page.md").write_text("# New page")
+
+    commit = repository.commit_changes("add page")
+
+    assert_that(commit, not_none(), "Should return the commit when changes are committed")
+
+
+def should_return_full_commit_hash(repository, wiki_root):
     (wiki_root / "page.md").write_text("# New page")
 
-    commit_hash = commit_wiki_changes(wiki_root, "add page")
+    commit = repository.commit_changes("add page")
 
-    assert_that(commit_hash, not_none(), "Should return a commit hash when changes are committed")
-    assert_that(len(commit_hash), equal_to(40), "Commit hash should be 40 hex characters")
+    assert_that(len(commit.commit_hash), equal_to(40), "Commit hash should be 40 hex characters")
 
 
-def should_list_files_changed_in_commit(wiki_root):
-    init_wiki_repo(wiki_root)
+def should_return_files_changed_by_commit(repository, wiki_root):
+    (wiki_root / "page.md").write_text("# New page")
+
+    commit = repository.commit_changes("add page")
+
+    assert_that(commit.changed_files, equal_to(["page.md"]), "Should report the committed file")
+
+
+def should_list_files_changed_in_commit(repository, wiki_root):
     (wiki_root / "species.md").write_text("# Ficus")
     (wiki_root / "techniques.md").write_text("# Wiring")
-    commit_hash = commit_wiki_changes(wiki_root, "add two pages")
+    commit = repository.commit_changes("add two pages")
 
-    changed = get_changed_files(wiki_root, commit_hash)
+    changed = repository.changed_files(commit.commit_hash)
 
     assert_that(sorted(changed), equal_to(["species.md", "techniques.md"]),
         "Should list all files added in the commit")
 
 
-def should_return_diff_for_modified_page(wiki_root):
-    init_wiki_repo(wiki_root)
+def should_return_diff_for_modified_page(repository, wiki_root):
     page = wiki_root / "page.md"
     page.write_text("# Original content")
-    commit_wiki_changes(wiki_root, "initial")
+    repository.commit_changes("initial")
     page.write_text("# Original content\n\n## New section")
-    commit_hash = commit_wiki_changes(wiki_root, "add section")
+    commit_hash = repository.commit_changes("add section").commit_hash
 
-    diff = get_page_diff(wiki_root, "page.md", commit_hash)
+    diff = repository.page_diff("page.md", commit_hash)
 
     assert_that(diff, contains_string("New section"), "Diff should contain the added content")
 
 
-def should_return_empty_string_when_page_not_in_commit(wiki_root):
-    init_wiki_repo(wiki_root)
+def should_return_empty_string_when_page_not_in_commit(repository, wiki_root):
     (wiki_root / "other.md").write_text("# Other")
-    commit_hash = commit_wiki_changes(wiki_root, "add other")
+    commit_hash = repository.commit_changes("add other").commit_hash
 
-    diff = get_page_diff(wiki_root, "page.md", commit_hash)
+    diff = repository.page_diff("page.md", commit_hash)
 
     assert_that(diff.strip(), equal_to(""), "Diff should be empty for unmodified page")
 
 
-def should_restore_page_to_previous_version_on_revert(wiki_root):
-    init_wiki_repo(wiki_root)
+def should_restore_page_to_previous_version_on_revert(repository, wiki_root):
     page = wiki_root / "page.md"
     page.write_text("# Version 1")
-    commit_wiki_changes(wiki_root, "initial")
+    repository.commit_changes("initial")
     page.write_text("# Version 2")
-    commit_hash = commit_wiki_changes(wiki_root, "update")
+    commit_hash = repository.commit_changes("update").commit_hash
 
-    revert_page(wiki_root, "page.md", commit_hash)
+    repository.revert_page("page.md", commit_hash)
 
     assert_that(page.read_text(), equal_to("# Version 1"),
         "Page should be restored to its content before the given commit")
 
 
-def should_delete_page_when_reverting_its_creation(wiki_root):
-    init_wiki_repo(wiki_root)
+def should_delete_page_when_reverting_its_creation(repository, wiki_root):
     page = wiki_root / "new_page.md"
     page.write_text("# Brand new")
-    commit_hash = commit_wiki_changes(wiki_root, "create page")
+    commit_hash = repository.commit_changes("create page").commit_hash
 
-    revert_page(wiki_root, "new_page.md", commit_hash)
+    repository.revert_page("new_page.md", commit_hash)
 
     assert_that(page.exists(), equal_to(False),
         "Page should be deleted when reverting its creation commit")
 
 
+def should_commit_only_given_paths(repository, wiki_root):
+    (wiki_root / "kept.md").write_text("# Kept")
+    (wiki_root / "gone.md").write_text("# Gone")
+    repository.commit_changes("initial")
+    (wiki_root / "kept.md").write_text("# Kept v2")
+    (wiki_root / "gone.md").unlink()
+    (wiki_root / "unrelated.md").write_text("# Not staged")
+
+    commit = repository.commit_changes("known changes", paths=["kept.md", "gone.md"])
+
+    assert_that(commit.changed_files, equal_to(["gone.md", "kept.md"]), "Should commit only the given paths")
+
+
+def should_leave_paths_not_given_for_a_full_commit(repository, wiki_root):
+    (wiki_root / "kept.md").write_text("# Kept")
+    repository.commit_changes("initial")
+    (wiki_root / "kept.md").write_text("# Kept v2")
+    (wiki_root / "unrelated.md").write_text("# Not staged")
+    repository.commit_changes("known changes", paths=["kept.md"])
+
+    commit = repository.commit_changes("rest")
+
+    assert_that(commit.changed_files, equal_to(["unrelated.md"]),
+        "Paths not given should stay uncommitted until a full commit")
+
+
+def should_keep_git_index_in_sync_with_commits(repository, wiki_root):
+    (wiki_root / "kept.md").write_text("# Kept")
+    (wiki_root / "gone.md").write_text("# Gone")
+    repository.commit_changes("initial")
+    (wiki_root / "kept.md").write_text("# Kept v2")
+    (wiki_root / "gone.md").unlink()
+    repository.commit_changes("known changes", paths=["kept.md", "gone.md"])
+
+    status = subprocess.run(
+        ["git", "status", "--porcelain"], cwd=wiki_root, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert_that(status, equal_to(""), "The git CLI should see a clean tree after a commit")
+
+
+def should_not_commit_local_state_files(repository, wiki_root):
+    (wiki_root / ".change_index.db").write_bytes(b"sqlite")
+
+    assert_that(repository.commit_changes("state only"), none(), "Should never commit local bookkeeping files")
+
+
+@pytest.fixture
+def repository(wiki_root):
+    repository = WikiRepository(wiki_root)
+    repository.init()
+    return repository
+
+
 @pytest.fixture
 def wiki_root(tmp_path):
     subprocess.run(
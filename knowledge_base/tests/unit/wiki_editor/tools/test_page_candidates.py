@@ -0,0 +1,55 @@
+import pytest
+from hamcrest import assert_that, equal_to, none
+
+from knowledge_base.change_index import WIKI_TREE, ChangeIndex
+from knowledge_base.wiki_editor.tools.page_candidates import candidate_pages, required_literals
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("Biorren", [["Biorren"]]),
+    ("error.*página", [["error", "página"]]),
+    (r"\bficus\b|olea", [["ficus"], ["olea"]]),
+    ("(?:acer)+ palmatum?", [["acer", " palmatu"]]),
+])
+def should_extract_literals_every_match_contains(pattern, expected):
+    assert_that(required_literals(pattern), equal_to(expected))
+
+
+@pytest.mark.parametrize("pattern", [r"\d+", "ab|cde", "(?:ficus)?", "[invalid", r"\x66icus", "(?x) f i c u s"])
+def should_not_narrow_patterns_without_required_literals(pattern):
+    assert_that(required_literals(pattern), none())
+
+
+def should_read_only_pages_containing_the_literals(wiki_root, change_index):
+    (wiki_root / "species").mkdir()
+    (wiki_root / "species" / "ficus.md").write_text("# FICUS retusa", encoding="utf-8")
+    (wiki_root / "olea.md").write_text("# Olea europaea", encoding="utf-8")
+    change_index.reconcile(WIKI_TREE)
+
+    candidates = candidate_pages(r"ficus\s+retusa", wiki_root, change_index)
+
+    assert_that(candidates, equal_to([wiki_root.resolve() / "species" / "ficus.md"]))
+
+
+def should_fall_back_to_every_page_without_literals(wiki_root, change_index):
+    (wiki_root / "a.md").write_text("uno", encoding="utf-8")
+    (wiki_root / "b.md").write_text("dos", encoding="utf-8")
+    change_index.reconcile(WIKI_TREE)
+
+    candidates = candidate_pages(r"\w+", wiki_root, change_index)
+
+    assert_that(candidates, equal_to([wiki_root.resolve() / "a.md", wiki_root.resolve() / "b.md"]))
+
+
+@pytest.fixture
+def wiki_root(tmp_path):
+    root = tmp_path / "wiki"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture
+def change_index(tmp_path, wiki_root):
+    index = ChangeIndex(tmp_path / "change_index.db", {WIKI_TREE: wiki_root})
+    yield index
+    index.close()
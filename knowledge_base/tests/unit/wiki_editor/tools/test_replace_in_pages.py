@@ -1,5 +1,6 @@
-from hamcrest import assert_that, contains_string, not_
+from hamcrest import assert_that, contains_string, equal_to, not_
 
+from knowledge_base.change_index import WIKI_TREE, ChangeIndex
 from knowledge_base.wiki_editor.tools.replace_in_pages import replace_in_pages
 
 
@@ -80,3 +81,18 @@ def test_should_replace_all_occurrences_within_a_page(tmp_path):
 
     content = (tmp_path / "page.md").read_text(encoding="utf-8")
     assert content.count("Biorend") == 2, "Should replace all occurrences within a page"
+
+
+def test_should_only_read_pending_pages_on_repeated_calls(tmp_path):
+    wiki_root = tmp_path / "wiki"
+    wiki_root.mkdir()
+    for i in range(4):
+        (wiki_root / f"page-{i}.md").write_text("Biorren aquí.", encoding="utf-8")
+    change_index = ChangeIndex(tmp_path / "change_index.db", {WIKI_TREE: wiki_root})
+    change_index.reconcile(WIKI_TREE)
+
+    replace_in_pages("Biorren", "Biorend", wiki_root, max_pages=3, change_index=change_index)
+
+    assert_that(change_index.pages_containing([["Biorren"]]), equal_to(["page-3.md"]),
+        "Fixed pages should be re-indexed so the next call skips them")
+    change_index.close()
@@ -61,3 +61,14 @@ def test_should_include_line_numbers(tmp_path):
     result = search_wiki_pages("Biorren", tmp_path)
 
     assert_that(result, contains_string(":2:"), "Should include line number in output")
+
+
+def test_should_return_next_results_from_offset(tmp_path):
+    (tmp_path / "page.md").write_text("\n".join(f"Biorren {i}" for i in range(5)), encoding="utf-8")
+
+    first = search_wiki_pages("Biorren", tmp_path, limit=2)
+    second = search_wiki_pages("Biorren", tmp_path, offset=2, limit=2)
+
+    assert_that(first, contains_string("offset=2"), "Should tell where the next batch starts")
+    assert_that(second, contains_string("page.md:3:Biorren 2"), "Should continue after the first batch")
+    assert_that(second, not_(contains_string("Biorren 1")), "Should not repeat earlier results")
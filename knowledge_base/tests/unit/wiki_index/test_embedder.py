@@ -0,0 +1,87 @@
+import numpy as np
+from hamcrest import assert_that, equal_to, contains_exactly
+
+from knowledge_base.wiki_index.embedder import create_embedder, normalize_embedding_text
+
+
+class FakeEmbeddingModel:
+    def __init__(self):
+        self.calls = []
+
+    def embed(self, texts, batch_size=256):
+        self.calls.append(list(texts))
+        for text in texts:
+            yield np.array([float(len(text)), 1.0], dtype=np.float32)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def should_serve_repeated_query_from_cache():
+    model = FakeEmbeddingModel()
+    embed_text, _ = create_embedder(model=model)
+
+    first = await embed_text("ficus retusa")
+    second = await embed_text("ficus retusa")
+
+    assert_that(second, equal_to(first), "Should return the same embedding for a repeated query")
+    assert_that(len(model.calls), equal_to(1), "Should call the model only once for a repeated query")
+
+
+async def should_share_cache_entry_for_whitespace_variants():
+    model = FakeEmbeddingModel()
+    embed_text, _ = create_embedder(model=model)
+
+    await embed_text("  ficus   retusa ")
+    await embed_text("ficus retusa")
+
+    assert_that(model.calls, contains_exactly(["ficus retusa"]), "Should normalize text before embedding and caching")
+
+
+async def should_recompute_embedding_after_ttl_expires():
+    model = FakeEmbeddingModel()
+    clock = FakeClock()
+    embed_text, _ = create_embedder(model=model, cache_ttl_seconds=10, clock=clock)
+
+    await embed_text("pino")
+    clock.now = 11
+    await embed_text("pino")
+
+    assert_that(len(model.calls), equal_to(2), "Should call the model again once the cached entry expires")
+
+
+async def should_evict_least_recently_used_entry_when_full():
+    model = FakeEmbeddingModel()
+    embed_text, _ = create_embedder(model=model, cache_size=2)
+
+    await embed_text("a")
+    await embed_text("b")
+    await embed_text("a")
+    await embed_text("c")
+    await embed_text("a")
+    await embed_text("b")
+
+    assert_that(model.calls, contains_exactly(["a"], ["b"], ["c"], ["b"]), "Should evict the least recently used query")
+
+
+async def should_embed_many_texts_in_batches():
+    model = FakeEmbeddingModel()
+    _, embed_many = create_embedder(model=model, batch_size=2)
+
+    embeddings = await embed_many(["uno", "dos", "tres"])
+
+    assert_that(model.calls, contains_exactly(["uno", "dos"], ["tres"]), "Should send texts to the model in chunks of batch_size")
+    assert_that([embedding[0] for embedding in embeddings], contains_exactly(3.0, 3.0, 4.0), "Should keep embeddings in input order")
+
+
+def should_normalize_unicode_and_whitespace():
+    decomposed = "acer palmatum\n\tcan\u0303o\u0301n"
+
+    normalized = normalize_embedding_text(decomposed)
+
+    assert_that(normalized, equal_to("acer palmatum ca\u00f1\u00f3n"), "Should apply NFC and collapse whitespace")
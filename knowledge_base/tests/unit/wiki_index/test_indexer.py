@@ -1,6 +1,7 @@
-from hamcrest import assert_that, equal_to, none
+from hamcrest import assert_that, contains_inanyorder, equal_to, none
 
-from knowledge_base.wiki_index.indexer import _extract_user_id_from_path
+from knowledge_base.wiki_index.entry import compute_content_hash
+from knowledge_base.wiki_index.indexer import _extract_user_id_from_path, build_full_index, update_pages_index
 
 
 def should_extract_user_id_from_user_scoped_path():
@@ -33,3 +34,124 @@ def should_extract_user_id_from_species_notes_path():
     user_id = _extract_user_id_from_path(page_path)
 
     assert_that(user_id, equal_to("abc456"), "Should extract user_id from user species-notes path")
+
+
+
+async def should_embed_all_pages_in_one_batch_when_embed_many_is_given(tmp_path):
+    _write_page(tmp_path, "species/ficus.md", "# Ficus\n\nFicus retusa care.\n")
+    _write_page(tmp_path, "species/pino.md", "# Pino\n\nPinus thunbergii care.\n")
+    batches = []
+    saved = []
+
+    async def embed_many(texts):
+        batches.append(texts)
+        return [[float(index)] for index in range(len(texts))]
+
+    report = await build_full_index(tmp_path, _fail_embed, saved.append, embed_many=embed_many)
+
+    assert_that(report.added, equal_to(2), "Should report every new page as added")
+    assert_that(len(batches), equal_to(1), "Should embed all abstracts in a single batched call")
+    assert_that(sorted(entry.page_path for entry in saved), equal_to(["species/ficus.md", "species/pino.md"]), "Should save one entry per page")
+
+
+async def should_only_embed_new_and_changed_pages(tmp_path):
+    _write_page(tmp_path, "species/ficus.md", "# Ficus\n\nFicus retusa care.\n")
+    _write_page(tmp_path, "species/pino.md", "# Pino\n\nPinus thunbergii care, updated.\n")
+    _write_page(tmp_path, "species/olmo.md", "# Olmo\n\nUlmus parvifolia care.\n")
+    stored_hashes = {
+        "species/ficus.md": compute_content_hash("# Ficus\n\nFicus retusa care.\n"),
+        "species/pino.md": compute_content_hash("# Pino\n\nPinus thunbergii care.\n"),
+    }
+    saved = []
+
+    report = await build_full_index(
+        tmp_path, _fake_embed, saved.append, load_content_hashes=lambda: stored_hashes
+    )
+
+    assert_that(sorted(entry.page_path for entry in saved), equal_to(["species/olmo.md", "species/pino.md"]), "Should save only new or changed pages")
+    assert_that((report.added, report.updated, report.unchanged), equal_to((1, 1, 1)), "Should count added, updated and unchanged pages")
+
+
+async def should_delete_entries_for_pages_removed_from_disk(tmp_path):
+    _write_page(tmp_path, "species/ficus.md", "# Ficus\n\nFicus retusa care.\n")
+    stored_hashes = {
+        "species/ficus.md": compute_content_hash("# Ficus\n\nFicus retusa care.\n"),
+        "species/acer.md": "stale",
+    }
+    deleted = []
+
+    report = await build_full_index(
+        tmp_path, _fake_embed, lambda entry: None,
+        load_content_hashes=lambda: stored_hashes,
+        delete_entries=deleted.extend,
+    )
+
+    assert_that(deleted, equal_to(["species/acer.md"]), "Should delete nodes whose page no longer exists")
+    assert_that(report.deleted, equal_to(1), "Should report the deleted page")
+
+
+async def should_delete_entries_for_pages_whose_abstract_became_empty(tmp_path):
+    _write_page(tmp_path, "species/ficus.md", "# Ficus\n\nFicus retusa care.\n")
+    _write_page(tmp_path, "species/acer.md", "")
+    stored_hashes = {
+        "species/ficus.md": compute_content_hash("# Ficus\n\nFicus retusa care.\n"),
+        "species/acer.md": compute_content_hash("# Acer\n\nAcer palmatum care.\n"),
+    }
+    deleted = []
+
+    await build_full_index(
+        tmp_path, _fake_embed, lambda entry: None,
+        load_content_hashes=lambda: stored_hashes,
+        delete_entries=deleted.extend,
+    )
+
+    assert_that(deleted, equal_to(["species/acer.md"]), "Should delete nodes of pages that no longer have an abstract")
+
+
+async def should_store_content_hash_on_saved_entries(tmp_path):
+    content = "# Ficus\n\nFicus retusa care.\n"
+    _write_page(tmp_path, "species/ficus.md", content)
+    saved = []
+
+    await build_full_index(tmp_path, _fake_embed, saved.append)
+
+    assert_that(saved[0].content_hash, equal_to(compute_content_hash(content)), "Should persist the page content hash")
+
+
+async def should_write_changed_pages_with_bulk_save_entries(tmp_path):
+    for index in range(5):
+        _write_page(tmp_path, f"species/page-{index}.md", f"# Page {index}\n\nBody {index}.\n")
+    bulk_calls = []
+
+    await build_full_index(
+        tmp_path, _fake_embed, save_entries=bulk_calls.append, batch_size=2
+    )
+
+    assert_that([len(call) for call in bulk_calls], contains_inanyorder(2, 2, 1), "Should save each batch with one bulk call")
+
+
+async def should_index_existing_pages_with_one_bulk_call(tmp_path):
+    _write_page(tmp_path, "species/ficus.md", "# Ficus\n\nFicus retusa care.\n")
+    _write_page(tmp_path, "species/pino.md", "# Pino\n\nPinus thunbergii care.\n")
+    bulk_calls = []
+
+    count = await update_pages_index(
+        ["species/ficus.md", "species/pino.md", "species/missing.md"], tmp_path, _fake_embed, bulk_calls.append
+    )
+
+    assert_that(count, equal_to(2), "Should skip pages that no longer exist")
+    assert_that(len(bulk_calls), equal_to(1), "Should persist all changed pages in a single bulk call")
+
+
+def _write_page(wiki_root, page_path, content):
+    full_path = wiki_root / page_path
+    full_path.parent.mkdir(parents=True, exist_ok=True)
+    full_path.write_text(content, encoding="utf-8")
+
+
+async def _fake_embed(text):
+    return [0.1, 0.2]
+
+
+async def _fail_embed(text):
+    raise AssertionError("Should not embed pages one by one")
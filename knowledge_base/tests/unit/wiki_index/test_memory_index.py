@@ -0,0 +1,88 @@
+import numpy as np
+from hamcrest import assert_that, equal_to, contains_exactly, has_length
+
+from knowledge_base.wiki_index.entry import IndexEntry
+from knowledge_base.wiki_index.memory_index import InMemoryVectorIndex
+
+
+def should_return_most_similar_pages_first():
+    index = _index_with([
+        _entry("a.md", [1.0, 0.0]),
+        _entry("b.md", [0.0, 1.0]),
+        _entry("c.md", [0.7, 0.7]),
+    ])
+
+    results = index.search([1.0, 0.1], top_k=2)
+
+    assert_that([page_path for page_path, _, _ in results], contains_exactly("a.md", "c.md"), "Should rank by cosine similarity")
+
+
+def should_return_exactly_k_results_when_user_pages_dominate():
+    entries = [_entry(f"users/u2/{index}.md", [1.0, 0.0], user_id="u2") for index in range(10)]
+    entries += [_entry(f"global-{index}.md", [0.0, 1.0]) for index in range(3)]
+    index = _index_with(entries)
+
+    results = index.search([1.0, 0.0], top_k=3, user_id="u1")
+
+    assert_that(results, has_length(3), "Should filter other users' pages before picking top-k")
+    assert_that({page_path for page_path, _, _ in results}, equal_to({"global-0.md", "global-1.md", "global-2.md"}), "Should only return visible pages")
+
+
+def should_include_own_pages_for_user():
+    index = _index_with([
+        _entry("global.md", [0.0, 1.0]),
+        _entry("users/u1/mine.md", [1.0, 0.0], user_id="u1"),
+    ])
+
+    results = index.search([1.0, 0.0], top_k=1, user_id="u1")
+
+    assert_that(results[0][0], equal_to("users/u1/mine.md"), "Should search the user's own pages too")
+
+
+def should_exclude_user_pages_for_global_search():
+    index = _index_with([
+        _entry("global.md", [0.0, 1.0]),
+        _entry("users/u1/mine.md", [1.0, 0.0], user_id="u1"),
+    ])
+
+    results = index.search([1.0, 0.0], top_k=5)
+
+    assert_that([page_path for page_path, _, _ in results], contains_exactly("global.md"), "Should only return global pages without user_id")
+
+
+def should_replace_existing_entry_on_upsert():
+    index = _index_with([_entry("a.md", [1.0, 0.0]), _entry("b.md", [0.0, 1.0])])
+
+    index.upsert([_entry("a.md", [0.0, 1.0], abstract="updated")])
+
+    results = index.search([0.0, 1.0], top_k=2)
+    assert_that(len(index), equal_to(2), "Should not duplicate upserted pages")
+    assert_that(results[0][2], equal_to(1.0), "Should use the new embedding")
+
+
+def should_grow_beyond_initial_capacity():
+    index = InMemoryVectorIndex(dim=2, initial_capacity=2)
+
+    index.upsert([_entry(f"{number}.md", [1.0, float(number)]) for number in range(5)])
+
+    assert_that(index.search([1.0, 4.0], top_k=1)[0][0], equal_to("4.md"), "Should keep all rows after growing")
+
+
+def should_remove_entries():
+    index = _index_with([_entry("a.md", [1.0, 0.0]), _entry("b.md", [0.0, 1.0]), _entry("c.md", [0.5, 0.5])])
+
+    index.remove(["a.md"])
+
+    results = index.search([1.0, 0.0], top_k=5)
+    assert_that([page_path for page_path, _, _ in results], contains_exactly("c.md", "b.md"), "Should no longer return removed pages")
+
+
+def _index_with(entries: list[IndexEntry]) -> InMemoryVectorIndex:
+    index = InMemoryVectorIndex(dim=2)
+    matrix = np.asarray([entry.embedding for entry in entries], dtype=np.float32)
+    index.load(entries, matrix)
+    return index
+
+
+def _entry(page_path: str, embedding: list[float], user_id: str | None = None, abstract: str = "abstract") -> IndexEntry:
+    return IndexEntry(page_path=page_path, abstract=abstract, links=[], embedding=embedding, user_id=user_id)
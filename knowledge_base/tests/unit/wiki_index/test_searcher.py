@@ -3,6 +3,8 @@ from unittest.mock import MagicMock
 import pytest
 from hamcrest import assert_that, equal_to, close_to
 
+from knowledge_base.wiki_index.entry import IndexEntry
+from knowledge_base.wiki_index.memory_index import InMemoryVectorIndex
 from knowledge_base.wiki_index.searcher import create_search_by_embedding
 
 
@@ -58,6 +60,17 @@ def should_restrict_to_global_pages_when_user_id_is_none(graph):
     assert_that("user_id IS NULL" in call_args[0][0], equal_to(True), "Query should restrict to global pages when user_id is None")
 
 
+def should_answer_from_in_memory_index_without_querying_graph(graph):
+    vector_index = InMemoryVectorIndex(dim=2)
+    vector_index.upsert([IndexEntry(page_path="page.md", abstract="Content", links=[], embedding=[1.0, 0.0])])
+    search_by_embedding = create_search_by_embedding(graph, vector_index=vector_index)
+
+    results = search_by_embedding([1.0, 0.0], top_k=1)
+
+    assert_that(results[0][0], equal_to("page.md"), "Should return the in-memory match")
+    assert_that(graph.query.call_count, equal_to(0), "Should not make a FalkorDB round-trip")
+
+
 @pytest.fixture
 def graph():
     mock = MagicMock()
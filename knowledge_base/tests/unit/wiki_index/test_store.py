@@ -1,11 +1,19 @@
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
-from falkordb.node import Node
 from hamcrest import assert_that, equal_to, none, is_
 
 from knowledge_base.wiki_index.entry import IndexEntry
-from knowledge_base.wiki_index.store import create_save_entry, create_load_entry, create_load_all_entries
+from knowledge_base.wiki_index.store import (
+    create_save_entry,
+    create_save_entries,
+    create_load_entry,
+    create_load_all_entries,
+    create_load_content_hashes,
+    create_delete_entries,
+    create_load_embedding_matrix,
+)
 
 
 def should_save_entry_merges_node_and_links(graph):
@@ -19,27 +27,41 @@ def should_save_entry_merges_node_and_links(graph):
 
     save_entry(entry)
 
-    assert_that(graph.query.call_count, equal_to(2), "Should call query once for node merge and once for each link")
+    assert_that(graph.query.call_count, equal_to(1), "Should merge node and replace its links in a single query")
 
 
-def should_load_entry_returns_entry_when_found(graph):
-    node = Node(properties={
-        'page_path': 'species/ficus.md',
-        'abstract': 'Ficus retusa is a tropical species.',
-        'embedding': [0.1, 0.2, 0.3],
-        'user_id': None,
-    })
-    links_result = MagicMock()
-    links_result.result_set = []
-    graph.query.side_effect = [
-        MagicMock(result_set=[[node]]),
-        links_result,
+def should_save_entries_in_one_query_per_batch(graph):
+    save_entries = create_save_entries(graph, batch_size=2)
+    entries = [
+        IndexEntry(page_path=f"species/page-{index}.md", abstract="Abstract", links=["techniques/wiring.md"] * 3, embedding=[0.1])
+        for index in range(5)
     ]
+
+    save_entries(entries)
+
+    assert_that(graph.query.call_count, equal_to(3), "Should issue one UNWIND query per batch regardless of link count")
+
+
+def should_deduplicate_links_in_bulk_save_params(graph):
+    save_entries = create_save_entries(graph)
+    entry = IndexEntry(page_path="species/ficus.md", abstract="Ficus", links=["a.md", "b.md", "a.md"], embedding=[0.1])
+
+    save_entries([entry])
+
+    params = graph.query.call_args.args[1]
+    assert_that(params["entries"][0]["links"], equal_to(["a.md", "b.md"]), "Should send each link once per entry")
+
+
+def should_load_entry_returns_entry_when_found(graph):
+    graph.query.return_value = MagicMock(result_set=[
+        ['species/ficus.md', 'Ficus retusa is a tropical species.', None, 'abc', ['techniques/wiring.md'], [0.1, 0.2, 0.3]],
+    ])
     load_entry = create_load_entry(graph)
 
     loaded = load_entry("species/ficus.md")
 
     assert_that(loaded.abstract, equal_to("Ficus retusa is a tropical species."), "Loaded abstract should match saved abstract")
+    assert_that(loaded.links, equal_to(["techniques/wiring.md"]), "Loaded links should come from the same query")
 
 
 def should_load_entry_returns_none_when_not_found(graph):
@@ -51,20 +73,78 @@ def should_load_entry_returns_none_when_not_found(graph):
     assert_that(result, none(), "Should return None when node not found in graph")
 
 
-def should_load_all_entries_returns_entries(graph):
-    node_one = Node(properties={'page_path': 'page_one.md', 'abstract': 'First page', 'embedding': [0.1]})
-    node_two = Node(properties={'page_path': 'page_two.md', 'abstract': 'Second page', 'embedding': [0.2]})
-    links_result = MagicMock(result_set=[])
-    graph.query.side_effect = [
-        MagicMock(result_set=[[node_one], [node_two]]),
-        links_result,
-        links_result,
-    ]
+def should_load_all_entries_in_a_single_query(graph):
+    graph.query.return_value = MagicMock(result_set=[
+        ['page_one.md', 'First page', None, None, ['page_two.md'], [0.1]],
+        ['page_two.md', 'Second page', 'user-1', None, [], [0.2]],
+    ])
     load_all_entries = create_load_all_entries(graph)
 
     entries = load_all_entries()
 
     assert_that(len(entries), equal_to(2), "Should return 2 entries from graph")
+    assert_that(graph.query.call_count, equal_to(1), "Should load nodes and their links in one round-trip")
+    assert_that(entries[0].links, equal_to(["page_two.md"]), "Should attach collected links to each entry")
+
+
+def should_not_project_embeddings_when_not_requested(graph):
+    graph.query.return_value = MagicMock(result_set=[['page_one.md', 'First page', None, None, []]])
+    load_all_entries = create_load_all_entries(graph)
+
+    entries = load_all_entries(with_embeddings=False)
+
+    query = graph.query.call_args.args[0]
+    assert_that("embedding" in query, is_(False), "Should not return the embedding column")
+    assert_that(entries[0].embedding, equal_to([]), "Entries should carry no embedding")
+
+
+def should_load_embeddings_as_float32_matrix(graph):
+    graph.query.return_value = MagicMock(result_set=[
+        ['page_one.md', 'First page', None, None, [], [0.1, 0.2]],
+        ['page_two.md', 'Second page', None, None, [], [0.3, 0.4]],
+    ])
+    load_embedding_matrix = create_load_embedding_matrix(graph)
+
+    entries, matrix = load_embedding_matrix()
+
+    assert_that(matrix.dtype, equal_to(np.float32), "Should pack embeddings as float32")
+    assert_that(matrix.shape, equal_to((2, 2)), "Should have one row per entry")
+    assert_that([entry.page_path for entry in entries], equal_to(["page_one.md", "page_two.md"]), "Rows should align with entries")
+
+
+def should_notify_on_saved_hook_after_each_batch(graph):
+    saved_batches = []
+    save_entries = create_save_entries(graph, batch_size=2, on_saved=saved_batches.append)
+    entries = [IndexEntry(page_path=f"page-{index}.md", abstract="Abstract", links=[], embedding=[0.1]) for index in range(3)]
+
+    save_entries(entries)
+
+    assert_that([len(batch) for batch in saved_batches], equal_to([2, 1]), "Should report every written batch")
+
+
+def should_load_content_hashes_by_page_path(graph):
+    graph.query.return_value = MagicMock(result_set=[["species/ficus.md", "abc"], ["species/pino.md", None]])
+    load_content_hashes = create_load_content_hashes(graph)
+
+    hashes = load_content_hashes()
+
+    assert_that(hashes, equal_to({"species/ficus.md": "abc", "species/pino.md": None}), "Should map each indexed page to its stored hash")
+
+
+def should_delete_entries_in_one_query(graph):
+    delete_entries = create_delete_entries(graph)
+
+    delete_entries(["species/acer.md", "species/olmo.md"])
+
+    assert_that(graph.query.call_count, equal_to(1), "Should delete all removed pages with a single query")
+
+
+def should_skip_delete_query_when_nothing_removed(graph):
+    delete_entries = create_delete_entries(graph)
+
+    delete_entries([])
+
+    assert_that(graph.query.call_count, equal_to(0), "Should not query the graph when there is nothing to delete")
 
 
 @pytest.fixture